@@ -184,6 +184,7 @@ class t_py_generator : public t_generator {
   std::string argument_list(t_struct* tstruct);
   std::string type_to_enum(t_type* ttype);
   std::string type_to_spec_args(t_type* ttype);
+  bool is_fixed_width(t_type* ttype);
 
   static std::string get_real_py_module(const t_program* program) {
     std::string real_module = program->get_namespace("py");
@@ -215,6 +216,12 @@ class t_py_generator : public t_generator {
 
   std::string package_dir_;
 
+  /**
+   * Expression for the field projection to pass to nested struct reads,
+   * or empty outside of a struct reader.
+   */
+  std::string projection_;
+
 };
 
 
@@ -299,12 +306,12 @@ string t_py_generator::render_includes() {
 }
 
 /**
- * Renders all the imports necessary to use the accelerated TBinaryProtocol
+ * Renders all the imports necessary to use the accelerated protocols
  */
 string t_py_generator::render_fastbinary_includes() {
   return
     "from thrift.transport import TTransport\n"
-    "from thrift.protocol import TBinaryProtocol\n"
+    "from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol\n"
     "try:\n"
     "  from thrift.protocol import fastbinary\n"
     "except:\n"
@@ -706,9 +713,16 @@ void t_py_generator::generate_py_struct_reader(ofstream& out,
   vector<t_field*>::const_iterator f_iter;
 
   indent(out) <<
-    "def read(self, iprot):" << endl;
+    "def read(self, iprot, fields=None):" << endl;
   indent_up();
 
+  // fields may be ids and paths rather than a projection, as long as it
+  // is turned into one before it reaches fastbinary or a nested read.
+  indent(out) <<
+    "if fields is not None:" << endl;
+  indent(out) <<
+    "  fields = TProtocol.projection(fields)" << endl;
+
   indent(out) <<
     "if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated "
     "and isinstance(iprot.trans, TTransport.CReadableTransport) "
@@ -717,7 +731,42 @@ void t_py_generator::generate_py_struct_reader(ofstream& out,
   indent_up();
 
   indent(out) <<
-    "fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))" << endl;
+    "if fields is None:" << endl;
+  indent(out) <<
+    "  fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))" << endl;
+  indent(out) <<
+    "else:" << endl;
+  indent(out) <<
+    "  fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)" << endl;
+  indent(out) <<
+    "return" << endl;
+  indent_down();
+
+  // The other accelerated paths can't project, so they fall through to
+  // the generic code below when given fields.
+  indent(out) <<
+    "if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated "
+    "and isinstance(iprot.trans, TTransport.CReadableTransport) "
+    "and self.thrift_spec is not None "
+    "and fastbinary is not None "
+    "and fields is None:" << endl;
+  indent_up();
+
+  indent(out) <<
+    "fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))" << endl;
+  indent(out) <<
+    "return" << endl;
+  indent_down();
+
+  indent(out) <<
+    "if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated "
+    "and isinstance(iprot.trans, TTransport.CReadableTransport) "
+    "and self.thrift_spec is not None "
+    "and fields is None:" << endl;
+  indent_up();
+
+  indent(out) <<
+    "iprot.readStruct(self, (self.__class__, self.thrift_spec))" << endl;
   indent(out) <<
     "return" << endl;
   indent_down();
@@ -757,9 +806,14 @@ void t_py_generator::generate_py_struct_reader(ofstream& out,
       }
       out << "fid == " << (*f_iter)->get_key() << ":" << endl;
       indent_up();
-      indent(out) << "if ftype == " << type_to_enum((*f_iter)->get_type()) << ":" << endl;
+      indent(out) << "if ftype == " << type_to_enum((*f_iter)->get_type()) <<
+        " and (fields is None or " << (*f_iter)->get_key() << " in fields):" << endl;
       indent_up();
+      std::ostringstream projection;
+      projection << "fields and fields[" << (*f_iter)->get_key() << "]";
+      projection_ = projection.str();
       generate_deserialize_field(out, *f_iter, "self.");
+      projection_ = "";
       indent_down();
       out <<
         indent() << "else:" << endl <<
@@ -802,7 +856,30 @@ void t_py_generator::generate_py_struct_writer(ofstream& out,
   indent_up();
 
   indent(out) <<
-    "oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))" << endl;
+    "fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)" << endl;
+  indent(out) <<
+    "return" << endl;
+  indent_down();
+
+  indent(out) <<
+    "if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated "
+    "and self.thrift_spec is not None "
+    "and fastbinary is not None:" << endl;
+  indent_up();
+
+  indent(out) <<
+    "oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))" << endl;
+  indent(out) <<
+    "return" << endl;
+  indent_down();
+
+  indent(out) <<
+    "if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated "
+    "and self.thrift_spec is not None:" << endl;
+  indent_up();
+
+  indent(out) <<
+    "oprot.writeStruct(self, (self.__class__, self.thrift_spec))" << endl;
   indent(out) <<
     "return" << endl;
   indent_down();
@@ -1104,16 +1181,9 @@ void t_py_generator::generate_service_client(t_service* tservice) {
 
     std::string argsname = (*f_iter)->get_name() + "_args";
 
-    // Serialize the request header
     if (gen_twisted_) {
       f_service_ <<
-        indent() << "oprot = self._oprot_factory.getProtocol(self._transport)" << endl <<
-        indent() <<
-          "oprot.writeMessageBegin('" << (*f_iter)->get_name() << "', TMessageType.CALL, self._seqid)"
-        << endl;
-    } else {
-      f_service_ <<
-        indent() << "self._oprot.writeMessageBegin('" << (*f_iter)->get_name() << "', TMessageType.CALL, self._seqid)" << endl;
+        indent() << "oprot = self._oprot_factory.getProtocol(self._transport)" << endl;
     }
 
     f_service_ <<
@@ -1124,18 +1194,12 @@ void t_py_generator::generate_service_client(t_service* tservice) {
         indent() << "args." << (*fld_iter)->get_name() << " = " << (*fld_iter)->get_name() << endl;
     }
 
-    // Write to the stream
-    if (gen_twisted_) {
-      f_service_ <<
-        indent() << "args.write(oprot)" << endl <<
-        indent() << "oprot.writeMessageEnd()" << endl <<
-        indent() << "oprot.trans.flush()" << endl;
-    } else {
-      f_service_ <<
-        indent() << "args.write(self._oprot)" << endl <<
-        indent() << "self._oprot.writeMessageEnd()" << endl <<
-        indent() << "self._oprot.trans.flush()" << endl;
-    }
+    // Write the whole call to the stream
+    string oprot = gen_twisted_ ? "oprot" : "self._oprot";
+    f_service_ <<
+      indent() << oprot << ".writeMessage('" << (*f_iter)->get_name() <<
+        "', TMessageType.CALL, self._seqid, args)" << endl <<
+      indent() << oprot << ".trans.flush()" << endl;
 
     indent_down();
 
@@ -1162,18 +1226,9 @@ void t_py_generator::generate_service_client(t_service* tservice) {
 
       if (gen_twisted_) {
         f_service_ <<
-          indent() << "d = self._reqs.pop(rseqid)" << endl;
-      } else {
-        f_service_ <<
-          indent() << "(fname, mtype, rseqid) = self._iprot.readMessageBegin()" << endl;
-      }
-
-      f_service_ <<
-        indent() << "if mtype == TMessageType.EXCEPTION:" << endl <<
-        indent() << "  x = TApplicationException()" << endl;
-
-      if (gen_twisted_) {
-        f_service_ <<
+          indent() << "d = self._reqs.pop(rseqid)" << endl <<
+          indent() << "if mtype == TMessageType.EXCEPTION:" << endl <<
+          indent() << "  x = TApplicationException()" << endl <<
           indent() << "  x.read(iprot)" << endl <<
           indent() << "  iprot.readMessageEnd()" << endl <<
           indent() << "  return d.errback(x)" << endl <<
@@ -1181,13 +1236,12 @@ void t_py_generator::generate_service_client(t_service* tservice) {
           indent() << "result.read(iprot)" << endl <<
           indent() << "iprot.readMessageEnd()" << endl;
       } else {
+        // An exception reply comes back in place of the result.
         f_service_ <<
-          indent() << "  x.read(self._iprot)" << endl <<
-          indent() << "  self._iprot.readMessageEnd()" << endl <<
-          indent() << "  raise x" << endl <<
-          indent() << "result = " << resultname << "()" << endl <<
-          indent() << "result.read(self._iprot)" << endl <<
-          indent() << "self._iprot.readMessageEnd()" << endl;
+          indent() << "(fname, mtype, rseqid, result) = self._iprot.readMessage(" <<
+            resultname << "())" << endl <<
+          indent() << "if mtype == TMessageType.EXCEPTION:" << endl <<
+          indent() << "  raise result" << endl;
       }
 
       // Careful, only return _result if not a void function
@@ -1483,9 +1537,7 @@ void t_py_generator::generate_service_server(t_service* tservice) {
     indent() << "  iprot.skip(TType.STRUCT)" << endl <<
     indent() << "  iprot.readMessageEnd()" << endl <<
     indent() << "  x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))" << endl <<
-    indent() << "  oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)" << endl <<
-    indent() << "  x.write(oprot)" << endl <<
-    indent() << "  oprot.writeMessageEnd()" << endl <<
+    indent() << "  oprot.writeMessage(name, TMessageType.EXCEPTION, seqid, x)" << endl <<
     indent() << "  oprot.trans.flush()" << endl;
 
   if (gen_twisted_) {
@@ -1607,10 +1659,8 @@ void t_py_generator::generate_process_function(t_service* tservice,
     indent_up();
     f_service_ <<
       indent() << "result.success = success" << endl <<
-      indent() << "oprot.writeMessageBegin(\"" << tfunction->get_name() <<
-        "\", TMessageType.REPLY, seqid)" << endl <<
-      indent() << "result.write(oprot)" << endl <<
-      indent() << "oprot.writeMessageEnd()" << endl <<
+      indent() << "oprot.writeMessage(\"" << tfunction->get_name() <<
+        "\", TMessageType.REPLY, seqid, result)" << endl <<
       indent() << "oprot.trans.flush()" << endl;
     indent_down();
     f_service_ << endl;
@@ -1641,10 +1691,8 @@ void t_py_generator::generate_process_function(t_service* tservice,
         }
       }
       f_service_ <<
-        indent() << "oprot.writeMessageBegin(\"" << tfunction->get_name() <<
-          "\", TMessageType.REPLY, seqid)" << endl <<
-        indent() << "result.write(oprot)" << endl <<
-        indent() << "oprot.writeMessageEnd()" << endl <<
+        indent() << "oprot.writeMessage(\"" << tfunction->get_name() <<
+          "\", TMessageType.REPLY, seqid, result)" << endl <<
         indent() << "oprot.trans.flush()" << endl;
       indent_down();
       f_service_ << endl;
@@ -1707,9 +1755,7 @@ void t_py_generator::generate_process_function(t_service* tservice,
     }
 
     f_service_ <<
-      indent() << "oprot.writeMessageBegin(\"" << tfunction->get_name() << "\", TMessageType.REPLY, seqid)" << endl <<
-      indent() << "result.write(oprot)" << endl <<
-      indent() << "oprot.writeMessageEnd()" << endl <<
+      indent() << "oprot.writeMessage(\"" << tfunction->get_name() << "\", TMessageType.REPLY, seqid, result)" << endl <<
       indent() << "oprot.trans.flush()" << endl;
 
     // Close function
@@ -1794,7 +1840,8 @@ void t_py_generator::generate_deserialize_struct(ofstream &out,
                                                   string prefix) {
   out <<
     indent() << prefix << " = " << type_name(tstruct) << "()" << endl <<
-    indent() << prefix << ".read(iprot)" << endl;
+    indent() << prefix << ".read(iprot" <<
+    (projection_.empty() ? "" : ", " + projection_) << ")" << endl;
 }
 
 /**
@@ -1814,6 +1861,30 @@ void t_py_generator::generate_deserialize_container(ofstream &out,
   t_field fvtype(g_type_byte, vtype);
   t_field fetype(g_type_byte, etype);
 
+  // Lists and sets of fixed-width values are read in one call
+  t_type* elem_type = NULL;
+  if (ttype->is_set()) {
+    elem_type = ((t_set*)ttype)->get_elem_type();
+  } else if (ttype->is_list()) {
+    elem_type = ((t_list*)ttype)->get_elem_type();
+  }
+  if (elem_type != NULL && is_fixed_width(elem_type)) {
+    if (ttype->is_set()) {
+      out <<
+        indent() << "(" << etype << ", " << size << ") = iprot.readSetBegin()" << endl <<
+        indent() << prefix << " = set(iprot.readFixedValues(" <<
+          type_to_enum(elem_type) << ", " << size << "))" << endl <<
+        indent() << "iprot.readSetEnd()" << endl;
+    } else {
+      out <<
+        indent() << "(" << etype << ", " << size << ") = iprot.readListBegin()" << endl <<
+        indent() << prefix << " = iprot.readFixedValues(" <<
+          type_to_enum(elem_type) << ", " << size << ")" << endl <<
+        indent() << "iprot.readListEnd()" << endl;
+    }
+    return;
+  }
+
   // Declare variables, read header
   if (ttype->is_map()) {
     out <<
@@ -1868,7 +1939,11 @@ void t_py_generator::generate_deserialize_map_element(ofstream &out,
   t_field fkey(tmap->get_key_type(), key);
   t_field fval(tmap->get_val_type(), val);
 
+  // Map keys are always read in full, so they hash and compare properly.
+  string projection = projection_;
+  projection_ = "";
   generate_deserialize_field(out, &fkey);
+  projection_ = projection;
   generate_deserialize_field(out, &fval);
 
   indent(out) <<
@@ -2015,7 +2090,18 @@ void t_py_generator::generate_serialize_container(ofstream &out,
       "len(" << prefix << "))" << endl;
   }
 
-  if (ttype->is_map()) {
+  t_type* elem_type = NULL;
+  if (ttype->is_set()) {
+    elem_type = ((t_set*)ttype)->get_elem_type();
+  } else if (ttype->is_list()) {
+    elem_type = ((t_list*)ttype)->get_elem_type();
+  }
+
+  if (elem_type != NULL && is_fixed_width(elem_type)) {
+    indent(out) <<
+      "oprot.writeFixedValues(" << type_to_enum(elem_type) << ", " <<
+      prefix << ")" << endl;
+  } else if (ttype->is_map()) {
     string kiter = tmp("kiter");
     string viter = tmp("viter");
     indent(out) <<
@@ -2291,6 +2377,33 @@ string t_py_generator::type_to_enum(t_type* type) {
   throw "INVALID TYPE IN type_to_enum: " + type->get_name();
 }
 
+/**
+ * Whether values of this type have a fixed size on the wire (bool, byte,
+ * i16, i32, i64, double and enums), so that lists and sets of them can go
+ * through readFixedValues/writeFixedValues.
+ */
+bool t_py_generator::is_fixed_width(t_type* type) {
+  type = get_true_type(type);
+
+  if (type->is_enum()) {
+    return true;
+  }
+  if (!type->is_base_type()) {
+    return false;
+  }
+  switch (((t_base_type*)type)->get_base()) {
+  case t_base_type::TYPE_BOOL:
+  case t_base_type::TYPE_BYTE:
+  case t_base_type::TYPE_I16:
+  case t_base_type::TYPE_I32:
+  case t_base_type::TYPE_I64:
+  case t_base_type::TYPE_DOUBLE:
+    return true;
+  default:
+    return false;
+  }
+}
+
 /** See the comment inside generate_py_struct_definition for what this is. */
 string t_py_generator::type_to_spec_args(t_type* ttype) {
   while (ttype->is_typedef()) {
@@ -0,0 +1,475 @@
+import threading
+import weakref
+from struct import pack, unpack
+from Thrift import TType
+from protocol import TBinaryProtocol, TCompactProtocol
+from protocol.TProtocol import projection
+from transport import TTransport
+try:
+    from protocol import fastbinary
+except:
+    fastbinary = None
+
+# Each thread keeps a TMemoryBuffer for serialize and deserialize to
+# reuse, unless it has grown past _MAX_KEPT_BUFFER bytes.
+_buffers = threading.local()
+_MAX_KEPT_BUFFER = 1 << 20
+
+def _get_buffer(value = None):
+    transport = getattr(_buffers, 'transport', None)
+    if transport is None:
+        return TTransport.TMemoryBuffer(value)
+    # Taken while in use, in case a read or write calls back in here.
+    _buffers.transport = None
+    transport.reset(value)
+    return transport
+
+def _put_buffer(transport):
+    if len(transport.bytearray_rbuf) <= _MAX_KEPT_BUFFER:
+        _buffers.transport = transport
+
+def serialize(thrift_object, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()):
+    transport = _get_buffer()
+    try:
+        protocol = protocol_factory.getProtocol(transport)
+        thrift_object.write(protocol)
+        return transport.getvalue()
+    finally:
+        _put_buffer(transport)
+
+_BINARY_FACTORIES = (TBinaryProtocol.TBinaryProtocolFactory,
+                     TBinaryProtocol.TBinaryProtocolOptimizedFactory,
+                     TBinaryProtocol.TBinaryProtocolAcceleratedFactory)
+
+def serialized_size(thrift_object, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()):
+    """Returns len(serialize(thrift_object, protocol_factory)).
+
+    With a binary protocol and fastbinary, the size is added up from the
+    object without encoding it, which is handy for framing and quota
+    checks.  Otherwise the object is serialized and measured.
+    """
+    if (fastbinary is not None and getattr(thrift_object, 'thrift_spec', None) is not None
+        and isinstance(protocol_factory, _BINARY_FACTORIES)):
+        return fastbinary.serialized_size(thrift_object,
+                                          (thrift_object.__class__, thrift_object.thrift_spec))
+    return len(serialize(thrift_object, protocol_factory))
+
+def serialize_many(objs, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()):
+    """Serializes a batch of objects of one class into a single string.
+
+    Each object comes after its length as a big-endian i32, as in the
+    frames of TFramedTransport.  With a binary protocol and fastbinary the
+    whole batch is encoded in one call; see deserialize_many.
+    """
+    objs = list(objs)
+    if (objs and getattr(fastbinary, 'encode_many', None) is not None
+        and getattr(objs[0], 'thrift_spec', None) is not None
+        and isinstance(protocol_factory, _BINARY_FACTORIES)):
+        return fastbinary.encode_many(objs, (objs[0].__class__, objs[0].thrift_spec))
+    parts = []
+    for obj in objs:
+        data = serialize(obj, protocol_factory)
+        parts.append(pack('!i', len(data)))
+        parts.append(data)
+    return ''.join(parts)
+
+def deserialize(base, buf, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory(), fields = None, arrays = False, columns = False,
+                intern = False, views = False):
+    """Reads base from buf.
+
+    If fields is given, only those fields are decoded and the rest are
+    skipped.  It is a list or set of field ids or paths, or what projection
+    makes of one.
+
+    If arrays is true and fastbinary does the decoding (that is, with
+    TBinaryProtocolAcceleratedFactory), lists of byte, i16, i32, i64 and
+    double come back as array.array objects instead of lists.  Otherwise
+    they are plain lists as usual.
+
+    columns is a similar option for lists of structs: each one comes back
+    as a dict mapping field names to columns, one value per element, with
+    numeric fields in array.array objects and the rest in lists.  The
+    struct instances are never created.  Such a dict can be written back
+    with TBinaryProtocolAccelerated, but not by the other protocols.
+    Unlike arrays, this raises ValueError if fastbinary can't be used.
+
+    intern, also honoured by fastbinary's binary decoder only, makes string
+    map keys and short strings share one object with equal strings from
+    earlier such calls (within a bounded table), which saves memory when
+    decoded messages with recurring keys are kept around.
+
+    views, again fastbinary's binary decoder only, makes string fields,
+    list elements and map values come back as read-only buffer objects over
+    buf instead of copies, which avoids copying big binary fields.  buf then
+    lives as long as any of them, and they see any later changes to it.
+    Buffers can be written back by the accelerated protocols, or passed to
+    str() for a copy.  buf must be a str, buffer, bytearray or mmap; other
+    protocols ignore views.
+    """
+    if columns and (fastbinary is None or getattr(base, 'thrift_spec', None) is None or
+                    protocol_factory.__class__ != TBinaryProtocol.TBinaryProtocolAcceleratedFactory):
+        raise ValueError('columns needs fastbinary and TBinaryProtocolAcceleratedFactory')
+    if fields is not None:
+        fields = projection(fields)
+    # The accelerated codecs can read buf in place, without a TMemoryBuffer.
+    if fastbinary is not None and getattr(base, 'thrift_spec', None) is not None:
+        if protocol_factory.__class__ == TBinaryProtocol.TBinaryProtocolAcceleratedFactory:
+            fastbinary.decode_binary_fields(base, buf, (base.__class__, base.thrift_spec), fields,
+                                            arrays=arrays, columns=columns, intern=intern,
+                                            views=views)
+            return base
+        if (protocol_factory.__class__ == TCompactProtocol.TCompactProtocolAcceleratedFactory
+            and fields is None):
+            fastbinary.decode_compact(base, buf, (base.__class__, base.thrift_spec))
+            return base
+    transport = _get_buffer(buf)
+    try:
+        protocol = protocol_factory.getProtocol(transport)
+        if fields is None:
+            base.read(protocol)
+        else:
+            base.read(protocol, fields)
+    finally:
+        _put_buffer(transport)
+    return base
+
+def deserialize_many(klass, buf, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()):
+    """Reads a batch written by serialize_many, returning a list of klass
+    instances.
+    """
+    if (fastbinary is not None and getattr(klass, 'thrift_spec', None) is not None
+        and isinstance(protocol_factory, _BINARY_FACTORIES)):
+        return fastbinary.decode_many(buf, (klass, klass.thrift_spec))
+    result = []
+    pos = 0
+    while pos < len(buf):
+        if len(buf) - pos < 4:
+            raise EOFError()
+        size, = unpack('!i', buf[pos:pos + 4])
+        pos += 4
+        if size < 0 or len(buf) - pos < size:
+            raise EOFError()
+        result.append(deserialize(klass(), buf[pos:pos + size], protocol_factory))
+        pos += size
+    return result
+
+def deserialize_plain(klass, buf, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory(), tuples = False):
+    """Reads a klass struct from buf as plain data rather than instances.
+
+    Each struct, klass and the ones inside it, becomes a dict mapping
+    attribute names to values, or if tuples is true, a tuple indexed by
+    field id like thrift_spec.  Fields missing from buf are left out (None
+    in tuples) instead of getting their defaults.  With a binary protocol
+    and fastbinary this skips creating instances entirely, which is handy
+    when the result is only going to be turned into JSON or the like.
+    serialize_plain writes such data back.
+    """
+    spec = (klass, klass.thrift_spec)
+    if fastbinary is not None and isinstance(protocol_factory, _BINARY_FACTORIES):
+        return fastbinary.decode_binary_plain(buf, spec, tuples=tuples)
+    transport = _get_buffer(buf)
+    try:
+        protocol = protocol_factory.getProtocol(transport)
+        return _read_plain(protocol, TType.STRUCT, spec, tuples)
+    finally:
+        _put_buffer(transport)
+
+def serialize_plain(klass, value, protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()):
+    """Serializes value, a dict or tuple standing for a klass instance as
+    made by deserialize_plain."""
+    spec = (klass, klass.thrift_spec)
+    if fastbinary is not None and isinstance(protocol_factory, _BINARY_FACTORIES):
+        return fastbinary.encode_binary(value, spec)
+    return serialize(_from_plain(value, TType.STRUCT, spec), protocol_factory)
+
+def _read_plain(iprot, ttype, typeargs, tuples):
+    if ttype == TType.STRUCT:
+        spec = typeargs[1]
+        if tuples:
+            result = [None] * len(spec)
+        else:
+            result = {}
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, id) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if 0 <= id < len(spec):
+                field = spec[id]
+            else:
+                field = None
+            if field is None or field[1] != ftype:
+                iprot.skip(ftype)
+            elif tuples:
+                result[id] = _read_plain(iprot, ftype, field[3], tuples)
+            else:
+                result[field[2]] = _read_plain(iprot, ftype, field[3], tuples)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+        if tuples:
+            return tuple(result)
+        return result
+    if ttype == TType.MAP:
+        (ktype, ktypeargs, vtype, vtypeargs) = typeargs
+        (_ktype, _vtype, size) = iprot.readMapBegin()
+        result = {}
+        for i in xrange(size):
+            key = _read_plain(iprot, ktype, ktypeargs, tuples)
+            result[key] = _read_plain(iprot, vtype, vtypeargs, tuples)
+        iprot.readMapEnd()
+        return result
+    if ttype == TType.LIST:
+        (_etype, size) = iprot.readListBegin()
+        result = [_read_plain(iprot, typeargs[0], typeargs[1], tuples) for i in xrange(size)]
+        iprot.readListEnd()
+        return result
+    if ttype == TType.SET:
+        (_etype, size) = iprot.readSetBegin()
+        result = set([_read_plain(iprot, typeargs[0], typeargs[1], tuples) for i in xrange(size)])
+        iprot.readSetEnd()
+        return result
+    return getattr(iprot, _READERS[ttype])()
+
+def _from_plain(value, ttype, typeargs):
+    if value is None:
+        return None
+    if ttype == TType.STRUCT:
+        (klass, spec) = typeargs
+        obj = klass()
+        for field in spec:
+            if field is None:
+                continue
+            if isinstance(value, tuple):
+                if field[0] < len(value):
+                    fieldval = value[field[0]]
+                else:
+                    fieldval = None
+            else:
+                fieldval = value.get(field[2])
+            # Set even missing fields, so that defaults aren't written.
+            setattr(obj, field[2], _from_plain(fieldval, field[1], field[3]))
+        return obj
+    if ttype == TType.MAP:
+        (ktype, ktypeargs, vtype, vtypeargs) = typeargs
+        return dict([(_from_plain(k, ktype, ktypeargs), _from_plain(v, vtype, vtypeargs))
+                     for (k, v) in value.iteritems()])
+    if ttype == TType.LIST:
+        return [_from_plain(v, typeargs[0], typeargs[1]) for v in value]
+    if ttype == TType.SET:
+        return set([_from_plain(v, typeargs[0], typeargs[1]) for v in value])
+    return value
+
+def deserialize_lazy(base, buf):
+    """Like deserialize with TBinaryProtocol, but struct and container fields
+    are only decoded when they are first accessed.
+
+    base stays an instance of its class throughout; buf is kept alive until
+    every such field has been accessed.  Comparing, copying or pickling
+    base decodes the rest of it first.
+    Without fastbinary this is the same as deserialize.
+    """
+    if fastbinary is None or getattr(base, 'thrift_spec', None) is None:
+        return deserialize(base, buf)
+    _decode_lazy(base, buf, 0)
+    return base
+
+def _decode_lazy(obj, buf, offset):
+    end, pending = fastbinary.decode_binary_lazy(
+        obj, buf, (obj.__class__, obj.thrift_spec), offset)
+    if pending:
+        fields = _LazyDict(obj.__dict__)
+        for name in pending:
+            # Drop the default set by __init__ so that __getattr__ is called.
+            dict.pop(fields, name, None)
+        fields._pending = pending
+        fields._buf = buf
+        fields._obj = weakref.ref(obj)
+        _hook_class(obj.__class__)
+        obj.__dict__ = fields
+
+class _LazyDict(dict):
+
+    """The __dict__ of a lazily decoded struct.
+
+    The fields still to be decoded are not in it, but anything that looks
+    at it as a whole (the generated __eq__ and __repr__, from either side)
+    decodes them first.  Once they are all decoded the struct gets an
+    ordinary dict back.
+    """
+
+    __slots__ = ('_pending', '_buf', '_obj')
+
+    def _take(self, name):
+        ttype, typeargs, offset = self._pending.pop(name)
+        if ttype == TType.STRUCT:
+            value = typeargs[0]()
+            _decode_lazy(value, self._buf, offset)
+        else:
+            value = fastbinary.decode_binary_value(self._buf, ttype, typeargs, offset)
+        dict.__setitem__(self, name, value)
+        if not self._pending:
+            self._release()
+        return value
+
+    def _take_all(self):
+        for name in self._pending.keys():
+            if dict.__contains__(self, name):
+                # Assigned to since it was decoded; the new value wins.
+                del self._pending[name]
+            else:
+                self._take(name)
+        if self._buf is not None:
+            self._release()
+
+    def _release(self):
+        self._buf = None
+        obj = self._obj()
+        if obj is not None and obj.__dict__ is self:
+            obj.__dict__ = dict(self)
+
+    def __missing__(self, name):
+        if name not in self._pending:
+            raise KeyError(name)
+        return self._take(name)
+
+    def get(self, name, default=None):
+        if name in self._pending and not dict.__contains__(self, name):
+            return self._take(name)
+        return dict.get(self, name, default)
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self._pending
+
+    has_key = __contains__
+
+    def __eq__(self, other):
+        self._take_all()
+        if isinstance(other, _LazyDict):
+            other._take_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+def _whole(name):
+    method = getattr(dict, name)
+    def whole(self, *args):
+        self._take_all()
+        return method(self, *args)
+    whole.__name__ = name
+    return whole
+
+for _name in ('__iter__', '__len__', '__repr__', 'copy', 'items', 'iteritems',
+              'iterkeys', 'itervalues', 'keys', 'values'):
+    setattr(_LazyDict, _name, _whole(_name))
+del _name
+
+# copy and pickle look these up, and read __dict__ if they aren't there, so
+# the struct is decoded before they do.
+_WHOLE_NAMES = ('__copy__', '__deepcopy__', '__getinitargs__',
+                '__getnewargs__', '__getstate__')
+
+_hooked_classes = {}
+
+def _hook_class(klass):
+    """Gives klass a __getattr__ that decodes pending fields, the first time
+    one of its instances is decoded lazily."""
+    if klass in _hooked_classes:
+        return
+    fallback = getattr(klass, '__getattr__', None)
+
+    def __getattr__(self, name):
+        fields = self.__dict__
+        if type(fields) is _LazyDict:
+            if name in fields._pending:
+                return fields._take(name)
+            if name in _WHOLE_NAMES:
+                fields._take_all()
+        if fallback is not None:
+            return fallback(self, name)
+        raise AttributeError(name)
+
+    klass.__getattr__ = __getattr__
+    _hooked_classes[klass] = True
+
+
+_READERS = {TType.BOOL: 'readBool', TType.BYTE: 'readByte',
+            TType.I16: 'readI16', TType.I32: 'readI32',
+            TType.I64: 'readI64', TType.DOUBLE: 'readDouble',
+            TType.STRING: 'readString'}
+
+def read_value(iprot, ttype, typeargs):
+    """Reads one value of type ttype from iprot.  typeargs is as in a
+    thrift_spec, e.g. (Bonk, Bonk.thrift_spec) for a struct."""
+    if ttype == TType.STRUCT:
+        obj = typeargs[0]()
+        obj.read(iprot)
+        return obj
+    if ttype == TType.LIST:
+        return list(iter_container(iprot, ttype, typeargs))
+    if ttype == TType.SET:
+        return set(iter_container(iprot, ttype, typeargs))
+    if ttype == TType.MAP:
+        return dict(iter_container(iprot, ttype, typeargs))
+    return getattr(iprot, _READERS[ttype])()
+
+def iter_container(iprot, ttype, typeargs):
+    """Yields the elements of the list or set, or the (key, value) pairs of
+    the map, that iprot is positioned at, reading them one at a time.
+
+    The container end is read once the last element has been yielded, so
+    the generator must be run to completion before anything else is read
+    from iprot.
+    """
+    if ttype == TType.MAP:
+        (ktype, ktypeargs, vtype, vtypeargs) = typeargs
+        (_ktype, _vtype, size) = iprot.readMapBegin()
+        for i in xrange(size):
+            key = read_value(iprot, ktype, ktypeargs)
+            yield (key, read_value(iprot, vtype, vtypeargs))
+        iprot.readMapEnd()
+    elif ttype in (TType.LIST, TType.SET):
+        (etype, etypeargs) = typeargs
+        if ttype == TType.LIST:
+            (_etype, size) = iprot.readListBegin()
+        else:
+            (_etype, size) = iprot.readSetBegin()
+        for i in xrange(size):
+            yield read_value(iprot, etype, etypeargs)
+        if ttype == TType.LIST:
+            iprot.readListEnd()
+        else:
+            iprot.readSetEnd()
+    else:
+        raise TypeError('expecting a list, set or map type, got %d' % ttype)
+
+def iter_field(iprot, obj, fid):
+    """Reads the struct obj from iprot, streaming the elements of its list,
+    set or map field fid instead of building the container.
+
+    This is a generator yielding those elements as they are read, so a
+    huge result (the success field of a foo_result, say) can be processed
+    in bounded memory and before all of it has arrived.  The other fields
+    are set on obj as usual.  If field fid isn't there (e.g. because the
+    call raised an exception), nothing is yielded.  As with
+    iter_container, the generator must be run to completion.
+    """
+    spec = obj.thrift_spec
+    iprot.readStructBegin()
+    while True:
+        (fname, ftype, id) = iprot.readFieldBegin()
+        if ftype == TType.STOP:
+            break
+        if 0 <= id < len(spec):
+            field = spec[id]
+        else:
+            field = None
+        if field is None or field[1] != ftype:
+            iprot.skip(ftype)
+        elif id == fid:
+            for value in iter_container(iprot, ftype, field[3]):
+                yield value
+        else:
+            setattr(obj, field[2], read_value(iprot, ftype, field[3]))
+        iprot.readFieldEnd()
+    iprot.readStructEnd()
@@ -0,0 +1,481 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements. See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License. You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from TProtocol import *
+from struct import pack, unpack, Struct
+from thrift.transport.TTransport import CReadableTransport
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+class TBinaryProtocol(TProtocolBase):
+
+  """Binary implementation of the Thrift protocol driver."""
+
+  # NastyHaxx. Python 2.4+ on 32-bit machines forces hex constants to be
+  # positive, converting this into a long. If we hardcode the int value
+  # instead it'll stay in 32 bit-land.
+
+  # VERSION_MASK = 0xffff0000
+  VERSION_MASK = -65536
+
+  # VERSION_1 = 0x80010000
+  VERSION_1 = -2147418112
+
+  TYPE_MASK = 0x000000ff
+
+  def __init__(self, trans, strictRead=False, strictWrite=True):
+    TProtocolBase.__init__(self, trans)
+    self.strictRead = strictRead
+    self.strictWrite = strictWrite
+
+  def writeMessageBegin(self, name, type, seqid):
+    if self.strictWrite:
+      self.writeI32(TBinaryProtocol.VERSION_1 | type)
+      self.writeString(name)
+      self.writeI32(seqid)
+    else:
+      self.writeString(name)
+      self.writeByte(type)
+      self.writeI32(seqid)
+
+  def writeMessageEnd(self):
+    pass
+
+  def writeStructBegin(self, name):
+    pass
+
+  def writeStructEnd(self):
+    pass
+
+  def writeFieldBegin(self, name, type, id):
+    self.writeByte(type)
+    self.writeI16(id)
+
+  def writeFieldEnd(self):
+    pass
+
+  def writeFieldStop(self):
+    self.writeByte(TType.STOP);
+
+  def writeMapBegin(self, ktype, vtype, size):
+    self.writeByte(ktype)
+    self.writeByte(vtype)
+    self.writeI32(size)
+
+  def writeMapEnd(self):
+    pass
+
+  def writeListBegin(self, etype, size):
+    self.writeByte(etype)
+    self.writeI32(size)
+
+  def writeListEnd(self):
+    pass
+
+  def writeSetBegin(self, etype, size):
+    self.writeByte(etype)
+    self.writeI32(size)
+
+  def writeSetEnd(self):
+    pass
+
+  def writeBool(self, bool):
+    if bool:
+      self.writeByte(1)
+    else:
+      self.writeByte(0)
+
+  def writeByte(self, byte):
+    buff = pack("!b", byte)
+    self.trans.write(buff)
+
+  def writeI16(self, i16):
+    buff = pack("!h", i16)
+    self.trans.write(buff)
+
+  def writeI32(self, i32):
+    buff = pack("!i", i32)
+    self.trans.write(buff)
+
+  def writeI64(self, i64):
+    buff = pack("!q", i64)
+    self.trans.write(buff)
+
+  def writeDouble(self, dub):
+    buff = pack("!d", dub)
+    self.trans.write(buff)
+
+  def writeString(self, str):
+    self.writeI32(len(str))
+    self.trans.write(str)
+
+  def readMessageBegin(self):
+    sz = self.readI32()
+    if sz < 0:
+      version = sz & TBinaryProtocol.VERSION_MASK
+      if version != TBinaryProtocol.VERSION_1:
+        raise TProtocolException(type=TProtocolException.BAD_VERSION, message='Bad version in readMessageBegin: %d' % (sz))
+      type = sz & TBinaryProtocol.TYPE_MASK
+      name = self.readString()
+      seqid = self.readI32()
+    else:
+      if self.strictRead:
+        raise TProtocolException(type=TProtocolException.BAD_VERSION, message='No protocol version header')
+      name = self.trans.readAll(sz)
+      type = self.readByte()
+      seqid = self.readI32()
+    return (name, type, seqid)
+
+  def readMessageEnd(self):
+    pass
+
+  def readStructBegin(self):
+    pass
+
+  def readStructEnd(self):
+    pass
+
+  def readFieldBegin(self):
+    type = self.readByte()
+    if type == TType.STOP:
+      return (None, type, 0)
+    id = self.readI16()
+    return (None, type, id)
+
+  def readFieldEnd(self):
+    pass
+
+  def readMapBegin(self):
+    ktype = self.readByte()
+    vtype = self.readByte()
+    size = self.readI32()
+    return (ktype, vtype, size)
+
+  def readMapEnd(self):
+    pass
+
+  def readListBegin(self):
+    etype = self.readByte()
+    size = self.readI32()
+    return (etype, size)
+
+  def readListEnd(self):
+    pass
+
+  def readSetBegin(self):
+    etype = self.readByte()
+    size = self.readI32()
+    return (etype, size)
+
+  def readSetEnd(self):
+    pass
+
+  def readBool(self):
+    byte = self.readByte()
+    if byte == 0:
+      return False
+    return True
+
+  def readByte(self):
+    buff = self.trans.readAll(1)
+    val, = unpack('!b', buff)
+    return val
+
+  def readI16(self):
+    buff = self.trans.readAll(2)
+    val, = unpack('!h', buff)
+    return val
+
+  def readI32(self):
+    buff = self.trans.readAll(4)
+    val, = unpack('!i', buff)
+    return val
+
+  def readI64(self):
+    buff = self.trans.readAll(8)
+    val, = unpack('!q', buff)
+    return val
+
+  def readDouble(self):
+    buff = self.trans.readAll(8)
+    val, = unpack('!d', buff)
+    return val
+
+  def readString(self):
+    len = self.readI32()
+    str = self.trans.readAll(len)
+    return str
+
+  # struct codes and sizes of the types readFixedValues takes.
+  _FIXED_FORMATS = {TType.BOOL: ('?', 1), TType.BYTE: ('b', 1),
+                    TType.I16: ('h', 2), TType.I32: ('i', 4),
+                    TType.I64: ('q', 8), TType.DOUBLE: ('d', 8)}
+
+  def readFixedValues(self, etype, size):
+    code, width = self._FIXED_FORMATS[etype]
+    if size < 0:
+      raise TProtocolException(type=TProtocolException.NEGATIVE_SIZE,
+                               message='Negative length')
+    return list(unpack('!%d%s' % (size, code), self.trans.readAll(size * width)))
+
+  def writeFixedValues(self, etype, values):
+    code, width = self._FIXED_FORMATS[etype]
+    self.trans.write(pack('!%d%s' % (len(values), code), *values))
+
+
+class TBinaryProtocolFactory:
+  def __init__(self, strictRead=False, strictWrite=True):
+    self.strictRead = strictRead
+    self.strictWrite = strictWrite
+
+  def getProtocol(self, trans):
+    prot = TBinaryProtocol(trans, self.strictRead, self.strictWrite)
+    return prot
+
+
+class TBinaryProtocolOptimized(TBinaryProtocol):
+
+  """Pure-Python TBinaryProtocol tuned for speed.
+
+  For when fastbinary can't be used (no C compiler, PyPy, ...).  It
+  produces the same bytes as TBinaryProtocol, but packs with precompiled
+  Structs, writes each field, list, set and map header with a single
+  pack and write, and, on a CReadableTransport with a bytearray_rbuf,
+  unpacks fixed-width values in place with Struct.unpack_from and
+  slices strings straight out of that buffer instead of going through
+  readAll.
+  """
+
+  _BYTE = Struct('!b')
+  _I16 = Struct('!h')
+  _I32 = Struct('!i')
+  _I64 = Struct('!q')
+  _DOUBLE = Struct('!d')
+  _FIELD = Struct('!bh')
+  _LIST = Struct('!bi')
+  _MAP = Struct('!bbi')
+
+  def __init__(self, trans, strictRead=False, strictWrite=True):
+    TBinaryProtocol.__init__(self, trans, strictRead, strictWrite)
+    if not isinstance(trans, CReadableTransport):
+      self.__read = trans.readAll
+      self.__unpack = self.__unpackRead
+    elif trans.bytearray_rbuf is not None:
+      self.__read = self.__readBytearray
+      self.__unpack = self.__unpackBytearray
+    else:
+      self.__read = self.__readBuf
+      self.__unpack = self.__unpackRead
+
+  def __unpackBytearray(self, st):
+    trans = self.trans
+    pos = trans.bytearray_rpos
+    sz = st.size
+    if trans.bytearray_rend - pos < sz:
+      trans.bytearray_refill(sz)
+      pos = trans.bytearray_rpos
+    trans.bytearray_rpos = pos + sz
+    return st.unpack_from(trans.bytearray_rbuf, pos)
+
+  def __unpackRead(self, st):
+    return st.unpack(self.__read(st.size))
+
+  def __readBytearray(self, sz):
+    trans = self.trans
+    pos = trans.bytearray_rpos
+    if trans.bytearray_rend - pos < sz:
+      # The refill can move the unread data or replace the buffer.
+      trans.bytearray_refill(sz)
+      pos = trans.bytearray_rpos
+    trans.bytearray_rpos = pos + sz
+    return str(buffer(trans.bytearray_rbuf, pos, sz))
+
+  def __readBuf(self, sz):
+    buff = self.trans.cstringio_buf.read(sz)
+    if len(buff) < sz:
+      buff = self.trans.cstringio_refill(buff, sz).read(sz)
+    return buff
+
+  def writeFieldBegin(self, name, type, id):
+    self.trans.write(self._FIELD.pack(type, id))
+
+  def writeFieldStop(self):
+    self.trans.write('\x00')
+
+  def writeMapBegin(self, ktype, vtype, size):
+    self.trans.write(self._MAP.pack(ktype, vtype, size))
+
+  def writeListBegin(self, etype, size):
+    self.trans.write(self._LIST.pack(etype, size))
+
+  def writeSetBegin(self, etype, size):
+    self.trans.write(self._LIST.pack(etype, size))
+
+  def writeBool(self, bool):
+    if bool:
+      self.trans.write('\x01')
+    else:
+      self.trans.write('\x00')
+
+  def writeByte(self, byte):
+    self.trans.write(self._BYTE.pack(byte))
+
+  def writeI16(self, i16):
+    self.trans.write(self._I16.pack(i16))
+
+  def writeI32(self, i32):
+    self.trans.write(self._I32.pack(i32))
+
+  def writeI64(self, i64):
+    self.trans.write(self._I64.pack(i64))
+
+  def writeDouble(self, dub):
+    self.trans.write(self._DOUBLE.pack(dub))
+
+  def writeString(self, str):
+    self.trans.write(self._I32.pack(len(str)))
+    self.trans.write(str)
+
+  def readFieldBegin(self):
+    type, = self.__unpack(self._BYTE)
+    if type == TType.STOP:
+      return (None, type, 0)
+    id, = self.__unpack(self._I16)
+    return (None, type, id)
+
+  def readMapBegin(self):
+    return self.__unpack(self._MAP)
+
+  def readListBegin(self):
+    return self.__unpack(self._LIST)
+
+  def readSetBegin(self):
+    return self.__unpack(self._LIST)
+
+  def readBool(self):
+    val, = self.__unpack(self._BYTE)
+    return val != 0
+
+  def readByte(self):
+    val, = self.__unpack(self._BYTE)
+    return val
+
+  def readI16(self):
+    val, = self.__unpack(self._I16)
+    return val
+
+  def readI32(self):
+    val, = self.__unpack(self._I32)
+    return val
+
+  def readI64(self):
+    val, = self.__unpack(self._I64)
+    return val
+
+  def readDouble(self):
+    val, = self.__unpack(self._DOUBLE)
+    return val
+
+  def readString(self):
+    len, = self.__unpack(self._I32)
+    if len < 0:
+      raise TProtocolException(type=TProtocolException.NEGATIVE_SIZE,
+                               message='Negative length')
+    return self.__read(len)
+
+  def readFixedValues(self, etype, size):
+    code, width = self._FIXED_FORMATS[etype]
+    if size < 0:
+      raise TProtocolException(type=TProtocolException.NEGATIVE_SIZE,
+                               message='Negative length')
+    return list(self.__unpack(Struct('!%d%s' % (size, code))))
+
+
+class TBinaryProtocolOptimizedFactory:
+  def __init__(self, strictRead=False, strictWrite=True):
+    self.strictRead = strictRead
+    self.strictWrite = strictWrite
+
+  def getProtocol(self, trans):
+    return TBinaryProtocolOptimized(trans, self.strictRead, self.strictWrite)
+
+
+class TBinaryProtocolAccelerated(TBinaryProtocol):
+
+  """C-Accelerated version of TBinaryProtocol.
+
+  Apart from skip and the whole-message methods, this class does not
+  override any of TBinaryProtocol's methods, but the generated code
+  recognizes it directly and will call into our C module to do the
+  encoding, bypassing this object entirely.
+  We inherit from TBinaryProtocol so that the normal TBinaryProtocol
+  encoding can happen if the fastbinary module doesn't work for some
+  reason.  (TODO(dreiss): Make this happen sanely in more cases.)
+
+  In order to take advantage of the C module, just use
+  TBinaryProtocolAccelerated instead of TBinaryProtocol.
+
+  NOTE:  This code was contributed by an external developer.
+         The internal Thrift team has reviewed and tested it,
+         but we cannot guarantee that it is production-ready.
+         Please feel free to report bugs and/or success stories
+         to the public mailing list.
+  """
+
+  def skip(self, type):
+    # Skipping in C saves building values only to throw them away, and
+    # steps over fixed-width containers in one go.
+    if fastbinary is not None and isinstance(self.trans, CReadableTransport):
+      fastbinary.skip_binary(self.trans, type)
+    else:
+      TBinaryProtocol.skip(self, type)
+
+  # The generated Client and Processor read and write messages with these,
+  # so a call or reply takes one trip into C.
+
+  def writeMessage(self, name, type, seqid, obj):
+    if (self.strictWrite and fastbinary is not None
+        and getattr(obj, 'thrift_spec', None) is not None):
+      fastbinary.encode_binary_message(self.trans, name, type, seqid, obj,
+                                       (obj.__class__, obj.thrift_spec))
+    else:
+      TBinaryProtocol.writeMessage(self, name, type, seqid, obj)
+
+  def readMessageBegin(self):
+    if fastbinary is not None and isinstance(self.trans, CReadableTransport):
+      return fastbinary.decode_binary_message(self.trans, None, None, None,
+                                              self.strictRead)[:3]
+    return TBinaryProtocol.readMessageBegin(self)
+
+  def readMessage(self, obj):
+    if (fastbinary is not None and isinstance(self.trans, CReadableTransport)
+        and getattr(obj, 'thrift_spec', None) is not None):
+      return fastbinary.decode_binary_message(self.trans, obj,
+                                              (obj.__class__, obj.thrift_spec),
+                                              _EXCEPTION_ARGS, self.strictRead)
+    return TBinaryProtocol.readMessage(self, obj)
+
+_EXCEPTION_ARGS = (TApplicationException, TApplicationException.thrift_spec)
+
+
+class TBinaryProtocolAcceleratedFactory:
+  def getProtocol(self, trans):
+    return TBinaryProtocolAccelerated(trans)
@@ -0,0 +1,846 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements. See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License. You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from TProtocol import *
+import re
+
+try:
+  import json
+except ImportError:
+  try:
+    import simplejson as json
+  except ImportError:
+    json = None
+
+__all__ = ['TJSONProtocol', 'TJSONProtocolFactory',
+           'TJSONProtocolAccelerated', 'TJSONProtocolAcceleratedFactory']
+
+VERSION = 1
+
+COMMA = ','
+COLON = ':'
+LBRACE = '{'
+RBRACE = '}'
+LBRACKET = '['
+RBRACKET = ']'
+QUOTE = '"'
+BACKSLASH = '\\'
+
+NAN = 'NaN'
+INFINITY = 'Infinity'
+NEG_INFINITY = '-Infinity'
+
+JTYPES = {TType.BOOL: 'tf',
+          TType.BYTE: 'i8',
+          TType.I16: 'i16',
+          TType.I32: 'i32',
+          TType.I64: 'i64',
+          TType.DOUBLE: 'dbl',
+          TType.STRING: 'str',
+          TType.STRUCT: 'rec',
+          TType.MAP: 'map',
+          TType.LIST: 'lst',
+          TType.SET: 'set',
+          }
+
+TTYPES = {}
+for k, v in JTYPES.items():
+  TTYPES[v] = k
+del k
+del v
+
+INT_TYPES = (TType.BYTE, TType.I16, TType.I32, TType.I64)
+
+NUMERIC_CHARS = '+-.0123456789Ee'
+
+ESCAPE_RE = re.compile(r'[\x00-\x1f"\\]')
+ESCAPES = {'"': '\\"',
+           '\\': '\\\\',
+           '\b': '\\b',
+           '\f': '\\f',
+           '\n': '\\n',
+           '\r': '\\r',
+           '\t': '\\t',
+           }
+for i in range(0x20):
+  ESCAPES.setdefault(chr(i), '\\u%04x' % i)
+del i
+
+UNESCAPES = {'"': '"',
+             '\\': '\\',
+             '/': '/',
+             'b': '\b',
+             'f': '\f',
+             'n': '\n',
+             'r': '\r',
+             't': '\t',
+             }
+
+def getTypeName(ttype):
+  try:
+    return JTYPES[ttype]
+  except KeyError:
+    raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                             message='Unrecognized type %d' % ttype)
+
+def getTType(name):
+  try:
+    return TTYPES[name]
+  except KeyError:
+    raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                             message='Unrecognized type name %r' % name)
+
+def quote(str):
+  """Quotes a Thrift string the way the C++ TJSONProtocol does.
+
+  Thrift strings are byte strings, so anything outside of the control
+  characters, the quote and the backslash is written through untouched.
+  """
+  if isinstance(str, unicode):
+    str = str.encode('utf-8')
+  if ESCAPE_RE.search(str) is None:
+    return QUOTE + str + QUOTE
+  return QUOTE + ESCAPE_RE.sub(lambda m: ESCAPES[m.group(0)], str) + QUOTE
+
+def formatDouble(dub):
+  """Returns (text, special) for a double.
+
+  special is true for NaN and the infinities, which must always be quoted.
+  """
+  if dub != dub:
+    return NAN, True
+  if dub == float('inf'):
+    return INFINITY, True
+  if dub == float('-inf'):
+    return NEG_INFINITY, True
+  return repr(float(dub)), False
+
+def parseDouble(str):
+  if str == NAN:
+    return float('nan')
+  if str == INFINITY:
+    return float('inf')
+  if str == NEG_INFINITY:
+    return float('-inf')
+  return float(str)
+
+
+class JSONBaseContext:
+
+  """Context for a top-level value.  Writes and reads nothing."""
+
+  def __init__(self, protocol):
+    self.protocol = protocol
+    self.first = True
+
+  def write(self):
+    pass
+
+  def read(self):
+    pass
+
+  def escapeNum(self):
+    return False
+
+
+class JSONListContext(JSONBaseContext):
+
+  def write(self):
+    if self.first:
+      self.first = False
+    else:
+      self.protocol.trans.write(COMMA)
+
+  def read(self):
+    if self.first:
+      self.first = False
+    else:
+      self.protocol.readJSONSyntaxChar(COMMA)
+
+
+class JSONPairContext(JSONBaseContext):
+
+  def __init__(self, protocol):
+    JSONBaseContext.__init__(self, protocol)
+    self.colon = True
+
+  def write(self):
+    if self.first:
+      self.first = False
+      self.colon = True
+    else:
+      if self.colon:
+        self.protocol.trans.write(COLON)
+      else:
+        self.protocol.trans.write(COMMA)
+      self.colon = not self.colon
+
+  def read(self):
+    if self.first:
+      self.first = False
+      self.colon = True
+    else:
+      if self.colon:
+        self.protocol.readJSONSyntaxChar(COLON)
+      else:
+        self.protocol.readJSONSyntaxChar(COMMA)
+      self.colon = not self.colon
+
+  # Numbers must be turned into strings if they are the key part of a pair
+  def escapeNum(self):
+    return self.colon
+
+
+class TJSONProtocol(TProtocolBase):
+
+  """JSON implementation of the Thrift protocol driver.
+
+  Wire-compatible with the C++ TJSONProtocol.  Structs are JSON objects
+  keyed by field id, each value wrapped in a one-entry object keyed by a
+  short type name ("i32", "str", "rec", ...).  Lists and sets are arrays
+  led by the element type name and the count; maps are arrays of the key
+  and value type names, the count and an object holding the pairs.
+  Messages are arrays of the version, name, type and sequence id followed
+  by the arguments.
+
+  The generated code does not tell strings and binary fields apart, so
+  binary fields are written as plain JSON strings rather than base64.
+  """
+
+  def __init__(self, trans):
+    TProtocolBase.__init__(self, trans)
+    self.__contexts = []
+    self.__context = JSONBaseContext(self)
+    self.__peeked = ''
+    # How many structs are being read token by token.
+    self.__tokenDepth = 0
+
+  def __pushContext(self, ctx):
+    self.__contexts.append(self.__context)
+    self.__context = ctx
+
+  def __popContext(self):
+    self.__context = self.__contexts.pop()
+
+  def __readChar(self):
+    if self.__peeked:
+      ch = self.__peeked
+      self.__peeked = ''
+      return ch
+    return self.trans.readAll(1)
+
+  def __peekChar(self):
+    if not self.__peeked:
+      self.__peeked = self.trans.readAll(1)
+    return self.__peeked
+
+  def writeJSONString(self, str):
+    self.__context.write()
+    self.trans.write(quote(str))
+
+  def writeJSONInteger(self, num):
+    self.__context.write()
+    if self.__context.escapeNum():
+      self.trans.write('"%d"' % num)
+    else:
+      self.trans.write('%d' % num)
+
+  def writeJSONDouble(self, dub):
+    self.__context.write()
+    val, special = formatDouble(dub)
+    if special or self.__context.escapeNum():
+      self.trans.write(QUOTE + val + QUOTE)
+    else:
+      self.trans.write(val)
+
+  def writeJSONObjectStart(self):
+    self.__context.write()
+    self.trans.write(LBRACE)
+    self.__pushContext(JSONPairContext(self))
+
+  def writeJSONObjectEnd(self):
+    self.__popContext()
+    self.trans.write(RBRACE)
+
+  def writeJSONArrayStart(self):
+    self.__context.write()
+    self.trans.write(LBRACKET)
+    self.__pushContext(JSONListContext(self))
+
+  def writeJSONArrayEnd(self):
+    self.__popContext()
+    self.trans.write(RBRACKET)
+
+  def writeMessageBegin(self, name, type, seqid):
+    self.writeJSONArrayStart()
+    self.writeJSONInteger(VERSION)
+    self.writeJSONString(name)
+    self.writeJSONInteger(type)
+    self.writeJSONInteger(seqid)
+
+  def writeMessageEnd(self):
+    self.writeJSONArrayEnd()
+
+  def writeStructBegin(self, name):
+    self.writeJSONObjectStart()
+
+  def writeStructEnd(self):
+    self.writeJSONObjectEnd()
+
+  def writeFieldBegin(self, name, type, id):
+    self.writeJSONInteger(id)
+    self.writeJSONObjectStart()
+    self.writeJSONString(getTypeName(type))
+
+  def writeFieldEnd(self):
+    self.writeJSONObjectEnd()
+
+  def writeFieldStop(self):
+    pass
+
+  def writeMapBegin(self, ktype, vtype, size):
+    self.writeJSONArrayStart()
+    self.writeJSONString(getTypeName(ktype))
+    self.writeJSONString(getTypeName(vtype))
+    self.writeJSONInteger(size)
+    self.writeJSONObjectStart()
+
+  def writeMapEnd(self):
+    self.writeJSONObjectEnd()
+    self.writeJSONArrayEnd()
+
+  def writeListBegin(self, etype, size):
+    self.writeJSONArrayStart()
+    self.writeJSONString(getTypeName(etype))
+    self.writeJSONInteger(size)
+
+  def writeListEnd(self):
+    self.writeJSONArrayEnd()
+
+  def writeSetBegin(self, etype, size):
+    self.writeJSONArrayStart()
+    self.writeJSONString(getTypeName(etype))
+    self.writeJSONInteger(size)
+
+  def writeSetEnd(self):
+    self.writeJSONArrayEnd()
+
+  def writeBool(self, bool):
+    if bool:
+      self.writeJSONInteger(1)
+    else:
+      self.writeJSONInteger(0)
+
+  def writeByte(self, byte):
+    self.writeJSONInteger(byte)
+
+  def writeI16(self, i16):
+    self.writeJSONInteger(i16)
+
+  def writeI32(self, i32):
+    self.writeJSONInteger(i32)
+
+  def writeI64(self, i64):
+    self.writeJSONInteger(i64)
+
+  def writeDouble(self, dub):
+    self.writeJSONDouble(dub)
+
+  def writeString(self, str):
+    self.writeJSONString(str)
+
+  def readJSONSyntaxChar(self, ch):
+    ch2 = self.__readChar()
+    if ch2 != ch:
+      raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                               message='Expected %r; got %r' % (ch, ch2))
+
+  def readJSONString(self, skipContext=False):
+    if not skipContext:
+      self.__context.read()
+    self.readJSONSyntaxChar(QUOTE)
+    chars = []
+    while True:
+      ch = self.__readChar()
+      if ch == QUOTE:
+        break
+      if ch == BACKSLASH:
+        ch = self.__readChar()
+        if ch == 'u':
+          hex = self.trans.readAll(4)
+          try:
+            ch = chr(int(hex, 16))
+          except ValueError:
+            raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                                     message='Bad escape \\u%s' % hex)
+        elif ch in UNESCAPES:
+          ch = UNESCAPES[ch]
+        else:
+          raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                                   message='Expected control char; got %r' % ch)
+      chars.append(ch)
+    return ''.join(chars)
+
+  def readJSONNumericChars(self):
+    chars = []
+    while self.__peekChar() in NUMERIC_CHARS:
+      chars.append(self.__readChar())
+    return ''.join(chars)
+
+  def readJSONInteger(self):
+    self.__context.read()
+    if self.__context.escapeNum():
+      self.readJSONSyntaxChar(QUOTE)
+    str = self.readJSONNumericChars()
+    try:
+      num = int(str)
+    except ValueError:
+      raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                               message='Expected numeric value; got %r' % str)
+    if self.__context.escapeNum():
+      self.readJSONSyntaxChar(QUOTE)
+    return num
+
+  def readJSONDouble(self):
+    self.__context.read()
+    if self.__peekChar() == QUOTE:
+      str = self.readJSONString(True)
+      if (str not in (NAN, INFINITY, NEG_INFINITY) and
+          not self.__context.escapeNum()):
+        raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                                 message='Numeric data unexpectedly quoted')
+    else:
+      if self.__context.escapeNum():
+        # This will raise - we should have had a quote here
+        self.readJSONSyntaxChar(QUOTE)
+      str = self.readJSONNumericChars()
+    try:
+      return parseDouble(str)
+    except ValueError:
+      raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                               message='Expected numeric value; got %r' % str)
+
+  def readJSONObjectStart(self, skipContext=False):
+    if not skipContext:
+      self.__context.read()
+    self.readJSONSyntaxChar(LBRACE)
+    self.__pushContext(JSONPairContext(self))
+
+  def readJSONObjectEnd(self):
+    self.readJSONSyntaxChar(RBRACE)
+    self.__popContext()
+
+  def readJSONArrayStart(self):
+    self.__context.read()
+    self.readJSONSyntaxChar(LBRACKET)
+    self.__pushContext(JSONListContext(self))
+
+  def readJSONArrayEnd(self):
+    self.readJSONSyntaxChar(RBRACKET)
+    self.__popContext()
+
+  def readMessageBegin(self):
+    self.readJSONArrayStart()
+    version = self.readJSONInteger()
+    if version != VERSION:
+      raise TProtocolException(type=TProtocolException.BAD_VERSION,
+                               message='Message contained bad version.')
+    name = self.readJSONString()
+    type = self.readJSONInteger()
+    seqid = self.readJSONInteger()
+    return (name, type, seqid)
+
+  def readMessageEnd(self):
+    self.readJSONArrayEnd()
+
+  def readStructBegin(self):
+    self.readJSONObjectStart()
+
+  def readStructEnd(self):
+    self.readJSONObjectEnd()
+
+  def readFieldBegin(self):
+    if self.__peekChar() == RBRACE:
+      return (None, TType.STOP, 0)
+    id = self.readJSONInteger()
+    self.readJSONObjectStart()
+    type = getTType(self.readJSONString())
+    return (None, type, id)
+
+  def readFieldEnd(self):
+    self.readJSONObjectEnd()
+
+  def readMapBegin(self):
+    self.readJSONArrayStart()
+    ktype = getTType(self.readJSONString())
+    vtype = getTType(self.readJSONString())
+    size = self.readJSONInteger()
+    self.readJSONObjectStart()
+    return (ktype, vtype, size)
+
+  def readMapEnd(self):
+    self.readJSONObjectEnd()
+    self.readJSONArrayEnd()
+
+  def readListBegin(self):
+    self.readJSONArrayStart()
+    etype = getTType(self.readJSONString())
+    size = self.readJSONInteger()
+    return (etype, size)
+
+  def readListEnd(self):
+    self.readJSONArrayEnd()
+
+  def readSetBegin(self):
+    self.readJSONArrayStart()
+    etype = getTType(self.readJSONString())
+    size = self.readJSONInteger()
+    return (etype, size)
+
+  def readSetEnd(self):
+    self.readJSONArrayEnd()
+
+  def readBool(self):
+    return self.readJSONInteger() != 0
+
+  def readByte(self):
+    return self.readJSONInteger()
+
+  def readI16(self):
+    return self.readJSONInteger()
+
+  def readI32(self):
+    return self.readJSONInteger()
+
+  def readI64(self):
+    return self.readJSONInteger()
+
+  def readDouble(self):
+    return self.readJSONDouble()
+
+  def readString(self):
+    return self.readJSONString()
+
+  def writeStruct(self, obj, spec):
+    """Writes a whole struct described by spec = (class, thrift_spec).
+
+    The JSON text is built straight from the thrift_spec and written in a
+    single call rather than token by token.  The output is identical to
+    what obj.write() would produce with the token-level methods.
+    """
+    self.__context.write()
+    out = []
+    _writeStruct(out, obj, spec[1])
+    self.trans.write(''.join(out))
+
+  def readStruct(self, obj, spec):
+    """Reads a whole struct described by spec = (class, thrift_spec).
+
+    The struct is gathered in the transport's read buffer (see
+    TTransport.CReadableTransport), copied out and parsed in one go with
+    the json module.  If that fails, it is read token by token, and so are
+    the structs inside it: trying the json module again for each of them
+    would only go over the same data again.
+    """
+    self.__context.read()
+    trans = self.trans
+    if json is not None and self.__tokenDepth == 0 and self.__peekChar() == LBRACE:
+      if trans.bytearray_rbuf is not None:
+        # Scan for the closing brace, refilling as long as it isn't
+        # there, and copy out only the struct.
+        scanned = 0
+        depth = 1
+        instring = False
+        while True:
+          pos = trans.bytearray_rpos
+          scanned, depth, instring = _scanObject(
+            trans.bytearray_rbuf, pos + scanned, trans.bytearray_rend,
+            depth, instring)
+          scanned -= pos
+          if depth == 0:
+            break
+          trans.bytearray_refill(trans.bytearray_rend - pos + 1)
+        data = LBRACE + str(buffer(trans.bytearray_rbuf, pos, scanned))
+      else:
+        buf = trans.cstringio_buf
+        pos = buf.tell()
+        data = LBRACE + buf.read()
+      try:
+        tree, end = _decoder.raw_decode(data.decode('latin-1'))
+      except ValueError:
+        # Not something the json module can parse (e.g. a map keyed by
+        # structs), or not all in a cstringio_buf.  Put the data back and
+        # fall through to the token-level reader.
+        if trans.bytearray_rbuf is None:
+          buf.seek(pos)
+      else:
+        pos += end - len(self.__peeked)
+        if trans.bytearray_rbuf is not None:
+          trans.bytearray_rpos = pos
+        else:
+          buf.seek(pos)
+        self.__peeked = ''
+        try:
+          _readStruct(obj, tree, spec[1])
+        except (TypeError, ValueError, KeyError, IndexError, AttributeError), e:
+          raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                                   message='Bad JSON struct: %s' % e)
+        return
+    self.readJSONObjectStart(True)
+    self.__tokenDepth += 1
+    try:
+      self.__readFields(obj, spec[1])
+    finally:
+      self.__tokenDepth -= 1
+
+  def __readFields(self, obj, thrift_spec):
+    while True:
+      (fname, ftype, fid) = self.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if 0 <= fid < len(thrift_spec):
+        field = thrift_spec[fid]
+      else:
+        field = None
+      if field is not None and field[1] == ftype:
+        setattr(obj, field[2], self.__readValue(ftype, field[3]))
+      else:
+        self.skip(ftype)
+      self.readFieldEnd()
+    self.readStructEnd()
+
+  def __readValue(self, ttype, args):
+    if ttype == TType.STRUCT:
+      obj = args[0]()
+      obj.read(self)
+      return obj
+    elif ttype == TType.LIST:
+      (etype, size) = self.readListBegin()
+      result = [self.__readValue(args[0], args[1]) for i in xrange(size)]
+      self.readListEnd()
+      return result
+    elif ttype == TType.SET:
+      (etype, size) = self.readSetBegin()
+      result = set([self.__readValue(args[0], args[1]) for i in xrange(size)])
+      self.readSetEnd()
+      return result
+    elif ttype == TType.MAP:
+      (ktype, vtype, size) = self.readMapBegin()
+      result = {}
+      for i in xrange(size):
+        key = self.__readValue(args[0], args[1])
+        result[key] = self.__readValue(args[2], args[3])
+      self.readMapEnd()
+      return result
+    elif ttype == TType.BOOL:
+      return self.readBool()
+    elif ttype == TType.DOUBLE:
+      return self.readDouble()
+    elif ttype == TType.STRING:
+      return self.readString()
+    else:
+      return self.readJSONInteger()
+
+
+# Spec-driven helpers for writeStruct/readStruct.  These follow the same
+# (class, thrift_spec) layout as fastbinary.
+
+def _writeStruct(out, obj, thrift_spec):
+  out.append(LBRACE)
+  sep = ''
+  for field in thrift_spec:
+    if field is None:
+      continue
+    (fid, ftype, fname, fargs, fdefault) = field
+    val = getattr(obj, fname)
+    if val is None:
+      continue
+    out.append('%s"%d":{"%s":' % (sep, fid, getTypeName(ftype)))
+    _writeValue(out, ftype, fargs, val)
+    out.append(RBRACE)
+    sep = COMMA
+  out.append(RBRACE)
+
+def _writeValue(out, ttype, args, val):
+  if ttype == TType.STRING:
+    out.append(quote(val))
+  elif ttype in INT_TYPES:
+    out.append('%d' % val)
+  elif ttype == TType.BOOL:
+    if val:
+      out.append('1')
+    else:
+      out.append('0')
+  elif ttype == TType.DOUBLE:
+    str, special = formatDouble(val)
+    if special:
+      str = QUOTE + str + QUOTE
+    out.append(str)
+  elif ttype == TType.STRUCT:
+    _writeStruct(out, val, args[1])
+  elif ttype == TType.LIST or ttype == TType.SET:
+    (etype, eargs) = args
+    out.append('["%s",%d' % (getTypeName(etype), len(val)))
+    for elem in val:
+      out.append(COMMA)
+      _writeValue(out, etype, eargs, elem)
+    out.append(RBRACKET)
+  elif ttype == TType.MAP:
+    (ktype, kargs, vtype, vargs) = args
+    out.append('["%s","%s",%d,{' % (getTypeName(ktype), getTypeName(vtype),
+                                    len(val)))
+    sep = ''
+    for k, v in val.iteritems():
+      out.append(sep)
+      _writeKey(out, ktype, kargs, k)
+      out.append(COLON)
+      _writeValue(out, vtype, vargs, v)
+      sep = COMMA
+    out.append('}]')
+  else:
+    raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                             message='Unrecognized type %d' % ttype)
+
+def _writeKey(out, ttype, args, key):
+  # Map keys are in "escapeNum" position, so numbers are quoted.
+  if ttype in INT_TYPES:
+    out.append('"%d"' % key)
+  elif ttype == TType.BOOL:
+    if key:
+      out.append('"1"')
+    else:
+      out.append('"0"')
+  elif ttype == TType.DOUBLE:
+    out.append(QUOTE + formatDouble(key)[0] + QUOTE)
+  else:
+    _writeValue(out, ttype, args, key)
+
+if json is not None:
+  _decoder = json.JSONDecoder()
+
+# A string, the start of one that isn't all there, or a brace outside of
+# strings.
+_OBJECT_TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|(")|(\{)|(\})')
+# The rest of a string, up to and including the closing quote if it's there.
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*(")?')
+
+def _scanObject(buf, pos, end, depth, instring):
+  """Scans buf[pos:end], depth braces into a JSON object and inside a
+  string if instring, for the end of the object.  Returns where it ends
+  and a depth of 0, or, if it doesn't end there, where to go on scanning
+  from and the depth and instring there."""
+  if instring:
+    m = _STRING_REST.match(buf, pos, end)
+    if m.group(1) is None:
+      return m.end(), depth, True
+    pos = m.end()
+  for m in _OBJECT_TOKENS.finditer(buf, pos, end):
+    group = m.lastindex
+    if group == 1:
+      return _scanObject(buf, m.end(), end, depth, True)
+    elif group == 2:
+      depth += 1
+    elif group == 3:
+      depth -= 1
+      if depth == 0:
+        return m.end(), 0, False
+  return end, depth, False
+
+def _readStruct(obj, tree, thrift_spec):
+  for key, wrapper in tree.iteritems():
+    fid = int(key)
+    ((tname, val),) = wrapper.items()
+    ftype = getTType(tname)
+    if 0 <= fid < len(thrift_spec):
+      field = thrift_spec[fid]
+      if field is not None and field[1] == ftype:
+        setattr(obj, field[2], _readValue(ftype, field[3], val))
+
+def _readValue(ttype, args, val):
+  if ttype == TType.STRING:
+    return val.encode('latin-1')
+  elif ttype in INT_TYPES:
+    if not isinstance(val, (int, long)):
+      raise TypeError('expected an integer; got %r' % val)
+    return val
+  elif ttype == TType.BOOL:
+    if not isinstance(val, (int, long)):
+      raise TypeError('expected an integer; got %r' % val)
+    return val != 0
+  elif ttype == TType.DOUBLE:
+    if isinstance(val, basestring):
+      return parseDouble(val)
+    return float(val)
+  elif ttype == TType.STRUCT:
+    obj = args[0]()
+    _readStruct(obj, val, args[1])
+    return obj
+  elif ttype == TType.LIST or ttype == TType.SET:
+    (etype, eargs) = args
+    if len(val) != val[1] + 2:
+      raise ValueError('container size mismatch')
+    result = [_readValue(etype, eargs, elem) for elem in val[2:]]
+    if ttype == TType.SET:
+      result = set(result)
+    return result
+  elif ttype == TType.MAP:
+    (ktype, kargs, vtype, vargs) = args
+    pairs = val[3]
+    if len(pairs) != val[2]:
+      raise ValueError('container size mismatch')
+    result = {}
+    for k, v in pairs.iteritems():
+      result[_readKey(ktype, kargs, k)] = _readValue(vtype, vargs, v)
+    return result
+  raise TypeError('unrecognized type %d' % ttype)
+
+def _readKey(ttype, args, key):
+  if ttype in INT_TYPES:
+    return int(key)
+  elif ttype == TType.BOOL:
+    return int(key) != 0
+  elif ttype == TType.DOUBLE:
+    return parseDouble(key)
+  return _readValue(ttype, args, key)
+
+
+class TJSONProtocolFactory:
+  def __init__(self):
+    pass
+
+  def getProtocol(self, trans):
+    return TJSONProtocol(trans)
+
+
+class TJSONProtocolAccelerated(TJSONProtocol):
+
+  """Faster version of TJSONProtocol.
+
+  Like TBinaryProtocolAccelerated, this class does not override any of
+  TJSONProtocol's methods.  The generated code recognizes it and hands
+  whole structs to writeStruct/readStruct, which work from the struct's
+  thrift_spec instead of going through the per-token methods.
+  """
+
+  pass
+
+
+class TJSONProtocolAcceleratedFactory:
+  def getProtocol(self, trans):
+    return TJSONProtocolAccelerated(trans)
@@ -78,6 +78,13 @@ class TApplicationException(TException):
   BAD_SEQUENCE_ID = 4
   MISSING_RESULT = 5
 
+  # For the accelerated protocols; read and write don't use it.
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'message', None, None, ), # 1
+    (2, TType.I32, 'type', None, None, ), # 2
+  )
+
   def __init__(self, type=UNKNOWN, message=None):
     TException.__init__(self, message)
     self.type = type
@@ -0,0 +1,388 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements. See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License. You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from TProtocol import *
+from struct import pack, unpack
+from thrift.transport.TTransport import CReadableTransport
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+__all__ = ['TCompactProtocol', 'TCompactProtocolFactory',
+           'TCompactProtocolAccelerated', 'TCompactProtocolAcceleratedFactory']
+
+class CompactType:
+  STOP = 0x00
+  TRUE = 0x01
+  FALSE = 0x02
+  BYTE = 0x03
+  I16 = 0x04
+  I32 = 0x05
+  I64 = 0x06
+  DOUBLE = 0x07
+  BINARY = 0x08
+  LIST = 0x09
+  SET = 0x0A
+  MAP = 0x0B
+  STRUCT = 0x0C
+
+CTYPES = {TType.STOP: CompactType.STOP,
+          TType.BOOL: CompactType.TRUE, # used for collection
+          TType.BYTE: CompactType.BYTE,
+          TType.I16: CompactType.I16,
+          TType.I32: CompactType.I32,
+          TType.I64: CompactType.I64,
+          TType.DOUBLE: CompactType.DOUBLE,
+          TType.STRING: CompactType.BINARY,
+          TType.STRUCT: CompactType.STRUCT,
+          TType.LIST: CompactType.LIST,
+          TType.SET: CompactType.SET,
+          TType.MAP: CompactType.MAP,
+          }
+
+TTYPES = {}
+for k, v in CTYPES.items():
+  TTYPES[v] = k
+TTYPES[CompactType.FALSE] = TType.BOOL
+del k
+del v
+
+def makeZigZag(n, bits):
+  return (n << 1) ^ (n >> (bits - 1))
+
+def fromZigZag(n):
+  return (n >> 1) ^ -(n & 1)
+
+def writeVarint(trans, n):
+  out = []
+  while True:
+    if n & ~0x7f == 0:
+      out.append(n)
+      break
+    else:
+      out.append((n & 0x7f) | 0x80)
+      n = n >> 7
+  trans.write(''.join(map(chr, out)))
+
+def readVarint(trans):
+  result = 0
+  shift = 0
+  while True:
+    x = trans.readAll(1)
+    byte = ord(x)
+    result |= (byte & 0x7f) << shift
+    if byte >> 7 == 0:
+      return result
+    shift += 7
+    if shift >= 70:
+      raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                               message='Variable-length int over 10 bytes.')
+
+
+class TCompactProtocol(TProtocolBase):
+
+  """Compact implementation of the Thrift protocol driver.
+
+  Wire-compatible with the C++ TCompactProtocol: integers are written as
+  zigzag varints, field ids as deltas from the previous field where
+  possible, and boolean field values are folded into the field header.
+  """
+
+  PROTOCOL_ID = 0x82
+  VERSION = 1
+  VERSION_MASK = 0x1f
+  TYPE_MASK = 0xe0
+  TYPE_BITS = 0x07
+  TYPE_SHIFT_AMOUNT = 5
+
+  def __init__(self, trans):
+    TProtocolBase.__init__(self, trans)
+    self.__last_fid = 0
+    self.__structs = []
+    self.__bool_fid = None
+    self.__bool_value = None
+
+  def __writeByte(self, byte):
+    self.trans.write(pack('!B', byte & 0xff))
+
+  def __writeVarint(self, n):
+    writeVarint(self.trans, n)
+
+  def __writeSize(self, i32):
+    self.__writeVarint(i32)
+
+  def __writeFieldHeader(self, ctype, fid):
+    delta = fid - self.__last_fid
+    if 0 < delta <= 15:
+      self.__writeByte(delta << 4 | ctype)
+    else:
+      self.__writeByte(ctype)
+      self.writeI16(fid)
+    self.__last_fid = fid
+
+  def __writeCollectionBegin(self, etype, size):
+    if size <= 14:
+      self.__writeByte(size << 4 | CTYPES[etype])
+    else:
+      self.__writeByte(0xf0 | CTYPES[etype])
+      self.__writeSize(size)
+
+  def writeMessageBegin(self, name, type, seqid):
+    self.__writeByte(TCompactProtocol.PROTOCOL_ID)
+    self.__writeByte(TCompactProtocol.VERSION |
+                     (type << TCompactProtocol.TYPE_SHIFT_AMOUNT))
+    self.__writeVarint(seqid & 0xffffffff)
+    self.writeString(name)
+
+  def writeMessageEnd(self):
+    pass
+
+  def writeStructBegin(self, name):
+    self.__structs.append(self.__last_fid)
+    self.__last_fid = 0
+
+  def writeStructEnd(self):
+    self.__last_fid = self.__structs.pop()
+
+  def writeFieldBegin(self, name, type, id):
+    if type == TType.BOOL:
+      self.__bool_fid = id
+    else:
+      self.__writeFieldHeader(CTYPES[type], id)
+
+  def writeFieldEnd(self):
+    pass
+
+  def writeFieldStop(self):
+    self.__writeByte(TType.STOP)
+
+  def writeMapBegin(self, ktype, vtype, size):
+    if size == 0:
+      self.__writeByte(0)
+    else:
+      self.__writeSize(size)
+      self.__writeByte(CTYPES[ktype] << 4 | CTYPES[vtype])
+
+  def writeMapEnd(self):
+    pass
+
+  def writeListBegin(self, etype, size):
+    self.__writeCollectionBegin(etype, size)
+
+  def writeListEnd(self):
+    pass
+
+  def writeSetBegin(self, etype, size):
+    self.__writeCollectionBegin(etype, size)
+
+  def writeSetEnd(self):
+    pass
+
+  def writeBool(self, bool):
+    if bool:
+      ctype = CompactType.TRUE
+    else:
+      ctype = CompactType.FALSE
+    if self.__bool_fid is not None:
+      self.__writeFieldHeader(ctype, self.__bool_fid)
+      self.__bool_fid = None
+    else:
+      self.__writeByte(ctype)
+
+  def writeByte(self, byte):
+    self.trans.write(pack('!b', byte))
+
+  def writeI16(self, i16):
+    self.__writeVarint(makeZigZag(i16, 32) & 0xffffffff)
+
+  def writeI32(self, i32):
+    self.__writeVarint(makeZigZag(i32, 32) & 0xffffffff)
+
+  def writeI64(self, i64):
+    self.__writeVarint(makeZigZag(i64, 64) & 0xffffffffffffffff)
+
+  def writeDouble(self, dub):
+    self.trans.write(pack('<d', dub))
+
+  def writeString(self, str):
+    self.__writeSize(len(str))
+    self.trans.write(str)
+
+  def __readByte(self):
+    result, = unpack('!B', self.trans.readAll(1))
+    return result
+
+  def __readVarint(self):
+    return readVarint(self.trans)
+
+  def __readSize(self):
+    result = self.__readVarint()
+    if result > 0x7fffffff:
+      raise TProtocolException(type=TProtocolException.NEGATIVE_SIZE,
+                               message='Negative length')
+    return result
+
+  def __getTType(self, byte):
+    try:
+      return TTYPES[byte & 0x0f]
+    except KeyError:
+      raise TProtocolException(type=TProtocolException.INVALID_DATA,
+                               message='Unknown compact type %d' % (byte & 0x0f))
+
+  def __readCollectionBegin(self):
+    size_type = self.__readByte()
+    size = size_type >> 4
+    type = self.__getTType(size_type)
+    if size == 15:
+      size = self.__readSize()
+    return type, size
+
+  def readMessageBegin(self):
+    proto_id = self.__readByte()
+    if proto_id != TCompactProtocol.PROTOCOL_ID:
+      raise TProtocolException(type=TProtocolException.BAD_VERSION,
+                               message='Bad protocol id in the message: %d' % proto_id)
+    ver_type = self.__readByte()
+    type = (ver_type >> TCompactProtocol.TYPE_SHIFT_AMOUNT) & TCompactProtocol.TYPE_BITS
+    version = ver_type & TCompactProtocol.VERSION_MASK
+    if version != TCompactProtocol.VERSION:
+      raise TProtocolException(type=TProtocolException.BAD_VERSION,
+                               message='Bad version: %d (expect %d)' % (version, TCompactProtocol.VERSION))
+    seqid = self.__readVarint()
+    if seqid > 0x7fffffff:
+      seqid -= 0x100000000
+    name = self.readString()
+    return (name, type, seqid)
+
+  def readMessageEnd(self):
+    pass
+
+  def readStructBegin(self):
+    self.__structs.append(self.__last_fid)
+    self.__last_fid = 0
+
+  def readStructEnd(self):
+    self.__last_fid = self.__structs.pop()
+
+  def readFieldBegin(self):
+    byte = self.__readByte()
+    ctype = byte & 0x0f
+    if ctype == CompactType.STOP:
+      return (None, TType.STOP, 0)
+    delta = byte >> 4
+    if delta == 0:
+      fid = self.readI16()
+    else:
+      fid = self.__last_fid + delta
+    self.__last_fid = fid
+    type = self.__getTType(ctype)
+    if ctype == CompactType.TRUE:
+      self.__bool_value = True
+    elif ctype == CompactType.FALSE:
+      self.__bool_value = False
+    return (None, type, fid)
+
+  def readFieldEnd(self):
+    pass
+
+  def readMapBegin(self):
+    size = self.__readSize()
+    types = 0
+    if size > 0:
+      types = self.__readByte()
+    vtype = self.__getTType(types)
+    ktype = self.__getTType(types >> 4)
+    return (ktype, vtype, size)
+
+  def readMapEnd(self):
+    pass
+
+  def readListBegin(self):
+    return self.__readCollectionBegin()
+
+  def readListEnd(self):
+    pass
+
+  def readSetBegin(self):
+    return self.__readCollectionBegin()
+
+  def readSetEnd(self):
+    pass
+
+  def readBool(self):
+    if self.__bool_value is not None:
+      result = self.__bool_value
+      self.__bool_value = None
+      return result
+    return self.__readByte() == CompactType.TRUE
+
+  def readByte(self):
+    result, = unpack('!b', self.trans.readAll(1))
+    return result
+
+  def readI16(self):
+    return fromZigZag(self.__readVarint())
+
+  def readI32(self):
+    return fromZigZag(self.__readVarint())
+
+  def readI64(self):
+    return fromZigZag(self.__readVarint())
+
+  def readDouble(self):
+    buff = self.trans.readAll(8)
+    val, = unpack('<d', buff)
+    return val
+
+  def readString(self):
+    len = self.__readSize()
+    return self.trans.readAll(len)
+
+
+class TCompactProtocolFactory:
+  def __init__(self):
+    pass
+
+  def getProtocol(self, trans):
+    return TCompactProtocol(trans)
+
+
+class TCompactProtocolAccelerated(TCompactProtocol):
+
+  """C-Accelerated version of TCompactProtocol.
+
+  Like TBinaryProtocolAccelerated, this class only overrides skip.  The
+  generated code recognizes it and calls fastbinary.encode_compact/
+  decode_compact for whole structs, falling back to the pure-Python
+  encoding if the fastbinary module is unavailable.
+  """
+
+  def skip(self, type):
+    # A boolean field's value lives in the field header we already read.
+    if (type != TType.BOOL and fastbinary is not None and
+        isinstance(self.trans, CReadableTransport)):
+      fastbinary.skip_compact(self.trans, type)
+    else:
+      TCompactProtocol.skip(self, type)
+
+
+class TCompactProtocolAcceleratedFactory:
+  def getProtocol(self, trans):
+    return TCompactProtocolAccelerated(trans)
@@ -157,6 +157,47 @@ class TProtocolBase:
   def readString(self):
     pass
 
+  # Readers and writers for the types readFixedValues/writeFixedValues take.
+  _FIXED_READERS = {TType.BOOL: 'readBool', TType.BYTE: 'readByte',
+                    TType.I16: 'readI16', TType.I32: 'readI32',
+                    TType.I64: 'readI64', TType.DOUBLE: 'readDouble'}
+  _FIXED_WRITERS = {TType.BOOL: 'writeBool', TType.BYTE: 'writeByte',
+                    TType.I16: 'writeI16', TType.I32: 'writeI32',
+                    TType.I64: 'writeI64', TType.DOUBLE: 'writeDouble'}
+
+  def readFixedValues(self, etype, size):
+    """Reads a list of size values of a fixed-width type (bool, byte, i16,
+    i32, i64 or double), such as the elements of a list<i32>.  Protocols
+    can override this to read them all at once."""
+    read = getattr(self, self._FIXED_READERS[etype])
+    return [read() for i in xrange(size)]
+
+  def writeFixedValues(self, etype, values):
+    """Writes a sequence of values of a fixed-width type; the counterpart of
+    readFixedValues."""
+    write = getattr(self, self._FIXED_WRITERS[etype])
+    for value in values:
+      write(value)
+
+  def writeMessage(self, name, type, seqid, obj):
+    """Writes a whole message: the envelope, and then the struct obj.
+    Protocols can override this to write it all at once."""
+    self.writeMessageBegin(name, type, seqid)
+    obj.write(self)
+    self.writeMessageEnd()
+
+  def readMessage(self, obj):
+    """Reads a whole message: the envelope, and then the struct into obj,
+    unless the message is an exception, which is read into a new
+    TApplicationException instead.  Returns (name, type, seqid, struct),
+    where struct is obj or the exception."""
+    (name, type, seqid) = self.readMessageBegin()
+    if type == TMessageType.EXCEPTION:
+      obj = TApplicationException()
+    obj.read(self)
+    self.readMessageEnd()
+    return (name, type, seqid, obj)
+
   def skip(self, type):
     if type == TType.STOP:
       return
@@ -203,3 +244,31 @@ class TProtocolBase:
 class TProtocolFactory:
   def getProtocol(self, trans):
     pass
+
+def projection(paths):
+  """Builds the fields argument of fastbinary's decoders from field ids and
+  paths.  Generated read methods and TSerialization.deserialize pass their
+  fields argument through it, so they take either.
+
+  Each path is a field id, or a sequence of ids leading to a field of a
+  nested struct.  A path through a list, set or map field applies to each
+  struct element (or map value) in it.  For example, projection([1, (3, 2)])
+  selects field 1, and field 2 of the struct(s) in field 3.  A dict is
+  taken to be built already and returned as it is.
+  """
+  if isinstance(paths, dict):
+    return paths
+  result = {}
+  for path in paths:
+    if isinstance(path, (int, long)):
+      path = (path,)
+    node = result
+    for fid in path[:-1]:
+      if fid in node and node[fid] is None:
+        # The whole field is already selected.
+        node = None
+        break
+      node = node.setdefault(fid, {})
+    if node is not None:
+      node[path[-1]] = None
+  return result
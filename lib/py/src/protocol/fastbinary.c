@@ -155,19 +155,140 @@ typedef struct {
   PyObject* defval;
 } StructItemSpec;
 
+/**
+ * A thrift_spec tuple parsed once into a C array, so we don't have to
+ * re-parse every item spec for every object we encode or decode.
+ * Holes in the thrift_spec have a NULL attrname.
+ */
+typedef struct {
+  PyObject* spec;
+  Py_ssize_t nspec;
+  StructItemSpec* items;
+  // Length of the last encode_binary result for this struct type,
+  // used to size the output buffer of the next one.
+  Py_ssize_t size_hint;
+} StructSpec;
+
+/**
+ * What decoded structs are made into: instances of their classes, or for
+ * decode_binary_plain, dicts keyed by attribute name or tuples indexed by
+ * field id.
+ */
+typedef enum {
+  PLAIN_NONE,
+  PLAIN_DICTS,
+  PLAIN_TUPLES,
+} PlainMode;
+
 /**
  * A cache of the two key attributes of a CReadableTransport,
  * so we don't have to keep calling PyObject_GetAttr.
+ *
+ * Alternatively, when decoding straight from an object supporting the
+ * buffer protocol (str, buffer, bytearray, mmap, memoryview), the raw
+ * data and a cursor into it.  In that case stringiobuf is NULL.
+ *
+ * A CReadableTransport with a bytearray_rbuf is read like a buffer too:
+ * bufobj is the bytearray, pos and len are its bytearray_rpos and
+ * bytearray_rend, and rbuf_trans is the transport, which refills it and
+ * gets pos back at the end (see decode_buffer_from_rbuf).
  */
 typedef struct {
   PyObject* stringiobuf;
   PyObject* refill_callable;
+  PyObject* rbuf_trans;
+
+  PyObject* bufobj;
+  const char* data;
+  Py_ssize_t len;
+  Py_ssize_t pos;
+#if (PY_VERSION_HEX >= 0x02060000)
+  Py_buffer view;
+#endif
+
+  // Decode numeric lists into array.array objects (see decode_array).
+  bool arrays;
+  // Decode lists of structs into columns (see decode_columns).
+  bool columns;
+  // Share repeated strings between decodes (see intern_string).
+  bool intern;
+  // If not NULL, the buffer object being decoded; strings come back as
+  // slices of it instead of copies (see decode_string).  Borrowed.
+  PyObject* views;
+  // Decode structs into dicts or tuples (see decode_binary_plain).
+  PlainMode plain;
 } DecodeBuffer;
 
 /** Pointer to interned string to speed up attribute lookup. */
 static PyObject* INTERN_STRING(cstringio_buf);
 /** Pointer to interned string to speed up attribute lookup. */
 static PyObject* INTERN_STRING(cstringio_refill);
+/** Pointer to interned string to speed up attribute lookup. */
+static PyObject* INTERN_STRING(bytearray_wbuf);
+/** Pointer to interned string to speed up attribute lookup. */
+static PyObject* INTERN_STRING(bytearray_rbuf);
+/** Pointer to interned string to speed up attribute lookup. */
+static PyObject* INTERN_STRING(bytearray_rpos);
+/** Pointer to interned string to speed up attribute lookup. */
+static PyObject* INTERN_STRING(bytearray_rend);
+/** Pointer to interned string to speed up attribute lookup. */
+static PyObject* INTERN_STRING(bytearray_refill);
+/** Pointer to interned string to speed up attribute lookup. */
+static PyObject* INTERN_STRING(write);
+
+/**
+ * Maps id(thrift_spec) to a CObject wrapping its StructSpec.  Each
+ * StructSpec holds a reference to its thrift_spec, so ids are never
+ * reused while an entry exists.  Entries are never evicted; there is
+ * one per struct type.
+ */
+static PyObject* struct_spec_cache;
+
+/**
+ * The most recent get_struct_spec result.  Elements of a list of structs
+ * all share one thrift_spec, so this saves the dict lookup for them.
+ */
+static PyObject* last_spec_seq;
+static StructSpec* last_struct_spec;
+
+/**
+ * Strings shared by decodes in intern mode, mapping each to itself.  When
+ * it reaches INTERN_TABLE_MAX entries the table is simply cleared: that
+ * keeps lookups cheap and lets strings that stopped recurring be freed.
+ * Strings already handed out stay shared.
+ */
+static PyObject* intern_table;
+#define INTERN_TABLE_MAX 8192
+
+/** In intern mode, longer strings are only interned when used as map keys. */
+#define INTERN_MAX_LEN 16
+
+/**
+ * Returns the interned copy of str, adding str to the table if there is
+ * none.  Steals the reference to str; NULL is passed through.
+ */
+static PyObject*
+intern_string(PyObject* str) {
+  PyObject* shared;
+
+  if (str == NULL) {
+    return NULL;
+  }
+  shared = PyDict_GetItem(intern_table, str);
+  if (shared != NULL) {
+    Py_INCREF(shared);
+    Py_DECREF(str);
+    return shared;
+  }
+  if (PyDict_Size(intern_table) >= INTERN_TABLE_MAX) {
+    PyDict_Clear(intern_table);
+  }
+  if (PyDict_SetItem(intern_table, str, str) == -1) {
+    Py_DECREF(str);
+    return NULL;
+  }
+  return str;
+}
 
 static inline bool
 check_ssize_t_32(Py_ssize_t len) {
@@ -182,6 +303,20 @@ check_ssize_t_32(Py_ssize_t len) {
   return true;
 }
 
+/**
+ * Gets the bytes of a string value.  Besides str (and unicode, in the
+ * default encoding), anything with a read buffer will do, such as the
+ * buffer slices a views mode decode produces.
+ */
+static bool
+string_data(PyObject* value, const char** data, Py_ssize_t* len) {
+  if (!PyString_Check(value) && !PyUnicode_Check(value) &&
+      PyObject_CheckReadBuffer(value)) {
+    return PyObject_AsReadBuffer(value, (const void**) data, len) == 0;
+  }
+  return PyString_AsStringAndSize(value, (char**) data, len) == 0;
+}
+
 static inline bool
 parse_pyint(PyObject* o, int32_t* ret, int32_t min, int32_t max) {
   long val = PyInt_AsLong(o);
@@ -279,31 +414,277 @@ parse_struct_item_spec(StructItemSpec* dest, PyObject* spec_tuple) {
   return true;
 }
 
+static void
+free_struct_spec(void* ptr) {
+  StructSpec* sspec = (StructSpec*) ptr;
+  Py_XDECREF(sspec->spec);
+  free(sspec->items);
+  free(sspec);
+}
+
+/**
+ * Returns the parsed form of a thrift_spec tuple, building and caching
+ * it on first use.  The result is borrowed from the cache.
+ */
+static StructSpec*
+get_struct_spec(PyObject* spec_seq) {
+  PyObject* key;
+  PyObject* cobj;
+  StructSpec* sspec;
+  Py_ssize_t i;
+
+  if (spec_seq == last_spec_seq) {
+    return last_struct_spec;
+  }
+
+  key = PyLong_FromVoidPtr(spec_seq);
+  if (key == NULL) {
+    return NULL;
+  }
+
+  cobj = PyDict_GetItem(struct_spec_cache, key);
+  if (cobj != NULL) {
+    Py_DECREF(key);
+    last_spec_seq = spec_seq;
+    last_struct_spec = (StructSpec*) PyCObject_AsVoidPtr(cobj);
+    return last_struct_spec;
+  }
+
+  if (!PyTuple_Check(spec_seq)) {
+    Py_DECREF(key);
+    PyErr_SetString(PyExc_TypeError, "expecting a tuple for the struct spec");
+    return NULL;
+  }
+
+  sspec = calloc(1, sizeof(StructSpec));
+  if (sspec == NULL) {
+    Py_DECREF(key);
+    PyErr_NoMemory();
+    return NULL;
+  }
+  sspec->nspec = PyTuple_GET_SIZE(spec_seq);
+  // calloc(0) may legally return NULL, so always ask for one item.
+  sspec->items = calloc(sspec->nspec + 1, sizeof(StructItemSpec));
+  if (sspec->items == NULL) {
+    free_struct_spec(sspec);
+    Py_DECREF(key);
+    PyErr_NoMemory();
+    return NULL;
+  }
+
+  for (i = 0; i < sspec->nspec; i++) {
+    PyObject* spec_tuple = PyTuple_GET_ITEM(spec_seq, i);
+    if (spec_tuple == Py_None) {
+      continue;
+    }
+    if (!parse_struct_item_spec(&sspec->items[i], spec_tuple)) {
+      free_struct_spec(sspec);
+      Py_DECREF(key);
+      return NULL;
+    }
+  }
+
+  Py_INCREF(spec_seq);
+  sspec->spec = spec_seq;
+
+  cobj = PyCObject_FromVoidPtr(sspec, free_struct_spec);
+  if (cobj == NULL) {
+    free_struct_spec(sspec);
+    Py_DECREF(key);
+    return NULL;
+  }
+
+  if (PyDict_SetItem(struct_spec_cache, key, cobj) == -1) {
+    // cobj owns sspec and frees it.
+    Py_DECREF(cobj);
+    Py_DECREF(key);
+    return NULL;
+  }
+  Py_DECREF(cobj);
+  Py_DECREF(key);
+
+  last_spec_seq = spec_seq;
+  last_struct_spec = sspec;
+  return sspec;
+}
+
 /* ====== END UTILITIES ====== */
 
 
+/* ====== BEGIN ARRAY SUPPORT ====== */
+
+/*
+ * Lists of fixed-width numbers can be decoded into array.array objects,
+ * and array.array objects of the matching typecode are encoded without
+ * boxing each element.  This is array.array, set up in initfastbinary
+ * (NULL if the array module isn't there).
+ */
+static PyObject* array_type;
+
+/*
+ * Size on the wire of the fixed-width types, or 0 for the others.  Lists,
+ * sets and maps of fixed-width types are skipped in a single step instead
+ * of element by element.
+ */
+static int
+fixed_width(TType type) {
+  switch (type) {
+  case T_BOOL:
+  case T_I08: return 1;
+  case T_I16: return 2;
+  case T_I32: return 4;
+  case T_I64:
+  case T_DOUBLE: return 8;
+  default: return 0;
+  }
+}
+
+/*
+ * The array typecode holding a type with no loss, or 0 if there isn't one.
+ */
+static char
+array_typecode(TType type) {
+  switch (type) {
+  case T_I08: return 'b';
+  case T_I16: return sizeof(short) == 2 ? 'h' : 0;
+  case T_I32: return sizeof(int) == 4 ? 'i' : 0;
+  case T_I64: return sizeof(long) == 8 ? 'l' : 0;
+  case T_DOUBLE: return sizeof(double) == 8 ? 'd' : 0;
+  default: return 0;
+  }
+}
+
+/*
+ * Copies n values of the given width between host and network byte order.
+ * Swapping is its own inverse, so this works in both directions.
+ */
+static void
+copy_swapped(char* dest, const char* src, Py_ssize_t n, int width) {
+  Py_ssize_t i;
+  switch (width) {
+  case 2:
+    for (i = 0; i < n; i++) {
+      uint16_t v;
+      memcpy(&v, src + 2 * i, 2);
+      v = htons(v);
+      memcpy(dest + 2 * i, &v, 2);
+    }
+    break;
+  case 4:
+    for (i = 0; i < n; i++) {
+      uint32_t v;
+      memcpy(&v, src + 4 * i, 4);
+      v = htonl(v);
+      memcpy(dest + 4 * i, &v, 4);
+    }
+    break;
+  case 8:
+    for (i = 0; i < n; i++) {
+      uint64_t v;
+      memcpy(&v, src + 8 * i, 8);
+      v = htonll(v);
+      memcpy(dest + 8 * i, &v, 8);
+    }
+    break;
+  default:
+    memcpy(dest, src, n * width);
+  }
+}
+
+/*
+ * If value is an array.array holding elements of type etype, returns a
+ * pointer to its data and sets *len to the number of elements.  Otherwise
+ * returns NULL, with no exception set unless something went wrong.
+ */
+static const char*
+get_array_data(PyObject* value, TType etype, Py_ssize_t* len) {
+  PyObject* typecode;
+  const void* data;
+  Py_ssize_t nbytes;
+  char expected = array_typecode(etype);
+  bool match;
+
+  if (array_type == NULL || expected == 0 ||
+      !PyObject_TypeCheck(value, (PyTypeObject*) array_type)) {
+    return NULL;
+  }
+
+  typecode = PyObject_GetAttrString(value, "typecode");
+  if (typecode == NULL) {
+    return NULL;
+  }
+  match = PyString_Check(typecode) && PyString_GET_SIZE(typecode) == 1 &&
+          PyString_AS_STRING(typecode)[0] == expected;
+  Py_DECREF(typecode);
+  if (!match) {
+    return NULL;
+  }
+
+  if (PyObject_AsReadBuffer(value, &data, &nbytes) < 0) {
+    return NULL;
+  }
+  *len = nbytes / fixed_width(etype);
+  return data;
+}
+
+/* ====== END ARRAY SUPPORT ====== */
+
+
 /* ====== BEGIN WRITING FUNCTIONS ====== */
 
 /* --- LOW-LEVEL WRITING FUNCTIONS --- */
 
+/*
+ * Appends len bytes to outbuf, which is a cStringIO output object or (for
+ * encode_binary_into) a bytearray.  A bytearray's capacity is doubled when
+ * it runs out, as cStringIO does, rather than grown by the 1/8 that
+ * PyByteArray_Resize allows.  Like cwrite, failures are left for the
+ * caller to find with PyErr_Occurred.
+ */
+static void
+writeBytes(PyObject* outbuf, const char* data, Py_ssize_t len) {
+#if (PY_VERSION_HEX >= 0x02060000)
+  if (PyByteArray_CheckExact(outbuf)) {
+    PyByteArrayObject* array = (PyByteArrayObject*) outbuf;
+    Py_ssize_t size = Py_SIZE(array);
+
+    if (len == 0) {
+      return;
+    }
+    // Leave room for the trailing NUL bytearrays keep.
+    if (size + len >= array->ob_alloc) {
+      if (PyByteArray_Resize(outbuf, 2 * (size + len)) == -1) {
+        return;
+      }
+      Py_SIZE(array) = size;
+    }
+    memcpy(array->ob_bytes + size, data, len);
+    Py_SIZE(array) = size + len;
+    array->ob_bytes[size + len] = '\0';
+    return;
+  }
+#endif
+  PycStringIO->cwrite(outbuf, (char*) data, len);
+}
+
 static void writeByte(PyObject* outbuf, int8_t val) {
   int8_t net = val;
-  PycStringIO->cwrite(outbuf, (char*)&net, sizeof(int8_t));
+  writeBytes(outbuf, (char*)&net, sizeof(int8_t));
 }
 
 static void writeI16(PyObject* outbuf, int16_t val) {
   int16_t net = (int16_t)htons(val);
-  PycStringIO->cwrite(outbuf, (char*)&net, sizeof(int16_t));
+  writeBytes(outbuf, (char*)&net, sizeof(int16_t));
 }
 
 static void writeI32(PyObject* outbuf, int32_t val) {
   int32_t net = (int32_t)htonl(val);
-  PycStringIO->cwrite(outbuf, (char*)&net, sizeof(int32_t));
+  writeBytes(outbuf, (char*)&net, sizeof(int32_t));
 }
 
 static void writeI64(PyObject* outbuf, int64_t val) {
   int64_t net = (int64_t)htonll(val);
-  PycStringIO->cwrite(outbuf, (char*)&net, sizeof(int64_t));
+  writeBytes(outbuf, (char*)&net, sizeof(int64_t));
 }
 
 static void writeDouble(PyObject* outbuf, double dub) {
@@ -317,8 +698,150 @@ static void writeDouble(PyObject* outbuf, double dub) {
 }
 
 
+/*
+ * Gets the value of a field of a struct being written, as a new reference.
+ * Besides an instance, the struct can be a dict keyed by attribute name or
+ * a tuple indexed by field id, as decode_binary_plain makes them.  Fields
+ * missing from those come back as None.
+ */
+static PyObject*
+struct_field(PyObject* value, StructItemSpec* item) {
+  PyObject* fieldval;
+
+  if (PyDict_Check(value)) {
+    fieldval = PyDict_GetItem(value, item->attrname);
+    if (fieldval == NULL) {
+      fieldval = Py_None;
+    }
+  } else if (PyTuple_Check(value)) {
+    if (item->tag < PyTuple_GET_SIZE(value)) {
+      fieldval = PyTuple_GET_ITEM(value, item->tag);
+    } else {
+      fieldval = Py_None;
+    }
+  } else {
+    return PyObject_GetAttr(value, item->attrname);
+  }
+  Py_INCREF(fieldval);
+  return fieldval;
+}
+
+
 /* --- MAIN RECURSIVE OUTPUT FUCNTION -- */
 
+static int
+output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs);
+
+/*
+ * Writes a list of structs given as columns, the inverse of
+ * decode_columns: columns maps attribute names to equally long sequences,
+ * and row i of the list is made of item i of each.  None items, and
+ * fields with no column, are left out of the row.
+ */
+static bool
+output_columns(PyObject* output, PyObject* columns, PyObject* typeargs) {
+  typedef struct {
+    const char* data;   // raw data of a matching array.array column
+    PyObject* fast;     // any other column, via PySequence_Fast
+  } ColumnSource;
+
+  StructTypeArgs parsedargs;
+  StructSpec* sspec;
+  ColumnSource* sources;
+  Py_ssize_t nrows = -1, row, i;
+  bool ok = false;
+
+  if (!parse_struct_args(&parsedargs, typeargs)) {
+    return false;
+  }
+  sspec = get_struct_spec(parsedargs.spec);
+  if (sspec == NULL) {
+    return false;
+  }
+
+  sources = calloc(sspec->nspec + 1, sizeof(ColumnSource));
+  if (sources == NULL) {
+    PyErr_NoMemory();
+    return false;
+  }
+
+  for (i = 0; i < sspec->nspec; i++) {
+    StructItemSpec* item = &sspec->items[i];
+    PyObject* column;
+    Py_ssize_t n;
+
+    if (item->attrname == NULL) {
+      continue;
+    }
+    column = PyDict_GetItem(columns, item->attrname);
+    if (column == NULL || column == Py_None) {
+      continue;
+    }
+
+    sources[i].data = get_array_data(column, item->type, &n);
+    if (sources[i].data == NULL) {
+      if (PyErr_Occurred()) {
+        goto cleanup;
+      }
+      sources[i].fast = PySequence_Fast(column, "expecting a sequence for each column");
+      if (sources[i].fast == NULL) {
+        goto cleanup;
+      }
+      n = PySequence_Fast_GET_SIZE(sources[i].fast);
+    }
+
+    if (nrows == -1) {
+      nrows = n;
+    } else if (n != nrows) {
+      PyErr_SetString(PyExc_ValueError, "columns have different lengths");
+      goto cleanup;
+    }
+  }
+  if (nrows == -1) {
+    nrows = 0;
+  }
+  if (!check_ssize_t_32(nrows)) {
+    goto cleanup;
+  }
+
+  writeByte(output, T_STRUCT);
+  writeI32(output, (int32_t) nrows);
+
+  for (row = 0; row < nrows; row++) {
+    for (i = 0; i < sspec->nspec; i++) {
+      StructItemSpec* item = &sspec->items[i];
+
+      if (sources[i].data != NULL) {
+        int width = fixed_width(item->type);
+        char value[8];
+        copy_swapped(value, sources[i].data + row * width, 1, width);
+        writeByte(output, (int8_t) item->type);
+        writeI16(output, (int16_t) item->tag);
+        writeBytes(output, value, width);
+      } else if (sources[i].fast != NULL) {
+        PyObject* value = PySequence_Fast_GET_ITEM(sources[i].fast, row);
+        if (value == Py_None) {
+          continue;
+        }
+        writeByte(output, (int8_t) item->type);
+        writeI16(output, (int16_t) item->tag);
+        if (!output_val(output, value, item->type, item->typeargs)) {
+          goto cleanup;
+        }
+      }
+    }
+    writeByte(output, T_STOP);
+  }
+  ok = true;
+
+cleanup:
+  for (i = 0; i < sspec->nspec; i++) {
+    Py_XDECREF(sources[i].fast);
+  }
+  free(sources);
+  return ok;
+}
+
 static int
 output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
   /*
@@ -399,14 +922,15 @@ output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
   }
 
   case T_STRING: {
-    Py_ssize_t len = PyString_Size(value);
+    const char* data;
+    Py_ssize_t len;
 
-    if (!check_ssize_t_32(len)) {
+    if (!string_data(value, &data, &len) || !check_ssize_t_32(len)) {
       return false;
     }
 
     writeI32(output, (int32_t) len);
-    PycStringIO->cwrite(output, PyString_AsString(value), (int32_t) len);
+    writeBytes(output, data, (int32_t) len);
     break;
   }
 
@@ -421,6 +945,13 @@ output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
       return false;
     }
 
+    if (type == T_LIST && parsedargs.element_type == T_STRUCT && PyDict_Check(value)) {
+      if (!output_columns(output, value, parsedargs.typeargs)) {
+        return false;
+      }
+      break;
+    }
+
     len = PyObject_Length(value);
 
     if (!check_ssize_t_32(len)) {
@@ -430,6 +961,27 @@ output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
     writeByte(output, parsedargs.element_type);
     writeI32(output, (int32_t) len);
 
+    if (type == T_LIST) {
+      Py_ssize_t nitems, done;
+      const char* data = get_array_data(value, parsedargs.element_type, &nitems);
+      if (data != NULL) {
+        int width = fixed_width(parsedargs.element_type);
+        char chunk[4096];
+        for (done = 0; done < nitems; ) {
+          Py_ssize_t n = nitems - done;
+          if (n > (Py_ssize_t) sizeof(chunk) / width) {
+            n = sizeof(chunk) / width;
+          }
+          copy_swapped(chunk, data + done * width, n, width);
+          writeBytes(output, chunk, n * width);
+          done += n;
+        }
+        break;
+      } else if (PyErr_Occurred()) {
+        return false;
+      }
+    }
+
     iterator =  PyObject_GetIter(value);
     if (iterator == NULL) {
       return false;
@@ -496,34 +1048,27 @@ output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
   //               the way we did for decode_struct.
   case T_STRUCT: {
     StructTypeArgs parsedargs;
-    Py_ssize_t nspec;
+    StructSpec* sspec;
     Py_ssize_t i;
 
     if (!parse_struct_args(&parsedargs, typeargs)) {
       return false;
     }
 
-    nspec = PyTuple_Size(parsedargs.spec);
-
-    if (nspec == -1) {
+    sspec = get_struct_spec(parsedargs.spec);
+    if (sspec == NULL) {
       return false;
     }
 
-    for (i = 0; i < nspec; i++) {
-      StructItemSpec parsedspec;
-      PyObject* spec_tuple;
+    for (i = 0; i < sspec->nspec; i++) {
+      StructItemSpec* parsedspec = &sspec->items[i];
       PyObject* instval = NULL;
 
-      spec_tuple = PyTuple_GET_ITEM(parsedargs.spec, i);
-      if (spec_tuple == Py_None) {
+      if (parsedspec->attrname == NULL) {
         continue;
       }
 
-      if (!parse_struct_item_spec (&parsedspec, spec_tuple)) {
-        return false;
-      }
-
-      instval = PyObject_GetAttr(value, parsedspec.attrname);
+      instval = struct_field(value, parsedspec);
 
       if (!instval) {
         return false;
@@ -534,10 +1079,10 @@ output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
         continue;
       }
 
-      writeByte(output, (int8_t) parsedspec.type);
-      writeI16(output, parsedspec.tag);
+      writeByte(output, (int8_t) parsedspec->type);
+      writeI16(output, parsedspec->tag);
 
-      if (!output_val(output, instval, parsedspec.type, parsedspec.typeargs)) {
+      if (!output_val(output, instval, parsedspec->type, parsedspec->typeargs)) {
         Py_DECREF(instval);
         return false;
       }
@@ -564,168 +1109,2833 @@ output_val(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
 }
 
 
-/* --- TOP-LEVEL WRAPPER FOR OUTPUT -- */
+/* --- OUTPUT SIZE -- */
 
-static PyObject *
-encode_binary(PyObject *self, PyObject *args) {
-  PyObject* enc_obj;
-  PyObject* type_args;
-  PyObject* buf;
-  PyObject* ret = NULL;
+static bool
+binary_size(PyObject* value, TType type, PyObject* typeargs, Py_ssize_t* size);
 
-  if (!PyArg_ParseTuple(args, "OO", &enc_obj, &type_args)) {
-    return NULL;
-  }
+/*
+ * The output_columns part of binary_size.
+ */
+static bool
+columns_size(PyObject* columns, PyObject* typeargs, Py_ssize_t* size) {
+  StructTypeArgs parsedargs;
+  StructSpec* sspec;
+  Py_ssize_t nrows = -1, n, i, row;
 
-  buf = PycStringIO->NewOutput(INIT_OUTBUF_SIZE);
-  if (output_val(buf, enc_obj, T_STRUCT, type_args)) {
-    ret = PycStringIO->cgetvalue(buf);
+  if (!parse_struct_args(&parsedargs, typeargs)) {
+    return false;
+  }
+  sspec = get_struct_spec(parsedargs.spec);
+  if (sspec == NULL) {
+    return false;
   }
 
-  Py_DECREF(buf);
-  return ret;
-}
-
-/* ====== END WRITING FUNCTIONS ====== */
+  for (i = 0; i < sspec->nspec; i++) {
+    StructItemSpec* item = &sspec->items[i];
+    PyObject* column;
+    PyObject* fast;
 
+    if (item->attrname == NULL) {
+      continue;
+    }
+    column = PyDict_GetItem(columns, item->attrname);
+    if (column == NULL || column == Py_None) {
+      continue;
+    }
 
-/* ====== BEGIN READING FUNCTIONS ====== */
+    if (get_array_data(column, item->type, &n) != NULL) {
+      *size += n * (3 + fixed_width(item->type));
+    } else if (PyErr_Occurred()) {
+      return false;
+    } else {
+      fast = PySequence_Fast(column, "expecting a sequence for each column");
+      if (fast == NULL) {
+        return false;
+      }
+      n = PySequence_Fast_GET_SIZE(fast);
+      for (row = 0; row < n; row++) {
+        PyObject* value = PySequence_Fast_GET_ITEM(fast, row);
+        if (value == Py_None) {
+          continue;
+        }
+        *size += 3;
+        if (!binary_size(value, item->type, item->typeargs, size)) {
+          Py_DECREF(fast);
+          return false;
+        }
+      }
+      Py_DECREF(fast);
+    }
 
-/* --- LOW-LEVEL READING FUNCTIONS --- */
+    if (nrows == -1) {
+      nrows = n;
+    } else if (n != nrows) {
+      PyErr_SetString(PyExc_ValueError, "columns have different lengths");
+      return false;
+    }
+  }
 
-static void
-free_decodebuf(DecodeBuffer* d) {
-  Py_XDECREF(d->stringiobuf);
-  Py_XDECREF(d->refill_callable);
+  if (nrows == -1) {
+    nrows = 0;
+  }
+  if (!check_ssize_t_32(nrows)) {
+    return false;
+  }
+  // The list header, and a T_STOP per row.
+  *size += 5 + nrows;
+  return true;
 }
 
+/*
+ * Checks that output_val can write value as the fixed-width type, raising
+ * the same exception it would if not.
+ */
 static bool
-decode_buffer_from_obj(DecodeBuffer* dest, PyObject* obj) {
-  dest->stringiobuf = PyObject_GetAttr(obj, INTERN_STRING(cstringio_buf));
-  if (!dest->stringiobuf) {
-    return false;
+check_fixed(PyObject* value, TType type) {
+  int32_t ival;
+
+  switch (type) {
+  case T_BOOL:
+    return PyObject_IsTrue(value) != -1;
+  case T_I08:
+    return parse_pyint(value, &ival, INT8_MIN, INT8_MAX);
+  case T_I16:
+    return parse_pyint(value, &ival, INT16_MIN, INT16_MAX);
+  case T_I32:
+    return parse_pyint(value, &ival, INT32_MIN, INT32_MAX);
+  case T_I64: {
+    int64_t nval = PyLong_AsLongLong(value);
+    if (INT_CONV_ERROR_OCCURRED(nval)) {
+      return false;
+    }
+    if (!CHECK_RANGE(nval, INT64_MIN, INT64_MAX)) {
+      PyErr_SetString(PyExc_OverflowError, "int out of range");
+      return false;
+    }
+    return true;
+  }
+  case T_DOUBLE:
+    return !(PyFloat_AsDouble(value) == -1.0 && PyErr_Occurred());
+  default:
+    return true;
   }
+}
 
-  if (!PycStringIO_InputCheck(dest->stringiobuf)) {
-    free_decodebuf(dest);
-    PyErr_SetString(PyExc_TypeError, "expecting stringio input");
-    return false;
+/*
+ * Adds the number of bytes output_val would write for value to *size,
+ * failing wherever output_val would: every value is checked as it would
+ * be encoded, except the elements of array.array lists and columns, which
+ * are copied as they are.
+ */
+static bool
+binary_size(PyObject* value, TType type, PyObject* typeargs, Py_ssize_t* size) {
+  int width = fixed_width(type);
+
+  if (width > 0) {
+    if (!check_fixed(value, type)) {
+      return false;
+    }
+    *size += width;
+    return true;
   }
 
-  dest->refill_callable = PyObject_GetAttr(obj, INTERN_STRING(cstringio_refill));
+  switch (type) {
 
-  if(!dest->refill_callable) {
-    free_decodebuf(dest);
-    return false;
+  case T_STRING: {
+    const char* data;
+    Py_ssize_t len;
+    if (!string_data(value, &data, &len) || !check_ssize_t_32(len)) {
+      return false;
+    }
+    *size += 4 + len;
+    return true;
   }
 
-  if (!PyCallable_Check(dest->refill_callable)) {
-    free_decodebuf(dest);
-    PyErr_SetString(PyExc_TypeError, "expecting callable");
-    return false;
+  case T_LIST:
+  case T_SET: {
+    SetListTypeArgs parsedargs;
+    PyObject* iterator;
+    PyObject* item;
+    Py_ssize_t len;
+
+    if (!parse_set_list_args(&parsedargs, typeargs)) {
+      return false;
+    }
+    if (type == T_LIST && parsedargs.element_type == T_STRUCT && PyDict_Check(value)) {
+      return columns_size(value, parsedargs.typeargs, size);
+    }
+
+    len = PyObject_Length(value);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+    *size += 5;
+
+    if (type == T_LIST) {
+      Py_ssize_t nitems;
+      if (get_array_data(value, parsedargs.element_type, &nitems) != NULL) {
+        *size += nitems * fixed_width(parsedargs.element_type);
+        return true;
+      } else if (PyErr_Occurred()) {
+        return false;
+      }
+    }
+
+    iterator = PyObject_GetIter(value);
+    if (iterator == NULL) {
+      return false;
+    }
+    while ((item = PyIter_Next(iterator))) {
+      if (!binary_size(item, parsedargs.element_type, parsedargs.typeargs, size)) {
+        Py_DECREF(item);
+        Py_DECREF(iterator);
+        return false;
+      }
+      Py_DECREF(item);
+    }
+    Py_DECREF(iterator);
+    return !PyErr_Occurred();
   }
 
-  return true;
-}
+  case T_MAP: {
+    MapTypeArgs parsedargs;
+    PyObject *k, *v;
+    Py_ssize_t pos = 0;
+    Py_ssize_t len;
 
-static bool readBytes(DecodeBuffer* input, char** output, int len) {
-  int read;
+    if (!parse_map_args(&parsedargs, typeargs)) {
+      return false;
+    }
+    len = PyDict_Size(value);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+    *size += 6;
 
-  // TODO(dreiss): Don't fear the malloc.  Think about taking a copy of
-  //               the partial read instead of forcing the transport
-  //               to prepend it to its buffer.
+    while (PyDict_Next(value, &pos, &k, &v)) {
+      if (!binary_size(k, parsedargs.ktag, parsedargs.ktypeargs, size)
+          || !binary_size(v, parsedargs.vtag, parsedargs.vtypeargs, size)) {
+        return false;
+      }
+    }
+    return true;
+  }
 
-  read = PycStringIO->cread(input->stringiobuf, output, len);
+  case T_STRUCT: {
+    StructTypeArgs parsedargs;
+    StructSpec* sspec;
+    Py_ssize_t i;
 
-  if (read == len) {
+    if (!parse_struct_args(&parsedargs, typeargs)) {
+      return false;
+    }
+    sspec = get_struct_spec(parsedargs.spec);
+    if (sspec == NULL) {
+      return false;
+    }
+
+    for (i = 0; i < sspec->nspec; i++) {
+      StructItemSpec* parsedspec = &sspec->items[i];
+      PyObject* instval;
+      bool ok;
+
+      if (parsedspec->attrname == NULL) {
+        continue;
+      }
+      instval = struct_field(value, parsedspec);
+      if (instval == NULL) {
+        return false;
+      }
+      if (instval == Py_None) {
+        Py_DECREF(instval);
+        continue;
+      }
+
+      // Field type and id.
+      *size += 3;
+      ok = binary_size(instval, parsedspec->type, parsedspec->typeargs, size);
+      Py_DECREF(instval);
+      if (!ok) {
+        return false;
+      }
+    }
+
+    // T_STOP.
+    *size += 1;
     return true;
-  } else if (read == -1) {
+  }
+
+  default:
+    PyErr_SetString(PyExc_TypeError, "Unexpected TType");
     return false;
-  } else {
-    PyObject* newiobuf;
+  }
+}
 
-    // using building functions as this is a rare codepath
-    newiobuf = PyObject_CallFunction(
-        input->refill_callable, "s#i", *output, read, len, NULL);
-    if (newiobuf == NULL) {
+
+/* --- TOP-LEVEL WRAPPER FOR OUTPUT -- */
+
+// Message envelope constants, from TBinaryProtocol.
+#define VERSION_MASK ((int32_t)0xffff0000)
+#define VERSION_1 ((int32_t)0x80010000)
+#define TYPE_MASK ((int32_t)0x000000ff)
+// TMessageType.EXCEPTION
+#define T_EXCEPTION_MESSAGE 3
+
+/*
+ * Writes obj, preceded by a strict message envelope if name is not NULL.
+ */
+static bool
+output_message(PyObject* output, PyObject* name, int32_t mtype, int32_t seqid,
+               PyObject* enc_obj, PyObject* type_args) {
+  if (name != NULL) {
+    writeI32(output, VERSION_1 | mtype);
+    if (!output_val(output, name, T_STRING, NULL)) {
       return false;
     }
+    writeI32(output, seqid);
+  }
+  return output_val(output, enc_obj, T_STRUCT, type_args);
+}
 
-    // must do this *AFTER* the call so that we don't deref the io buffer
-    Py_CLEAR(input->stringiobuf);
-    input->stringiobuf = newiobuf;
+/*
+ * Encodes obj (as a message, if name is not NULL) into a new string.  The
+ * output buffer starts out a little bigger than the last result for the
+ * same struct type, so messages of a steady size are written without
+ * growing it.
+ */
+static PyObject*
+encode_binary_string(PyObject* name, int32_t mtype, int32_t seqid,
+                     PyObject* enc_obj, PyObject* type_args) {
+  PyObject* buf;
+  PyObject* ret = NULL;
+  StructTypeArgs parsedargs;
+  StructSpec* sspec;
+  Py_ssize_t bufsize = INIT_OUTBUF_SIZE;
+
+  if (!parse_struct_args(&parsedargs, type_args)) {
+    return NULL;
+  }
+  sspec = get_struct_spec(parsedargs.spec);
+  if (sspec == NULL) {
+    return NULL;
+  }
+  if (sspec->size_hint + sspec->size_hint / 8 > bufsize) {
+    bufsize = sspec->size_hint + sspec->size_hint / 8;
+  }
+
+  buf = PycStringIO->NewOutput(bufsize);
+  if (buf == NULL) {
+    return NULL;
+  }
+  if (output_message(buf, name, mtype, seqid, enc_obj, type_args)) {
+    ret = PycStringIO->cgetvalue(buf);
+  }
+  if (ret != NULL) {
+    sspec->size_hint = PyString_GET_SIZE(ret);
+  }
+
+  Py_DECREF(buf);
+  return ret;
+}
+
+static PyObject *
+encode_binary(PyObject *self, PyObject *args) {
+  PyObject* enc_obj;
+  PyObject* type_args;
+
+  if (!PyArg_ParseTuple(args, "OO", &enc_obj, &type_args)) {
+    return NULL;
+  }
+
+  return encode_binary_string(NULL, 0, 0, enc_obj, type_args);
+}
+
+#if (PY_VERSION_HEX >= 0x02060000)
+/*
+ * Appends the encoding of obj (as a message, if name is not NULL) to a
+ * bytearray, growing it at most once if the message is no bigger than the
+ * last one of its type.
+ */
+static PyObject*
+encode_binary_bytearray(PyObject* out, PyObject* name, int32_t mtype, int32_t seqid,
+                        PyObject* enc_obj, PyObject* type_args) {
+  PyByteArrayObject* array = (PyByteArrayObject*) out;
+  StructTypeArgs parsedargs;
+  StructSpec* sspec;
+  Py_ssize_t start = Py_SIZE(array);
+  Py_ssize_t reserve;
+
+  if (!parse_struct_args(&parsedargs, type_args)) {
+    return NULL;
+  }
+  sspec = get_struct_spec(parsedargs.spec);
+  if (sspec == NULL) {
+    return NULL;
+  }
+  // writeBytes changes the size behind PyByteArray_Resize's back, which
+  // mustn't happen while someone holds a view of the data.
+  if (array->ob_exports > 0) {
+    PyErr_SetString(PyExc_BufferError,
+                    "Existing exports of data: object cannot be re-sized");
+    return NULL;
+  }
+
+  reserve = sspec->size_hint + sspec->size_hint / 8;
+  if (reserve > 0 && start + reserve >= array->ob_alloc) {
+    if (PyByteArray_Resize(out, start + reserve) == -1) {
+      return NULL;
+    }
+    Py_SIZE(array) = start;
+    array->ob_bytes[start] = '\0';
+  }
+
+  if (!output_message(out, name, mtype, seqid, enc_obj, type_args) || PyErr_Occurred()) {
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    PyByteArray_Resize(out, start);
+    PyErr_Restore(type, value, traceback);
+    return NULL;
+  }
+
+  sspec->size_hint = Py_SIZE(array) - start;
+  return PyInt_FromSsize_t(sspec->size_hint);
+}
+#endif
+
+/*
+ * The body of encode_binary_into and encode_binary_message: appends the
+ * encoding to out and returns its length.  out is a bytearray, or a
+ * transport.  The encoding goes straight into a bytearray, including the
+ * bytearray_wbuf of a CWritableTransport; any other transport is passed
+ * the encoded string.  If encoding fails, out is left as it was.
+ * (Before Python 2.6, out is always a transport.)
+ */
+static PyObject*
+encode_into(PyObject* out, PyObject* name, int32_t mtype, int32_t seqid,
+            PyObject* enc_obj, PyObject* type_args) {
+#if (PY_VERSION_HEX >= 0x02060000)
+  PyObject* wbuf;
+#endif
+  PyObject* encoded;
+  PyObject* ret;
+
+#if (PY_VERSION_HEX >= 0x02060000)
+  if (PyByteArray_CheckExact(out)) {
+    return encode_binary_bytearray(out, name, mtype, seqid, enc_obj, type_args);
+  }
+
+  wbuf = PyObject_GetAttr(out, INTERN_STRING(bytearray_wbuf));
+  if (wbuf != NULL) {
+    if (!PyByteArray_CheckExact(wbuf)) {
+      PyErr_SetString(PyExc_TypeError, "expecting bytearray_wbuf to be a bytearray");
+      ret = NULL;
+    } else {
+      ret = encode_binary_bytearray(wbuf, name, mtype, seqid, enc_obj, type_args);
+    }
+    Py_DECREF(wbuf);
+    return ret;
+  }
+  if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+    return NULL;
+  }
+  PyErr_Clear();
+#endif
+
+  encoded = encode_binary_string(name, mtype, seqid, enc_obj, type_args);
+  if (encoded == NULL) {
+    return NULL;
+  }
+  ret = PyObject_CallMethodObjArgs(out, INTERN_STRING(write), encoded, NULL);
+  if (ret != NULL) {
+    Py_DECREF(ret);
+    ret = PyInt_FromSsize_t(PyString_GET_SIZE(encoded));
+  }
+  Py_DECREF(encoded);
+  return ret;
+}
+
+/*
+ * encode_binary_into(obj, typeargs, out)
+ *
+ * Appends the encoding of obj to out and returns its length; see
+ * encode_into.
+ */
+static PyObject *
+encode_binary_into(PyObject *self, PyObject *args) {
+  PyObject* enc_obj;
+  PyObject* type_args;
+  PyObject* out;
+
+  if (!PyArg_ParseTuple(args, "OOO", &enc_obj, &type_args, &out)) {
+    return NULL;
+  }
+
+  return encode_into(out, NULL, 0, 0, enc_obj, type_args);
+}
+
+/*
+ * encode_binary_message(out, name, type, seqid, obj, typeargs)
+ *
+ * Like encode_binary_into, but obj is preceded by a (strict) message
+ * envelope, so a whole call or reply is written at once.
+ */
+static PyObject *
+encode_binary_message(PyObject *self, PyObject *args) {
+  PyObject* out;
+  PyObject* name;
+  int mtype;
+  int seqid;
+  PyObject* enc_obj;
+  PyObject* type_args;
+
+  if (!PyArg_ParseTuple(args, "OSiiOO", &out, &name, &mtype, &seqid, &enc_obj, &type_args)) {
+    return NULL;
+  }
+
+  return encode_into(out, name, mtype, seqid, enc_obj, type_args);
+}
+
+/*
+ * serialized_size(obj, typeargs)
+ *
+ * The length of encode_binary(obj, typeargs), worked out without encoding.
+ */
+static PyObject *
+serialized_size(PyObject *self, PyObject *args) {
+  PyObject* enc_obj;
+  PyObject* type_args;
+  Py_ssize_t size = 0;
+
+  if (!PyArg_ParseTuple(args, "OO", &enc_obj, &type_args)) {
+    return NULL;
+  }
+
+  if (!binary_size(enc_obj, T_STRUCT, type_args, &size)) {
+    return NULL;
+  }
+  return PyInt_FromSsize_t(size);
+}
+
+/* ====== END WRITING FUNCTIONS ====== */
+
+
+/* ====== BEGIN READING FUNCTIONS ====== */
+
+/* --- LOW-LEVEL READING FUNCTIONS --- */
+
+/*
+ * Hands the read position back to a bytearray_rbuf transport.
+ */
+static bool
+store_rbuf_pos(DecodeBuffer* d) {
+  PyObject* rpos = PyInt_FromSsize_t(d->pos);
+  int ret;
+
+  if (rpos == NULL) {
+    return false;
+  }
+  ret = PyObject_SetAttr(d->rbuf_trans, INTERN_STRING(bytearray_rpos), rpos);
+  Py_DECREF(rpos);
+  return ret != -1;
+}
+
+static void
+free_decodebuf(DecodeBuffer* d) {
+  if (d->rbuf_trans != NULL) {
+    // Whatever was consumed stays consumed, even if decoding failed, just
+    // as with a cStringIO.  Setting an int attribute can only fail for
+    // lack of memory, which we can't do much about at this point.
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    if (!store_rbuf_pos(d)) {
+      PyErr_Clear();
+    }
+    PyErr_Restore(type, value, traceback);
+    Py_CLEAR(d->rbuf_trans);
+  }
+  Py_XDECREF(d->stringiobuf);
+  Py_XDECREF(d->refill_callable);
+#if (PY_VERSION_HEX >= 0x02060000)
+  if (d->view.obj != NULL) {
+    PyBuffer_Release(&d->view);
+  }
+#endif
+  Py_XDECREF(d->bufobj);
+}
+
+static bool
+is_buffer_obj(PyObject* obj) {
+#if (PY_VERSION_HEX >= 0x02060000)
+  if (PyObject_CheckBuffer(obj)) {
+    return true;
+  }
+#endif
+  return PyObject_CheckReadBuffer(obj);
+}
+
+static bool
+decode_buffer_from_bytes(DecodeBuffer* dest, PyObject* obj, Py_ssize_t offset) {
+#if (PY_VERSION_HEX >= 0x02060000)
+  if (PyObject_CheckBuffer(obj)) {
+    if (PyObject_GetBuffer(obj, &dest->view, PyBUF_SIMPLE) < 0) {
+      return false;
+    }
+    dest->data = dest->view.buf;
+    dest->len = dest->view.len;
+  } else
+#endif
+  {
+    const void* data;
+    if (PyObject_AsReadBuffer(obj, &data, &dest->len) < 0) {
+      return false;
+    }
+    // Old-style buffers are only valid while we hold the object.
+    Py_INCREF(obj);
+    dest->bufobj = obj;
+    dest->data = data;
+  }
+
+  if (offset < 0 || offset > dest->len) {
+    free_decodebuf(dest);
+    PyErr_SetString(PyExc_ValueError, "offset out of range");
+    return false;
+  }
+  dest->pos = offset;
+
+  return true;
+}
+
+#if (PY_VERSION_HEX >= 0x02060000)
+static Py_ssize_t
+get_ssize_attr(PyObject* obj, PyObject* name) {
+  PyObject* value = PyObject_GetAttr(obj, name);
+  Py_ssize_t ret;
+
+  if (value == NULL) {
+    return -1;
+  }
+  ret = PyInt_AsSsize_t(value);
+  Py_DECREF(value);
+  return ret;
+}
+
+/*
+ * Points d at the unread part of its transport's bytearray_rbuf, between
+ * bytearray_rpos and bytearray_rend.
+ */
+static bool
+load_rbuf(DecodeBuffer* d) {
+  PyObject* rbuf;
+  Py_ssize_t rpos, rend;
+
+  rbuf = PyObject_GetAttr(d->rbuf_trans, INTERN_STRING(bytearray_rbuf));
+  if (rbuf == NULL) {
+    return false;
+  }
+  if (!PyByteArray_Check(rbuf)) {
+    Py_DECREF(rbuf);
+    PyErr_SetString(PyExc_TypeError, "expecting a bytearray for bytearray_rbuf");
+    return false;
+  }
+  Py_XDECREF(d->bufobj);
+  d->bufobj = rbuf;
+
+  rpos = get_ssize_attr(d->rbuf_trans, INTERN_STRING(bytearray_rpos));
+  if (rpos == -1 && PyErr_Occurred()) {
+    return false;
+  }
+  rend = get_ssize_attr(d->rbuf_trans, INTERN_STRING(bytearray_rend));
+  if (rend == -1 && PyErr_Occurred()) {
+    return false;
+  }
+  if (rpos < 0 || rpos > rend || rend > PyByteArray_GET_SIZE(rbuf)) {
+    PyErr_SetString(PyExc_ValueError, "bytearray_rpos or bytearray_rend out of range");
+    return false;
+  }
+
+  d->data = PyByteArray_AS_STRING(rbuf);
+  d->pos = rpos;
+  d->len = rend;
+  return true;
+}
+
+/*
+ * Has the transport make at least len bytes available past the read
+ * position, moving or reallocating its bytearray_rbuf as it sees fit.
+ */
+static bool
+refill_rbuf(DecodeBuffer* d, int len) {
+  PyObject* reqlen;
+  PyObject* ret;
+
+  if (!store_rbuf_pos(d)) {
+    return false;
+  }
+  reqlen = PyInt_FromLong(len);
+  if (reqlen == NULL) {
+    return false;
+  }
+  ret = PyObject_CallMethodObjArgs(d->rbuf_trans, INTERN_STRING(bytearray_refill),
+                                   reqlen, NULL);
+  Py_DECREF(reqlen);
+  if (ret == NULL) {
+    return false;
+  }
+  Py_DECREF(ret);
+
+  if (!load_rbuf(d)) {
+    return false;
+  }
+  if (d->len - d->pos < len) {
+    PyErr_SetString(PyExc_TypeError,
+        "refill claimed to have refilled the buffer, but didn't!!");
+    return false;
+  }
+  return true;
+}
+#endif
+
+static bool
+decode_buffer_from_obj(DecodeBuffer* dest, PyObject* obj) {
+#if (PY_VERSION_HEX >= 0x02060000)
+  PyObject* rbuf = PyObject_GetAttr(obj, INTERN_STRING(bytearray_rbuf));
+  if (rbuf == NULL) {
+    return false;
+  }
+  if (rbuf != Py_None) {
+    Py_DECREF(rbuf);
+    Py_INCREF(obj);
+    dest->rbuf_trans = obj;
+    if (!load_rbuf(dest)) {
+      // Don't write back a position we never read.
+      Py_CLEAR(dest->rbuf_trans);
+      free_decodebuf(dest);
+      return false;
+    }
+    return true;
+  }
+  Py_DECREF(rbuf);
+#endif
+
+  dest->stringiobuf = PyObject_GetAttr(obj, INTERN_STRING(cstringio_buf));
+  if (!dest->stringiobuf) {
+    return false;
+  }
+
+  if (!PycStringIO_InputCheck(dest->stringiobuf)) {
+    free_decodebuf(dest);
+    PyErr_SetString(PyExc_TypeError, "expecting stringio input");
+    return false;
+  }
+
+  dest->refill_callable = PyObject_GetAttr(obj, INTERN_STRING(cstringio_refill));
+
+  if(!dest->refill_callable) {
+    free_decodebuf(dest);
+    return false;
+  }
+
+  if (!PyCallable_Check(dest->refill_callable)) {
+    free_decodebuf(dest);
+    PyErr_SetString(PyExc_TypeError, "expecting callable");
+    return false;
+  }
+
+  return true;
+}
+
+static bool readBytes(DecodeBuffer* input, char** output, int len) {
+  int read;
+
+  if (input->stringiobuf == NULL) {
+    if (len < 0) {
+      PyErr_SetNone(PyExc_EOFError);
+      return false;
+    }
+    if (input->len - input->pos < len) {
+#if (PY_VERSION_HEX >= 0x02060000)
+      if (input->rbuf_trans != NULL) {
+        if (!refill_rbuf(input, len)) {
+          return false;
+        }
+      } else
+#endif
+      {
+        PyErr_SetNone(PyExc_EOFError);
+        return false;
+      }
+    }
+    *output = (char*) input->data + input->pos;
+    input->pos += len;
+    return true;
+  }
+
+  // TODO(dreiss): Don't fear the malloc.  Think about taking a copy of
+  //               the partial read instead of forcing the transport
+  //               to prepend it to its buffer.
+
+  read = PycStringIO->cread(input->stringiobuf, output, len);
+
+  if (read == len) {
+    return true;
+  } else if (read == -1) {
+    return false;
+  } else {
+    PyObject* newiobuf;
+
+    // using building functions as this is a rare codepath
+    newiobuf = PyObject_CallFunction(
+        input->refill_callable, "s#i", *output, read, len, NULL);
+    if (newiobuf == NULL) {
+      return false;
+    }
+
+    // must do this *AFTER* the call so that we don't deref the io buffer
+    Py_CLEAR(input->stringiobuf);
+    input->stringiobuf = newiobuf;
+
+    read = PycStringIO->cread(input->stringiobuf, output, len);
+
+    if (read == len) {
+      return true;
+    } else if (read == -1) {
+      return false;
+    } else {
+      // TODO(dreiss): This could be a valid code path for big binary blobs.
+      PyErr_SetString(PyExc_TypeError,
+          "refill claimed to have refilled the buffer, but didn't!!");
+      return false;
+    }
+  }
+}
+
+static int8_t readByte(DecodeBuffer* input) {
+  char* buf;
+  if (!readBytes(input, &buf, sizeof(int8_t))) {
+    return -1;
+  }
+
+  return *(int8_t*) buf;
+}
+
+static int16_t readI16(DecodeBuffer* input) {
+  char* buf;
+  if (!readBytes(input, &buf, sizeof(int16_t))) {
+    return -1;
+  }
+
+  return (int16_t) ntohs(*(int16_t*) buf);
+}
+
+static int32_t readI32(DecodeBuffer* input) {
+  char* buf;
+  if (!readBytes(input, &buf, sizeof(int32_t))) {
+    return -1;
+  }
+  return (int32_t) ntohl(*(int32_t*) buf);
+}
+
+
+static int64_t readI64(DecodeBuffer* input) {
+  char* buf;
+  if (!readBytes(input, &buf, sizeof(int64_t))) {
+    return -1;
+  }
+
+  return (int64_t) ntohll(*(int64_t*) buf);
+}
+
+static double readDouble(DecodeBuffer* input) {
+  union {
+    int64_t f;
+    double t;
+  } transfer;
+
+  transfer.f = readI64(input);
+  if (transfer.f == -1) {
+    return -1;
+  }
+  return transfer.t;
+}
+
+static bool
+checkTypeByte(DecodeBuffer* input, TType expected) {
+  TType got = readByte(input);
+  if (INT_CONV_ERROR_OCCURRED(got)) {
+    return false;
+  }
+
+  if (expected != got) {
+    PyErr_SetString(PyExc_TypeError, "got wrong ttype while reading field");
+    return false;
+  }
+  return true;
+}
+
+static bool
+skipBytes(DecodeBuffer* input, int64_t len) {
+  char* dummy_buf;
+  // readBytes takes an int, so huge runs are skipped in pieces.
+  while (len > INT_MAX) {
+    if (!readBytes(input, &dummy_buf, INT_MAX)) {
+      return false;
+    }
+    len -= INT_MAX;
+  }
+  return readBytes(input, &dummy_buf, (int) len);
+}
+
+static bool
+skip(DecodeBuffer* input, TType type) {
+#define SKIPBYTES(n) \
+  do { \
+    if (!readBytes(input, &dummy_buf, (n))) { \
+      return false; \
+    } \
+  } while(0)
+
+  char* dummy_buf;
+
+  switch (type) {
+
+  case T_BOOL:
+  case T_I08: SKIPBYTES(1); break;
+  case T_I16: SKIPBYTES(2); break;
+  case T_I32: SKIPBYTES(4); break;
+  case T_I64:
+  case T_DOUBLE: SKIPBYTES(8); break;
+
+  case T_STRING: {
+    // TODO(dreiss): Find out if these check_ssize_t32s are really necessary.
+    int len = readI32(input);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+    SKIPBYTES(len);
+    break;
+  }
+
+  case T_LIST:
+  case T_SET: {
+    TType etype;
+    int len, i;
+
+    etype = readByte(input);
+    if (INT_CONV_ERROR_OCCURRED(etype)) {
+      return false;
+    }
+
+    len = readI32(input);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+
+    if (fixed_width(etype)) {
+      if (!skipBytes(input, (int64_t) len * fixed_width(etype))) {
+        return false;
+      }
+      break;
+    }
+
+    for (i = 0; i < len; i++) {
+      if (!skip(input, etype)) {
+        return false;
+      }
+    }
+    break;
+  }
+
+  case T_MAP: {
+    TType ktype, vtype;
+    int len, i;
+
+    ktype = readByte(input);
+    if (INT_CONV_ERROR_OCCURRED(ktype)) {
+      return false;
+    }
+
+    vtype = readByte(input);
+    if (INT_CONV_ERROR_OCCURRED(vtype)) {
+      return false;
+    }
+
+    len = readI32(input);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+
+    if (fixed_width(ktype) && fixed_width(vtype)) {
+      if (!skipBytes(input, (int64_t) len * (fixed_width(ktype) + fixed_width(vtype)))) {
+        return false;
+      }
+      break;
+    }
+
+    for (i = 0; i < len; i++) {
+      if (!(skip(input, ktype) && skip(input, vtype))) {
+        return false;
+      }
+    }
+    break;
+  }
+
+  case T_STRUCT: {
+    while (true) {
+      TType type;
+
+      type = readByte(input);
+      if (INT_CONV_ERROR_OCCURRED(type)) {
+        return false;
+      }
+
+      if (type == T_STOP)
+        break;
+
+      SKIPBYTES(2); // tag
+      if (!skip(input, type)) {
+        return false;
+      }
+    }
+    break;
+  }
+
+  case T_STOP:
+  case T_VOID:
+  case T_UTF16:
+  case T_UTF8:
+  case T_U64:
+  default:
+    PyErr_SetString(PyExc_TypeError, "Unexpected TType");
+    return false;
+
+  }
+
+  return true;
+
+#undef SKIPBYTES
+}
+
+
+/* --- HELPER FUNCTION FOR DECODE_VAL --- */
+
+/**
+ * Makes the value of a string of len bytes that readBytes put at buf.  In
+ * views mode that is a read-only buffer object over the input rather than a
+ * copy, so big binary fields cost nothing to decode; the input then stays
+ * alive as long as any of them does.
+ */
+static PyObject*
+decode_string(DecodeBuffer* input, char* buf, Py_ssize_t len) {
+  if (input->views != NULL) {
+    return PyBuffer_FromObject(input->views, buf - input->data, len);
+  }
+  if (input->intern && len <= INTERN_MAX_LEN) {
+    return intern_string(PyString_FromStringAndSize(buf, len));
+  }
+  return PyString_FromStringAndSize(buf, len);
+}
+
+static PyObject*
+decode_val(DecodeBuffer* input, TType type, PyObject* typeargs, PyObject* fields);
+
+/**
+ * Decodes a struct into output.  If pending is not NULL, struct and
+ * container fields are skipped instead, and recorded in pending as
+ * attrname -> (type, typeargs, offset) for decode_binary_lazy.
+ *
+ * If fields is not NULL, it is a dict whose keys are the ids of the fields
+ * to decode; all others are skipped.  Each value is None to decode the
+ * whole field, or another such dict to apply to the struct(s) it holds.
+ */
+static bool
+decode_struct(DecodeBuffer* input, PyObject* output, PyObject* spec_seq,
+              PyObject* pending, PyObject* fields) {
+  StructSpec* sspec = get_struct_spec(spec_seq);
+  if (sspec == NULL) {
+    return false;
+  }
+
+  while (true) {
+    TType type;
+    int16_t tag;
+    StructItemSpec* parsedspec;
+    PyObject* fieldval = NULL;
+    PyObject* subfields = NULL;
+    bool ok;
+
+    type = readByte(input);
+    if (INT_CONV_ERROR_OCCURRED(type)) {
+      return false;
+    }
+    if (type == T_STOP) {
+      break;
+    }
+    tag = readI16(input);
+    if (INT_CONV_ERROR_OCCURRED(tag)) {
+      return false;
+    }
+    if (tag >= 0 && tag < sspec->nspec) {
+      parsedspec = &sspec->items[tag];
+    } else {
+      parsedspec = NULL;
+    }
+
+    if (parsedspec == NULL || parsedspec->attrname == NULL) {
+      if (!skip(input, type)) {
+        return false;
+      } else {
+        continue;
+      }
+    }
+
+    if (parsedspec->type != type) {
+      if (!skip(input, type)) {
+        PyErr_SetString(PyExc_TypeError, "struct field had wrong type while reading and can't be skipped");
+        return false;
+      } else {
+        continue;
+      }
+    }
+
+    if (fields != NULL) {
+      PyObject* key = PyInt_FromLong(tag);
+      if (key == NULL) {
+        return false;
+      }
+      subfields = PyDict_GetItem(fields, key);
+      Py_DECREF(key);
+
+      if (subfields == NULL) {
+        if (!skip(input, type)) {
+          return false;
+        }
+        continue;
+      }
+      if (subfields == Py_None) {
+        subfields = NULL;
+      } else if (!PyDict_Check(subfields)) {
+        PyErr_SetString(PyExc_TypeError, "expecting None or a dict of field ids");
+        return false;
+      }
+    }
+
+    if (pending != NULL && (type == T_STRUCT || type == T_LIST ||
+                            type == T_SET || type == T_MAP)) {
+      Py_ssize_t offset = input->pos;
+      PyObject* entry;
+
+      if (!skip(input, type)) {
+        return false;
+      }
+      entry = Py_BuildValue("(iOn)", (int) type, parsedspec->typeargs, offset);
+      if (entry == NULL) {
+        return false;
+      }
+      if (PyDict_SetItem(pending, parsedspec->attrname, entry) == -1) {
+        Py_DECREF(entry);
+        return false;
+      }
+      Py_DECREF(entry);
+      continue;
+    }
+
+    fieldval = decode_val(input, parsedspec->type, parsedspec->typeargs, subfields);
+    if (fieldval == NULL) {
+      return false;
+    }
+
+    if (input->plain == PLAIN_TUPLES) {
+      // new_struct made the tuple, so nobody else has seen it yet.
+      PyObject* old = PyTuple_GET_ITEM(output, tag);
+      PyTuple_SET_ITEM(output, tag, fieldval);
+      Py_DECREF(old);
+      continue;
+    }
+    if (input->plain == PLAIN_DICTS) {
+      ok = PyDict_SetItem(output, parsedspec->attrname, fieldval) != -1;
+    } else {
+      ok = PyObject_SetAttr(output, parsedspec->attrname, fieldval) != -1;
+    }
+    Py_DECREF(fieldval);
+    if (!ok) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * Makes the object decode_struct fills in for a struct of the given
+ * class and spec: an instance, or in plain mode an empty dict or a tuple
+ * of Nones as long as the spec.
+ */
+static PyObject*
+new_struct(DecodeBuffer* input, StructTypeArgs* parsedargs) {
+  switch (input->plain) {
+  case PLAIN_DICTS:
+    return PyDict_New();
+  case PLAIN_TUPLES: {
+    Py_ssize_t len = PyTuple_Size(parsedargs->spec);
+    PyObject* ret;
+    Py_ssize_t i;
+
+    if (len < 0) {
+      return NULL;
+    }
+    ret = PyTuple_New(len);
+    if (ret == NULL) {
+      return NULL;
+    }
+    for (i = 0; i < len; i++) {
+      Py_INCREF(Py_None);
+      PyTuple_SET_ITEM(ret, i, Py_None);
+    }
+    return ret;
+  }
+  default:
+    return PyObject_CallObject(parsedargs->klass, NULL);
+  }
+}
+
+
+/* --- MAIN RECURSIVE INPUT FUCNTION --- */
+
+// Returns a new reference.
+/*
+ * Decodes len values of type etype into an array.array, byte-swapping them
+ * on the way.  The caller has checked that array_typecode(etype) != 0.
+ */
+static PyObject*
+decode_array(DecodeBuffer* input, TType etype, int32_t len) {
+  char typecode[2] = {array_typecode(etype), '\0'};
+  int width = fixed_width(etype);
+  PyObject* data;
+  PyObject* ret;
+  char* buf;
+
+  if (len > INT_MAX / width) {
+    PyErr_SetString(PyExc_OverflowError, "list too long to decode into an array");
+    return NULL;
+  }
+
+  if (!readBytes(input, &buf, len * width)) {
+    return NULL;
+  }
+
+  data = PyString_FromStringAndSize(NULL, (Py_ssize_t) len * width);
+  if (data == NULL) {
+    return NULL;
+  }
+  copy_swapped(PyString_AS_STRING(data), buf, len, width);
+
+  ret = PyObject_CallFunction(array_type, "sO", typecode, data);
+  Py_DECREF(data);
+  return ret;
+}
+
+/*
+ * Columnar decoding: with input->columns set, a list of structs decodes
+ * into a dict mapping the attribute name of each field to a column with
+ * that field's value for every row, without creating the row objects.
+ * Numeric fields (see array_typecode) go into array.array columns, the
+ * rest into lists.  Rows lacking a field get the field's default; for a
+ * numeric field with no default, the column becomes a list with None in
+ * those rows.  If fields is not NULL, only the named columns are decoded.
+ */
+typedef struct {
+  StructItemSpec* item; // NULL if this column isn't wanted
+  PyObject* subfields;  // borrowed from fields
+  char* data;           // numeric columns: width bytes per row, host order
+  char* present;        // numeric columns: whether each row had a value
+  PyObject* list;       // other columns
+} Column;
+
+static PyObject*
+finish_numeric_column(Column* col, int32_t len) {
+  TType type = col->item->type;
+  int width = fixed_width(type);
+  char typecode[2] = {array_typecode(type), '\0'};
+  bool complete = true;
+  PyObject* data;
+  PyObject* ret;
+  int32_t row;
+
+  for (row = 0; row < len; row++) {
+    if (!col->present[row]) {
+      complete = false;
+      break;
+    }
+  }
+
+  if (!complete && col->item->defval != Py_None) {
+    // Let array.array convert the default for us.
+    PyObject* fill = PyObject_CallFunction(array_type, "s[O]", typecode, col->item->defval);
+    const void* filldata;
+    Py_ssize_t fillsize;
+    if (fill == NULL) {
+      return NULL;
+    }
+    if (PyObject_AsReadBuffer(fill, &filldata, &fillsize) < 0) {
+      Py_DECREF(fill);
+      return NULL;
+    }
+    for (row = 0; row < len; row++) {
+      if (!col->present[row]) {
+        memcpy(col->data + row * width, filldata, width);
+      }
+    }
+    Py_DECREF(fill);
+    complete = true;
+  }
+
+  data = PyString_FromStringAndSize(col->data, (Py_ssize_t) len * width);
+  if (data == NULL) {
+    return NULL;
+  }
+  ret = PyObject_CallFunction(array_type, "sO", typecode, data);
+  Py_DECREF(data);
+  if (ret == NULL || complete) {
+    return ret;
+  }
+
+  data = ret;
+  ret = PySequence_List(data);
+  Py_DECREF(data);
+  if (ret == NULL) {
+    return NULL;
+  }
+  for (row = 0; row < len; row++) {
+    if (!col->present[row]) {
+      Py_INCREF(Py_None);
+      PyList_SetItem(ret, row, Py_None);
+    }
+  }
+  return ret;
+}
+
+static PyObject*
+decode_columns(DecodeBuffer* input, PyObject* typeargs, int32_t len, PyObject* fields) {
+  StructTypeArgs parsedargs;
+  StructSpec* sspec;
+  Column* cols;
+  PyObject* ret = NULL;
+  Py_ssize_t i;
+  int32_t row;
+
+  if (!parse_struct_args(&parsedargs, typeargs)) {
+    return NULL;
+  }
+  sspec = get_struct_spec(parsedargs.spec);
+  if (sspec == NULL) {
+    return NULL;
+  }
+
+  cols = calloc(sspec->nspec + 1, sizeof(Column));
+  if (cols == NULL) {
+    return PyErr_NoMemory();
+  }
+
+  for (i = 0; i < sspec->nspec; i++) {
+    StructItemSpec* item = &sspec->items[i];
+    Column* col = &cols[i];
+
+    if (item->attrname == NULL) {
+      continue;
+    }
+    if (fields != NULL) {
+      PyObject* key = PyInt_FromLong(item->tag);
+      if (key == NULL) {
+        goto cleanup;
+      }
+      col->subfields = PyDict_GetItem(fields, key);
+      Py_DECREF(key);
+      if (col->subfields == NULL) {
+        continue;
+      }
+      if (col->subfields == Py_None) {
+        col->subfields = NULL;
+      } else if (!PyDict_Check(col->subfields)) {
+        PyErr_SetString(PyExc_TypeError, "expecting None or a dict of field ids");
+        goto cleanup;
+      }
+    }
+    col->item = item;
+
+    if (array_type != NULL && array_typecode(item->type)) {
+      col->data = malloc((size_t) len * fixed_width(item->type) + 1);
+      col->present = calloc((size_t) len + 1, 1);
+      if (col->data == NULL || col->present == NULL) {
+        PyErr_NoMemory();
+        goto cleanup;
+      }
+    } else {
+      col->list = PyList_New(len);
+      if (col->list == NULL) {
+        goto cleanup;
+      }
+      for (row = 0; row < len; row++) {
+        Py_INCREF(item->defval);
+        PyList_SET_ITEM(col->list, row, item->defval);
+      }
+    }
+  }
+
+  for (row = 0; row < len; row++) {
+    // Like decode_struct, but the values go into the columns.
+    while (true) {
+      TType type;
+      int16_t tag;
+      Column* col = NULL;
+
+      type = readByte(input);
+      if (INT_CONV_ERROR_OCCURRED(type)) {
+        goto cleanup;
+      }
+      if (type == T_STOP) {
+        break;
+      }
+      tag = readI16(input);
+      if (INT_CONV_ERROR_OCCURRED(tag)) {
+        goto cleanup;
+      }
+      if (tag >= 0 && tag < sspec->nspec) {
+        col = &cols[tag];
+      }
+
+      if (col == NULL || col->item == NULL || col->item->type != type) {
+        if (!skip(input, type)) {
+          goto cleanup;
+        }
+        continue;
+      }
+
+      if (col->data != NULL) {
+        int width = fixed_width(type);
+        char* buf;
+        if (!readBytes(input, &buf, width)) {
+          goto cleanup;
+        }
+        copy_swapped(col->data + (Py_ssize_t) row * width, buf, 1, width);
+        col->present[row] = 1;
+      } else {
+        PyObject* value = decode_val(input, type, col->item->typeargs, col->subfields);
+        if (value == NULL) {
+          goto cleanup;
+        }
+        PyList_SetItem(col->list, row, value);
+      }
+    }
+  }
+
+  ret = PyDict_New();
+  if (ret == NULL) {
+    goto cleanup;
+  }
+  for (i = 0; i < sspec->nspec; i++) {
+    Column* col = &cols[i];
+    PyObject* column;
+
+    if (col->item == NULL) {
+      continue;
+    }
+    if (col->data != NULL) {
+      column = finish_numeric_column(col, len);
+      if (column == NULL) {
+        Py_CLEAR(ret);
+        goto cleanup;
+      }
+    } else {
+      column = col->list;
+      Py_INCREF(column);
+    }
+    if (PyDict_SetItem(ret, col->item->attrname, column) == -1) {
+      Py_DECREF(column);
+      Py_CLEAR(ret);
+      goto cleanup;
+    }
+    Py_DECREF(column);
+  }
+
+cleanup:
+  for (i = 0; i < sspec->nspec; i++) {
+    free(cols[i].data);
+    free(cols[i].present);
+    Py_XDECREF(cols[i].list);
+  }
+  free(cols);
+  return ret;
+}
+
+static PyObject*
+decode_val(DecodeBuffer* input, TType type, PyObject* typeargs, PyObject* fields) {
+  switch (type) {
+
+  case T_BOOL: {
+    int8_t v = readByte(input);
+    if (INT_CONV_ERROR_OCCURRED(v)) {
+      return NULL;
+    }
+
+    switch (v) {
+    case 0: Py_RETURN_FALSE;
+    case 1: Py_RETURN_TRUE;
+    // Don't laugh.  This is a potentially serious issue.
+    default: PyErr_SetString(PyExc_TypeError, "boolean out of range"); return NULL;
+    }
+    break;
+  }
+  case T_I08: {
+    int8_t v = readByte(input);
+    if (INT_CONV_ERROR_OCCURRED(v)) {
+      return NULL;
+    }
+
+    return PyInt_FromLong(v);
+  }
+  case T_I16: {
+    int16_t v = readI16(input);
+    if (INT_CONV_ERROR_OCCURRED(v)) {
+      return NULL;
+    }
+    return PyInt_FromLong(v);
+  }
+  case T_I32: {
+    int32_t v = readI32(input);
+    if (INT_CONV_ERROR_OCCURRED(v)) {
+      return NULL;
+    }
+    return PyInt_FromLong(v);
+  }
+
+  case T_I64: {
+    int64_t v = readI64(input);
+    if (INT_CONV_ERROR_OCCURRED(v)) {
+      return NULL;
+    }
+    // TODO(dreiss): Find out if we can take this fastpath always when
+    //               sizeof(long) == sizeof(long long).
+    if (CHECK_RANGE(v, LONG_MIN, LONG_MAX)) {
+      return PyInt_FromLong((long) v);
+    }
+
+    return PyLong_FromLongLong(v);
+  }
+
+  case T_DOUBLE: {
+    double v = readDouble(input);
+    if (v == -1.0 && PyErr_Occurred()) {
+      return false;
+    }
+    return PyFloat_FromDouble(v);
+  }
+
+  case T_STRING: {
+    Py_ssize_t len = readI32(input);
+    char* buf;
+    if (!readBytes(input, &buf, len)) {
+      return NULL;
+    }
+
+    return decode_string(input, buf, len);
+  }
+
+  case T_LIST:
+  case T_SET: {
+    SetListTypeArgs parsedargs;
+    int32_t len;
+    PyObject* ret = NULL;
+    PyObject* views = input->views;
+    int i;
+
+    if (!parse_set_list_args(&parsedargs, typeargs)) {
+      return NULL;
+    }
+
+    if (!checkTypeByte(input, parsedargs.element_type)) {
+      return NULL;
+    }
+
+    len = readI32(input);
+    if (!check_ssize_t_32(len)) {
+      return NULL;
+    }
+
+    if (input->arrays && type == T_LIST && array_type != NULL &&
+        array_typecode(parsedargs.element_type)) {
+      return decode_array(input, parsedargs.element_type, len);
+    }
+
+    if (input->columns && type == T_LIST && parsedargs.element_type == T_STRUCT) {
+      return decode_columns(input, parsedargs.typeargs, len, fields);
+    }
+
+    ret = PyList_New(len);
+    if (!ret) {
+      return NULL;
+    }
+
+    // Set elements must hash and compare like strs, so views are no good.
+    if (type == T_SET) {
+      input->views = NULL;
+    }
+    for (i = 0; i < len; i++) {
+      PyObject* item = decode_val(input, parsedargs.element_type, parsedargs.typeargs, fields);
+      if (!item) {
+        input->views = views;
+        Py_DECREF(ret);
+        return NULL;
+      }
+      PyList_SET_ITEM(ret, i, item);
+    }
+    input->views = views;
+
+    // TODO(dreiss): Consider biting the bullet and making two separate cases
+    //               for list and set, avoiding this post facto conversion.
+    if (type == T_SET) {
+      PyObject* setret;
+#if (PY_VERSION_HEX < 0x02050000)
+      // hack needed for older versions
+      setret = PyObject_CallFunctionObjArgs((PyObject*)&PySet_Type, ret, NULL);
+#else
+      // official version
+      setret = PySet_New(ret);
+#endif
+      Py_DECREF(ret);
+      return setret;
+    }
+    return ret;
+  }
+
+  case T_MAP: {
+    int32_t len;
+    int i;
+    MapTypeArgs parsedargs;
+    PyObject* ret = NULL;
+    PyObject* views = input->views;
+
+    if (!parse_map_args(&parsedargs, typeargs)) {
+      return NULL;
+    }
+
+    if (!checkTypeByte(input, parsedargs.ktag)) {
+      return NULL;
+    }
+    if (!checkTypeByte(input, parsedargs.vtag)) {
+      return NULL;
+    }
+
+    len = readI32(input);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+
+    ret = PyDict_New();
+    if (!ret) {
+      goto error;
+    }
+
+    for (i = 0; i < len; i++) {
+      PyObject* k = NULL;
+      PyObject* v = NULL;
+      // Keys are always decoded in full, and never as views, so they hash
+      // and compare properly.
+      input->views = NULL;
+      k = decode_val(input, parsedargs.ktag, parsedargs.ktypeargs, NULL);
+      input->views = views;
+      if (k == NULL) {
+        goto loop_error;
+      }
+      // Short strings were already interned by decode_val.
+      if (input->intern && parsedargs.ktag == T_STRING &&
+          PyString_GET_SIZE(k) > INTERN_MAX_LEN) {
+        k = intern_string(k);
+        if (k == NULL) {
+          goto loop_error;
+        }
+      }
+      v = decode_val(input, parsedargs.vtag, parsedargs.vtypeargs, fields);
+      if (v == NULL) {
+        goto loop_error;
+      }
+      if (PyDict_SetItem(ret, k, v) == -1) {
+        goto loop_error;
+      }
+
+      Py_DECREF(k);
+      Py_DECREF(v);
+      continue;
+
+      // Yuck!  Destructors, anyone?
+      loop_error:
+      Py_XDECREF(k);
+      Py_XDECREF(v);
+      goto error;
+    }
+
+    return ret;
+
+    error:
+    Py_XDECREF(ret);
+    return NULL;
+  }
+
+  case T_STRUCT: {
+    StructTypeArgs parsedargs;
+    if (!parse_struct_args(&parsedargs, typeargs)) {
+      return NULL;
+    }
+
+    PyObject* ret = new_struct(input, &parsedargs);
+    if (!ret) {
+      return NULL;
+    }
+
+    if (!decode_struct(input, ret, parsedargs.spec, NULL, fields)) {
+      Py_DECREF(ret);
+      return NULL;
+    }
+
+    return ret;
+  }
+
+  case T_STOP:
+  case T_VOID:
+  case T_UTF16:
+  case T_UTF8:
+  case T_U64:
+  default:
+    PyErr_SetString(PyExc_TypeError, "Unexpected TType");
+    return NULL;
+  }
+}
+
+
+/* --- TOP-LEVEL WRAPPER FOR INPUT -- */
+
+static PyObject*
+decode_binary_impl(PyObject* output_obj, PyObject* transport, PyObject* typeargs,
+                   Py_ssize_t offset, PyObject* fields, bool arrays, bool columns,
+                   bool intern, bool views, PlainMode plain) {
+  bool from_buffer;
+  PyObject* plain_obj = NULL;
+  StructTypeArgs parsedargs;
+  DecodeBuffer input = {};
+
+  if (!parse_struct_args(&parsedargs, typeargs)) {
+    return NULL;
+  }
+
+  from_buffer = is_buffer_obj(transport);
+  // The slices are old-style buffer objects, so the input must be one too.
+  if (views && !(from_buffer && PyObject_CheckReadBuffer(transport))) {
+    PyErr_SetString(PyExc_TypeError,
+        "views need a str, buffer, bytearray or mmap to decode from");
+    return NULL;
+  }
+  if (from_buffer) {
+    if (!decode_buffer_from_bytes(&input, transport, offset)) {
+      return NULL;
+    }
+  } else if (!decode_buffer_from_obj(&input, transport)) {
+    return NULL;
+  }
+  input.arrays = arrays;
+  input.columns = columns;
+  input.intern = intern;
+  input.views = views ? transport : NULL;
+  input.plain = plain;
+
+  // In plain mode there is no obj; we make the dict or tuple ourselves.
+  if (plain != PLAIN_NONE) {
+    plain_obj = output_obj = new_struct(&input, &parsedargs);
+    if (plain_obj == NULL) {
+      free_decodebuf(&input);
+      return NULL;
+    }
+  }
+
+  if (!decode_struct(&input, output_obj, parsedargs.spec, NULL, fields)) {
+    Py_XDECREF(plain_obj);
+    free_decodebuf(&input);
+    return NULL;
+  }
+
+  free_decodebuf(&input);
+
+  if (plain_obj != NULL) {
+    return plain_obj;
+  }
+  // When reading from a buffer, tell the caller where we stopped.
+  if (from_buffer) {
+    return PyInt_FromSsize_t(input.pos);
+  }
+  Py_RETURN_NONE;
+}
+
+/*
+ * decode_binary(obj, trans_or_buf, typeargs[, offset][, arrays=False][, columns=False]
+ *               [, intern=False][, views=False])
+ *
+ * With arrays true, lists of byte, i16, i32, i64 and double come back as
+ * array.array objects instead of lists of boxed numbers.  With columns
+ * true, lists of structs come back as dicts of columns; see decode_columns.
+ * With intern true, string map keys and short strings are shared with
+ * earlier intern mode decodes; see intern_string.  With views true, which
+ * needs a buffer rather than a transport, strings other than map keys and
+ * set elements come back as buffer objects over it; see decode_string.
+ */
+static PyObject*
+decode_binary(PyObject *self, PyObject *args, PyObject *kwargs) {
+  static char* kwlist[] = {"obj", "trans", "typeargs", "offset", "arrays", "columns",
+                           "intern", "views", NULL};
+  PyObject* output_obj = NULL;
+  PyObject* transport = NULL;
+  PyObject* typeargs = NULL;
+  Py_ssize_t offset = 0;
+  int arrays = 0;
+  int columns = 0;
+  int intern = 0;
+  int views = 0;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOO|niiii", kwlist, &output_obj,
+                                   &transport, &typeargs, &offset, &arrays, &columns,
+                                   &intern, &views)) {
+    return NULL;
+  }
+
+  return decode_binary_impl(output_obj, transport, typeargs, offset, NULL, arrays, columns,
+                            intern, views, PLAIN_NONE);
+}
+
+/*
+ * Like decode_binary, but only decodes the fields named in fields, a dict
+ * as described at decode_struct (or None for all of them).
+ */
+static PyObject*
+decode_binary_fields(PyObject *self, PyObject *args, PyObject *kwargs) {
+  static char* kwlist[] = {"obj", "trans", "typeargs", "fields", "offset", "arrays",
+                           "columns", "intern", "views", NULL};
+  PyObject* output_obj = NULL;
+  PyObject* transport = NULL;
+  PyObject* typeargs = NULL;
+  PyObject* fields = NULL;
+  Py_ssize_t offset = 0;
+  int arrays = 0;
+  int columns = 0;
+  int intern = 0;
+  int views = 0;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOOO|niiii", kwlist, &output_obj,
+                                   &transport, &typeargs, &fields, &offset, &arrays,
+                                   &columns, &intern, &views)) {
+    return NULL;
+  }
+
+  if (fields == Py_None) {
+    fields = NULL;
+  } else if (!PyDict_Check(fields)) {
+    PyErr_SetString(PyExc_TypeError, "expecting None or a dict of field ids");
+    return NULL;
+  }
+
+  return decode_binary_impl(output_obj, transport, typeargs, offset, fields, arrays, columns,
+                            intern, views, PLAIN_NONE);
+}
+
+/*
+ * decode_binary_plain(trans_or_buf, typeargs[, fields][, offset][, tuples=False]
+ *                     [, arrays=False][, columns=False][, intern=False][, views=False])
+ *
+ * Decodes a struct, and the structs inside it, into plain dicts mapping
+ * attribute names to values, or with tuples true, into tuples indexed by
+ * field id like thrift_spec, and returns it.  No instances are made, so
+ * there is no __init__ or setattr per field.  Fields missing from the
+ * input are left out (None in tuples) rather than given their defaults.
+ * The encoders take such dicts and tuples wherever a struct goes.
+ */
+static PyObject*
+decode_binary_plain(PyObject *self, PyObject *args, PyObject *kwargs) {
+  static char* kwlist[] = {"trans", "typeargs", "fields", "offset", "tuples", "arrays",
+                           "columns", "intern", "views", NULL};
+  PyObject* transport = NULL;
+  PyObject* typeargs = NULL;
+  PyObject* fields = NULL;
+  Py_ssize_t offset = 0;
+  int tuples = 0;
+  int arrays = 0;
+  int columns = 0;
+  int intern = 0;
+  int views = 0;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO|Oniiiii", kwlist, &transport,
+                                   &typeargs, &fields, &offset, &tuples, &arrays,
+                                   &columns, &intern, &views)) {
+    return NULL;
+  }
+
+  if (fields == Py_None) {
+    fields = NULL;
+  } else if (fields != NULL && !PyDict_Check(fields)) {
+    PyErr_SetString(PyExc_TypeError, "expecting None or a dict of field ids");
+    return NULL;
+  }
+
+  return decode_binary_impl(NULL, transport, typeargs, offset, fields, arrays, columns,
+                            intern, views, tuples ? PLAIN_TUPLES : PLAIN_DICTS);
+}
+
+/*
+ * Lazy decoding.  decode_binary_lazy decodes the scalar and string fields
+ * of a struct held in a buffer, and returns (end_offset, pending) where
+ * pending maps the attribute names of struct and container fields to
+ * (type, typeargs, offset).  decode_binary_value decodes one of those
+ * later on.  TSerialization.deserialize_lazy ties the two together.
+ */
+
+static PyObject*
+decode_binary_lazy(PyObject *self, PyObject *args) {
+  PyObject* output_obj = NULL;
+  PyObject* buf = NULL;
+  PyObject* typeargs = NULL;
+  PyObject* pending = NULL;
+  Py_ssize_t offset = 0;
+  StructTypeArgs parsedargs;
+  DecodeBuffer input = {};
+
+  if (!PyArg_ParseTuple(args, "OOO|n", &output_obj, &buf, &typeargs, &offset)) {
+    return NULL;
+  }
+
+  if (!parse_struct_args(&parsedargs, typeargs)) {
+    return NULL;
+  }
+
+  if (!is_buffer_obj(buf)) {
+    PyErr_SetString(PyExc_TypeError, "lazy decoding needs a buffer, not a transport");
+    return NULL;
+  }
+
+  if (!decode_buffer_from_bytes(&input, buf, offset)) {
+    return NULL;
+  }
+
+  pending = PyDict_New();
+  if (pending == NULL) {
+    free_decodebuf(&input);
+    return NULL;
+  }
+
+  if (!decode_struct(&input, output_obj, parsedargs.spec, pending, NULL)) {
+    Py_DECREF(pending);
+    free_decodebuf(&input);
+    return NULL;
+  }
+
+  free_decodebuf(&input);
+
+  return Py_BuildValue("(nN)", input.pos, pending);
+}
+
+static PyObject*
+decode_binary_value(PyObject *self, PyObject *args) {
+  PyObject* buf = NULL;
+  PyObject* typeargs = NULL;
+  PyObject* ret;
+  int type;
+  Py_ssize_t offset = 0;
+  DecodeBuffer input = {};
+
+  if (!PyArg_ParseTuple(args, "OiO|n", &buf, &type, &typeargs, &offset)) {
+    return NULL;
+  }
+
+  if (!decode_buffer_from_bytes(&input, buf, offset)) {
+    return NULL;
+  }
+
+  ret = decode_val(&input, (TType) type, typeargs, NULL);
+  free_decodebuf(&input);
+  return ret;
+}
+
+/*
+ * skip_binary(trans_or_buf, type[, offset]) skips one value of the given
+ * type, returning the end offset when reading from a buffer.  This is what
+ * TBinaryProtocolAccelerated.skip uses.
+ */
+static PyObject*
+skip_binary(PyObject *self, PyObject *args) {
+  PyObject* transport = NULL;
+  int type;
+  Py_ssize_t offset = 0;
+  bool from_buffer;
+  DecodeBuffer input = {};
+
+  if (!PyArg_ParseTuple(args, "Oi|n", &transport, &type, &offset)) {
+    return NULL;
+  }
+
+  from_buffer = is_buffer_obj(transport);
+  if (from_buffer) {
+    if (!decode_buffer_from_bytes(&input, transport, offset)) {
+      return NULL;
+    }
+  } else if (!decode_buffer_from_obj(&input, transport)) {
+    return NULL;
+  }
+
+  if (!skip(&input, (TType) type)) {
+    free_decodebuf(&input);
+    return NULL;
+  }
+
+  free_decodebuf(&input);
+
+  if (from_buffer) {
+    return PyInt_FromSsize_t(input.pos);
+  }
+  Py_RETURN_NONE;
+}
+
+/*
+ * Raises thrift.protocol.TProtocol.TProtocolException(type, message).
+ */
+static void
+set_protocol_exception(int type, const char* message) {
+  PyObject* module;
+  PyObject* exc_class;
+  PyObject* exc;
+
+  module = PyImport_ImportModule("thrift.protocol.TProtocol");
+  if (module == NULL) {
+    return;
+  }
+  exc_class = PyObject_GetAttrString(module, "TProtocolException");
+  Py_DECREF(module);
+  if (exc_class == NULL) {
+    return;
+  }
+  exc = PyObject_CallFunction(exc_class, "is", type, message);
+  if (exc != NULL) {
+    PyErr_SetObject(exc_class, exc);
+    Py_DECREF(exc);
+  }
+  Py_DECREF(exc_class);
+}
+
+// From TProtocolException.
+#define BAD_VERSION 4
+
+/*
+ * decode_binary_message(trans, obj, typeargs, exc_typeargs, strict_read)
+ *
+ * Reads a message envelope from a CReadableTransport, and the struct
+ * after it: a new exc_typeargs struct (i.e. a TApplicationException) if
+ * the message type is EXCEPTION, and obj, described by typeargs,
+ * otherwise.  Returns (name, type, seqid, struct).  If obj is None only
+ * the envelope is read, and struct is None.  This does what
+ * TBinaryProtocol's readMessageBegin does, and the struct's read.
+ */
+static PyObject*
+decode_binary_message(PyObject *self, PyObject *args) {
+  PyObject* transport;
+  PyObject* obj;
+  PyObject* typeargs;
+  PyObject* exc_typeargs;
+  int strict_read;
+  DecodeBuffer input = {};
+  int32_t size;
+  int32_t mtype = 0;
+  int32_t seqid;
+  PyObject* name = NULL;
+  PyObject* value = NULL;
+  PyObject* ret = NULL;
+
+  if (!PyArg_ParseTuple(args, "OOOOi", &transport, &obj, &typeargs, &exc_typeargs,
+                        &strict_read)) {
+    return NULL;
+  }
+
+  if (!decode_buffer_from_obj(&input, transport)) {
+    return NULL;
+  }
+
+  size = readI32(&input);
+  if (INT_CONV_ERROR_OCCURRED(size)) {
+    goto cleanup;
+  }
+  if (size < 0) {
+    if ((size & VERSION_MASK) != VERSION_1) {
+      char message[64];
+      PyOS_snprintf(message, sizeof(message), "Bad version in readMessageBegin: %d", size);
+      set_protocol_exception(BAD_VERSION, message);
+      goto cleanup;
+    }
+    mtype = size & TYPE_MASK;
+    name = decode_val(&input, T_STRING, NULL, NULL);
+  } else {
+    char* buf;
+    if (strict_read) {
+      set_protocol_exception(BAD_VERSION, "No protocol version header");
+      goto cleanup;
+    }
+    if (readBytes(&input, &buf, size)) {
+      name = PyString_FromStringAndSize(buf, size);
+    }
+    mtype = readByte(&input);
+  }
+  if (name == NULL || PyErr_Occurred()) {
+    goto cleanup;
+  }
+  seqid = readI32(&input);
+  if (INT_CONV_ERROR_OCCURRED(seqid)) {
+    goto cleanup;
+  }
+
+  if (obj == Py_None) {
+    Py_INCREF(Py_None);
+    value = Py_None;
+  } else if (mtype == T_EXCEPTION_MESSAGE) {
+    value = decode_val(&input, T_STRUCT, exc_typeargs, NULL);
+    if (value == NULL) {
+      goto cleanup;
+    }
+  } else {
+    StructTypeArgs parsedargs;
+    if (!parse_struct_args(&parsedargs, typeargs) ||
+        !decode_struct(&input, obj, parsedargs.spec, NULL, NULL)) {
+      goto cleanup;
+    }
+    Py_INCREF(obj);
+    value = obj;
+  }
+
+  ret = Py_BuildValue("OiiO", name, mtype, seqid, value);
+
+cleanup:
+  free_decodebuf(&input);
+  Py_XDECREF(name);
+  Py_XDECREF(value);
+  return ret;
+}
+
+/* ====== END READING FUNCTIONS ====== */
+
+
+/* ====== BEGIN BATCH FUNCTIONS ====== */
+
+/*
+ * Batches hold structs of one type, each preceded by its length as a
+ * big-endian i32, as in TFramedTransport's frames.  Doing a whole batch
+ * in one call saves setting up a transport and protocol per record.
+ */
+
+#if (PY_VERSION_HEX >= 0x02060000)
+/*
+ * encode_many(objs, typeargs) returns the batch holding the structs in
+ * the iterable objs.
+ */
+static PyObject*
+encode_many(PyObject *self, PyObject *args) {
+  PyObject* objs;
+  PyObject* type_args;
+  PyObject* iterator;
+  PyObject* item;
+  PyObject* out;
+  PyObject* ret = NULL;
+
+  if (!PyArg_ParseTuple(args, "OO", &objs, &type_args)) {
+    return NULL;
+  }
+
+  iterator = PyObject_GetIter(objs);
+  if (iterator == NULL) {
+    return NULL;
+  }
+  out = PyByteArray_FromStringAndSize(NULL, 0);
+  if (out == NULL) {
+    Py_DECREF(iterator);
+    return NULL;
+  }
+
+  while ((item = PyIter_Next(iterator))) {
+    Py_ssize_t start = PyByteArray_GET_SIZE(out);
+    Py_ssize_t len;
+    int32_t net;
+
+    // The length is filled in once we know it.
+    writeI32(out, 0);
+    if (!output_val(out, item, T_STRUCT, type_args) || PyErr_Occurred()) {
+      Py_DECREF(item);
+      goto cleanup;
+    }
+    Py_DECREF(item);
+
+    len = PyByteArray_GET_SIZE(out) - start - sizeof(int32_t);
+    if (!check_ssize_t_32(len)) {
+      goto cleanup;
+    }
+    net = (int32_t) htonl((int32_t) len);
+    memcpy(PyByteArray_AS_STRING(out) + start, &net, sizeof(int32_t));
+  }
+
+  if (!PyErr_Occurred()) {
+    ret = PyString_FromStringAndSize(PyByteArray_AS_STRING(out), PyByteArray_GET_SIZE(out));
+  }
+
+cleanup:
+  Py_DECREF(out);
+  Py_DECREF(iterator);
+  return ret;
+}
+#endif
+
+/*
+ * decode_many(buf, typeargs[, offset]) returns a list of the structs in
+ * the batch held in buf, from offset to the end.  Each struct must take
+ * up exactly its record.
+ */
+static PyObject*
+decode_many(PyObject *self, PyObject *args) {
+  PyObject* buf;
+  PyObject* type_args;
+  Py_ssize_t offset = 0;
+  Py_ssize_t end;
+  StructTypeArgs parsedargs;
+  DecodeBuffer input = {};
+  PyObject* ret;
+
+  if (!PyArg_ParseTuple(args, "OO|n", &buf, &type_args, &offset)) {
+    return NULL;
+  }
+
+  if (!parse_struct_args(&parsedargs, type_args)) {
+    return NULL;
+  }
+
+  if (!is_buffer_obj(buf)) {
+    PyErr_SetString(PyExc_TypeError, "decode_many needs a buffer, not a transport");
+    return NULL;
+  }
+  if (!decode_buffer_from_bytes(&input, buf, offset)) {
+    return NULL;
+  }
+
+  ret = PyList_New(0);
+  if (ret == NULL) {
+    free_decodebuf(&input);
+    return NULL;
+  }
+
+  end = input.len;
+  while (input.pos < end) {
+    PyObject* obj;
+    int32_t len = readI32(&input);
+
+    if (INT_CONV_ERROR_OCCURRED(len)) {
+      goto error;
+    }
+    if (len < 0 || end - input.pos < len) {
+      PyErr_SetNone(PyExc_EOFError);
+      goto error;
+    }
+
+    // Stop the struct from reading past its record.
+    input.len = input.pos + len;
+    obj = PyObject_CallObject(parsedargs.klass, NULL);
+    if (obj == NULL) {
+      goto error;
+    }
+    if (!decode_struct(&input, obj, parsedargs.spec, NULL, NULL)) {
+      Py_DECREF(obj);
+      goto error;
+    }
+    if (input.pos != input.len) {
+      Py_DECREF(obj);
+      PyErr_SetString(PyExc_ValueError, "struct is shorter than its record");
+      goto error;
+    }
+    input.len = end;
+
+    if (PyList_Append(ret, obj) == -1) {
+      Py_DECREF(obj);
+      goto error;
+    }
+    Py_DECREF(obj);
+  }
+
+  free_decodebuf(&input);
+  return ret;
+
+error:
+  free_decodebuf(&input);
+  Py_DECREF(ret);
+  return NULL;
+}
+
+/* ====== END BATCH FUNCTIONS ====== */
+
+
+/* ====== BEGIN COMPACT PROTOCOL FUNCTIONS ====== */
+
+// Stolen out of TCompactProtocol.h, with the same apology as TType.
+typedef enum CType {
+  CT_STOP          = 0x00,
+  CT_BOOLEAN_TRUE  = 0x01,
+  CT_BOOLEAN_FALSE = 0x02,
+  CT_BYTE          = 0x03,
+  CT_I16           = 0x04,
+  CT_I32           = 0x05,
+  CT_I64           = 0x06,
+  CT_DOUBLE        = 0x07,
+  CT_BINARY        = 0x08,
+  CT_LIST          = 0x09,
+  CT_SET           = 0x0A,
+  CT_MAP           = 0x0B,
+  CT_STRUCT        = 0x0C
+} CType;
+
+static const int8_t TTypeToCType[16] = {
+  CT_STOP,         // T_STOP
+  -1,              // T_VOID
+  CT_BOOLEAN_TRUE, // T_BOOL
+  CT_BYTE,         // T_BYTE
+  CT_DOUBLE,       // T_DOUBLE
+  -1,              // unused
+  CT_I16,          // T_I16
+  -1,              // unused
+  CT_I32,          // T_I32
+  -1,              // T_U64
+  CT_I64,          // T_I64
+  CT_BINARY,       // T_STRING
+  CT_STRUCT,       // T_STRUCT
+  CT_MAP,          // T_MAP
+  CT_SET,          // T_SET
+  CT_LIST,         // T_LIST
+};
+
+static int8_t
+getCompactType(TType type) {
+  int8_t ctype = -1;
+  if (type >= 0 && type < 16) {
+    ctype = TTypeToCType[type];
+  }
+  if (ctype == -1) {
+    PyErr_SetString(PyExc_TypeError, "Unexpected TType");
+  }
+  return ctype;
+}
+
+static TType
+getTType(int8_t ctype) {
+  switch (ctype) {
+  case CT_STOP: return T_STOP;
+  case CT_BOOLEAN_FALSE:
+  case CT_BOOLEAN_TRUE: return T_BOOL;
+  case CT_BYTE: return T_BYTE;
+  case CT_I16: return T_I16;
+  case CT_I32: return T_I32;
+  case CT_I64: return T_I64;
+  case CT_DOUBLE: return T_DOUBLE;
+  case CT_BINARY: return T_STRING;
+  case CT_LIST: return T_LIST;
+  case CT_SET: return T_SET;
+  case CT_MAP: return T_MAP;
+  case CT_STRUCT: return T_STRUCT;
+  default:
+    PyErr_SetString(PyExc_TypeError, "Unexpected compact type");
+    return -1;
+  }
+}
+
+static inline uint32_t
+i32ToZigzag(int32_t n) {
+  return (((uint32_t) n) << 1) ^ (uint32_t) (n >> 31);
+}
+
+static inline uint64_t
+i64ToZigzag(int64_t n) {
+  return (((uint64_t) n) << 1) ^ (uint64_t) (n >> 63);
+}
+
+static inline int32_t
+zigzagToI32(uint32_t n) {
+  return (int32_t) (n >> 1) ^ -(int32_t) (n & 1);
+}
+
+static inline int64_t
+zigzagToI64(uint64_t n) {
+  return (int64_t) (n >> 1) ^ -(int64_t) (n & 1);
+}
+
+
+/* --- LOW-LEVEL COMPACT WRITING FUNCTIONS --- */
+
+static void writeVarint(PyObject* outbuf, uint64_t n) {
+  char buf[10];
+  int wsize = 0;
+
+  while (true) {
+    if ((n & ~(uint64_t) 0x7F) == 0) {
+      buf[wsize++] = (char) n;
+      break;
+    }
+    buf[wsize++] = (char) ((n & 0x7F) | 0x80);
+    n >>= 7;
+  }
+  PycStringIO->cwrite(outbuf, buf, wsize);
+}
+
+// Doubles go out little-endian, unlike everything in the binary protocol.
+static void writeDoubleCompact(PyObject* outbuf, double dub) {
+  union {
+    double f;
+    uint64_t t;
+  } transfer;
+  char buf[8];
+  int i;
+
+  transfer.f = dub;
+  for (i = 0; i < 8; i++) {
+    buf[i] = (char) (transfer.t >> (8 * i));
+  }
+  PycStringIO->cwrite(outbuf, buf, 8);
+}
+
+static void
+writeFieldHeaderCompact(PyObject* outbuf, int8_t ctype, int16_t fid, int16_t* last_fid) {
+  if (fid > *last_fid && fid - *last_fid <= 15) {
+    writeByte(outbuf, (int8_t) ((fid - *last_fid) << 4 | ctype));
+  } else {
+    writeByte(outbuf, ctype);
+    writeVarint(outbuf, i32ToZigzag(fid));
+  }
+  *last_fid = fid;
+}
+
+static void
+writeCollectionBeginCompact(PyObject* outbuf, int8_t ctype, int32_t size) {
+  if (size <= 14) {
+    writeByte(outbuf, (int8_t) (size << 4 | ctype));
+  } else {
+    writeByte(outbuf, (int8_t) (0xf0 | ctype));
+    writeVarint(outbuf, (uint32_t) size);
+  }
+}
+
+
+/* --- MAIN RECURSIVE COMPACT OUTPUT FUNCTION --- */
+
+static bool
+output_val_compact(PyObject* output, PyObject* value, TType type, PyObject* typeargs) {
+  /*
+   * Same refcounting strategy as output_val.
+   */
+
+  switch (type) {
+
+  case T_BOOL: {
+    int v = PyObject_IsTrue(value);
+    if (v == -1) {
+      return false;
+    }
+
+    writeByte(output, v ? CT_BOOLEAN_TRUE : CT_BOOLEAN_FALSE);
+    break;
+  }
+  case T_I08: {
+    int32_t val;
+
+    if (!parse_pyint(value, &val, INT8_MIN, INT8_MAX)) {
+      return false;
+    }
+
+    writeByte(output, (int8_t) val);
+    break;
+  }
+  case T_I16: {
+    int32_t val;
+
+    if (!parse_pyint(value, &val, INT16_MIN, INT16_MAX)) {
+      return false;
+    }
+
+    writeVarint(output, i32ToZigzag(val));
+    break;
+  }
+  case T_I32: {
+    int32_t val;
+
+    if (!parse_pyint(value, &val, INT32_MIN, INT32_MAX)) {
+      return false;
+    }
+
+    writeVarint(output, i32ToZigzag(val));
+    break;
+  }
+  case T_I64: {
+    int64_t nval = PyLong_AsLongLong(value);
+
+    if (INT_CONV_ERROR_OCCURRED(nval)) {
+      return false;
+    }
+
+    writeVarint(output, i64ToZigzag(nval));
+    break;
+  }
+
+  case T_DOUBLE: {
+    double nval = PyFloat_AsDouble(value);
+    if (nval == -1.0 && PyErr_Occurred()) {
+      return false;
+    }
+
+    writeDoubleCompact(output, nval);
+    break;
+  }
+
+  case T_STRING: {
+    const char* data;
+    Py_ssize_t len;
+
+    if (!string_data(value, &data, &len) || !check_ssize_t_32(len)) {
+      return false;
+    }
+
+    writeVarint(output, (uint32_t) len);
+    PycStringIO->cwrite(output, (char*) data, (int32_t) len);
+    break;
+  }
+
+  case T_LIST:
+  case T_SET: {
+    Py_ssize_t len;
+    SetListTypeArgs parsedargs;
+    PyObject *item;
+    PyObject *iterator;
+    int8_t ctype;
+
+    if (!parse_set_list_args(&parsedargs, typeargs)) {
+      return false;
+    }
+
+    ctype = getCompactType(parsedargs.element_type);
+    if (ctype == -1) {
+      return false;
+    }
+
+    len = PyObject_Length(value);
+
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+
+    writeCollectionBeginCompact(output, ctype, (int32_t) len);
+
+    iterator = PyObject_GetIter(value);
+    if (iterator == NULL) {
+      return false;
+    }
+
+    while ((item = PyIter_Next(iterator))) {
+      if (!output_val_compact(output, item, parsedargs.element_type, parsedargs.typeargs)) {
+        Py_DECREF(item);
+        Py_DECREF(iterator);
+        return false;
+      }
+      Py_DECREF(item);
+    }
+
+    Py_DECREF(iterator);
+
+    if (PyErr_Occurred()) {
+      return false;
+    }
+
+    break;
+  }
+
+  case T_MAP: {
+    PyObject *k, *v;
+    Py_ssize_t pos = 0;
+    Py_ssize_t len;
+    int8_t kctype, vctype;
+
+    MapTypeArgs parsedargs;
+
+    len = PyDict_Size(value);
+    if (!check_ssize_t_32(len)) {
+      return false;
+    }
+
+    if (!parse_map_args(&parsedargs, typeargs)) {
+      return false;
+    }
+
+    kctype = getCompactType(parsedargs.ktag);
+    vctype = getCompactType(parsedargs.vtag);
+    if (kctype == -1 || vctype == -1) {
+      return false;
+    }
+
+    // Empty maps don't carry their key and value types.
+    if (len == 0) {
+      writeByte(output, 0);
+      break;
+    }
+
+    writeVarint(output, (uint32_t) len);
+    writeByte(output, (int8_t) (kctype << 4 | vctype));
+
+    while (PyDict_Next(value, &pos, &k, &v)) {
+      Py_INCREF(k);
+      Py_INCREF(v);
+
+      if (!output_val_compact(output, k, parsedargs.ktag, parsedargs.ktypeargs)
+          || !output_val_compact(output, v, parsedargs.vtag, parsedargs.vtypeargs)) {
+        Py_DECREF(k);
+        Py_DECREF(v);
+        return false;
+      }
+      Py_DECREF(k);
+      Py_DECREF(v);
+    }
+    break;
+  }
+
+  case T_STRUCT: {
+    StructTypeArgs parsedargs;
+    StructSpec* sspec;
+    Py_ssize_t i;
+    int16_t last_fid = 0;
+
+    if (!parse_struct_args(&parsedargs, typeargs)) {
+      return false;
+    }
+
+    sspec = get_struct_spec(parsedargs.spec);
+    if (sspec == NULL) {
+      return false;
+    }
+
+    for (i = 0; i < sspec->nspec; i++) {
+      StructItemSpec* parsedspec = &sspec->items[i];
+      PyObject* instval = NULL;
+      int8_t ctype;
+
+      if (parsedspec->attrname == NULL) {
+        continue;
+      }
+
+      instval = struct_field(value, parsedspec);
+
+      if (!instval) {
+        return false;
+      }
+
+      if (instval == Py_None) {
+        Py_DECREF(instval);
+        continue;
+      }
+
+      // Boolean fields carry their value in the field header.
+      if (parsedspec->type == T_BOOL) {
+        int v = PyObject_IsTrue(instval);
+        Py_DECREF(instval);
+        if (v == -1) {
+          return false;
+        }
+        writeFieldHeaderCompact(output, v ? CT_BOOLEAN_TRUE : CT_BOOLEAN_FALSE,
+                                parsedspec->tag, &last_fid);
+        continue;
+      }
+
+      ctype = getCompactType(parsedspec->type);
+      if (ctype == -1) {
+        Py_DECREF(instval);
+        return false;
+      }
+
+      writeFieldHeaderCompact(output, ctype, parsedspec->tag, &last_fid);
+
+      if (!output_val_compact(output, instval, parsedspec->type, parsedspec->typeargs)) {
+        Py_DECREF(instval);
+        return false;
+      }
+
+      Py_DECREF(instval);
+    }
+
+    writeByte(output, (int8_t)CT_STOP);
+    break;
+  }
+
+  case T_STOP:
+  case T_VOID:
+  case T_UTF16:
+  case T_UTF8:
+  case T_U64:
+  default:
+    PyErr_SetString(PyExc_TypeError, "Unexpected TType");
+    return false;
+
+  }
+
+  return true;
+}
+
+
+/* --- TOP-LEVEL WRAPPER FOR COMPACT OUTPUT --- */
+
+static PyObject *
+encode_compact(PyObject *self, PyObject *args) {
+  PyObject* enc_obj;
+  PyObject* type_args;
+  PyObject* buf;
+  PyObject* ret = NULL;
+
+  if (!PyArg_ParseTuple(args, "OO", &enc_obj, &type_args)) {
+    return NULL;
+  }
+
+  buf = PycStringIO->NewOutput(INIT_OUTBUF_SIZE);
+  if (output_val_compact(buf, enc_obj, T_STRUCT, type_args)) {
+    ret = PycStringIO->cgetvalue(buf);
+  }
+
+  Py_DECREF(buf);
+  return ret;
+}
+
+
+/* --- LOW-LEVEL COMPACT READING FUNCTIONS --- */
+
+static bool
+readVarint(DecodeBuffer* input, uint64_t* result) {
+  uint64_t val = 0;
+  int shift = 0;
+  int rsize = 0;
+
+  while (true) {
+    char* buf;
+    uint8_t byte;
 
-    read = PycStringIO->cread(input->stringiobuf, output, len);
+    if (!readBytes(input, &buf, 1)) {
+      return false;
+    }
+    byte = (uint8_t) buf[0];
+    rsize++;
 
-    if (read == len) {
+    val |= (uint64_t) (byte & 0x7f) << shift;
+    shift += 7;
+    if (!(byte & 0x80)) {
+      *result = val;
       return true;
-    } else if (read == -1) {
-      return false;
-    } else {
-      // TODO(dreiss): This could be a valid code path for big binary blobs.
-      PyErr_SetString(PyExc_TypeError,
-          "refill claimed to have refilled the buffer, but didn't!!");
+    }
+
+    // Have to check for invalid data so we don't shift past 64 bits.
+    if (rsize == 10) {
+      PyErr_SetString(PyExc_OverflowError, "Variable-length int over 10 bytes.");
       return false;
     }
   }
 }
 
-static int8_t readByte(DecodeBuffer* input) {
-  char* buf;
-  if (!readBytes(input, &buf, sizeof(int8_t))) {
-    return -1;
+static bool
+readI32Compact(DecodeBuffer* input, int32_t* result) {
+  uint64_t val;
+  if (!readVarint(input, &val)) {
+    return false;
   }
+  *result = zigzagToI32((uint32_t) val);
+  return true;
+}
 
-  return *(int8_t*) buf;
+static bool
+readSizeCompact(DecodeBuffer* input, int32_t* result) {
+  uint64_t val;
+  if (!readVarint(input, &val)) {
+    return false;
+  }
+  if (val > INT32_MAX) {
+    PyErr_SetString(PyExc_OverflowError, "size out of range");
+    return false;
+  }
+  *result = (int32_t) val;
+  return true;
 }
 
-static int16_t readI16(DecodeBuffer* input) {
+static bool
+readDoubleCompact(DecodeBuffer* input, double* result) {
+  union {
+    uint64_t f;
+    double t;
+  } transfer;
   char* buf;
-  if (!readBytes(input, &buf, sizeof(int16_t))) {
-    return -1;
+  int i;
+
+  if (!readBytes(input, &buf, 8)) {
+    return false;
   }
 
-  return (int16_t) ntohs(*(int16_t*) buf);
+  transfer.f = 0;
+  for (i = 0; i < 8; i++) {
+    transfer.f |= (uint64_t) (uint8_t) buf[i] << (8 * i);
+  }
+  *result = transfer.t;
+  return true;
 }
 
-static int32_t readI32(DecodeBuffer* input) {
+static bool
+readCollectionBeginCompact(DecodeBuffer* input, TType* etype, int32_t* len) {
+  int8_t size_and_type;
   char* buf;
-  if (!readBytes(input, &buf, sizeof(int32_t))) {
-    return -1;
-  }
-  return (int32_t) ntohl(*(int32_t*) buf);
-}
 
+  if (!readBytes(input, &buf, 1)) {
+    return false;
+  }
+  size_and_type = *(int8_t*) buf;
 
-static int64_t readI64(DecodeBuffer* input) {
-  char* buf;
-  if (!readBytes(input, &buf, sizeof(int64_t))) {
-    return -1;
+  *etype = getTType(size_and_type & 0x0f);
+  if (*etype == -1) {
+    return false;
   }
 
-  return (int64_t) ntohll(*(int64_t*) buf);
+  *len = ((uint8_t) size_and_type >> 4) & 0x0f;
+  if (*len == 15) {
+    return readSizeCompact(input, len);
+  }
+  return true;
 }
 
-static double readDouble(DecodeBuffer* input) {
-  union {
-    int64_t f;
-    double t;
-  } transfer;
+// Reads a map header; ktype and vtype are left as T_STOP for empty maps.
+static bool
+readMapBeginCompact(DecodeBuffer* input, TType* ktype, TType* vtype, int32_t* len) {
+  int8_t kvtype;
+  char* buf;
 
-  transfer.f = readI64(input);
-  if (transfer.f == -1) {
-    return -1;
+  if (!readSizeCompact(input, len)) {
+    return false;
   }
-  return transfer.t;
-}
 
-static bool
-checkTypeByte(DecodeBuffer* input, TType expected) {
-  TType got = readByte(input);
-  if (INT_CONV_ERROR_OCCURRED(got)) {
+  if (*len == 0) {
+    *ktype = *vtype = T_STOP;
+    return true;
+  }
+
+  if (!readBytes(input, &buf, 1)) {
     return false;
   }
+  kvtype = *(int8_t*) buf;
+
+  *ktype = getTType(((uint8_t) kvtype >> 4) & 0x0f);
+  *vtype = getTType(kvtype & 0x0f);
+  return *ktype != -1 && *vtype != -1;
+}
 
+static bool
+checkTType(TType expected, TType got) {
   if (expected != got) {
     PyErr_SetString(PyExc_TypeError, "got wrong ttype while reading field");
     return false;
@@ -733,104 +3943,119 @@ checkTypeByte(DecodeBuffer* input, TType expected) {
   return true;
 }
 
-static bool
-skip(DecodeBuffer* input, TType type) {
-#define SKIPBYTES(n) \
-  do { \
-    if (!readBytes(input, &dummy_buf, (n))) { \
-      return false; \
-    } \
-  } while(0)
+/*
+ * Like fixed_width, for compact collection elements.  Integers are varints,
+ * so only bytes, bools and doubles qualify.
+ */
+static int
+fixed_width_compact(TType type) {
+  switch (type) {
+  case T_BOOL:
+  case T_I08: return 1;
+  case T_DOUBLE: return 8;
+  default: return 0;
+  }
+}
 
+static bool
+skip_compact(DecodeBuffer* input, TType type) {
   char* dummy_buf;
+  uint64_t dummy_varint;
 
   switch (type) {
 
   case T_BOOL:
-  case T_I08: SKIPBYTES(1); break;
-  case T_I16: SKIPBYTES(2); break;
-  case T_I32: SKIPBYTES(4); break;
+  case T_I08:
+    return readBytes(input, &dummy_buf, 1);
+
+  case T_I16:
+  case T_I32:
   case T_I64:
-  case T_DOUBLE: SKIPBYTES(8); break;
+    return readVarint(input, &dummy_varint);
+
+  case T_DOUBLE:
+    return readBytes(input, &dummy_buf, 8);
 
   case T_STRING: {
-    // TODO(dreiss): Find out if these check_ssize_t32s are really necessary.
-    int len = readI32(input);
-    if (!check_ssize_t_32(len)) {
+    int32_t len;
+    if (!readSizeCompact(input, &len)) {
       return false;
     }
-    SKIPBYTES(len);
-    break;
+    return readBytes(input, &dummy_buf, len);
   }
 
   case T_LIST:
   case T_SET: {
     TType etype;
-    int len, i;
+    int32_t len, i;
 
-    etype = readByte(input);
-    if (etype == -1) {
+    if (!readCollectionBeginCompact(input, &etype, &len)) {
       return false;
     }
 
-    len = readI32(input);
-    if (!check_ssize_t_32(len)) {
-      return false;
+    if (fixed_width_compact(etype)) {
+      return skipBytes(input, (int64_t) len * fixed_width_compact(etype));
     }
 
     for (i = 0; i < len; i++) {
-      if (!skip(input, etype)) {
+      if (!skip_compact(input, etype)) {
         return false;
       }
     }
-    break;
+    return true;
   }
 
   case T_MAP: {
     TType ktype, vtype;
-    int len, i;
-
-    ktype = readByte(input);
-    if (ktype == -1) {
-      return false;
-    }
+    int32_t len, i;
 
-    vtype = readByte(input);
-    if (vtype == -1) {
+    if (!readMapBeginCompact(input, &ktype, &vtype, &len)) {
       return false;
     }
 
-    len = readI32(input);
-    if (!check_ssize_t_32(len)) {
-      return false;
+    if (fixed_width_compact(ktype) && fixed_width_compact(vtype)) {
+      return skipBytes(input,
+          (int64_t) len * (fixed_width_compact(ktype) + fixed_width_compact(vtype)));
     }
 
     for (i = 0; i < len; i++) {
-      if (!(skip(input, ktype) && skip(input, vtype))) {
+      if (!(skip_compact(input, ktype) && skip_compact(input, vtype))) {
         return false;
       }
     }
-    break;
+    return true;
   }
 
   case T_STRUCT: {
     while (true) {
-      TType type;
+      int8_t byte;
+      int8_t ctype;
 
-      type = readByte(input);
-      if (type == -1) {
+      if (!readBytes(input, &dummy_buf, 1)) {
         return false;
       }
+      byte = *(int8_t*) dummy_buf;
+      ctype = byte & 0x0f;
 
-      if (type == T_STOP)
-        break;
+      if (ctype == CT_STOP) {
+        return true;
+      }
 
-      SKIPBYTES(2); // tag
-      if (!skip(input, type)) {
+      // No delta means the field id follows as a varint.
+      if ((byte & 0xf0) == 0 && !readVarint(input, &dummy_varint)) {
+        return false;
+      }
+
+      // Boolean fields have no body.
+      if (ctype == CT_BOOLEAN_TRUE || ctype == CT_BOOLEAN_FALSE) {
+        continue;
+      }
+
+      type = getTType(ctype);
+      if (type == -1 || !skip_compact(input, type)) {
         return false;
       }
     }
-    break;
   }
 
   case T_STOP:
@@ -843,75 +4068,89 @@ skip(DecodeBuffer* input, TType type) {
     return false;
 
   }
-
-  return true;
-
-#undef SKIPBYTES
 }
 
 
-/* --- HELPER FUNCTION FOR DECODE_VAL --- */
+/* --- HELPER FUNCTION FOR DECODE_VAL_COMPACT --- */
 
 static PyObject*
-decode_val(DecodeBuffer* input, TType type, PyObject* typeargs);
+decode_val_compact(DecodeBuffer* input, TType type, PyObject* typeargs);
 
 static bool
-decode_struct(DecodeBuffer* input, PyObject* output, PyObject* spec_seq) {
-  int spec_seq_len = PyTuple_Size(spec_seq);
-  if (spec_seq_len == -1) {
+decode_struct_compact(DecodeBuffer* input, PyObject* output, PyObject* spec_seq) {
+  StructSpec* sspec = get_struct_spec(spec_seq);
+  int16_t last_fid = 0;
+
+  if (sspec == NULL) {
     return false;
   }
 
   while (true) {
     TType type;
+    int8_t byte;
+    int8_t ctype;
     int16_t tag;
-    PyObject* item_spec;
+    char* buf;
+    StructItemSpec* parsedspec;
     PyObject* fieldval = NULL;
-    StructItemSpec parsedspec;
 
-    type = readByte(input);
-    if (type == -1) {
+    if (!readBytes(input, &buf, 1)) {
       return false;
     }
-    if (type == T_STOP) {
+    byte = *(int8_t*) buf;
+    ctype = byte & 0x0f;
+    if (ctype == CT_STOP) {
       break;
     }
-    tag = readI16(input);
-    if (INT_CONV_ERROR_OCCURRED(tag)) {
+
+    if ((byte & 0xf0) == 0) {
+      int32_t fid;
+      if (!readI32Compact(input, &fid)) {
+        return false;
+      }
+      tag = (int16_t) fid;
+    } else {
+      tag = last_fid + (((uint8_t) byte >> 4) & 0x0f);
+    }
+    last_fid = tag;
+
+    type = getTType(ctype);
+    if (type == -1) {
       return false;
     }
-    if (tag >= 0 && tag < spec_seq_len) {
-      item_spec = PyTuple_GET_ITEM(spec_seq, tag);
+
+    if (tag >= 0 && tag < sspec->nspec) {
+      parsedspec = &sspec->items[tag];
     } else {
-      item_spec = Py_None;
+      parsedspec = NULL;
     }
 
-    if (item_spec == Py_None) {
-      if (!skip(input, type)) {
+    if (parsedspec == NULL || parsedspec->attrname == NULL) {
+      if (type != T_BOOL && !skip_compact(input, type)) {
         return false;
-      } else {
-        continue;
       }
+      continue;
     }
 
-    if (!parse_struct_item_spec(&parsedspec, item_spec)) {
-      return false;
-    }
-    if (parsedspec.type != type) {
-      if (!skip(input, type)) {
+    if (parsedspec->type != type) {
+      if (type != T_BOOL && !skip_compact(input, type)) {
         PyErr_SetString(PyExc_TypeError, "struct field had wrong type while reading and can't be skipped");
         return false;
-      } else {
-        continue;
       }
+      continue;
     }
 
-    fieldval = decode_val(input, parsedspec.type, parsedspec.typeargs);
-    if (fieldval == NULL) {
-      return false;
+    if (type == T_BOOL) {
+      fieldval = (ctype == CT_BOOLEAN_TRUE) ? Py_True : Py_False;
+      Py_INCREF(fieldval);
+    } else {
+      fieldval = decode_val_compact(input, parsedspec->type, parsedspec->typeargs);
+      if (fieldval == NULL) {
+        return false;
+      }
     }
 
-    if (PyObject_SetAttr(output, parsedspec.attrname, fieldval) == -1) {
+    if (PyObject_SetAttr(output, parsedspec->attrname, fieldval) == -1) {
       Py_DECREF(fieldval);
       return false;
     }
@@ -921,11 +4160,11 @@ decode_struct(DecodeBuffer* input, PyObject* output, PyObject* spec_seq) {
 }
 
 
-/* --- MAIN RECURSIVE INPUT FUCNTION --- */
+/* --- MAIN RECURSIVE COMPACT INPUT FUNCTION --- */
 
 // Returns a new reference.
 static PyObject*
-decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
+decode_val_compact(DecodeBuffer* input, TType type, PyObject* typeargs) {
   switch (type) {
 
   case T_BOOL: {
@@ -935,9 +4174,8 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
     }
 
     switch (v) {
-    case 0: Py_RETURN_FALSE;
-    case 1: Py_RETURN_TRUE;
-    // Don't laugh.  This is a potentially serious issue.
+    case CT_BOOLEAN_FALSE: Py_RETURN_FALSE;
+    case CT_BOOLEAN_TRUE: Py_RETURN_TRUE;
     default: PyErr_SetString(PyExc_TypeError, "boolean out of range"); return NULL;
     }
     break;
@@ -950,28 +4188,25 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
 
     return PyInt_FromLong(v);
   }
-  case T_I16: {
-    int16_t v = readI16(input);
-    if (INT_CONV_ERROR_OCCURRED(v)) {
-      return NULL;
-    }
-    return PyInt_FromLong(v);
-  }
+  case T_I16:
   case T_I32: {
-    int32_t v = readI32(input);
-    if (INT_CONV_ERROR_OCCURRED(v)) {
+    int32_t v;
+    if (!readI32Compact(input, &v)) {
       return NULL;
     }
+    if (type == T_I16) {
+      v = (int16_t) v;
+    }
     return PyInt_FromLong(v);
   }
 
   case T_I64: {
-    int64_t v = readI64(input);
-    if (INT_CONV_ERROR_OCCURRED(v)) {
+    uint64_t val;
+    int64_t v;
+    if (!readVarint(input, &val)) {
       return NULL;
     }
-    // TODO(dreiss): Find out if we can take this fastpath always when
-    //               sizeof(long) == sizeof(long long).
+    v = zigzagToI64(val);
     if (CHECK_RANGE(v, LONG_MIN, LONG_MAX)) {
       return PyInt_FromLong((long) v);
     }
@@ -980,16 +4215,19 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
   }
 
   case T_DOUBLE: {
-    double v = readDouble(input);
-    if (v == -1.0 && PyErr_Occurred()) {
-      return false;
+    double v;
+    if (!readDoubleCompact(input, &v)) {
+      return NULL;
     }
     return PyFloat_FromDouble(v);
   }
 
   case T_STRING: {
-    Py_ssize_t len = readI32(input);
+    int32_t len;
     char* buf;
+    if (!readSizeCompact(input, &len)) {
+      return NULL;
+    }
     if (!readBytes(input, &buf, len)) {
       return NULL;
     }
@@ -1000,6 +4238,7 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
   case T_LIST:
   case T_SET: {
     SetListTypeArgs parsedargs;
+    TType etype;
     int32_t len;
     PyObject* ret = NULL;
     int i;
@@ -1008,12 +4247,11 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
       return NULL;
     }
 
-    if (!checkTypeByte(input, parsedargs.element_type)) {
+    if (!readCollectionBeginCompact(input, &etype, &len)) {
       return NULL;
     }
 
-    len = readI32(input);
-    if (!check_ssize_t_32(len)) {
+    if (!checkTType(parsedargs.element_type, etype)) {
       return NULL;
     }
 
@@ -1023,7 +4261,7 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
     }
 
     for (i = 0; i < len; i++) {
-      PyObject* item = decode_val(input, parsedargs.element_type, parsedargs.typeargs);
+      PyObject* item = decode_val_compact(input, parsedargs.element_type, parsedargs.typeargs);
       if (!item) {
         Py_DECREF(ret);
         return NULL;
@@ -1031,8 +4269,6 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
       PyList_SET_ITEM(ret, i, item);
     }
 
-    // TODO(dreiss): Consider biting the bullet and making two separate cases
-    //               for list and set, avoiding this post facto conversion.
     if (type == T_SET) {
       PyObject* setret;
 #if (PY_VERSION_HEX < 0x02050000)
@@ -1051,6 +4287,7 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
   case T_MAP: {
     int32_t len;
     int i;
+    TType ktype, vtype;
     MapTypeArgs parsedargs;
     PyObject* ret = NULL;
 
@@ -1058,16 +4295,13 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
       return NULL;
     }
 
-    if (!checkTypeByte(input, parsedargs.ktag)) {
-      return NULL;
-    }
-    if (!checkTypeByte(input, parsedargs.vtag)) {
+    if (!readMapBeginCompact(input, &ktype, &vtype, &len)) {
       return NULL;
     }
 
-    len = readI32(input);
-    if (!check_ssize_t_32(len)) {
-      return false;
+    if (len > 0 && !(checkTType(parsedargs.ktag, ktype)
+                     && checkTType(parsedargs.vtag, vtype))) {
+      return NULL;
     }
 
     ret = PyDict_New();
@@ -1078,11 +4312,11 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
     for (i = 0; i < len; i++) {
       PyObject* k = NULL;
       PyObject* v = NULL;
-      k = decode_val(input, parsedargs.ktag, parsedargs.ktypeargs);
+      k = decode_val_compact(input, parsedargs.ktag, parsedargs.ktypeargs);
       if (k == NULL) {
         goto loop_error;
       }
-      v = decode_val(input, parsedargs.vtag, parsedargs.vtypeargs);
+      v = decode_val_compact(input, parsedargs.vtag, parsedargs.vtypeargs);
       if (v == NULL) {
         goto loop_error;
       }
@@ -1094,7 +4328,6 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
       Py_DECREF(v);
       continue;
 
-      // Yuck!  Destructors, anyone?
       loop_error:
       Py_XDECREF(k);
       Py_XDECREF(v);
@@ -1119,7 +4352,7 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
       return NULL;
     }
 
-    if (!decode_struct(input, ret, parsedargs.spec)) {
+    if (!decode_struct_compact(input, ret, parsedargs.spec)) {
       Py_DECREF(ret);
       return NULL;
     }
@@ -1139,17 +4372,19 @@ decode_val(DecodeBuffer* input, TType type, PyObject* typeargs) {
 }
 
 
-/* --- TOP-LEVEL WRAPPER FOR INPUT -- */
+/* --- TOP-LEVEL WRAPPER FOR COMPACT INPUT --- */
 
 static PyObject*
-decode_binary(PyObject *self, PyObject *args) {
+decode_compact(PyObject *self, PyObject *args) {
   PyObject* output_obj = NULL;
   PyObject* transport = NULL;
   PyObject* typeargs = NULL;
+  Py_ssize_t offset = 0;
+  bool from_buffer;
   StructTypeArgs parsedargs;
   DecodeBuffer input = {};
 
-  if (!PyArg_ParseTuple(args, "OOO", &output_obj, &transport, &typeargs)) {
+  if (!PyArg_ParseTuple(args, "OOO|n", &output_obj, &transport, &typeargs, &offset)) {
     return NULL;
   }
 
@@ -1157,21 +4392,69 @@ decode_binary(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  if (!decode_buffer_from_obj(&input, transport)) {
+  from_buffer = is_buffer_obj(transport);
+  if (from_buffer) {
+    if (!decode_buffer_from_bytes(&input, transport, offset)) {
+      return NULL;
+    }
+  } else if (!decode_buffer_from_obj(&input, transport)) {
     return NULL;
   }
 
-  if (!decode_struct(&input, output_obj, parsedargs.spec)) {
+  if (!decode_struct_compact(&input, output_obj, parsedargs.spec)) {
     free_decodebuf(&input);
     return NULL;
   }
 
   free_decodebuf(&input);
 
+  // When reading from a buffer, tell the caller where we stopped.
+  if (from_buffer) {
+    return PyInt_FromSsize_t(input.pos);
+  }
   Py_RETURN_NONE;
 }
 
-/* ====== END READING FUNCTIONS ====== */
+/*
+ * The compact counterpart of skip_binary.  Boolean fields carry their value
+ * in the field header, so TCompactProtocolAccelerated does not send those
+ * here.
+ */
+static PyObject*
+skip_compact_value(PyObject *self, PyObject *args) {
+  PyObject* transport = NULL;
+  int type;
+  Py_ssize_t offset = 0;
+  bool from_buffer;
+  DecodeBuffer input = {};
+
+  if (!PyArg_ParseTuple(args, "Oi|n", &transport, &type, &offset)) {
+    return NULL;
+  }
+
+  from_buffer = is_buffer_obj(transport);
+  if (from_buffer) {
+    if (!decode_buffer_from_bytes(&input, transport, offset)) {
+      return NULL;
+    }
+  } else if (!decode_buffer_from_obj(&input, transport)) {
+    return NULL;
+  }
+
+  if (!skip_compact(&input, (TType) type)) {
+    free_decodebuf(&input);
+    return NULL;
+  }
+
+  free_decodebuf(&input);
+
+  if (from_buffer) {
+    return PyInt_FromSsize_t(input.pos);
+  }
+  Py_RETURN_NONE;
+}
+
+/* ====== END COMPACT PROTOCOL FUNCTIONS ====== */
 
 
 /* -- PYTHON MODULE SETUP STUFF --- */
@@ -1179,13 +4462,31 @@ decode_binary(PyObject *self, PyObject *args) {
 static PyMethodDef ThriftFastBinaryMethods[] = {
 
   {"encode_binary",  encode_binary, METH_VARARGS, ""},
-  {"decode_binary",  decode_binary, METH_VARARGS, ""},
+  {"encode_binary_into",  encode_binary_into, METH_VARARGS, ""},
+  {"encode_binary_message",  encode_binary_message, METH_VARARGS, ""},
+  {"serialized_size",  serialized_size, METH_VARARGS, ""},
+  {"decode_binary",  (PyCFunction) decode_binary, METH_VARARGS | METH_KEYWORDS, ""},
+  {"decode_binary_fields",  (PyCFunction) decode_binary_fields, METH_VARARGS | METH_KEYWORDS, ""},
+  {"decode_binary_plain",  (PyCFunction) decode_binary_plain, METH_VARARGS | METH_KEYWORDS, ""},
+  {"decode_binary_lazy",  decode_binary_lazy, METH_VARARGS, ""},
+  {"decode_binary_value",  decode_binary_value, METH_VARARGS, ""},
+  {"skip_binary",  skip_binary, METH_VARARGS, ""},
+  {"decode_binary_message",  decode_binary_message, METH_VARARGS, ""},
+#if (PY_VERSION_HEX >= 0x02060000)
+  {"encode_many",  encode_many, METH_VARARGS, ""},
+#endif
+  {"decode_many",  decode_many, METH_VARARGS, ""},
+  {"encode_compact", encode_compact, METH_VARARGS, ""},
+  {"decode_compact", decode_compact, METH_VARARGS, ""},
+  {"skip_compact", skip_compact_value, METH_VARARGS, ""},
 
   {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
 PyMODINIT_FUNC
 initfastbinary(void) {
+  PyObject* array_module;
+
 #define INIT_INTERN_STRING(value) \
   do { \
     INTERN_STRING(value) = PyString_InternFromString(#value); \
@@ -1194,10 +4495,30 @@ initfastbinary(void) {
 
   INIT_INTERN_STRING(cstringio_buf);
   INIT_INTERN_STRING(cstringio_refill);
+  INIT_INTERN_STRING(bytearray_wbuf);
+  INIT_INTERN_STRING(bytearray_rbuf);
+  INIT_INTERN_STRING(bytearray_rpos);
+  INIT_INTERN_STRING(bytearray_rend);
+  INIT_INTERN_STRING(bytearray_refill);
+  INIT_INTERN_STRING(write);
 #undef INIT_INTERN_STRING
 
   PycString_IMPORT;
   if (PycStringIO == NULL) return;
 
+  struct_spec_cache = PyDict_New();
+  if (struct_spec_cache == NULL) return;
+
+  intern_table = PyDict_New();
+  if (intern_table == NULL) return;
+
+  // array support is optional; without the module we just build lists.
+  array_module = PyImport_ImportModule("array");
+  if (array_module != NULL) {
+    array_type = PyObject_GetAttrString(array_module, "array");
+    Py_DECREF(array_module);
+  }
+  PyErr_Clear();
+
   (void) Py_InitModule("thrift.protocol.fastbinary", ThriftFastBinaryMethods);
 }
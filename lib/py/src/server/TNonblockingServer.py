@@ -99,6 +99,10 @@ class Connection:
         self.message = ''
         self.lock = threading.Lock()
         self.wake_up = wake_up
+        # A connection has one request in progress at a time, so it can
+        # keep its input and output buffers from one request to the next.
+        self.itransport = TTransport.TMemoryBuffer()
+        self.otransport = TTransport.TMemoryBuffer()
 
     def _read_len(self):
         """Reads length of request.
@@ -284,8 +288,10 @@ class TNonblockingServer:
                 connection = self.clients[readable]
                 connection.read()
                 if connection.status == WAIT_PROCESS:
-                    itransport = TTransport.TMemoryBuffer(connection.message)
-                    otransport = TTransport.TMemoryBuffer()
+                    itransport = connection.itransport
+                    itransport.reset(connection.message)
+                    otransport = connection.otransport
+                    otransport.reset()
                     iprot = self.in_protocol.getProtocol(itransport)
                     oprot = self.out_protocol.getProtocol(otransport)
                     self.tasks.put([self.processor, iprot, oprot, 
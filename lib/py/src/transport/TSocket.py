@@ -94,17 +94,55 @@ class TSocket(TSocketBase):
       raise TTransportException(type=TTransportException.END_OF_FILE, message='TSocket read 0 bytes')
     return buff
 
+  def readinto(self, buf):
+    n = self.handle.recv_into(buf)
+    if n == 0:
+      raise TTransportException(type=TTransportException.END_OF_FILE, message='TSocket read 0 bytes')
+    return n
+
   def write(self, buff):
     if not self.handle:
       raise TTransportException(type=TTransportException.NOT_OPEN, message='Transport not open')
-    sent = 0
+    self.__send(buff)
+
+  def writev(self, bufs):
+    """Writes bufs, a list of strings, bytearrays or buffers, in order.
+
+    Python 2 sockets have no sendmsg, so there is one send per segment.
+    Runs of segments under WRITEV_MIN bytes are copied together first,
+    which is cheaper than sending them one by one; bigger ones are sent
+    as they are.
+    """
+    if not self.handle:
+      raise TTransportException(type=TTransportException.NOT_OPEN, message='Transport not open')
+    small = bytearray()
+    for buf in bufs:
+      if len(buf) < self.WRITEV_MIN:
+        small += buf
+        continue
+      if small:
+        self.__send(small)
+        small = bytearray()
+      self.__send(buf)
+    if small:
+      self.__send(small)
+
+  def __send(self, buff):
     have = len(buff)
-    while sent < have:
-      plus = self.handle.send(buff)
-      if plus == 0:
+    sent = self.handle.send(buff)
+    if sent == have:
+      return
+    # Go on from where the send stopped through a view, instead of
+    # copying what is left each time.
+    view = memoryview(buff)
+    while True:
+      if sent == 0:
         raise TTransportException(type=TTransportException.END_OF_FILE, message='TSocket sent 0 bytes')
-      sent += plus
-      buff = buff[plus:]
+      view = view[sent:]
+      have -= sent
+      if have == 0:
+        return
+      sent = self.handle.send(view)
 
   def flush(self):
     pass
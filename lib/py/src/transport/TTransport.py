@@ -17,8 +17,7 @@
 # under the License.
 #
 
-from cStringIO import StringIO
-from struct import pack,unpack
+from struct import pack,pack_into,unpack
 from thrift.Thrift import TException
 
 class TTransportException(TException):
@@ -30,6 +29,8 @@ class TTransportException(TException):
   ALREADY_OPEN = 2
   TIMED_OUT = 3
   END_OF_FILE = 4
+  NEGATIVE_SIZE = 5
+  SIZE_LIMIT = 6
 
   def __init__(self, type=UNKNOWN, message=None):
     TException.__init__(self, message)
@@ -39,6 +40,11 @@ class TTransportBase:
 
   """Base class for Thrift transport layer."""
 
+  # writev joins segments smaller than this rather than passing each one
+  # on, and buffering transports pass on strings at least this big as
+  # they are instead of copying them into their buffer.
+  WRITEV_MIN = 65536
+
   def isOpen(self):
     pass
 
@@ -52,21 +58,65 @@ class TTransportBase:
     pass
 
   def readAll(self, sz):
-    buff = ''
-    have = 0
-    while (have < sz):
-      chunk = self.read(sz-have)
-      have += len(chunk)
-      buff += chunk
+    chunk = self.read(sz)
+    if len(chunk) == sz:
+      return chunk
 
+    # Collect the chunks and join them once: adding them up one by one
+    # would copy a big read that arrives in small pieces over and over.
+    chunks = []
+    have = 0
+    while True:
       if len(chunk) == 0:
         raise EOFError()
 
-    return buff
+      have += len(chunk)
+      chunks.append(chunk)
+      if have >= sz:
+        break
+      chunk = self.read(sz-have)
+
+    return ''.join(chunks)
+
+  def readinto(self, buf):
+    """Reads up to len(buf) bytes into buf, a bytearray or memoryview,
+    returning how many were read.
+
+    This version goes through read; transports that can receive into buf
+    directly override it.
+    """
+    chunk = self.read(len(buf))
+    buf[:len(chunk)] = chunk
+    return len(chunk)
+
+  def readAllInto(self, buf):
+    """Fills buf, a bytearray or memoryview, the way readAll reads a
+    string, so that a big read lands in one preallocated buffer."""
+    if not len(buf):
+      # Like readAll(0), don't touch the transport: some take reading
+      # nothing for the end of the stream.
+      return
+    have = self.readinto(buf)
+    if have < len(buf):
+      view = memoryview(buf)
+      while have < len(view):
+        n = self.readinto(view[have:])
+        if n == 0:
+          raise EOFError()
+        have += n
 
   def write(self, buf):
     pass
 
+  def writev(self, bufs):
+    """Writes bufs, a list of strings, bytearrays or buffers, in order.
+
+    This version writes them one at a time; transports that can pass
+    segments on without joining them override it.
+    """
+    for buf in bufs:
+      self.write(buf)
+
   def flush(self):
     pass
 
@@ -98,6 +148,32 @@ class CReadableTransport:
     """
     pass
 
+  # Alternatively, a transport can keep what it has read in a bytearray,
+  # which C then reads in place.  It sets bytearray_rbuf to the bytearray,
+  # and bytearray_rpos and bytearray_rend to plain int attributes marking
+  # the unread part of it; fastbinary sets bytearray_rpos when it's done.
+  bytearray_rbuf = None
+
+  def bytearray_refill(self, reqlen):
+    """Makes at least reqlen bytes available after bytearray_rpos,
+    replacing bytearray_rbuf or moving the unread data within it if need
+    be.
+
+    If reqlen bytes can't be read, throw EOFError.
+    """
+    pass
+
+class CWritableTransport:
+  """base class for transports that are writable from C"""
+
+  @property
+  def bytearray_wbuf(self):
+    """A bytearray holding what has been written but not yet flushed.
+
+    fastbinary.encode_binary_into appends to it in place of calling write.
+    """
+    pass
+
 class TServerTransportBase:
 
   """Base class for Thrift server transports."""
@@ -127,16 +203,32 @@ class TBufferedTransportFactory:
     return buffered
 
 
-class TBufferedTransport(TTransportBase,CReadableTransport):
+class TBufferedTransport(TTransportBase, CReadableTransport, CWritableTransport):
+
+  """Class that wraps another transport and buffers its I/O.
 
-  """Class that wraps another transport and buffers its I/O."""
+  Reads are received into one bytearray, which is kept from refill to
+  refill and which fastbinary reads in place.  How much is read ahead
+  follows the traffic: it doubles whenever a read fills all the room it
+  was given, and halves after two reads in a row that used less than
+  half of it, within rbuf_size and MAX_READAHEAD.  When a big read grows
+  the buffer past that, it is replaced by a smaller one at the next
+  refill after it has been consumed.
+  """
 
   DEFAULT_BUFFER = 4096
+  MAX_READAHEAD = 1 << 20
 
-  def __init__(self, trans):
+  def __init__(self, trans, rbuf_size=DEFAULT_BUFFER):
     self.__trans = trans
-    self.__wbuf = StringIO()
-    self.__rbuf = StringIO("")
+    self.__wbuf = bytearray()
+    self.__wsegs = []
+    self.__min_readahead = rbuf_size
+    self.__readahead = rbuf_size
+    self.__small_reads = 0
+    self.bytearray_rbuf = bytearray(rbuf_size)
+    self.bytearray_rpos = 0
+    self.bytearray_rend = 0
 
   def isOpen(self):
     return self.__trans.isOpen()
@@ -147,108 +239,236 @@ class TBufferedTransport(TTransportBase,CReadableTransport):
   def close(self):
     return self.__trans.close()
 
+  def __fill(self, reqlen):
+    """Reads until at least reqlen bytes are unread, or the underlying
+    transport has nothing more, and returns how many are unread.  The
+    unread bytes are moved to the front of the buffer first.
+
+    reqlen often comes off the wire, so no more than MAX_READAHEAD is
+    allocated for it ahead of the data: past that the buffer grows as
+    the data comes in, and a bogus length runs into the end of the
+    stream before it can take much memory."""
+    buf = self.bytearray_rbuf
+    rpos = self.bytearray_rpos
+    rend = self.bytearray_rend - rpos
+    size = rend + self.__readahead
+    if reqlen > size:
+      size = min(reqlen, rend + self.MAX_READAHEAD)
+    if len(buf) < size or len(buf) > 2 * size:
+      # Doubling what is kept keeps many small refills linear.
+      new = bytearray(max(size, 2 * rend))
+      new[:rend] = buffer(buf, rpos, rend)
+      buf = self.bytearray_rbuf = new
+    elif rpos:
+      buf[:rend] = buf[rpos:rpos + rend]
+    self.bytearray_rpos = 0
+    self.bytearray_rend = rend
+
+    view = memoryview(buf)
+    while rend < reqlen:
+      room = len(buf) - rend
+      if room == 0:
+        new = bytearray(min(2 * rend, reqlen))
+        new[:rend] = buf
+        buf = self.bytearray_rbuf = new
+        view = memoryview(buf)
+        room = len(buf) - rend
+      n = self.__trans.readinto(view[rend:])
+      if n == 0:
+        break
+      rend += n
+      self.bytearray_rend = rend
+      if n == room:
+        self.__readahead = min(2 * self.__readahead, self.MAX_READAHEAD)
+        self.__small_reads = 0
+      elif 2 * n < self.__readahead:
+        self.__small_reads += 1
+        if self.__small_reads == 2:
+          self.__readahead = max(self.__readahead // 2, self.__min_readahead)
+          self.__small_reads = 0
+    return rend
+
   def read(self, sz):
-    ret = self.__rbuf.read(sz)
-    if len(ret) != 0:
-      return ret
+    rpos = self.bytearray_rpos
+    avail = self.bytearray_rend - rpos
+    if avail == 0:
+      avail = self.__fill(1)
+      rpos = 0
+    sz = min(sz, avail)
+    self.bytearray_rpos = rpos + sz
+    return str(buffer(self.bytearray_rbuf, rpos, sz))
 
-    self.__rbuf = StringIO(self.__trans.read(max(sz, self.DEFAULT_BUFFER)))
-    return self.__rbuf.read(sz)
+  def readAll(self, sz):
+    if self.bytearray_rend - self.bytearray_rpos < sz and self.__fill(sz) < sz:
+      raise EOFError()
+    rpos = self.bytearray_rpos
+    self.bytearray_rpos = rpos + sz
+    return str(buffer(self.bytearray_rbuf, rpos, sz))
+
+  def readinto(self, buf):
+    rpos = self.bytearray_rpos
+    avail = self.bytearray_rend - rpos
+    if avail == 0:
+      if len(buf) >= self.__readahead:
+        # Buffering this much would only add a copy.
+        return self.__trans.readinto(buf)
+      avail = self.__fill(1)
+      rpos = 0
+    sz = min(len(buf), avail)
+    buf[:sz] = buffer(self.bytearray_rbuf, rpos, sz)
+    self.bytearray_rpos = rpos + sz
+    return sz
 
   def write(self, buf):
-    self.__wbuf.write(buf)
+    if len(buf) >= self.WRITEV_MIN and isinstance(buf, str):
+      # Strings can't change before the flush, so a big one is kept
+      # as a segment of its own rather than copied.
+      self.__wsegs.extend((self.__wbuf, buf))
+      self.__wbuf = bytearray()
+    else:
+      self.__wbuf += buf
 
   def flush(self):
-    out = self.__wbuf.getvalue()
+    out = self.__wbuf
+    segs = self.__wsegs
     # reset wbuf before write/flush to preserve state on underlying failure
-    self.__wbuf = StringIO()
-    self.__trans.write(out)
+    self.__wbuf = bytearray()
+    if segs:
+      self.__wsegs = []
+      segs.append(out)
+      self.__trans.writev(segs)
+    else:
+      self.__trans.write(out)
     self.__trans.flush()
 
   # Implement the CReadableTransport interface.
-  @property
-  def cstringio_buf(self):
-    return self.__rbuf
-
-  def cstringio_refill(self, partialread, reqlen):
-    retstring = partialread
-    if reqlen < self.DEFAULT_BUFFER:
-      # try to make a read of as much as we can.
-      retstring += self.__trans.read(self.DEFAULT_BUFFER)
-
-    # but make sure we do read reqlen bytes.
-    if len(retstring) < reqlen:
-      retstring += self.__trans.readAll(reqlen - len(retstring))
+  def bytearray_refill(self, reqlen):
+    if self.__fill(reqlen) < reqlen:
+      raise EOFError()
 
-    self.__rbuf = StringIO(retstring)
-    return self.__rbuf
+  # Implement the CWritableTransport interface.
+  @property
+  def bytearray_wbuf(self):
+    return self.__wbuf
 
 class TMemoryBuffer(TTransportBase, CReadableTransport):
-  """Wraps a cStringIO object as a TTransport.
-
-  NOTE: Unlike the C++ version of this class, you cannot write to it
-        then immediately read from it.  If you want to read from a
-        TMemoryBuffer, you must either pass a string to the constructor.
-  TODO(dreiss): Make this work like the C++ version.
+  """A TTransport over one bytearray, like the C++ version.
+
+  Writes go to the end of the buffer and reads come from the front, so
+  what is written can be read back straight away.  reset() empties the
+  buffer, optionally refilling it, but keeps its memory, so a server can
+  keep one input and one output buffer per connection instead of making
+  new ones for every request.  fastbinary reads the buffer in place (the
+  bytearray_rbuf interface of CReadableTransport).
   """
 
   def __init__(self, value=None):
-    """value -- a value to read from for stringio
-
-    If value is set, this will be a transport for reading,
-    otherwise, it is for writing"""
+    """value -- a string to read from, if any"""
+    self.bytearray_rbuf = bytearray()
+    self.bytearray_rpos = 0
+    self.bytearray_rend = 0
     if value is not None:
-      self._buffer = StringIO(value)
-    else:
-      self._buffer = StringIO()
+      self.write(value)
 
   def isOpen(self):
-    return not self._buffer.closed
+    return self.bytearray_rbuf is not None
 
   def open(self):
     pass
 
   def close(self):
-    self._buffer.close()
+    self.bytearray_rbuf = None
+
+  def reset(self, value=None):
+    """Drops what is in the buffer and then writes value, if given.
+
+    The buffer keeps its size; data is copied into it from the front.
+    """
+    self.bytearray_rpos = 0
+    self.bytearray_rend = 0
+    if value is not None:
+      self.write(value)
 
   def read(self, sz):
-    return self._buffer.read(sz)
+    rpos = self.bytearray_rpos
+    sz = min(sz, self.bytearray_rend - rpos)
+    self.bytearray_rpos = rpos + sz
+    return str(buffer(self.bytearray_rbuf, rpos, sz))
+
+  def readAll(self, sz):
+    rpos = self.bytearray_rpos
+    if self.bytearray_rend - rpos < sz:
+      raise EOFError()
+    self.bytearray_rpos = rpos + sz
+    return str(buffer(self.bytearray_rbuf, rpos, sz))
+
+  def readinto(self, buf):
+    rpos = self.bytearray_rpos
+    sz = min(len(buf), self.bytearray_rend - rpos)
+    buf[:sz] = buffer(self.bytearray_rbuf, rpos, sz)
+    self.bytearray_rpos = rpos + sz
+    return sz
 
   def write(self, buf):
-    self._buffer.write(buf)
+    # Where this runs past the end, the bytearray grows to fit.
+    rend = self.bytearray_rend
+    end = rend + len(buf)
+    self.bytearray_rbuf[rend:end] = buf
+    self.bytearray_rend = end
 
   def flush(self):
     pass
 
   def getvalue(self):
-    return self._buffer.getvalue()
+    """Returns everything written since the last reset, read or not."""
+    return str(buffer(self.bytearray_rbuf, 0, self.bytearray_rend))
 
   # Implement the CReadableTransport interface.
-  @property
-  def cstringio_buf(self):
-    return self._buffer
-
-  def cstringio_refill(self, partialread, reqlen):
-    # only one shot at reading...
-    raise EOFError()
+  def bytearray_refill(self, reqlen):
+    # Everything there is to read is already in the buffer.
+    if self.bytearray_rend - self.bytearray_rpos < reqlen:
+      raise EOFError()
 
 class TFramedTransportFactory:
 
   """Factory transport that builds framed transports"""
 
+  def __init__(self, max_frame_size=None):
+    self.max_frame_size = max_frame_size
+
   def getTransport(self, trans):
-    framed = TFramedTransport(trans)
+    framed = TFramedTransport(trans, self.max_frame_size)
     return framed
 
 
-class TFramedTransport(TTransportBase, CReadableTransport):
+class TFramedTransport(TTransportBase, CReadableTransport, CWritableTransport):
+
+  """Class that wraps another transport and frames its I/O when writing.
 
-  """Class that wraps another transport and frames its I/O when writing."""
+  Each frame is read into one bytearray, kept from frame to frame, with a
+  single readAllInto of the underlying transport (recv_into on a
+  TSocket), and fastbinary reads it in place.  No more than
+  MAX_PREALLOC is allocated for a frame before its data arrives; a bigger
+  one grows its buffer as it comes in, so a corrupt size runs into the end
+  of the stream before it can take much memory.  Frames of any size are
+  accepted unless max_frame_size is given, in which case bigger ones are
+  refused with a SIZE_LIMIT TTransportException before anything is read.
 
-  def __init__(self, trans,):
+  Writes go into a bytearray that starts with room for the frame size, so
+  flush sends each frame with one write without copying it.
+  """
+
+  MIN_BUFFER = 4096
+  MAX_PREALLOC = 1 << 20
+
+  def __init__(self, trans, max_frame_size=None):
     self.__trans = trans
-    self.__rbuf = StringIO()
-    self.__wbuf = StringIO()
+    self.__max_frame_size = max_frame_size
+    self.__wbuf = bytearray(4)
+    self.__wsegs = []
+    self.bytearray_rbuf = bytearray()
+    self.bytearray_rpos = 0
+    self.bytearray_rend = 0
 
   def isOpen(self):
     return self.__trans.isOpen()
@@ -260,48 +480,124 @@ class TFramedTransport(TTransportBase, CReadableTransport):
     return self.__trans.close()
 
   def read(self, sz):
-    ret = self.__rbuf.read(sz)
-    if len(ret) != 0:
-      return ret
+    if self.bytearray_rend == self.bytearray_rpos:
+      self.readFrame()
+    rpos = self.bytearray_rpos
+    sz = min(sz, self.bytearray_rend - rpos)
+    self.bytearray_rpos = rpos + sz
+    return str(buffer(self.bytearray_rbuf, rpos, sz))
 
-    self.readFrame()
-    return self.__rbuf.read(sz)
+  def readAll(self, sz):
+    rpos = self.bytearray_rpos
+    if self.bytearray_rend - rpos < sz:
+      return TTransportBase.readAll(self, sz)
+    self.bytearray_rpos = rpos + sz
+    return str(buffer(self.bytearray_rbuf, rpos, sz))
+
+  def __readSize(self):
+    sz, = unpack('!i', self.__trans.readAll(4))
+    if sz < 0:
+      raise TTransportException(TTransportException.NEGATIVE_SIZE,
+                                'Negative frame size %d' % sz)
+    if self.__max_frame_size is not None and sz > self.__max_frame_size:
+      raise TTransportException(TTransportException.SIZE_LIMIT,
+                                'Frame size %d is over the limit of %d' %
+                                (sz, self.__max_frame_size))
+    return sz
 
   def readFrame(self):
-    buff = self.__trans.readAll(4)
-    sz, = unpack('!i', buff)
-    self.__rbuf = StringIO(self.__trans.readAll(sz))
+    """Reads the next frame into the read buffer, after what is unread of
+    the ones before."""
+    self.__readFrame(self.__readSize())
+
+  def __readFrame(self, sz):
+    if sz == 0:
+      # There is nothing to read, and a TSocket would take reading
+      # nothing for the end of the stream.
+      return
+    buf = self.bytearray_rbuf
+    rpos = self.bytearray_rpos
+    rend = self.bytearray_rend - rpos
+    size = rend + sz
+    if len(buf) < size or len(buf) > max(2 * size, self.MIN_BUFFER):
+      # Doubling what is kept keeps many small frames linear.
+      new = bytearray(max(min(size, rend + self.MAX_PREALLOC), 2 * rend))
+      new[:rend] = buffer(buf, rpos, rend)
+      buf = self.bytearray_rbuf = new
+    elif rpos:
+      buf[:rend] = buf[rpos:rpos + rend]
+    self.bytearray_rpos = 0
+    self.bytearray_rend = rend
+    have = rend
+    while len(buf) < size:
+      # A big frame: fill the buffer, then double it.
+      self.__trans.readAllInto(memoryview(buf)[have:])
+      have = len(buf)
+      new = bytearray(min(2 * have, size))
+      new[:have] = buf
+      buf = self.bytearray_rbuf = new
+    self.__trans.readAllInto(memoryview(buf)[have:size])
+    self.bytearray_rend = size
+
+  def readinto(self, buf):
+    rpos = self.bytearray_rpos
+    avail = self.bytearray_rend - rpos
+    if avail == 0:
+      sz = self.__readSize()
+      while sz == 0:
+        # Reading nothing would look like the end of the stream.
+        sz = self.__readSize()
+      if sz <= len(buf):
+        # The whole frame fits, so it can go straight into buf.
+        self.__trans.readAllInto(memoryview(buf)[:sz])
+        return sz
+      self.__readFrame(sz)
+      rpos = 0
+      avail = sz
+    sz = min(len(buf), avail)
+    buf[:sz] = buffer(self.bytearray_rbuf, rpos, sz)
+    self.bytearray_rpos = rpos + sz
+    return sz
 
   def write(self, buf):
-    self.__wbuf.write(buf)
+    if len(buf) >= self.WRITEV_MIN and isinstance(buf, str):
+      # Strings can't change before the flush, so a big one is kept
+      # as a segment of its own rather than copied.
+      self.__wsegs.extend((self.__wbuf, buf))
+      self.__wbuf = bytearray()
+    else:
+      self.__wbuf += buf
 
   def flush(self):
-    wout = self.__wbuf.getvalue()
-    wsz = len(wout)
+    wout = self.__wbuf
+    segs = self.__wsegs
     # reset wbuf before write/flush to preserve state on underlying failure
-    self.__wbuf = StringIO()
-    # N.B.: Doing this string concatenation is WAY cheaper than making
-    # two separate calls to the underlying socket object. Socket writes in
-    # Python turn out to be REALLY expensive, but it seems to do a pretty
-    # good job of managing string buffer operations without excessive copies
-    buf = pack("!i", wsz) + wout
-    self.__trans.write(buf)
+    self.__wbuf = bytearray(4)
+    # N.B.: Sending the frame size and the frame with one write is WAY
+    # cheaper than making two separate calls to the underlying socket
+    # object.  Socket writes in Python turn out to be REALLY expensive.
+    # The size goes in the room left for it at the front of the buffer,
+    # which is the first segment if big strings were kept apart.
+    if segs:
+      self.__wsegs = []
+      segs.append(wout)
+      pack_into("!i", segs[0], 0, sum(map(len, segs)) - 4)
+      self.__trans.writev(segs)
+    else:
+      pack_into("!i", wout, 0, len(wout) - 4)
+      self.__trans.write(wout)
     self.__trans.flush()
 
   # Implement the CReadableTransport interface.
-  @property
-  def cstringio_buf(self):
-    return self.__rbuf
-
-  def cstringio_refill(self, prefix, reqlen):
-    # self.__rbuf will already be empty here because fastbinary doesn't
-    # ask for a refill until the previous buffer is empty.  Therefore,
-    # we can start reading new frames immediately.
-    while len(prefix) < reqlen:
+  def bytearray_refill(self, reqlen):
+    # A value can run on into the next frames; join them up behind it.
+    while self.bytearray_rend - self.bytearray_rpos < reqlen:
       self.readFrame()
-      prefix += self.__rbuf.getvalue()
-    self.__rbuf = StringIO(prefix)
-    return self.__rbuf
+
+  # Implement the CWritableTransport interface.
+  @property
+  def bytearray_wbuf(self):
+    return self.__wbuf
 
 
 class TFileObjectTransport(TTransportBase):
@@ -25,20 +25,19 @@ from twisted.python import log
 from twisted.web import server, resource, http
 
 from thrift.transport import TTransport
-from cStringIO import StringIO
 
 
 class TMessageSenderTransport(TTransport.TTransportBase):
 
     def __init__(self):
-        self.__wbuf = StringIO()
+        self.__wbuf = TTransport.TMemoryBuffer()
 
     def write(self, buf):
         self.__wbuf.write(buf)
 
     def flush(self):
         msg = self.__wbuf.getvalue()
-        self.__wbuf = StringIO()
+        self.__wbuf.reset()
         self.sendMessage(msg)
 
     def sendMessage(self, message):
@@ -69,6 +68,7 @@ class ThriftClientProtocol(basic.Int32StringReceiver):
 
         self.recv_map = {}
         self.started = defer.Deferred()
+        self._rbuf = TTransport.TMemoryBuffer()
 
     def dispatch(self, msg):
         self.sendString(msg)
@@ -86,7 +86,9 @@ class ThriftClientProtocol(basic.Int32StringReceiver):
             v.errback(tex)
 
     def stringReceived(self, frame):
-        tr = TTransport.TMemoryBuffer(frame)
+        # Replies are read as they arrive, so one buffer does for all.
+        tr = self._rbuf
+        tr.reset(frame)
         iprot = self._iprot_factory.getProtocol(tr)
         (fname, mtype, rseqid) = iprot.readMessageBegin()
 
@@ -103,28 +105,46 @@ class ThriftServerProtocol(basic.Int32StringReceiver):
 
     MAX_LENGTH = 2 ** 31 - 1
 
+    def __init__(self):
+        # Buffers of finished requests, kept for the next ones.  Several
+        # requests can be in progress at once, each with its own buffers.
+        self._buffers = []
+
+    def _getBuffer(self):
+        if self._buffers:
+            return self._buffers.pop()
+        return TTransport.TMemoryBuffer()
+
+    def _putBuffers(self, tmi, tmo):
+        tmi.reset()
+        tmo.reset()
+        self._buffers.extend((tmi, tmo))
+
     def dispatch(self, msg):
         self.sendString(msg)
 
-    def processError(self, error):
+    def processError(self, error, tmi, tmo):
+        self._putBuffers(tmi, tmo)
         self.transport.loseConnection()
 
-    def processOk(self, _, tmo):
+    def processOk(self, _, tmi, tmo):
         msg = tmo.getvalue()
+        self._putBuffers(tmi, tmo)
 
         if len(msg) > 0:
             self.dispatch(msg)
 
     def stringReceived(self, frame):
-        tmi = TTransport.TMemoryBuffer(frame)
-        tmo = TTransport.TMemoryBuffer()
+        tmi = self._getBuffer()
+        tmi.reset(frame)
+        tmo = self._getBuffer()
 
         iprot = self.factory.iprot_factory.getProtocol(tmi)
         oprot = self.factory.oprot_factory.getProtocol(tmo)
 
         d = self.factory.processor.process(iprot, oprot)
         d.addCallbacks(self.processOk, self.processError,
-            callbackArgs=(tmo,))
+            callbackArgs=(tmi, tmo), errbackArgs=(tmi, tmo))
 
 
 class IThriftServerFactory(Interface):
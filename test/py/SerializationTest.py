@@ -24,12 +24,31 @@ sys.path.insert(0, './gen-py')
 sys.path.insert(0, glob.glob('../../lib/py/build/lib.*')[0])
 
 from ThriftTest.ttypes import *
+from DebugProtoTest.ttypes import HolyMoley, CompactProtoTestStruct
 from thrift.transport import TTransport
 from thrift.transport import TSocket
-from thrift.protocol import TBinaryProtocol
-from thrift.TSerialization import serialize, deserialize
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+from thrift.protocol import fastbinary
+from thrift.TSerialization import serialize, serialized_size, serialize_many, deserialize_many
+from thrift.TSerialization import deserialize, deserialize_lazy, projection, iter_field
+from thrift.TSerialization import deserialize_plain, serialize_plain
 import unittest
 import time
+import array
+import struct
+import socket
+import copy
+import pickle
+import cPickle
+
+class TrickleBuffer(TTransport.TMemoryBuffer):
+  """A TMemoryBuffer that hands out at most 7 bytes per read."""
+
+  def read(self, sz):
+    return TTransport.TMemoryBuffer.read(self, min(sz, 7))
+
+  def readinto(self, buf):
+    return TTransport.TMemoryBuffer.readinto(self, memoryview(buf)[:7])
 
 class AbstractTest(unittest.TestCase):
 
@@ -78,12 +97,598 @@ class AbstractTest(unittest.TestCase):
       self.assertEquals(obj.end_in_both, self.v2obj.end_in_both)
 
 
+  def testProjection(self):
+      prot = self.protocol_factory.getProtocol(
+          TTransport.TMemoryBuffer(self._serialize(self.v2obj)))
+      obj = VersioningTestV2()
+      obj.read(prot, projection([1, 5, (7, 1), 12]))
+      self.assertEquals(obj, VersioningTestV2(begin_in_both=12345, newlong=4,
+          newstruct=Bonk(message="Hello!"), end_in_both=54321))
+
+  def testProjectionFromIds(self):
+      # Field ids and paths can be passed as they are, as a set or a list,
+      # on every path.
+      data = self._serialize(self.v2obj)
+      expected = VersioningTestV2(begin_in_both=12345, newstruct=Bonk(message="Hello!"),
+                                  newlist=[7,8,9])
+      for fields in (set([1, (7, 1), 8]), [1, (7, 1), 8]):
+        prot = self.protocol_factory.getProtocol(TTransport.TMemoryBuffer(data))
+        obj = VersioningTestV2()
+        obj.read(prot, fields)
+        self.assertEquals(obj, expected)
+        self.assertEquals(deserialize(VersioningTestV2(), data, self.protocol_factory, fields),
+                          expected)
+      expected = VersioningTestV2(begin_in_both=12345, newstruct=self.v2obj.newstruct)
+      self.assertEquals(deserialize(VersioningTestV2(), data, self.protocol_factory,
+                                    set([1, 7])), expected)
+
+  def testFixedValues(self):
+      values = [(TType.BOOL, [True, False, True]),
+                (TType.BYTE, [-128, 0, 127]),
+                (TType.I16, [-32768, 1, 32767]),
+                (TType.I32, [-2**31, 1, 2**31-1]),
+                (TType.I64, [-2**63, 1, 2**63-1]),
+                (TType.DOUBLE, [-1.5, 0.0, 1e100])]
+      def write(bulk):
+        trans = TTransport.TMemoryBuffer()
+        prot = self.protocol_factory.getProtocol(trans)
+        for etype, vals in values:
+          prot.writeListBegin(etype, len(vals))
+          if bulk:
+            prot.writeFixedValues(etype, vals)
+          else:
+            TProtocol.TProtocolBase.writeFixedValues(prot, etype, vals)
+          prot.writeListEnd()
+        return trans.getvalue()
+      data = write(True)
+      self.assertEquals(data, write(False))
+
+      prot = self.protocol_factory.getProtocol(TTransport.TMemoryBuffer(data))
+      for etype, vals in values:
+        (_etype, size) = prot.readListBegin()
+        self.assertEquals(prot.readFixedValues(etype, size), vals)
+        prot.readListEnd()
+
+  def testIterField(self):
+      data = self._serialize(self.v2obj)
+      trans = TTransport.TBufferedTransport(TTransport.TMemoryBuffer(data))
+      prot = self.protocol_factory.getProtocol(trans)
+      obj = VersioningTestV2()
+      self.assertEquals(list(iter_field(prot, obj, 8)), [7,8,9])
+      self.assertEquals(obj.newlist, None)
+      self.assertEquals(obj.newstruct, self.v2obj.newstruct)
+      self.assertEquals(obj.newmap, self.v2obj.newmap)
+      self.assertEquals(obj.end_in_both, 54321)
+
+      prot = self.protocol_factory.getProtocol(TTransport.TMemoryBuffer(data))
+      obj = VersioningTestV2()
+      self.assertEquals(sorted(iter_field(prot, obj, 10)), [(1,2), (2,3)])
+      self.assertEquals(obj.newlist, [7,8,9])
+
+  def testSerializedSize(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      insanity = Insanity(userMap={Numberz.FIVE: 5, Numberz.EIGHT: 8},
+                          xtructs=[Xtruct(string_thing="abc", i64_thing=-1),
+                                   Xtruct(byte_thing=3)])
+      for obj in (self.v1obj, self.v2obj, insanity, Xtruct2()):
+        self.assertEquals(serialized_size(obj, self.protocol_factory),
+                          len(self._serialize(obj)))
+
+  def testMany(self):
+      objs = [Xtruct(string_thing=str(i), i32_thing=i) for i in range(5)] + [Xtruct()]
+      data = serialize_many(objs, self.protocol_factory)
+      records = [self._serialize(obj) for obj in objs]
+      self.assertEquals(data, ''.join([struct.pack('!i', len(r)) + r for r in records]))
+      self.assertEquals(deserialize_many(Xtruct, data, self.protocol_factory), objs)
+      self.assertEquals(serialize_many([], self.protocol_factory), '')
+      self.assertEquals(deserialize_many(Xtruct, '', self.protocol_factory), [])
+      self.assertRaises(EOFError, deserialize_many, Xtruct, data[:-1], self.protocol_factory)
+
+  def testPlain(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      data = self._serialize(self.v2obj)
+      plain = deserialize_plain(VersioningTestV2, data, self.protocol_factory)
+      self.assertEquals(plain['newstruct'], {'type': 123, 'message': 'Hello!'})
+      self.assertEquals(plain['newset'], set([42, 1, 8]))
+      self.assertEquals(serialize_plain(VersioningTestV2, plain, self.protocol_factory), data)
+      plain = deserialize_plain(VersioningTestV2, data, self.protocol_factory, tuples=True)
+      self.assertEquals(len(plain), len(VersioningTestV2.thrift_spec))
+      self.assertEquals(plain[7], (None, 'Hello!', 123))
+      self.assertEquals(plain[10], {1: 2, 2: 3})
+      self.assertEquals(serialize_plain(VersioningTestV2, plain, self.protocol_factory), data)
+
+      # Fields that aren't there are left out.
+      data = self._serialize(self.v1obj)
+      self.assertEquals(deserialize_plain(VersioningTestV2, data, self.protocol_factory),
+                        {'begin_in_both': 12345, 'end_in_both': 54321})
+      self.assertEquals(serialize_plain(VersioningTestV1, {'begin_in_both': 12345,
+                                                           'old_string': 'aaa',
+                                                           'end_in_both': 54321},
+                                        self.protocol_factory), data)
+
+  def testFramed(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      data = self._serialize(self.v2obj)
+      trans = TTransport.TMemoryBuffer()
+      framed = TTransport.TFramedTransport(trans)
+      prot = self.protocol_factory.getProtocol(framed)
+      self.v2obj.write(prot)
+      framed.flush()
+      self.v1obj.write(prot)
+      framed.flush()
+      self.assertEquals(trans.getvalue(), struct.pack('!i', len(data)) + data +
+                        struct.pack('!i', len(self._serialize(self.v1obj))) +
+                        self._serialize(self.v1obj))
+
+  def testBufferedRead(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      objs = [self.v2obj, self.v1obj, Xtruct(string_thing='x' * 10000), Xtruct()]
+      data = ''.join([self._serialize(obj) for obj in objs])
+      for source in (TTransport.TMemoryBuffer(data), TrickleBuffer(data)):
+        trans = TTransport.TBufferedTransport(source)
+        prot = self.protocol_factory.getProtocol(trans)
+        for obj in objs:
+          copy = obj.__class__()
+          copy.read(prot)
+          self.assertEquals(copy, obj)
+        self.assertRaises(EOFError, trans.readAll, 1)
+
+  def testMemoryBuffer(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      trans = TTransport.TMemoryBuffer()
+      prot = self.protocol_factory.getProtocol(trans)
+      self.v1obj.write(prot)
+      self.v2obj.write(prot)
+      for obj in (self.v1obj, self.v2obj):
+        copy = obj.__class__()
+        copy.read(prot)
+        self.assertEquals(copy, obj)
+      self.assertRaises(EOFError, trans.readAll, 1)
+      self.assertEquals(trans.getvalue(), self._serialize(self.v1obj) + self._serialize(self.v2obj))
+
+      # reset() starts over in the same memory.
+      buf = trans.bytearray_rbuf
+      trans.reset(self._serialize(self.v2obj))
+      copy = VersioningTestV2()
+      copy.read(prot)
+      self.assertEquals(copy, self.v2obj)
+      trans.reset()
+      self.assertEquals(trans.getvalue(), '')
+      self.v1obj.write(prot)
+      self.assertEquals(trans.getvalue(), self._serialize(self.v1obj))
+      self.assert_(trans.bytearray_rbuf is buf)
+
+  def testWholeMessage(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      trans = TTransport.TMemoryBuffer()
+      prot = self.protocol_factory.getProtocol(trans)
+      prot.writeMessage("foo", TMessageType.REPLY, 7, self.v2obj)
+      prot.writeMessage("bar", TMessageType.EXCEPTION, -1,
+                        TApplicationException(TApplicationException.UNKNOWN_METHOD, "bar"))
+      prot = self.protocol_factory.getProtocol(TTransport.TMemoryBuffer(trans.getvalue()))
+      self.assertEquals(prot.readMessage(VersioningTestV2()),
+                        ("foo", TMessageType.REPLY, 7, self.v2obj))
+      (name, type, seqid, x) = prot.readMessage(VersioningTestV2())
+      self.assertEquals((name, type, seqid), ("bar", TMessageType.EXCEPTION, -1))
+      self.assertTrue(isinstance(x, TApplicationException))
+      self.assertEquals((x.type, x.message), (TApplicationException.UNKNOWN_METHOD, "bar"))
+
+  def testSkip(self):
+      data = self._serialize(self.v2obj) + self._serialize(self.v1obj)
+      prot = self.protocol_factory.getProtocol(TTransport.TMemoryBuffer(data))
+      prot.skip(TType.STRUCT)
+      obj = VersioningTestV1()
+      obj.read(prot)
+      self.assertEquals(obj, self.v1obj)
+
+
 class NormalBinaryTest(AbstractTest):
   protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()
 
+  def testBufferedReadahead(self):
+      trans = TTransport.TBufferedTransport(TTransport.TMemoryBuffer('x' * 100000 + 'y' * 100))
+      self.assertEquals(trans.readAll(100000), 'x' * 100000)
+      self.assertEquals(len(trans.bytearray_rbuf), 100000)
+      # The outsized buffer goes, but the read-ahead has doubled.
+      self.assertEquals(trans.read(1000), 'y' * 100)
+      self.assertEquals(len(trans.bytearray_rbuf), 2 * trans.DEFAULT_BUFFER)
+      self.assertEquals(trans.read(1000), '')
+
+  def testBogusLength(self):
+      # A corrupt length runs into the end of the data before the buffer
+      # is grown anywhere near it.
+      for source in (TTransport.TMemoryBuffer('\x7f\xff\xff\x00abc'),
+                     TrickleBuffer('\x7f\xff\xff\x00' + 'x' * 100000)):
+        trans = TTransport.TBufferedTransport(source)
+        prot = TBinaryProtocol.TBinaryProtocol(trans)
+        self.assertRaises(EOFError, prot.readString)
+        self.assert_(len(trans.bytearray_rbuf) <= 2 * trans.MAX_READAHEAD)
+      trans = TTransport.TBufferedTransport(TTransport.TMemoryBuffer('abc'))
+      self.assertRaises(EOFError, trans.bytearray_refill, 0x7fffffff)
+      self.assert_(len(trans.bytearray_rbuf) <= trans.MAX_READAHEAD)
+
+  def testReadInto(self):
+      data = ''.join([chr(i % 251) for i in xrange(20000)])
+      framed = ''.join([struct.pack('!i', len(chunk)) + chunk
+                        for chunk in (data[:3], data[3:10003], data[10003:])])
+      for trans in (TTransport.TMemoryBuffer(data), TrickleBuffer(data),
+                    TTransport.TBufferedTransport(TrickleBuffer(data)),
+                    TTransport.TBufferedTransport(TTransport.TMemoryBuffer(data)),
+                    TTransport.TFramedTransport(TTransport.TMemoryBuffer(framed))):
+        self.assertEquals(trans.readAll(3), data[:3])
+        buf = bytearray(10000)
+        trans.readAllInto(buf)
+        self.assertEquals(buf, data[3:10003])
+        # What is left is too short, but still lands in the buffer.
+        buf = bytearray(10000)
+        self.assertRaises(EOFError, trans.readAllInto, buf)
+        self.assertEquals(buf[:9997], data[10003:])
+
+      # Filling nothing doesn't read, so it isn't taken for the end of a
+      # TSocket's stream.
+      a, b = socket.socketpair()
+      reader = TSocket.TSocket()
+      reader.setHandle(b)
+      a.sendall('x')
+      reader.readAllInto(bytearray())
+      self.assertEquals(reader.readAll(1), 'x')
+      a.close()
+      reader.close()
+
+  def testWritev(self):
+      class Recorder(TTransport.TMemoryBuffer):
+        def writev(self, bufs):
+          self.segments = bufs
+          TTransport.TMemoryBuffer.writev(self, bufs)
+      big = 'x' * TTransport.TTransportBase.WRITEV_MIN
+      for wrapper, header in ((TTransport.TBufferedTransport, ''),
+                              (TTransport.TFramedTransport, struct.pack('!i', len(big) + 4))):
+        out = Recorder()
+        trans = wrapper(out)
+        trans.write('ab')
+        trans.write(big)
+        trans.write(bytearray('cd'))
+        trans.flush()
+        self.assertEquals(out.getvalue(), header + 'ab' + big + 'cd')
+        # The big string is passed on, not copied.
+        self.assert_(out.segments[1] is big)
+
+      a, b = socket.socketpair()
+      writer = TSocket.TSocket()
+      writer.setHandle(a)
+      writer.WRITEV_MIN = 4
+      writer.writev(['ab', bytearray('cd'), 'efghij', buffer('klm')])
+      reader = TSocket.TSocket()
+      reader.setHandle(b)
+      self.assertEquals(reader.readAll(13), 'abcdefghijklm')
+      writer.close()
+      reader.close()
+
 class AcceleratedBinaryTest(AbstractTest):
   protocol_factory = TBinaryProtocol.TBinaryProtocolAcceleratedFactory()
 
+  def testDecodeManyPadding(self):
+      data = self._serialize(Xtruct())
+      self.assertRaises(ValueError, fastbinary.decode_many,
+                        struct.pack('!i', len(data) + 1) + data + '\0', (Xtruct, Xtruct.thrift_spec))
+
+  def testSerializedSizeChecks(self):
+      # serialized_size fails wherever serialize would, the same way.
+      for obj, exc in ((Xtruct(i32_thing='x'), TypeError),
+                       (Xtruct(i32_thing=1<<40), OverflowError),
+                       (Xtruct(byte_thing=128), OverflowError),
+                       (Xtruct(i64_thing=1<<70), OverflowError),
+                       (VersioningTestV2(newdouble='x'), TypeError),
+                       (VersioningTestV2(newlist=[1, 'x']), TypeError),
+                       (VersioningTestV2(newmap={1: 1<<40}), OverflowError)):
+        self.assertRaises(exc, serialize, obj, self.protocol_factory)
+        self.assertRaises(exc, serialized_size, obj, self.protocol_factory)
+
+  def testEncodeInto(self):
+      data = self._serialize(self.v2obj)
+      spec = (VersioningTestV2, VersioningTestV2.thrift_spec)
+      buf = bytearray('head')
+      self.assertEquals(fastbinary.encode_binary_into(self.v2obj, spec, buf), len(data))
+      self.assertEquals(buf, 'head' + data)
+      self.assertEquals(fastbinary.encode_binary_into(self.v2obj, spec, buf), len(data))
+      self.assertEquals(buf, 'head' + data + data)
+
+      # A failed encode leaves the buffer as it was.
+      buf = bytearray('head')
+      self.v2obj.newint = 'bad'
+      self.assertRaises(TypeError, fastbinary.encode_binary_into, self.v2obj, spec, buf)
+      self.assertEquals(buf, 'head')
+
+      self.v2obj.newint = 1
+      trans = TTransport.TMemoryBuffer()
+      self.assertEquals(fastbinary.encode_binary_into(self.v2obj, spec, trans), len(data))
+      self.assertEquals(trans.getvalue(), data)
+
+  def testMessageMatchesPython(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      spec = (VersioningTestV2, VersioningTestV2.thrift_spec)
+      trans = TTransport.TMemoryBuffer()
+      prot = TBinaryProtocol.TBinaryProtocol(trans)
+      prot.writeMessageBegin("foo", TMessageType.CALL, 3)
+      self.v2obj.write(prot)
+      prot.writeMessageEnd()
+      data = trans.getvalue()
+      out = bytearray()
+      fastbinary.encode_binary_message(out, "foo", TMessageType.CALL, 3, self.v2obj, spec)
+      self.assertEquals(out, data)
+
+      obj = VersioningTestV2()
+      self.assertEquals(fastbinary.decode_binary_message(
+          TTransport.TMemoryBuffer(data), obj, spec, None, True),
+                        ("foo", TMessageType.CALL, 3, obj))
+      self.assertEquals(obj, self.v2obj)
+      self.assertRaises(TProtocol.TProtocolException, fastbinary.decode_binary_message,
+                        TTransport.TMemoryBuffer(data[4:]), None, None, None, True)
+
+  def testLazy(self):
+      data = self._serialize(self.v2obj)
+      self.v2obj.newset = set(self.v2obj.newset)
+
+      obj = deserialize_lazy(VersioningTestV2(), data)
+      self.assert_(isinstance(obj, VersioningTestV2))
+      self.assertEquals(obj.newint, 1)
+      self.assertEquals(obj.newstring, "Hola!")
+      self.failIf(dict.__contains__(obj.__dict__, 'newlist'))
+      self.assertEquals(obj.newlist, [7,8,9])
+      self.assertEquals(obj.newstruct, Bonk(message="Hello!", type=123))
+      self.assertEquals(self._serialize(obj),
+                        self._serialize(self._deserialize(VersioningTestV2, data)))
+      self.assertEquals(obj, self.v2obj)
+      self.assertEquals(obj.__class__, VersioningTestV2)
+
+      obj = deserialize_lazy(VersioningTestV2(), data)
+      obj.newmap = {}
+      self.assertNotEquals(obj, self.v2obj)
+      self.assertEquals(obj.__class__, VersioningTestV2)
+      self.assertEquals(obj.newmap, {})
+
+  def testLazyLikePlain(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      data = self._serialize(self.v2obj)
+      # Equal from either side, with nothing extra in the __dict__.
+      obj = deserialize_lazy(VersioningTestV2(), data)
+      self.assertEquals(self.v2obj, obj)
+      self.assertEquals(obj.__dict__, self.v2obj.__dict__)
+      self.assertEquals(type(obj.__dict__), dict)
+      obj = deserialize_lazy(VersioningTestV2(), data)
+      self.assertEquals(sorted(obj.__dict__.keys()), sorted(self.v2obj.__dict__.keys()))
+      self.assertEquals(repr(obj), repr(self.v2obj))
+
+      obj = deserialize_lazy(VersioningTestV2(), data)
+      self.assertEquals(obj.__class__, VersioningTestV2)
+      self.assertEquals(obj.__class__.__module__, VersioningTestV2.__module__)
+      for dumps in (pickle.dumps, cPickle.dumps):
+        for proto in (0, 1, 2):
+          copied = pickle.loads(dumps(deserialize_lazy(VersioningTestV2(), data), proto))
+          self.assertEquals(copied.__class__, VersioningTestV2)
+          self.assertEquals(copied, self.v2obj)
+      for clone in (copy.copy, copy.deepcopy):
+        obj = deserialize_lazy(VersioningTestV2(), data)
+        self.assertEquals(clone(obj), self.v2obj)
+
+  def testArrays(self):
+      self.v2obj.newset = set(self.v2obj.newset)
+      data = self._serialize(self.v2obj)
+      obj = deserialize(VersioningTestV2(), data, self.protocol_factory, arrays=True)
+      self.assertEquals(obj.newlist, array.array('i', [7,8,9]))
+      self.assertEquals(serialized_size(obj, self.protocol_factory), len(data))
+      self.assertEquals(obj.newset, self.v2obj.newset)
+      self.assertEquals(self._serialize(obj), data)
+
+      obj = deserialize(VersioningTestV2(), data, arrays=True)
+      self.assertEquals(obj, self.v2obj)
+
+  def testColumns(self):
+      obj = Insanity(userMap={1: 2},
+                     xtructs=[Xtruct(string_thing="a", byte_thing=1, i32_thing=2, i64_thing=3),
+                              Xtruct(string_thing="b", i32_thing=5, i64_thing=6)])
+      data = self._serialize(obj)
+      objcopy = deserialize(Insanity(), data, self.protocol_factory, columns=True)
+      self.assertEquals(self._serialize(objcopy), data)
+      self.assertEquals(serialized_size(objcopy, self.protocol_factory), len(data))
+      self.assertEquals(objcopy.userMap, {1: 2})
+      # i64 columns are arrays only where a C long has 64 bits.
+      self.assertEquals(list(objcopy.xtructs.pop('i64_thing')), [3, 6])
+      self.assertEquals(objcopy.xtructs, {'string_thing': ["a", "b"],
+                                          'byte_thing': [1, None],
+                                          'i32_thing': array.array('i', [2, 5])})
+
+      objcopy = deserialize(Insanity(), data, self.protocol_factory, columns=True,
+                            fields=projection([(2, 9)]))
+      self.assertEquals(objcopy.xtructs, {'i32_thing': array.array('i', [2, 5])})
+
+      self.assertRaises(ValueError, deserialize, Insanity(), data, columns=True)
+
+  def testIntern(self):
+      # Too long to be interned anywhere but in a map key.
+      key = 'thrift.requests.count.60'
+      data = self._serialize(HolyMoley(bonks={key: []}))
+      first = deserialize(HolyMoley(), data, self.protocol_factory, intern=True)
+      second = deserialize(HolyMoley(), data, self.protocol_factory, intern=True)
+      self.assertEquals(second, first)
+      self.assert_(second.bonks.keys()[0] is first.bonks.keys()[0])
+      plain = deserialize(HolyMoley(), data, self.protocol_factory)
+      self.assert_(plain.bonks.keys()[0] is not first.bonks.keys()[0])
+
+      data = self._serialize(Xtruct(string_thing='pending'))
+      first = deserialize(Xtruct(), data, self.protocol_factory, intern=True)
+      second = deserialize(Xtruct(), data, self.protocol_factory, intern=True)
+      self.assert_(second.string_thing is first.string_thing)
+      data = self._serialize(Xtruct(string_thing=key))
+      first = deserialize(Xtruct(), data, self.protocol_factory, intern=True)
+      second = deserialize(Xtruct(), data, self.protocol_factory, intern=True)
+      self.assert_(second.string_thing is not first.string_thing)
+
+  def testViews(self):
+      blob = '\0\xff' * 1000
+      obj = CompactProtoTestStruct(a_binary=blob, binary_list=['a', blob], binary_set=set(['b']),
+                                   binary_byte_map={'c': 1}, byte_string_map={1: blob})
+      data = self._serialize(obj)
+      copy = deserialize(CompactProtoTestStruct(), data, self.protocol_factory, views=True)
+      self.assertEquals(type(copy.a_binary), buffer)
+      self.assertEquals(str(copy.a_binary), blob)
+      self.assertEquals(map(str, copy.binary_list), ['a', blob])
+      self.assertEquals(str(copy.byte_string_map[1]), blob)
+      # Set elements and map keys have to stay strs.
+      self.assertEquals(copy.binary_set, set(['b']))
+      self.assertEquals(copy.binary_byte_map, {'c': 1})
+      self.assertEquals(self._serialize(copy), data)
+      self.assertEquals(serialized_size(copy, self.protocol_factory), len(data))
+
+      copy = deserialize(CompactProtoTestStruct(), bytearray(data), self.protocol_factory,
+                         views=True)
+      self.assertEquals(str(copy.a_binary), blob)
+      self.assertRaises(TypeError, fastbinary.decode_binary, CompactProtoTestStruct(),
+                        TTransport.TMemoryBuffer(data),
+                        (CompactProtoTestStruct, CompactProtoTestStruct.thrift_spec), views=True)
+
+  def testSkipBadType(self):
+      prot = self.protocol_factory.getProtocol(TTransport.TMemoryBuffer('\xff\x00\x01'))
+      self.assertRaises(TypeError, prot.skip, TType.STRUCT)
+
+class OptimizedBinaryTest(AbstractTest):
+  protocol_factory = TBinaryProtocol.TBinaryProtocolOptimizedFactory()
+
+  def testSameAsNormal(self):
+      trans = TTransport.TMemoryBuffer()
+      self.v2obj.write(TBinaryProtocol.TBinaryProtocol(trans))
+      self.assertEquals(self._serialize(self.v2obj), trans.getvalue())
+
+  def testBufferedTransport(self):
+      data = self._serialize(self.v2obj) * 500
+      self.v2obj.newset = set(self.v2obj.newset)
+      trans = TTransport.TBufferedTransport(TTransport.TMemoryBuffer(data))
+      prot = self.protocol_factory.getProtocol(trans)
+      for i in xrange(500):
+        obj = VersioningTestV2()
+        obj.read(prot)
+        self.assertEquals(obj, self.v2obj)
+
+  def testReadsBuffer(self):
+      class NoReadAll(TTransport.TMemoryBuffer):
+        def readAll(self, sz):
+          raise AssertionError('readAll called')
+      self.v2obj.newset = set(self.v2obj.newset)
+      for trans in (NoReadAll(self._serialize(self.v2obj)),
+                    TTransport.TBufferedTransport(NoReadAll(self._serialize(self.v2obj)))):
+        obj = VersioningTestV2()
+        obj.read(self.protocol_factory.getProtocol(trans))
+        self.assertEquals(obj, self.v2obj)
+
+class CompactProtocolTest(AbstractTest):
+  protocol_factory = TCompactProtocol.TCompactProtocolFactory()
+
+  def testRoundTrip(self):
+      obj = self._deserialize(VersioningTestV2, self._serialize(self.v2obj))
+      self.assertEquals(obj.newset, set(self.v2obj.newset))
+      obj.newset = self.v2obj.newset
+      self.assertEquals(obj, self.v2obj)
+
+  def testWireFormat(self):
+      """Test that the encoding matches the C++ TCompactProtocol"""
+      obj = Xtruct(string_thing="a", byte_thing=-1, i32_thing=-2,
+                   i64_thing=1<<40)
+      self.assertEquals(self._serialize(obj),
+          "\x18\x01a\x33\xff\x55\x03\x26\x80\x80\x80\x80\x80\x40\x00")
+      trans = TTransport.TMemoryBuffer()
+      prot = self.protocol_factory.getProtocol(trans)
+      prot.writeMessageBegin("foo", TMessageType.REPLY, 7)
+      self.assertEquals(trans.getvalue(), "\x82\x41\x07\x03foo")
+      prot = self.protocol_factory.getProtocol(
+          TTransport.TMemoryBuffer(trans.getvalue()))
+      self.assertEquals(prot.readMessageBegin(), ("foo", TMessageType.REPLY, 7))
+
+  def testMessageTypes(self):
+      for mtype in (TMessageType.CALL, TMessageType.REPLY,
+                    TMessageType.EXCEPTION, TMessageType.ONEWAY):
+        trans = TTransport.TMemoryBuffer()
+        prot = self.protocol_factory.getProtocol(trans)
+        prot.writeMessageBegin("foo", mtype, 7)
+        prot.writeMessageEnd()
+        prot = self.protocol_factory.getProtocol(
+            TTransport.TMemoryBuffer(trans.getvalue()))
+        self.assertEquals(prot.readMessageBegin(), ("foo", mtype, 7))
+
+class AcceleratedCompactTest(CompactProtocolTest):
+  protocol_factory = TCompactProtocol.TCompactProtocolAcceleratedFactory()
+
+class JSONProtocolTest(AbstractTest):
+  protocol_factory = TJSONProtocol.TJSONProtocolFactory()
+
+  def testRoundTrip(self):
+      obj = self._deserialize(VersioningTestV2, self._serialize(self.v2obj))
+      self.assertEquals(obj.newset, set(self.v2obj.newset))
+      obj.newset = self.v2obj.newset
+      self.assertEquals(obj, self.v2obj)
+
+  def testWireFormat(self):
+      """Test that the encoding matches the C++ TJSONProtocol"""
+      obj = Xtruct(string_thing='a"\n\x01', byte_thing=-1, i32_thing=-2,
+                   i64_thing=1<<40)
+      data = ('{"1":{"str":"a\\"\\n\\u0001"},"4":{"i8":-1},"9":{"i32":-2},'
+              '"11":{"i64":1099511627776}}')
+      self.assertEquals(self._serialize(obj), data)
+      self.assertEquals(self._deserialize(Xtruct, data), obj)
+
+      obj = VersioningTestV2(newdouble=float('inf'), newmap={1: 2})
+      data = ('{"6":{"dbl":"Infinity"},"10":{"map":["i32","i32",1,{"1":2}]}}')
+      self.assertEquals(self._serialize(obj), data)
+      self.assertEquals(self._deserialize(VersioningTestV2, data), obj)
+
+  def testMessage(self):
+      trans = TTransport.TMemoryBuffer()
+      prot = self.protocol_factory.getProtocol(trans)
+      prot.writeMessageBegin("foo", TMessageType.REPLY, 7)
+      self.v2obj.write(prot)
+      prot.writeMessageEnd()
+      self.assertEquals(trans.getvalue()[:13], '[1,"foo",2,7,')
+      prot = self.protocol_factory.getProtocol(
+          TTransport.TMemoryBuffer(trans.getvalue()))
+      self.assertEquals(prot.readMessageBegin(), ("foo", TMessageType.REPLY, 7))
+      obj = VersioningTestV2()
+      obj.read(prot)
+      prot.readMessageEnd()
+      obj.newset = self.v2obj.newset
+      self.assertEquals(obj, self.v2obj)
+
+class AcceleratedJSONTest(JSONProtocolTest):
+  protocol_factory = TJSONProtocol.TJSONProtocolAcceleratedFactory()
+
+  def testMatchesTokenProtocol(self):
+      trans = TTransport.TMemoryBuffer()
+      self.v2obj.write(TJSONProtocol.TJSONProtocol(trans))
+      self.assertEquals(self._serialize(self.v2obj), trans.getvalue())
+
+  def testNestedFallback(self):
+      obj = Insanity(userMap={}, xtructs=[Xtruct(string_thing='x{"}' * 3, i32_thing=i)
+                                          for i in xrange(200)])
+      data = self._serialize(obj)
+      calls = []
+      class FailingDecoder:
+        def raw_decode(self, s):
+          calls.append(s)
+          raise ValueError("as if the json module couldn't parse it")
+      decoder = TJSONProtocol._decoder
+      TJSONProtocol._decoder = FailingDecoder()
+      try:
+        # The whole struct is gathered, even through a small buffer, and
+        # once the json module gives up on it, the Xtructs in it are read
+        # token by token too.
+        for trans in (TTransport.TMemoryBuffer(data),
+                      TTransport.TBufferedTransport(TTransport.TMemoryBuffer(data), 64)):
+          del calls[:]
+          copy = Insanity()
+          copy.read(self.protocol_factory.getProtocol(trans))
+          self.assertEquals(copy, obj)
+          self.assertEquals(calls, [data])
+      finally:
+        TJSONProtocol._decoder = decoder
+
 
 class AcceleratedFramedTest(unittest.TestCase):
   def testSplit(self):
@@ -119,6 +724,61 @@ class AcceleratedFramedTest(unittest.TestCase):
     self.assertEqual(prot.readString(), bigstring)
     self.assertEqual(prot.readI16(), 24)
 
+  def testStructAcrossFrames(self):
+    obj = Xtruct(string_thing='x' * 1000, i32_thing=5)
+    data = serialize(obj)
+    framed = ''.join([struct.pack('!i', len(part)) + part
+                      for part in ('', data[:3], '', data[3:500], data[500:])])
+    # Empty frames mustn't be taken for the end of a socket's stream.
+    a, b = socket.socketpair()
+    a.sendall(framed)
+    sock = TSocket.TSocket()
+    sock.setHandle(b)
+    for trans in (TTransport.TMemoryBuffer(framed), TrickleBuffer(framed), sock):
+      prot = TBinaryProtocol.TBinaryProtocolAccelerated(TTransport.TFramedTransport(trans))
+      copy = Xtruct()
+      copy.read(prot)
+      self.assertEquals(copy, obj)
+    a.close()
+    sock.close()
+
+    # readinto goes on past empty frames too.
+    trans = TTransport.TFramedTransport(TTransport.TMemoryBuffer(framed))
+    buf = bytearray(3)
+    self.assertEquals(trans.readinto(buf), 3)
+    self.assertEquals(buf, data[:3])
+    self.assertEquals(trans.readinto(buf), 3)
+    self.assertEquals(buf, data[3:6])
+
+  def testMaxFrameSize(self):
+    # There is no limit unless one is given, and a big frame gets its
+    # buffer as it arrives.
+    big = TTransport.TFramedTransport.MAX_PREALLOC * 3 + 1
+    data = struct.pack('!i', big) + 'y' * big
+    self.assertEquals(TTransport.TFramedTransport(TTransport.TMemoryBuffer(data)).readAll(big),
+                      'y' * big)
+    trans = TTransport.TFramedTransport(TTransport.TMemoryBuffer(data[:-1]))
+    self.assertRaises(EOFError, trans.read, 1)
+    trans = TTransport.TFramedTransport(TTransport.TMemoryBuffer('\x7f\xff\xff\xffabc'))
+    self.assertRaises(EOFError, trans.read, 1)
+    self.assert_(len(trans.bytearray_rbuf) <= trans.MAX_PREALLOC)
+    self.assertEquals(trans.bytearray_rend, 0)
+
+    data = struct.pack('!i', 100) + 'x' * 100
+    self.assertEquals(TTransport.TFramedTransport(TTransport.TMemoryBuffer(data), 100).read(1000),
+                      'x' * 100)
+    self.assertEquals(TTransport.TFramedTransportFactory(100).getTransport(
+        TTransport.TMemoryBuffer(data)).read(1000), 'x' * 100)
+    for data, limit, type in ((data, 99, TTransport.TTransportException.SIZE_LIMIT),
+                              (struct.pack('!i', -1), 99, TTransport.TTransportException.NEGATIVE_SIZE)):
+      trans = TTransport.TFramedTransport(TTransport.TMemoryBuffer(data), limit)
+      try:
+        trans.read(1)
+      except TTransport.TTransportException, e:
+        self.assertEquals(e.type, type)
+      else:
+        self.fail('expected TTransportException')
+
 class SerializersTest(unittest.TestCase):
 
   def testSerializeThenDeserialize(self):
@@ -137,6 +797,47 @@ class SerializersTest(unittest.TestCase):
     deserialize(objcopy, serialize(obj))
     self.assertEquals(obj, objcopy)
 
+  def testDeserializeFromBuffers(self):
+    obj = Xtruct2(i32_thing=1,
+                  struct_thing=Xtruct(string_thing="foo", i64_thing=-5))
+    for factory in (TBinaryProtocol.TBinaryProtocolAcceleratedFactory(),
+                    TCompactProtocol.TCompactProtocolAcceleratedFactory()):
+      data = serialize(obj, factory)
+      for buf in (data, buffer(data), bytearray(data), memoryview(data)):
+        objcopy = Xtruct2()
+        deserialize(objcopy, buf, factory)
+        self.assertEquals(obj, objcopy)
+
+  def testDeserializeProjection(self):
+    obj = Insanity(userMap={1: 2}, xtructs=[Xtruct(string_thing="a", i32_thing=1),
+                                            Xtruct(string_thing="b", i32_thing=2)])
+    fields = projection([(2, 1)])
+    self.assertEquals(fields, {2: {1: None}})
+    for factory in (TBinaryProtocol.TBinaryProtocolFactory(),
+                    TBinaryProtocol.TBinaryProtocolAcceleratedFactory()):
+      objcopy = deserialize(Insanity(), serialize(obj, factory), factory, fields)
+      self.assertEquals(objcopy, Insanity(xtructs=[Xtruct(string_thing="a"),
+                                                   Xtruct(string_thing="b")]))
+
+  def testDecodeFromBufferOffset(self):
+    """Test that decode_binary reads from a buffer at an offset"""
+    try:
+      from thrift.protocol import fastbinary
+    except ImportError:
+      return
+    spec = (Xtruct, Xtruct.thrift_spec)
+    one = serialize(Xtruct(string_thing="one"))
+    two = serialize(Xtruct(string_thing="two"))
+    data = bytearray(one + two)
+    obj = Xtruct()
+    self.assertEquals(fastbinary.decode_binary(obj, data, spec), len(one))
+    self.assertEquals(obj.string_thing, "one")
+    self.assertEquals(fastbinary.decode_binary(obj, data, spec, len(one)),
+                      len(data))
+    self.assertEquals(obj.string_thing, "two")
+    self.assertRaises(EOFError, fastbinary.decode_binary, Xtruct(),
+                      data[:-1], spec, len(one))
+
 
 def suite():
   suite = unittest.TestSuite()
@@ -144,6 +845,11 @@ def suite():
 
   suite.addTest(loader.loadTestsFromTestCase(NormalBinaryTest))
   suite.addTest(loader.loadTestsFromTestCase(AcceleratedBinaryTest))
+  suite.addTest(loader.loadTestsFromTestCase(OptimizedBinaryTest))
+  suite.addTest(loader.loadTestsFromTestCase(CompactProtocolTest))
+  suite.addTest(loader.loadTestsFromTestCase(AcceleratedCompactTest))
+  suite.addTest(loader.loadTestsFromTestCase(JSONProtocolTest))
+  suite.addTest(loader.loadTestsFromTestCase(AcceleratedJSONTest))
   suite.addTest(loader.loadTestsFromTestCase(AcceleratedFramedTest))
   suite.addTest(loader.loadTestsFromTestCase(SerializersTest))
   return suite
@@ -28,14 +28,19 @@ from ThriftTest.ttypes import *
 from thrift.transport import TTransport
 from thrift.transport import TSocket
 from thrift.protocol import TBinaryProtocol
+from thrift.protocol import TCompactProtocol
+from thrift.protocol import TJSONProtocol
 import unittest
 import time
 
 class TestEof(unittest.TestCase):
 
   def setUp(self):
+    self.data = self.serializeData(TBinaryProtocol.TBinaryProtocolFactory())
+
+  def serializeData(self, pfactory):
     trans = TTransport.TMemoryBuffer()
-    prot = TBinaryProtocol.TBinaryProtocol(trans)
+    prot = pfactory.getProtocol(trans)
 
     x = Xtruct()
     x.string_thing = "Zero"
@@ -49,7 +54,7 @@ class TestEof(unittest.TestCase):
 
     x.write(prot)
 
-    self.data = trans.getvalue()
+    return trans.getvalue()
 
   def testTransportReadAll(self):
     """Test that readAll on any type of transport throws an EOFError"""
@@ -111,6 +116,35 @@ class TestEof(unittest.TestCase):
     self.eofTestHelper(TBinaryProtocol.TBinaryProtocolAcceleratedFactory())
     self.eofTestHelperStress(TBinaryProtocol.TBinaryProtocolAcceleratedFactory())
 
+  def testBinaryProtocolOptimizedEof(self):
+    """Test that TBinaryProtocolOptimized throws an EOFError when it reaches the end of the stream"""
+    self.eofTestHelper(TBinaryProtocol.TBinaryProtocolOptimizedFactory())
+    self.eofTestHelperStress(TBinaryProtocol.TBinaryProtocolOptimizedFactory())
+
+  def testCompactProtocolEof(self):
+    """Test that TCompactProtocol throws an EOFError when it reaches the end of the stream"""
+    self.data = self.serializeData(TCompactProtocol.TCompactProtocolFactory())
+    self.eofTestHelper(TCompactProtocol.TCompactProtocolFactory())
+    self.eofTestHelperStress(TCompactProtocol.TCompactProtocolFactory())
+
+  def testCompactProtocolAcceleratedEof(self):
+    """Test that TCompactProtocolAccelerated throws an EOFError when it reaches the end of the stream"""
+    self.data = self.serializeData(TCompactProtocol.TCompactProtocolFactory())
+    self.eofTestHelper(TCompactProtocol.TCompactProtocolAcceleratedFactory())
+    self.eofTestHelperStress(TCompactProtocol.TCompactProtocolAcceleratedFactory())
+
+  def testJSONProtocolEof(self):
+    """Test that TJSONProtocol throws an EOFError when it reaches the end of the stream"""
+    self.data = self.serializeData(TJSONProtocol.TJSONProtocolFactory())
+    self.eofTestHelper(TJSONProtocol.TJSONProtocolFactory())
+    self.eofTestHelperStress(TJSONProtocol.TJSONProtocolFactory())
+
+  def testJSONProtocolAcceleratedEof(self):
+    """Test that TJSONProtocolAccelerated throws an EOFError when it reaches the end of the stream"""
+    self.data = self.serializeData(TJSONProtocol.TJSONProtocolFactory())
+    self.eofTestHelper(TJSONProtocol.TJSONProtocolAcceleratedFactory())
+    self.eofTestHelperStress(TJSONProtocol.TJSONProtocolAcceleratedFactory())
+
 def suite():
   suite = unittest.TestSuite()
   loader = unittest.TestLoader()
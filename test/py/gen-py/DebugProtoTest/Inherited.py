@@ -0,0 +1,230 @@
+#
+# Autogenerated by Thrift
+#
+# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+#
+
+from thrift.Thrift import *
+import DebugProtoTest.Srv
+from ttypes import *
+from thrift.Thrift import TProcessor
+from thrift.transport import TTransport
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+
+class Iface(DebugProtoTest.Srv.Iface):
+  def identity(self, arg):
+    """
+    Parameters:
+     - arg
+    """
+    pass
+
+
+class Client(DebugProtoTest.Srv.Client, Iface):
+  def __init__(self, iprot, oprot=None):
+    DebugProtoTest.Srv.Client.__init__(self, iprot, oprot)
+
+  def identity(self, arg):
+    """
+    Parameters:
+     - arg
+    """
+    self.send_identity(arg)
+    return self.recv_identity()
+
+  def send_identity(self, arg):
+    args = identity_args()
+    args.arg = arg
+    self._oprot.writeMessage('identity', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_identity(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(identity_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "identity failed: unknown result");
+
+
+class Processor(DebugProtoTest.Srv.Processor, Iface, TProcessor):
+  def __init__(self, handler):
+    DebugProtoTest.Srv.Processor.__init__(self, handler)
+    self._processMap["identity"] = Processor.process_identity
+
+  def process(self, iprot, oprot):
+    (name, type, seqid) = iprot.readMessageBegin()
+    if name not in self._processMap:
+      iprot.skip(TType.STRUCT)
+      iprot.readMessageEnd()
+      x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+      oprot.writeMessage(name, TMessageType.EXCEPTION, seqid, x)
+      oprot.trans.flush()
+      return
+    else:
+      self._processMap[name](self, seqid, iprot, oprot)
+    return True
+
+  def process_identity(self, seqid, iprot, oprot):
+    args = identity_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = identity_result()
+    result.success = self._handler.identity(args.arg)
+    oprot.writeMessage("identity", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+class identity_args:
+  """
+  Attributes:
+   - arg
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'arg', None, None, ), # 1
+  )
+
+  def __init__(self, arg=None,):
+    self.arg = arg
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.arg = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('identity_args')
+    if self.arg != None:
+      oprot.writeFieldBegin('arg', TType.I32, 1)
+      oprot.writeI32(self.arg)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class identity_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.I32, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.I32 and (fields is None or 0 in fields):
+          self.success = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('identity_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.I32, 0)
+      oprot.writeI32(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+
@@ -0,0 +1,259 @@
+#
+# Autogenerated by Thrift
+#
+# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+#
+
+from thrift.Thrift import *
+from ttypes import *
+from thrift.Thrift import TProcessor
+from thrift.transport import TTransport
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+
+class Iface:
+  def myMethod(self, first, second, third, fourth):
+    """
+    Parameters:
+     - first
+     - second
+     - third
+     - fourth
+    """
+    pass
+
+
+class Client(Iface):
+  def __init__(self, iprot, oprot=None):
+    self._iprot = self._oprot = iprot
+    if oprot != None:
+      self._oprot = oprot
+    self._seqid = 0
+
+  def myMethod(self, first, second, third, fourth):
+    """
+    Parameters:
+     - first
+     - second
+     - third
+     - fourth
+    """
+    self.send_myMethod(first, second, third, fourth)
+    self.recv_myMethod()
+
+  def send_myMethod(self, first, second, third, fourth):
+    args = myMethod_args()
+    args.first = first
+    args.second = second
+    args.third = third
+    args.fourth = fourth
+    self._oprot.writeMessage('myMethod', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_myMethod(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(myMethod_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    return
+
+
+class Processor(Iface, TProcessor):
+  def __init__(self, handler):
+    self._handler = handler
+    self._processMap = {}
+    self._processMap["myMethod"] = Processor.process_myMethod
+
+  def process(self, iprot, oprot):
+    (name, type, seqid) = iprot.readMessageBegin()
+    if name not in self._processMap:
+      iprot.skip(TType.STRUCT)
+      iprot.readMessageEnd()
+      x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+      oprot.writeMessage(name, TMessageType.EXCEPTION, seqid, x)
+      oprot.trans.flush()
+      return
+    else:
+      self._processMap[name](self, seqid, iprot, oprot)
+    return True
+
+  def process_myMethod(self, seqid, iprot, oprot):
+    args = myMethod_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = myMethod_result()
+    self._handler.myMethod(args.first, args.second, args.third, args.fourth)
+    oprot.writeMessage("myMethod", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+class myMethod_args:
+  """
+  Attributes:
+   - first
+   - second
+   - third
+   - fourth
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'fourth', None, None, ), # 1
+    (2, TType.I32, 'third', None, None, ), # 2
+    (3, TType.I16, 'second', None, None, ), # 3
+    (4, TType.STRING, 'first', None, None, ), # 4
+  )
+
+  def __init__(self, first=None, second=None, third=None, fourth=None,):
+    self.first = first
+    self.second = second
+    self.third = third
+    self.fourth = fourth
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 4:
+        if ftype == TType.STRING and (fields is None or 4 in fields):
+          self.first = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I16 and (fields is None or 3 in fields):
+          self.second = iprot.readI16();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.third = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.I64 and (fields is None or 1 in fields):
+          self.fourth = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('myMethod_args')
+    if self.fourth != None:
+      oprot.writeFieldBegin('fourth', TType.I64, 1)
+      oprot.writeI64(self.fourth)
+      oprot.writeFieldEnd()
+    if self.third != None:
+      oprot.writeFieldBegin('third', TType.I32, 2)
+      oprot.writeI32(self.third)
+      oprot.writeFieldEnd()
+    if self.second != None:
+      oprot.writeFieldBegin('second', TType.I16, 3)
+      oprot.writeI16(self.second)
+      oprot.writeFieldEnd()
+    if self.first != None:
+      oprot.writeFieldBegin('first', TType.STRING, 4)
+      oprot.writeString(self.first)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class myMethod_result:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('myMethod_result')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+
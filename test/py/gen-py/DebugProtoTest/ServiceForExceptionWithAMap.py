@@ -0,0 +1,211 @@
+#
+# Autogenerated by Thrift
+#
+# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+#
+
+from thrift.Thrift import *
+from ttypes import *
+from thrift.Thrift import TProcessor
+from thrift.transport import TTransport
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+
+class Iface:
+  def methodThatThrowsAnException(self, ):
+    pass
+
+
+class Client(Iface):
+  def __init__(self, iprot, oprot=None):
+    self._iprot = self._oprot = iprot
+    if oprot != None:
+      self._oprot = oprot
+    self._seqid = 0
+
+  def methodThatThrowsAnException(self, ):
+    self.send_methodThatThrowsAnException()
+    self.recv_methodThatThrowsAnException()
+
+  def send_methodThatThrowsAnException(self, ):
+    args = methodThatThrowsAnException_args()
+    self._oprot.writeMessage('methodThatThrowsAnException', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_methodThatThrowsAnException(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(methodThatThrowsAnException_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    if result.xwamap != None:
+      raise result.xwamap
+    return
+
+
+class Processor(Iface, TProcessor):
+  def __init__(self, handler):
+    self._handler = handler
+    self._processMap = {}
+    self._processMap["methodThatThrowsAnException"] = Processor.process_methodThatThrowsAnException
+
+  def process(self, iprot, oprot):
+    (name, type, seqid) = iprot.readMessageBegin()
+    if name not in self._processMap:
+      iprot.skip(TType.STRUCT)
+      iprot.readMessageEnd()
+      x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+      oprot.writeMessage(name, TMessageType.EXCEPTION, seqid, x)
+      oprot.trans.flush()
+      return
+    else:
+      self._processMap[name](self, seqid, iprot, oprot)
+    return True
+
+  def process_methodThatThrowsAnException(self, seqid, iprot, oprot):
+    args = methodThatThrowsAnException_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = methodThatThrowsAnException_result()
+    try:
+      self._handler.methodThatThrowsAnException()
+    except ExceptionWithAMap, xwamap:
+      result.xwamap = xwamap
+    oprot.writeMessage("methodThatThrowsAnException", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+class methodThatThrowsAnException_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('methodThatThrowsAnException_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class methodThatThrowsAnException_result:
+  """
+  Attributes:
+   - xwamap
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'xwamap', (ExceptionWithAMap, ExceptionWithAMap.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, xwamap=None,):
+    self.xwamap = xwamap
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT and (fields is None or 1 in fields):
+          self.xwamap = ExceptionWithAMap()
+          self.xwamap.read(iprot, fields and fields[1])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('methodThatThrowsAnException_result')
+    if self.xwamap != None:
+      oprot.writeFieldBegin('xwamap', TType.STRUCT, 1)
+      self.xwamap.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+
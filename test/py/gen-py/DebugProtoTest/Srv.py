@@ -0,0 +1,924 @@
+#
+# Autogenerated by Thrift
+#
+# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+#
+
+from thrift.Thrift import *
+from ttypes import *
+from thrift.Thrift import TProcessor
+from thrift.transport import TTransport
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+
+class Iface:
+  def Janky(self, arg):
+    """
+    Parameters:
+     - arg
+    """
+    pass
+
+  def voidMethod(self, ):
+    pass
+
+  def primitiveMethod(self, ):
+    pass
+
+  def structMethod(self, ):
+    pass
+
+  def methodWithDefaultArgs(self, something):
+    """
+    Parameters:
+     - something
+    """
+    pass
+
+  def onewayMethod(self, ):
+    pass
+
+
+class Client(Iface):
+  def __init__(self, iprot, oprot=None):
+    self._iprot = self._oprot = iprot
+    if oprot != None:
+      self._oprot = oprot
+    self._seqid = 0
+
+  def Janky(self, arg):
+    """
+    Parameters:
+     - arg
+    """
+    self.send_Janky(arg)
+    return self.recv_Janky()
+
+  def send_Janky(self, arg):
+    args = Janky_args()
+    args.arg = arg
+    self._oprot.writeMessage('Janky', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_Janky(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(Janky_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "Janky failed: unknown result");
+
+  def voidMethod(self, ):
+    self.send_voidMethod()
+    self.recv_voidMethod()
+
+  def send_voidMethod(self, ):
+    args = voidMethod_args()
+    self._oprot.writeMessage('voidMethod', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_voidMethod(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(voidMethod_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    return
+
+  def primitiveMethod(self, ):
+    self.send_primitiveMethod()
+    return self.recv_primitiveMethod()
+
+  def send_primitiveMethod(self, ):
+    args = primitiveMethod_args()
+    self._oprot.writeMessage('primitiveMethod', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_primitiveMethod(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(primitiveMethod_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "primitiveMethod failed: unknown result");
+
+  def structMethod(self, ):
+    self.send_structMethod()
+    return self.recv_structMethod()
+
+  def send_structMethod(self, ):
+    args = structMethod_args()
+    self._oprot.writeMessage('structMethod', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_structMethod(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(structMethod_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "structMethod failed: unknown result");
+
+  def methodWithDefaultArgs(self, something):
+    """
+    Parameters:
+     - something
+    """
+    self.send_methodWithDefaultArgs(something)
+    self.recv_methodWithDefaultArgs()
+
+  def send_methodWithDefaultArgs(self, something):
+    args = methodWithDefaultArgs_args()
+    args.something = something
+    self._oprot.writeMessage('methodWithDefaultArgs', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+  def recv_methodWithDefaultArgs(self, ):
+    (fname, mtype, rseqid, result) = self._iprot.readMessage(methodWithDefaultArgs_result())
+    if mtype == TMessageType.EXCEPTION:
+      raise result
+    return
+
+  def onewayMethod(self, ):
+    self.send_onewayMethod()
+
+  def send_onewayMethod(self, ):
+    args = onewayMethod_args()
+    self._oprot.writeMessage('onewayMethod', TMessageType.CALL, self._seqid, args)
+    self._oprot.trans.flush()
+
+class Processor(Iface, TProcessor):
+  def __init__(self, handler):
+    self._handler = handler
+    self._processMap = {}
+    self._processMap["Janky"] = Processor.process_Janky
+    self._processMap["voidMethod"] = Processor.process_voidMethod
+    self._processMap["primitiveMethod"] = Processor.process_primitiveMethod
+    self._processMap["structMethod"] = Processor.process_structMethod
+    self._processMap["methodWithDefaultArgs"] = Processor.process_methodWithDefaultArgs
+    self._processMap["onewayMethod"] = Processor.process_onewayMethod
+
+  def process(self, iprot, oprot):
+    (name, type, seqid) = iprot.readMessageBegin()
+    if name not in self._processMap:
+      iprot.skip(TType.STRUCT)
+      iprot.readMessageEnd()
+      x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+      oprot.writeMessage(name, TMessageType.EXCEPTION, seqid, x)
+      oprot.trans.flush()
+      return
+    else:
+      self._processMap[name](self, seqid, iprot, oprot)
+    return True
+
+  def process_Janky(self, seqid, iprot, oprot):
+    args = Janky_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = Janky_result()
+    result.success = self._handler.Janky(args.arg)
+    oprot.writeMessage("Janky", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+  def process_voidMethod(self, seqid, iprot, oprot):
+    args = voidMethod_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = voidMethod_result()
+    self._handler.voidMethod()
+    oprot.writeMessage("voidMethod", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+  def process_primitiveMethod(self, seqid, iprot, oprot):
+    args = primitiveMethod_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = primitiveMethod_result()
+    result.success = self._handler.primitiveMethod()
+    oprot.writeMessage("primitiveMethod", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+  def process_structMethod(self, seqid, iprot, oprot):
+    args = structMethod_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = structMethod_result()
+    result.success = self._handler.structMethod()
+    oprot.writeMessage("structMethod", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+  def process_methodWithDefaultArgs(self, seqid, iprot, oprot):
+    args = methodWithDefaultArgs_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = methodWithDefaultArgs_result()
+    self._handler.methodWithDefaultArgs(args.something)
+    oprot.writeMessage("methodWithDefaultArgs", TMessageType.REPLY, seqid, result)
+    oprot.trans.flush()
+
+  def process_onewayMethod(self, seqid, iprot, oprot):
+    args = onewayMethod_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    self._handler.onewayMethod()
+    return
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+class Janky_args:
+  """
+  Attributes:
+   - arg
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'arg', None, None, ), # 1
+  )
+
+  def __init__(self, arg=None,):
+    self.arg = arg
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.arg = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Janky_args')
+    if self.arg != None:
+      oprot.writeFieldBegin('arg', TType.I32, 1)
+      oprot.writeI32(self.arg)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Janky_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.I32, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.I32 and (fields is None or 0 in fields):
+          self.success = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Janky_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.I32, 0)
+      oprot.writeI32(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class voidMethod_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('voidMethod_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class voidMethod_result:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('voidMethod_result')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class primitiveMethod_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('primitiveMethod_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class primitiveMethod_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.I32, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.I32 and (fields is None or 0 in fields):
+          self.success = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('primitiveMethod_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.I32, 0)
+      oprot.writeI32(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class structMethod_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('structMethod_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class structMethod_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (CompactProtoTestStruct, CompactProtoTestStruct.thrift_spec), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT and (fields is None or 0 in fields):
+          self.success = CompactProtoTestStruct()
+          self.success.read(iprot, fields and fields[0])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('structMethod_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class methodWithDefaultArgs_args:
+  """
+  Attributes:
+   - something
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'something', None, 2, ), # 1
+  )
+
+  def __init__(self, something=thrift_spec[1][4],):
+    self.something = something
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.something = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('methodWithDefaultArgs_args')
+    if self.something != None:
+      oprot.writeFieldBegin('something', TType.I32, 1)
+      oprot.writeI32(self.something)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class methodWithDefaultArgs_result:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('methodWithDefaultArgs_result')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class onewayMethod_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('onewayMethod_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+
@@ -0,0 +1 @@
+__all__ = ['ttypes', 'constants', 'ServiceForExceptionWithAMap', 'Srv', 'Inherited', 'EmptyService', 'ReverseOrderService']
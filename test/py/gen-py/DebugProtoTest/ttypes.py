@@ -0,0 +1,3654 @@
+#
+# Autogenerated by Thrift
+#
+# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+#
+
+from thrift.Thrift import *
+
+from thrift.transport import TTransport
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+
+class SomeEnum:
+  ONE = 1
+  TWO = 2
+
+  _VALUES_TO_NAMES = {
+    1: "ONE",
+    2: "TWO",
+  }
+
+  _NAMES_TO_VALUES = {
+    "ONE": 1,
+    "TWO": 2,
+  }
+
+class Doubles:
+  """
+  Attributes:
+   - nan
+   - inf
+   - neginf
+   - repeating
+   - big
+   - small
+   - zero
+   - negzero
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.DOUBLE, 'nan', None, None, ), # 1
+    (2, TType.DOUBLE, 'inf', None, None, ), # 2
+    (3, TType.DOUBLE, 'neginf', None, None, ), # 3
+    (4, TType.DOUBLE, 'repeating', None, None, ), # 4
+    (5, TType.DOUBLE, 'big', None, None, ), # 5
+    (6, TType.DOUBLE, 'small', None, None, ), # 6
+    (7, TType.DOUBLE, 'zero', None, None, ), # 7
+    (8, TType.DOUBLE, 'negzero', None, None, ), # 8
+  )
+
+  def __init__(self, nan=None, inf=None, neginf=None, repeating=None, big=None, small=None, zero=None, negzero=None,):
+    self.nan = nan
+    self.inf = inf
+    self.neginf = neginf
+    self.repeating = repeating
+    self.big = big
+    self.small = small
+    self.zero = zero
+    self.negzero = negzero
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.DOUBLE and (fields is None or 1 in fields):
+          self.nan = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.DOUBLE and (fields is None or 2 in fields):
+          self.inf = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.DOUBLE and (fields is None or 3 in fields):
+          self.neginf = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.DOUBLE and (fields is None or 4 in fields):
+          self.repeating = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.DOUBLE and (fields is None or 5 in fields):
+          self.big = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.DOUBLE and (fields is None or 6 in fields):
+          self.small = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.DOUBLE and (fields is None or 7 in fields):
+          self.zero = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.DOUBLE and (fields is None or 8 in fields):
+          self.negzero = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Doubles')
+    if self.nan != None:
+      oprot.writeFieldBegin('nan', TType.DOUBLE, 1)
+      oprot.writeDouble(self.nan)
+      oprot.writeFieldEnd()
+    if self.inf != None:
+      oprot.writeFieldBegin('inf', TType.DOUBLE, 2)
+      oprot.writeDouble(self.inf)
+      oprot.writeFieldEnd()
+    if self.neginf != None:
+      oprot.writeFieldBegin('neginf', TType.DOUBLE, 3)
+      oprot.writeDouble(self.neginf)
+      oprot.writeFieldEnd()
+    if self.repeating != None:
+      oprot.writeFieldBegin('repeating', TType.DOUBLE, 4)
+      oprot.writeDouble(self.repeating)
+      oprot.writeFieldEnd()
+    if self.big != None:
+      oprot.writeFieldBegin('big', TType.DOUBLE, 5)
+      oprot.writeDouble(self.big)
+      oprot.writeFieldEnd()
+    if self.small != None:
+      oprot.writeFieldBegin('small', TType.DOUBLE, 6)
+      oprot.writeDouble(self.small)
+      oprot.writeFieldEnd()
+    if self.zero != None:
+      oprot.writeFieldBegin('zero', TType.DOUBLE, 7)
+      oprot.writeDouble(self.zero)
+      oprot.writeFieldEnd()
+    if self.negzero != None:
+      oprot.writeFieldBegin('negzero', TType.DOUBLE, 8)
+      oprot.writeDouble(self.negzero)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class OneOfEach:
+  """
+  Attributes:
+   - im_true
+   - im_false
+   - a_bite
+   - integer16
+   - integer32
+   - integer64
+   - double_precision
+   - some_characters
+   - zomg_unicode
+   - what_who
+   - base64
+   - byte_list
+   - i16_list
+   - i64_list
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BOOL, 'im_true', None, None, ), # 1
+    (2, TType.BOOL, 'im_false', None, None, ), # 2
+    (3, TType.BYTE, 'a_bite', None, 200, ), # 3
+    (4, TType.I16, 'integer16', None, 33000, ), # 4
+    (5, TType.I32, 'integer32', None, None, ), # 5
+    (6, TType.I64, 'integer64', None, 10000000000, ), # 6
+    (7, TType.DOUBLE, 'double_precision', None, None, ), # 7
+    (8, TType.STRING, 'some_characters', None, None, ), # 8
+    (9, TType.STRING, 'zomg_unicode', None, None, ), # 9
+    (10, TType.BOOL, 'what_who', None, None, ), # 10
+    (11, TType.STRING, 'base64', None, None, ), # 11
+    (12, TType.LIST, 'byte_list', (TType.BYTE,None), [
+      1,
+      2,
+      3,
+    ], ), # 12
+    (13, TType.LIST, 'i16_list', (TType.I16,None), [
+      1,
+      2,
+      3,
+    ], ), # 13
+    (14, TType.LIST, 'i64_list', (TType.I64,None), [
+      1,
+      2,
+      3,
+    ], ), # 14
+  )
+
+  def __init__(self, im_true=None, im_false=None, a_bite=thrift_spec[3][4], integer16=thrift_spec[4][4], integer32=None, integer64=thrift_spec[6][4], double_precision=None, some_characters=None, zomg_unicode=None, what_who=None, base64=None, byte_list=thrift_spec[12][4], i16_list=thrift_spec[13][4], i64_list=thrift_spec[14][4],):
+    self.im_true = im_true
+    self.im_false = im_false
+    self.a_bite = a_bite
+    self.integer16 = integer16
+    self.integer32 = integer32
+    self.integer64 = integer64
+    self.double_precision = double_precision
+    self.some_characters = some_characters
+    self.zomg_unicode = zomg_unicode
+    self.what_who = what_who
+    self.base64 = base64
+    if byte_list is self.thrift_spec[12][4]:
+      byte_list = [
+      1,
+      2,
+      3,
+    ]
+    self.byte_list = byte_list
+    if i16_list is self.thrift_spec[13][4]:
+      i16_list = [
+      1,
+      2,
+      3,
+    ]
+    self.i16_list = i16_list
+    if i64_list is self.thrift_spec[14][4]:
+      i64_list = [
+      1,
+      2,
+      3,
+    ]
+    self.i64_list = i64_list
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BOOL and (fields is None or 1 in fields):
+          self.im_true = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.BOOL and (fields is None or 2 in fields):
+          self.im_false = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.BYTE and (fields is None or 3 in fields):
+          self.a_bite = iprot.readByte();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I16 and (fields is None or 4 in fields):
+          self.integer16 = iprot.readI16();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32 and (fields is None or 5 in fields):
+          self.integer32 = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I64 and (fields is None or 6 in fields):
+          self.integer64 = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.DOUBLE and (fields is None or 7 in fields):
+          self.double_precision = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.STRING and (fields is None or 8 in fields):
+          self.some_characters = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 9:
+        if ftype == TType.STRING and (fields is None or 9 in fields):
+          self.zomg_unicode = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 10:
+        if ftype == TType.BOOL and (fields is None or 10 in fields):
+          self.what_who = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 11:
+        if ftype == TType.STRING and (fields is None or 11 in fields):
+          self.base64 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 12:
+        if ftype == TType.LIST and (fields is None or 12 in fields):
+          (_etype3, _size0) = iprot.readListBegin()
+          self.byte_list = iprot.readFixedValues(TType.BYTE, _size0)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 13:
+        if ftype == TType.LIST and (fields is None or 13 in fields):
+          (_etype7, _size4) = iprot.readListBegin()
+          self.i16_list = iprot.readFixedValues(TType.I16, _size4)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 14:
+        if ftype == TType.LIST and (fields is None or 14 in fields):
+          (_etype11, _size8) = iprot.readListBegin()
+          self.i64_list = iprot.readFixedValues(TType.I64, _size8)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('OneOfEach')
+    if self.im_true != None:
+      oprot.writeFieldBegin('im_true', TType.BOOL, 1)
+      oprot.writeBool(self.im_true)
+      oprot.writeFieldEnd()
+    if self.im_false != None:
+      oprot.writeFieldBegin('im_false', TType.BOOL, 2)
+      oprot.writeBool(self.im_false)
+      oprot.writeFieldEnd()
+    if self.a_bite != None:
+      oprot.writeFieldBegin('a_bite', TType.BYTE, 3)
+      oprot.writeByte(self.a_bite)
+      oprot.writeFieldEnd()
+    if self.integer16 != None:
+      oprot.writeFieldBegin('integer16', TType.I16, 4)
+      oprot.writeI16(self.integer16)
+      oprot.writeFieldEnd()
+    if self.integer32 != None:
+      oprot.writeFieldBegin('integer32', TType.I32, 5)
+      oprot.writeI32(self.integer32)
+      oprot.writeFieldEnd()
+    if self.integer64 != None:
+      oprot.writeFieldBegin('integer64', TType.I64, 6)
+      oprot.writeI64(self.integer64)
+      oprot.writeFieldEnd()
+    if self.double_precision != None:
+      oprot.writeFieldBegin('double_precision', TType.DOUBLE, 7)
+      oprot.writeDouble(self.double_precision)
+      oprot.writeFieldEnd()
+    if self.some_characters != None:
+      oprot.writeFieldBegin('some_characters', TType.STRING, 8)
+      oprot.writeString(self.some_characters)
+      oprot.writeFieldEnd()
+    if self.zomg_unicode != None:
+      oprot.writeFieldBegin('zomg_unicode', TType.STRING, 9)
+      oprot.writeString(self.zomg_unicode)
+      oprot.writeFieldEnd()
+    if self.what_who != None:
+      oprot.writeFieldBegin('what_who', TType.BOOL, 10)
+      oprot.writeBool(self.what_who)
+      oprot.writeFieldEnd()
+    if self.base64 != None:
+      oprot.writeFieldBegin('base64', TType.STRING, 11)
+      oprot.writeString(self.base64)
+      oprot.writeFieldEnd()
+    if self.byte_list != None:
+      oprot.writeFieldBegin('byte_list', TType.LIST, 12)
+      oprot.writeListBegin(TType.BYTE, len(self.byte_list))
+      oprot.writeFixedValues(TType.BYTE, self.byte_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.i16_list != None:
+      oprot.writeFieldBegin('i16_list', TType.LIST, 13)
+      oprot.writeListBegin(TType.I16, len(self.i16_list))
+      oprot.writeFixedValues(TType.I16, self.i16_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.i64_list != None:
+      oprot.writeFieldBegin('i64_list', TType.LIST, 14)
+      oprot.writeListBegin(TType.I64, len(self.i64_list))
+      oprot.writeFixedValues(TType.I64, self.i64_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Bonk:
+  """
+  Attributes:
+   - type
+   - message
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'type', None, None, ), # 1
+    (2, TType.STRING, 'message', None, None, ), # 2
+  )
+
+  def __init__(self, type=None, message=None,):
+    self.type = type
+    self.message = message
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.type = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING and (fields is None or 2 in fields):
+          self.message = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Bonk')
+    if self.type != None:
+      oprot.writeFieldBegin('type', TType.I32, 1)
+      oprot.writeI32(self.type)
+      oprot.writeFieldEnd()
+    if self.message != None:
+      oprot.writeFieldBegin('message', TType.STRING, 2)
+      oprot.writeString(self.message)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Nesting:
+  """
+  Attributes:
+   - my_bonk
+   - my_ooe
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'my_bonk', (Bonk, Bonk.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'my_ooe', (OneOfEach, OneOfEach.thrift_spec), None, ), # 2
+  )
+
+  def __init__(self, my_bonk=None, my_ooe=None,):
+    self.my_bonk = my_bonk
+    self.my_ooe = my_ooe
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT and (fields is None or 1 in fields):
+          self.my_bonk = Bonk()
+          self.my_bonk.read(iprot, fields and fields[1])
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT and (fields is None or 2 in fields):
+          self.my_ooe = OneOfEach()
+          self.my_ooe.read(iprot, fields and fields[2])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Nesting')
+    if self.my_bonk != None:
+      oprot.writeFieldBegin('my_bonk', TType.STRUCT, 1)
+      self.my_bonk.write(oprot)
+      oprot.writeFieldEnd()
+    if self.my_ooe != None:
+      oprot.writeFieldBegin('my_ooe', TType.STRUCT, 2)
+      self.my_ooe.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class HolyMoley:
+  """
+  Attributes:
+   - big
+   - contain
+   - bonks
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'big', (TType.STRUCT,(OneOfEach, OneOfEach.thrift_spec)), None, ), # 1
+    (2, TType.SET, 'contain', (TType.LIST,(TType.STRING,None)), None, ), # 2
+    (3, TType.MAP, 'bonks', (TType.STRING,None,TType.LIST,(TType.STRUCT,(Bonk, Bonk.thrift_spec))), None, ), # 3
+  )
+
+  def __init__(self, big=None, contain=None, bonks=None,):
+    self.big = big
+    self.contain = contain
+    self.bonks = bonks
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST and (fields is None or 1 in fields):
+          self.big = []
+          (_etype15, _size12) = iprot.readListBegin()
+          for _i16 in xrange(_size12):
+            _elem17 = OneOfEach()
+            _elem17.read(iprot, fields and fields[1])
+            self.big.append(_elem17)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.SET and (fields is None or 2 in fields):
+          self.contain = set()
+          (_etype21, _size18) = iprot.readSetBegin()
+          for _i22 in xrange(_size18):
+            _elem23 = []
+            (_etype27, _size24) = iprot.readListBegin()
+            for _i28 in xrange(_size24):
+              _elem29 = iprot.readString();
+              _elem23.append(_elem29)
+            iprot.readListEnd()
+            self.contain.add(_elem23)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.MAP and (fields is None or 3 in fields):
+          self.bonks = {}
+          (_ktype31, _vtype32, _size30 ) = iprot.readMapBegin() 
+          for _i34 in xrange(_size30):
+            _key35 = iprot.readString();
+            _val36 = []
+            (_etype40, _size37) = iprot.readListBegin()
+            for _i41 in xrange(_size37):
+              _elem42 = Bonk()
+              _elem42.read(iprot, fields and fields[3])
+              _val36.append(_elem42)
+            iprot.readListEnd()
+            self.bonks[_key35] = _val36
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('HolyMoley')
+    if self.big != None:
+      oprot.writeFieldBegin('big', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.big))
+      for iter43 in self.big:
+        iter43.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.contain != None:
+      oprot.writeFieldBegin('contain', TType.SET, 2)
+      oprot.writeSetBegin(TType.LIST, len(self.contain))
+      for iter44 in self.contain:
+        oprot.writeListBegin(TType.STRING, len(iter44))
+        for iter45 in iter44:
+          oprot.writeString(iter45)
+        oprot.writeListEnd()
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.bonks != None:
+      oprot.writeFieldBegin('bonks', TType.MAP, 3)
+      oprot.writeMapBegin(TType.STRING, TType.LIST, len(self.bonks))
+      for kiter46,viter47 in self.bonks.items():
+        oprot.writeString(kiter46)
+        oprot.writeListBegin(TType.STRUCT, len(viter47))
+        for iter48 in viter47:
+          iter48.write(oprot)
+        oprot.writeListEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Backwards:
+  """
+  Attributes:
+   - first_tag2
+   - second_tag1
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'second_tag1', None, None, ), # 1
+    (2, TType.I32, 'first_tag2', None, None, ), # 2
+  )
+
+  def __init__(self, first_tag2=None, second_tag1=None,):
+    self.first_tag2 = first_tag2
+    self.second_tag1 = second_tag1
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.first_tag2 = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.second_tag1 = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Backwards')
+    if self.second_tag1 != None:
+      oprot.writeFieldBegin('second_tag1', TType.I32, 1)
+      oprot.writeI32(self.second_tag1)
+      oprot.writeFieldEnd()
+    if self.first_tag2 != None:
+      oprot.writeFieldBegin('first_tag2', TType.I32, 2)
+      oprot.writeI32(self.first_tag2)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Empty:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Empty')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Wrapper:
+  """
+  Attributes:
+   - foo
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'foo', (Empty, Empty.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, foo=None,):
+    self.foo = foo
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT and (fields is None or 1 in fields):
+          self.foo = Empty()
+          self.foo.read(iprot, fields and fields[1])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Wrapper')
+    if self.foo != None:
+      oprot.writeFieldBegin('foo', TType.STRUCT, 1)
+      self.foo.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class RandomStuff:
+  """
+  Attributes:
+   - a
+   - b
+   - c
+   - d
+   - myintlist
+   - maps
+   - bigint
+   - triple
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'a', None, None, ), # 1
+    (2, TType.I32, 'b', None, None, ), # 2
+    (3, TType.I32, 'c', None, None, ), # 3
+    (4, TType.I32, 'd', None, None, ), # 4
+    (5, TType.LIST, 'myintlist', (TType.I32,None), None, ), # 5
+    (6, TType.MAP, 'maps', (TType.I32,None,TType.STRUCT,(Wrapper, Wrapper.thrift_spec)), None, ), # 6
+    (7, TType.I64, 'bigint', None, None, ), # 7
+    (8, TType.DOUBLE, 'triple', None, None, ), # 8
+  )
+
+  def __init__(self, a=None, b=None, c=None, d=None, myintlist=None, maps=None, bigint=None, triple=None,):
+    self.a = a
+    self.b = b
+    self.c = c
+    self.d = d
+    self.myintlist = myintlist
+    self.maps = maps
+    self.bigint = bigint
+    self.triple = triple
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.a = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.b = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32 and (fields is None or 3 in fields):
+          self.c = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I32 and (fields is None or 4 in fields):
+          self.d = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.LIST and (fields is None or 5 in fields):
+          (_etype52, _size49) = iprot.readListBegin()
+          self.myintlist = iprot.readFixedValues(TType.I32, _size49)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.MAP and (fields is None or 6 in fields):
+          self.maps = {}
+          (_ktype54, _vtype55, _size53 ) = iprot.readMapBegin() 
+          for _i57 in xrange(_size53):
+            _key58 = iprot.readI32();
+            _val59 = Wrapper()
+            _val59.read(iprot, fields and fields[6])
+            self.maps[_key58] = _val59
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.I64 and (fields is None or 7 in fields):
+          self.bigint = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.DOUBLE and (fields is None or 8 in fields):
+          self.triple = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('RandomStuff')
+    if self.a != None:
+      oprot.writeFieldBegin('a', TType.I32, 1)
+      oprot.writeI32(self.a)
+      oprot.writeFieldEnd()
+    if self.b != None:
+      oprot.writeFieldBegin('b', TType.I32, 2)
+      oprot.writeI32(self.b)
+      oprot.writeFieldEnd()
+    if self.c != None:
+      oprot.writeFieldBegin('c', TType.I32, 3)
+      oprot.writeI32(self.c)
+      oprot.writeFieldEnd()
+    if self.d != None:
+      oprot.writeFieldBegin('d', TType.I32, 4)
+      oprot.writeI32(self.d)
+      oprot.writeFieldEnd()
+    if self.myintlist != None:
+      oprot.writeFieldBegin('myintlist', TType.LIST, 5)
+      oprot.writeListBegin(TType.I32, len(self.myintlist))
+      oprot.writeFixedValues(TType.I32, self.myintlist)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.maps != None:
+      oprot.writeFieldBegin('maps', TType.MAP, 6)
+      oprot.writeMapBegin(TType.I32, TType.STRUCT, len(self.maps))
+      for kiter60,viter61 in self.maps.items():
+        oprot.writeI32(kiter60)
+        viter61.write(oprot)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.bigint != None:
+      oprot.writeFieldBegin('bigint', TType.I64, 7)
+      oprot.writeI64(self.bigint)
+      oprot.writeFieldEnd()
+    if self.triple != None:
+      oprot.writeFieldBegin('triple', TType.DOUBLE, 8)
+      oprot.writeDouble(self.triple)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Base64:
+  """
+  Attributes:
+   - a
+   - b1
+   - b2
+   - b3
+   - b4
+   - b5
+   - b6
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'a', None, None, ), # 1
+    (2, TType.STRING, 'b1', None, None, ), # 2
+    (3, TType.STRING, 'b2', None, None, ), # 3
+    (4, TType.STRING, 'b3', None, None, ), # 4
+    (5, TType.STRING, 'b4', None, None, ), # 5
+    (6, TType.STRING, 'b5', None, None, ), # 6
+    (7, TType.STRING, 'b6', None, None, ), # 7
+  )
+
+  def __init__(self, a=None, b1=None, b2=None, b3=None, b4=None, b5=None, b6=None,):
+    self.a = a
+    self.b1 = b1
+    self.b2 = b2
+    self.b3 = b3
+    self.b4 = b4
+    self.b5 = b5
+    self.b6 = b6
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.a = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING and (fields is None or 2 in fields):
+          self.b1 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING and (fields is None or 3 in fields):
+          self.b2 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING and (fields is None or 4 in fields):
+          self.b3 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING and (fields is None or 5 in fields):
+          self.b4 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.STRING and (fields is None or 6 in fields):
+          self.b5 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.STRING and (fields is None or 7 in fields):
+          self.b6 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Base64')
+    if self.a != None:
+      oprot.writeFieldBegin('a', TType.I32, 1)
+      oprot.writeI32(self.a)
+      oprot.writeFieldEnd()
+    if self.b1 != None:
+      oprot.writeFieldBegin('b1', TType.STRING, 2)
+      oprot.writeString(self.b1)
+      oprot.writeFieldEnd()
+    if self.b2 != None:
+      oprot.writeFieldBegin('b2', TType.STRING, 3)
+      oprot.writeString(self.b2)
+      oprot.writeFieldEnd()
+    if self.b3 != None:
+      oprot.writeFieldBegin('b3', TType.STRING, 4)
+      oprot.writeString(self.b3)
+      oprot.writeFieldEnd()
+    if self.b4 != None:
+      oprot.writeFieldBegin('b4', TType.STRING, 5)
+      oprot.writeString(self.b4)
+      oprot.writeFieldEnd()
+    if self.b5 != None:
+      oprot.writeFieldBegin('b5', TType.STRING, 6)
+      oprot.writeString(self.b5)
+      oprot.writeFieldEnd()
+    if self.b6 != None:
+      oprot.writeFieldBegin('b6', TType.STRING, 7)
+      oprot.writeString(self.b6)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class CompactProtoTestStruct:
+  """
+  Attributes:
+   - a_byte
+   - a_i16
+   - a_i32
+   - a_i64
+   - a_double
+   - a_string
+   - a_binary
+   - true_field
+   - false_field
+   - empty_struct_field
+   - byte_list
+   - i16_list
+   - i32_list
+   - i64_list
+   - double_list
+   - string_list
+   - binary_list
+   - boolean_list
+   - struct_list
+   - byte_set
+   - i16_set
+   - i32_set
+   - i64_set
+   - double_set
+   - string_set
+   - binary_set
+   - boolean_set
+   - struct_set
+   - byte_byte_map
+   - i16_byte_map
+   - i32_byte_map
+   - i64_byte_map
+   - double_byte_map
+   - string_byte_map
+   - binary_byte_map
+   - boolean_byte_map
+   - byte_i16_map
+   - byte_i32_map
+   - byte_i64_map
+   - byte_double_map
+   - byte_string_map
+   - byte_binary_map
+   - byte_boolean_map
+   - list_byte_map
+   - set_byte_map
+   - map_byte_map
+   - byte_map_map
+   - byte_set_map
+   - byte_list_map
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BYTE, 'a_byte', None, None, ), # 1
+    (2, TType.I16, 'a_i16', None, None, ), # 2
+    (3, TType.I32, 'a_i32', None, None, ), # 3
+    (4, TType.I64, 'a_i64', None, None, ), # 4
+    (5, TType.DOUBLE, 'a_double', None, None, ), # 5
+    (6, TType.STRING, 'a_string', None, None, ), # 6
+    (7, TType.STRING, 'a_binary', None, None, ), # 7
+    (8, TType.BOOL, 'true_field', None, None, ), # 8
+    (9, TType.BOOL, 'false_field', None, None, ), # 9
+    (10, TType.STRUCT, 'empty_struct_field', (Empty, Empty.thrift_spec), None, ), # 10
+    (11, TType.LIST, 'byte_list', (TType.BYTE,None), None, ), # 11
+    (12, TType.LIST, 'i16_list', (TType.I16,None), None, ), # 12
+    (13, TType.LIST, 'i32_list', (TType.I32,None), None, ), # 13
+    (14, TType.LIST, 'i64_list', (TType.I64,None), None, ), # 14
+    (15, TType.LIST, 'double_list', (TType.DOUBLE,None), None, ), # 15
+    (16, TType.LIST, 'string_list', (TType.STRING,None), None, ), # 16
+    (17, TType.LIST, 'binary_list', (TType.STRING,None), None, ), # 17
+    (18, TType.LIST, 'boolean_list', (TType.BOOL,None), None, ), # 18
+    (19, TType.LIST, 'struct_list', (TType.STRUCT,(Empty, Empty.thrift_spec)), None, ), # 19
+    (20, TType.SET, 'byte_set', (TType.BYTE,None), None, ), # 20
+    (21, TType.SET, 'i16_set', (TType.I16,None), None, ), # 21
+    (22, TType.SET, 'i32_set', (TType.I32,None), None, ), # 22
+    (23, TType.SET, 'i64_set', (TType.I64,None), None, ), # 23
+    (24, TType.SET, 'double_set', (TType.DOUBLE,None), None, ), # 24
+    (25, TType.SET, 'string_set', (TType.STRING,None), None, ), # 25
+    (26, TType.SET, 'binary_set', (TType.STRING,None), None, ), # 26
+    (27, TType.SET, 'boolean_set', (TType.BOOL,None), None, ), # 27
+    (28, TType.SET, 'struct_set', (TType.STRUCT,(Empty, Empty.thrift_spec)), None, ), # 28
+    (29, TType.MAP, 'byte_byte_map', (TType.BYTE,None,TType.BYTE,None), None, ), # 29
+    (30, TType.MAP, 'i16_byte_map', (TType.I16,None,TType.BYTE,None), None, ), # 30
+    (31, TType.MAP, 'i32_byte_map', (TType.I32,None,TType.BYTE,None), None, ), # 31
+    (32, TType.MAP, 'i64_byte_map', (TType.I64,None,TType.BYTE,None), None, ), # 32
+    (33, TType.MAP, 'double_byte_map', (TType.DOUBLE,None,TType.BYTE,None), None, ), # 33
+    (34, TType.MAP, 'string_byte_map', (TType.STRING,None,TType.BYTE,None), None, ), # 34
+    (35, TType.MAP, 'binary_byte_map', (TType.STRING,None,TType.BYTE,None), None, ), # 35
+    (36, TType.MAP, 'boolean_byte_map', (TType.BOOL,None,TType.BYTE,None), None, ), # 36
+    (37, TType.MAP, 'byte_i16_map', (TType.BYTE,None,TType.I16,None), None, ), # 37
+    (38, TType.MAP, 'byte_i32_map', (TType.BYTE,None,TType.I32,None), None, ), # 38
+    (39, TType.MAP, 'byte_i64_map', (TType.BYTE,None,TType.I64,None), None, ), # 39
+    (40, TType.MAP, 'byte_double_map', (TType.BYTE,None,TType.DOUBLE,None), None, ), # 40
+    (41, TType.MAP, 'byte_string_map', (TType.BYTE,None,TType.STRING,None), None, ), # 41
+    (42, TType.MAP, 'byte_binary_map', (TType.BYTE,None,TType.STRING,None), None, ), # 42
+    (43, TType.MAP, 'byte_boolean_map', (TType.BYTE,None,TType.BOOL,None), None, ), # 43
+    (44, TType.MAP, 'list_byte_map', (TType.LIST,(TType.BYTE,None),TType.BYTE,None), None, ), # 44
+    (45, TType.MAP, 'set_byte_map', (TType.SET,(TType.BYTE,None),TType.BYTE,None), None, ), # 45
+    (46, TType.MAP, 'map_byte_map', (TType.MAP,(TType.BYTE,None,TType.BYTE,None),TType.BYTE,None), None, ), # 46
+    (47, TType.MAP, 'byte_map_map', (TType.BYTE,None,TType.MAP,(TType.BYTE,None,TType.BYTE,None)), None, ), # 47
+    (48, TType.MAP, 'byte_set_map', (TType.BYTE,None,TType.SET,(TType.BYTE,None)), None, ), # 48
+    (49, TType.MAP, 'byte_list_map', (TType.BYTE,None,TType.LIST,(TType.BYTE,None)), None, ), # 49
+  )
+
+  def __init__(self, a_byte=None, a_i16=None, a_i32=None, a_i64=None, a_double=None, a_string=None, a_binary=None, true_field=None, false_field=None, empty_struct_field=None, byte_list=None, i16_list=None, i32_list=None, i64_list=None, double_list=None, string_list=None, binary_list=None, boolean_list=None, struct_list=None, byte_set=None, i16_set=None, i32_set=None, i64_set=None, double_set=None, string_set=None, binary_set=None, boolean_set=None, struct_set=None, byte_byte_map=None, i16_byte_map=None, i32_byte_map=None, i64_byte_map=None, double_byte_map=None, string_byte_map=None, binary_byte_map=None, boolean_byte_map=None, byte_i16_map=None, byte_i32_map=None, byte_i64_map=None, byte_double_map=None, byte_string_map=None, byte_binary_map=None, byte_boolean_map=None, list_byte_map=None, set_byte_map=None, map_byte_map=None, byte_map_map=None, byte_set_map=None, byte_list_map=None,):
+    self.a_byte = a_byte
+    self.a_i16 = a_i16
+    self.a_i32 = a_i32
+    self.a_i64 = a_i64
+    self.a_double = a_double
+    self.a_string = a_string
+    self.a_binary = a_binary
+    self.true_field = true_field
+    self.false_field = false_field
+    self.empty_struct_field = empty_struct_field
+    self.byte_list = byte_list
+    self.i16_list = i16_list
+    self.i32_list = i32_list
+    self.i64_list = i64_list
+    self.double_list = double_list
+    self.string_list = string_list
+    self.binary_list = binary_list
+    self.boolean_list = boolean_list
+    self.struct_list = struct_list
+    self.byte_set = byte_set
+    self.i16_set = i16_set
+    self.i32_set = i32_set
+    self.i64_set = i64_set
+    self.double_set = double_set
+    self.string_set = string_set
+    self.binary_set = binary_set
+    self.boolean_set = boolean_set
+    self.struct_set = struct_set
+    self.byte_byte_map = byte_byte_map
+    self.i16_byte_map = i16_byte_map
+    self.i32_byte_map = i32_byte_map
+    self.i64_byte_map = i64_byte_map
+    self.double_byte_map = double_byte_map
+    self.string_byte_map = string_byte_map
+    self.binary_byte_map = binary_byte_map
+    self.boolean_byte_map = boolean_byte_map
+    self.byte_i16_map = byte_i16_map
+    self.byte_i32_map = byte_i32_map
+    self.byte_i64_map = byte_i64_map
+    self.byte_double_map = byte_double_map
+    self.byte_string_map = byte_string_map
+    self.byte_binary_map = byte_binary_map
+    self.byte_boolean_map = byte_boolean_map
+    self.list_byte_map = list_byte_map
+    self.set_byte_map = set_byte_map
+    self.map_byte_map = map_byte_map
+    self.byte_map_map = byte_map_map
+    self.byte_set_map = byte_set_map
+    self.byte_list_map = byte_list_map
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BYTE and (fields is None or 1 in fields):
+          self.a_byte = iprot.readByte();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I16 and (fields is None or 2 in fields):
+          self.a_i16 = iprot.readI16();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32 and (fields is None or 3 in fields):
+          self.a_i32 = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I64 and (fields is None or 4 in fields):
+          self.a_i64 = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.DOUBLE and (fields is None or 5 in fields):
+          self.a_double = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.STRING and (fields is None or 6 in fields):
+          self.a_string = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.STRING and (fields is None or 7 in fields):
+          self.a_binary = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.BOOL and (fields is None or 8 in fields):
+          self.true_field = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 9:
+        if ftype == TType.BOOL and (fields is None or 9 in fields):
+          self.false_field = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 10:
+        if ftype == TType.STRUCT and (fields is None or 10 in fields):
+          self.empty_struct_field = Empty()
+          self.empty_struct_field.read(iprot, fields and fields[10])
+        else:
+          iprot.skip(ftype)
+      elif fid == 11:
+        if ftype == TType.LIST and (fields is None or 11 in fields):
+          (_etype65, _size62) = iprot.readListBegin()
+          self.byte_list = iprot.readFixedValues(TType.BYTE, _size62)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 12:
+        if ftype == TType.LIST and (fields is None or 12 in fields):
+          (_etype69, _size66) = iprot.readListBegin()
+          self.i16_list = iprot.readFixedValues(TType.I16, _size66)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 13:
+        if ftype == TType.LIST and (fields is None or 13 in fields):
+          (_etype73, _size70) = iprot.readListBegin()
+          self.i32_list = iprot.readFixedValues(TType.I32, _size70)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 14:
+        if ftype == TType.LIST and (fields is None or 14 in fields):
+          (_etype77, _size74) = iprot.readListBegin()
+          self.i64_list = iprot.readFixedValues(TType.I64, _size74)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 15:
+        if ftype == TType.LIST and (fields is None or 15 in fields):
+          (_etype81, _size78) = iprot.readListBegin()
+          self.double_list = iprot.readFixedValues(TType.DOUBLE, _size78)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 16:
+        if ftype == TType.LIST and (fields is None or 16 in fields):
+          self.string_list = []
+          (_etype85, _size82) = iprot.readListBegin()
+          for _i86 in xrange(_size82):
+            _elem87 = iprot.readString();
+            self.string_list.append(_elem87)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 17:
+        if ftype == TType.LIST and (fields is None or 17 in fields):
+          self.binary_list = []
+          (_etype91, _size88) = iprot.readListBegin()
+          for _i92 in xrange(_size88):
+            _elem93 = iprot.readString();
+            self.binary_list.append(_elem93)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 18:
+        if ftype == TType.LIST and (fields is None or 18 in fields):
+          (_etype97, _size94) = iprot.readListBegin()
+          self.boolean_list = iprot.readFixedValues(TType.BOOL, _size94)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 19:
+        if ftype == TType.LIST and (fields is None or 19 in fields):
+          self.struct_list = []
+          (_etype101, _size98) = iprot.readListBegin()
+          for _i102 in xrange(_size98):
+            _elem103 = Empty()
+            _elem103.read(iprot, fields and fields[19])
+            self.struct_list.append(_elem103)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 20:
+        if ftype == TType.SET and (fields is None or 20 in fields):
+          (_etype107, _size104) = iprot.readSetBegin()
+          self.byte_set = set(iprot.readFixedValues(TType.BYTE, _size104))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 21:
+        if ftype == TType.SET and (fields is None or 21 in fields):
+          (_etype111, _size108) = iprot.readSetBegin()
+          self.i16_set = set(iprot.readFixedValues(TType.I16, _size108))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 22:
+        if ftype == TType.SET and (fields is None or 22 in fields):
+          (_etype115, _size112) = iprot.readSetBegin()
+          self.i32_set = set(iprot.readFixedValues(TType.I32, _size112))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 23:
+        if ftype == TType.SET and (fields is None or 23 in fields):
+          (_etype119, _size116) = iprot.readSetBegin()
+          self.i64_set = set(iprot.readFixedValues(TType.I64, _size116))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 24:
+        if ftype == TType.SET and (fields is None or 24 in fields):
+          (_etype123, _size120) = iprot.readSetBegin()
+          self.double_set = set(iprot.readFixedValues(TType.DOUBLE, _size120))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 25:
+        if ftype == TType.SET and (fields is None or 25 in fields):
+          self.string_set = set()
+          (_etype127, _size124) = iprot.readSetBegin()
+          for _i128 in xrange(_size124):
+            _elem129 = iprot.readString();
+            self.string_set.add(_elem129)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 26:
+        if ftype == TType.SET and (fields is None or 26 in fields):
+          self.binary_set = set()
+          (_etype133, _size130) = iprot.readSetBegin()
+          for _i134 in xrange(_size130):
+            _elem135 = iprot.readString();
+            self.binary_set.add(_elem135)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 27:
+        if ftype == TType.SET and (fields is None or 27 in fields):
+          (_etype139, _size136) = iprot.readSetBegin()
+          self.boolean_set = set(iprot.readFixedValues(TType.BOOL, _size136))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 28:
+        if ftype == TType.SET and (fields is None or 28 in fields):
+          self.struct_set = set()
+          (_etype143, _size140) = iprot.readSetBegin()
+          for _i144 in xrange(_size140):
+            _elem145 = Empty()
+            _elem145.read(iprot, fields and fields[28])
+            self.struct_set.add(_elem145)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 29:
+        if ftype == TType.MAP and (fields is None or 29 in fields):
+          self.byte_byte_map = {}
+          (_ktype147, _vtype148, _size146 ) = iprot.readMapBegin() 
+          for _i150 in xrange(_size146):
+            _key151 = iprot.readByte();
+            _val152 = iprot.readByte();
+            self.byte_byte_map[_key151] = _val152
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 30:
+        if ftype == TType.MAP and (fields is None or 30 in fields):
+          self.i16_byte_map = {}
+          (_ktype154, _vtype155, _size153 ) = iprot.readMapBegin() 
+          for _i157 in xrange(_size153):
+            _key158 = iprot.readI16();
+            _val159 = iprot.readByte();
+            self.i16_byte_map[_key158] = _val159
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 31:
+        if ftype == TType.MAP and (fields is None or 31 in fields):
+          self.i32_byte_map = {}
+          (_ktype161, _vtype162, _size160 ) = iprot.readMapBegin() 
+          for _i164 in xrange(_size160):
+            _key165 = iprot.readI32();
+            _val166 = iprot.readByte();
+            self.i32_byte_map[_key165] = _val166
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 32:
+        if ftype == TType.MAP and (fields is None or 32 in fields):
+          self.i64_byte_map = {}
+          (_ktype168, _vtype169, _size167 ) = iprot.readMapBegin() 
+          for _i171 in xrange(_size167):
+            _key172 = iprot.readI64();
+            _val173 = iprot.readByte();
+            self.i64_byte_map[_key172] = _val173
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 33:
+        if ftype == TType.MAP and (fields is None or 33 in fields):
+          self.double_byte_map = {}
+          (_ktype175, _vtype176, _size174 ) = iprot.readMapBegin() 
+          for _i178 in xrange(_size174):
+            _key179 = iprot.readDouble();
+            _val180 = iprot.readByte();
+            self.double_byte_map[_key179] = _val180
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 34:
+        if ftype == TType.MAP and (fields is None or 34 in fields):
+          self.string_byte_map = {}
+          (_ktype182, _vtype183, _size181 ) = iprot.readMapBegin() 
+          for _i185 in xrange(_size181):
+            _key186 = iprot.readString();
+            _val187 = iprot.readByte();
+            self.string_byte_map[_key186] = _val187
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 35:
+        if ftype == TType.MAP and (fields is None or 35 in fields):
+          self.binary_byte_map = {}
+          (_ktype189, _vtype190, _size188 ) = iprot.readMapBegin() 
+          for _i192 in xrange(_size188):
+            _key193 = iprot.readString();
+            _val194 = iprot.readByte();
+            self.binary_byte_map[_key193] = _val194
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 36:
+        if ftype == TType.MAP and (fields is None or 36 in fields):
+          self.boolean_byte_map = {}
+          (_ktype196, _vtype197, _size195 ) = iprot.readMapBegin() 
+          for _i199 in xrange(_size195):
+            _key200 = iprot.readBool();
+            _val201 = iprot.readByte();
+            self.boolean_byte_map[_key200] = _val201
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 37:
+        if ftype == TType.MAP and (fields is None or 37 in fields):
+          self.byte_i16_map = {}
+          (_ktype203, _vtype204, _size202 ) = iprot.readMapBegin() 
+          for _i206 in xrange(_size202):
+            _key207 = iprot.readByte();
+            _val208 = iprot.readI16();
+            self.byte_i16_map[_key207] = _val208
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 38:
+        if ftype == TType.MAP and (fields is None or 38 in fields):
+          self.byte_i32_map = {}
+          (_ktype210, _vtype211, _size209 ) = iprot.readMapBegin() 
+          for _i213 in xrange(_size209):
+            _key214 = iprot.readByte();
+            _val215 = iprot.readI32();
+            self.byte_i32_map[_key214] = _val215
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 39:
+        if ftype == TType.MAP and (fields is None or 39 in fields):
+          self.byte_i64_map = {}
+          (_ktype217, _vtype218, _size216 ) = iprot.readMapBegin() 
+          for _i220 in xrange(_size216):
+            _key221 = iprot.readByte();
+            _val222 = iprot.readI64();
+            self.byte_i64_map[_key221] = _val222
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 40:
+        if ftype == TType.MAP and (fields is None or 40 in fields):
+          self.byte_double_map = {}
+          (_ktype224, _vtype225, _size223 ) = iprot.readMapBegin() 
+          for _i227 in xrange(_size223):
+            _key228 = iprot.readByte();
+            _val229 = iprot.readDouble();
+            self.byte_double_map[_key228] = _val229
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 41:
+        if ftype == TType.MAP and (fields is None or 41 in fields):
+          self.byte_string_map = {}
+          (_ktype231, _vtype232, _size230 ) = iprot.readMapBegin() 
+          for _i234 in xrange(_size230):
+            _key235 = iprot.readByte();
+            _val236 = iprot.readString();
+            self.byte_string_map[_key235] = _val236
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 42:
+        if ftype == TType.MAP and (fields is None or 42 in fields):
+          self.byte_binary_map = {}
+          (_ktype238, _vtype239, _size237 ) = iprot.readMapBegin() 
+          for _i241 in xrange(_size237):
+            _key242 = iprot.readByte();
+            _val243 = iprot.readString();
+            self.byte_binary_map[_key242] = _val243
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 43:
+        if ftype == TType.MAP and (fields is None or 43 in fields):
+          self.byte_boolean_map = {}
+          (_ktype245, _vtype246, _size244 ) = iprot.readMapBegin() 
+          for _i248 in xrange(_size244):
+            _key249 = iprot.readByte();
+            _val250 = iprot.readBool();
+            self.byte_boolean_map[_key249] = _val250
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 44:
+        if ftype == TType.MAP and (fields is None or 44 in fields):
+          self.list_byte_map = {}
+          (_ktype252, _vtype253, _size251 ) = iprot.readMapBegin() 
+          for _i255 in xrange(_size251):
+            (_etype261, _size258) = iprot.readListBegin()
+            _key256 = iprot.readFixedValues(TType.BYTE, _size258)
+            iprot.readListEnd()
+            _val257 = iprot.readByte();
+            self.list_byte_map[_key256] = _val257
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 45:
+        if ftype == TType.MAP and (fields is None or 45 in fields):
+          self.set_byte_map = {}
+          (_ktype263, _vtype264, _size262 ) = iprot.readMapBegin() 
+          for _i266 in xrange(_size262):
+            (_etype272, _size269) = iprot.readSetBegin()
+            _key267 = set(iprot.readFixedValues(TType.BYTE, _size269))
+            iprot.readSetEnd()
+            _val268 = iprot.readByte();
+            self.set_byte_map[_key267] = _val268
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 46:
+        if ftype == TType.MAP and (fields is None or 46 in fields):
+          self.map_byte_map = {}
+          (_ktype274, _vtype275, _size273 ) = iprot.readMapBegin() 
+          for _i277 in xrange(_size273):
+            _key278 = {}
+            (_ktype281, _vtype282, _size280 ) = iprot.readMapBegin() 
+            for _i284 in xrange(_size280):
+              _key285 = iprot.readByte();
+              _val286 = iprot.readByte();
+              _key278[_key285] = _val286
+            iprot.readMapEnd()
+            _val279 = iprot.readByte();
+            self.map_byte_map[_key278] = _val279
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 47:
+        if ftype == TType.MAP and (fields is None or 47 in fields):
+          self.byte_map_map = {}
+          (_ktype288, _vtype289, _size287 ) = iprot.readMapBegin() 
+          for _i291 in xrange(_size287):
+            _key292 = iprot.readByte();
+            _val293 = {}
+            (_ktype295, _vtype296, _size294 ) = iprot.readMapBegin() 
+            for _i298 in xrange(_size294):
+              _key299 = iprot.readByte();
+              _val300 = iprot.readByte();
+              _val293[_key299] = _val300
+            iprot.readMapEnd()
+            self.byte_map_map[_key292] = _val293
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 48:
+        if ftype == TType.MAP and (fields is None or 48 in fields):
+          self.byte_set_map = {}
+          (_ktype302, _vtype303, _size301 ) = iprot.readMapBegin() 
+          for _i305 in xrange(_size301):
+            _key306 = iprot.readByte();
+            (_etype311, _size308) = iprot.readSetBegin()
+            _val307 = set(iprot.readFixedValues(TType.BYTE, _size308))
+            iprot.readSetEnd()
+            self.byte_set_map[_key306] = _val307
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 49:
+        if ftype == TType.MAP and (fields is None or 49 in fields):
+          self.byte_list_map = {}
+          (_ktype313, _vtype314, _size312 ) = iprot.readMapBegin() 
+          for _i316 in xrange(_size312):
+            _key317 = iprot.readByte();
+            (_etype322, _size319) = iprot.readListBegin()
+            _val318 = iprot.readFixedValues(TType.BYTE, _size319)
+            iprot.readListEnd()
+            self.byte_list_map[_key317] = _val318
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('CompactProtoTestStruct')
+    if self.a_byte != None:
+      oprot.writeFieldBegin('a_byte', TType.BYTE, 1)
+      oprot.writeByte(self.a_byte)
+      oprot.writeFieldEnd()
+    if self.a_i16 != None:
+      oprot.writeFieldBegin('a_i16', TType.I16, 2)
+      oprot.writeI16(self.a_i16)
+      oprot.writeFieldEnd()
+    if self.a_i32 != None:
+      oprot.writeFieldBegin('a_i32', TType.I32, 3)
+      oprot.writeI32(self.a_i32)
+      oprot.writeFieldEnd()
+    if self.a_i64 != None:
+      oprot.writeFieldBegin('a_i64', TType.I64, 4)
+      oprot.writeI64(self.a_i64)
+      oprot.writeFieldEnd()
+    if self.a_double != None:
+      oprot.writeFieldBegin('a_double', TType.DOUBLE, 5)
+      oprot.writeDouble(self.a_double)
+      oprot.writeFieldEnd()
+    if self.a_string != None:
+      oprot.writeFieldBegin('a_string', TType.STRING, 6)
+      oprot.writeString(self.a_string)
+      oprot.writeFieldEnd()
+    if self.a_binary != None:
+      oprot.writeFieldBegin('a_binary', TType.STRING, 7)
+      oprot.writeString(self.a_binary)
+      oprot.writeFieldEnd()
+    if self.true_field != None:
+      oprot.writeFieldBegin('true_field', TType.BOOL, 8)
+      oprot.writeBool(self.true_field)
+      oprot.writeFieldEnd()
+    if self.false_field != None:
+      oprot.writeFieldBegin('false_field', TType.BOOL, 9)
+      oprot.writeBool(self.false_field)
+      oprot.writeFieldEnd()
+    if self.empty_struct_field != None:
+      oprot.writeFieldBegin('empty_struct_field', TType.STRUCT, 10)
+      self.empty_struct_field.write(oprot)
+      oprot.writeFieldEnd()
+    if self.byte_list != None:
+      oprot.writeFieldBegin('byte_list', TType.LIST, 11)
+      oprot.writeListBegin(TType.BYTE, len(self.byte_list))
+      oprot.writeFixedValues(TType.BYTE, self.byte_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.i16_list != None:
+      oprot.writeFieldBegin('i16_list', TType.LIST, 12)
+      oprot.writeListBegin(TType.I16, len(self.i16_list))
+      oprot.writeFixedValues(TType.I16, self.i16_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.i32_list != None:
+      oprot.writeFieldBegin('i32_list', TType.LIST, 13)
+      oprot.writeListBegin(TType.I32, len(self.i32_list))
+      oprot.writeFixedValues(TType.I32, self.i32_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.i64_list != None:
+      oprot.writeFieldBegin('i64_list', TType.LIST, 14)
+      oprot.writeListBegin(TType.I64, len(self.i64_list))
+      oprot.writeFixedValues(TType.I64, self.i64_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.double_list != None:
+      oprot.writeFieldBegin('double_list', TType.LIST, 15)
+      oprot.writeListBegin(TType.DOUBLE, len(self.double_list))
+      oprot.writeFixedValues(TType.DOUBLE, self.double_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.string_list != None:
+      oprot.writeFieldBegin('string_list', TType.LIST, 16)
+      oprot.writeListBegin(TType.STRING, len(self.string_list))
+      for iter323 in self.string_list:
+        oprot.writeString(iter323)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.binary_list != None:
+      oprot.writeFieldBegin('binary_list', TType.LIST, 17)
+      oprot.writeListBegin(TType.STRING, len(self.binary_list))
+      for iter324 in self.binary_list:
+        oprot.writeString(iter324)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.boolean_list != None:
+      oprot.writeFieldBegin('boolean_list', TType.LIST, 18)
+      oprot.writeListBegin(TType.BOOL, len(self.boolean_list))
+      oprot.writeFixedValues(TType.BOOL, self.boolean_list)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.struct_list != None:
+      oprot.writeFieldBegin('struct_list', TType.LIST, 19)
+      oprot.writeListBegin(TType.STRUCT, len(self.struct_list))
+      for iter325 in self.struct_list:
+        iter325.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.byte_set != None:
+      oprot.writeFieldBegin('byte_set', TType.SET, 20)
+      oprot.writeSetBegin(TType.BYTE, len(self.byte_set))
+      oprot.writeFixedValues(TType.BYTE, self.byte_set)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.i16_set != None:
+      oprot.writeFieldBegin('i16_set', TType.SET, 21)
+      oprot.writeSetBegin(TType.I16, len(self.i16_set))
+      oprot.writeFixedValues(TType.I16, self.i16_set)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.i32_set != None:
+      oprot.writeFieldBegin('i32_set', TType.SET, 22)
+      oprot.writeSetBegin(TType.I32, len(self.i32_set))
+      oprot.writeFixedValues(TType.I32, self.i32_set)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.i64_set != None:
+      oprot.writeFieldBegin('i64_set', TType.SET, 23)
+      oprot.writeSetBegin(TType.I64, len(self.i64_set))
+      oprot.writeFixedValues(TType.I64, self.i64_set)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.double_set != None:
+      oprot.writeFieldBegin('double_set', TType.SET, 24)
+      oprot.writeSetBegin(TType.DOUBLE, len(self.double_set))
+      oprot.writeFixedValues(TType.DOUBLE, self.double_set)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.string_set != None:
+      oprot.writeFieldBegin('string_set', TType.SET, 25)
+      oprot.writeSetBegin(TType.STRING, len(self.string_set))
+      for iter326 in self.string_set:
+        oprot.writeString(iter326)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.binary_set != None:
+      oprot.writeFieldBegin('binary_set', TType.SET, 26)
+      oprot.writeSetBegin(TType.STRING, len(self.binary_set))
+      for iter327 in self.binary_set:
+        oprot.writeString(iter327)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.boolean_set != None:
+      oprot.writeFieldBegin('boolean_set', TType.SET, 27)
+      oprot.writeSetBegin(TType.BOOL, len(self.boolean_set))
+      oprot.writeFixedValues(TType.BOOL, self.boolean_set)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.struct_set != None:
+      oprot.writeFieldBegin('struct_set', TType.SET, 28)
+      oprot.writeSetBegin(TType.STRUCT, len(self.struct_set))
+      for iter328 in self.struct_set:
+        iter328.write(oprot)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.byte_byte_map != None:
+      oprot.writeFieldBegin('byte_byte_map', TType.MAP, 29)
+      oprot.writeMapBegin(TType.BYTE, TType.BYTE, len(self.byte_byte_map))
+      for kiter329,viter330 in self.byte_byte_map.items():
+        oprot.writeByte(kiter329)
+        oprot.writeByte(viter330)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.i16_byte_map != None:
+      oprot.writeFieldBegin('i16_byte_map', TType.MAP, 30)
+      oprot.writeMapBegin(TType.I16, TType.BYTE, len(self.i16_byte_map))
+      for kiter331,viter332 in self.i16_byte_map.items():
+        oprot.writeI16(kiter331)
+        oprot.writeByte(viter332)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.i32_byte_map != None:
+      oprot.writeFieldBegin('i32_byte_map', TType.MAP, 31)
+      oprot.writeMapBegin(TType.I32, TType.BYTE, len(self.i32_byte_map))
+      for kiter333,viter334 in self.i32_byte_map.items():
+        oprot.writeI32(kiter333)
+        oprot.writeByte(viter334)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.i64_byte_map != None:
+      oprot.writeFieldBegin('i64_byte_map', TType.MAP, 32)
+      oprot.writeMapBegin(TType.I64, TType.BYTE, len(self.i64_byte_map))
+      for kiter335,viter336 in self.i64_byte_map.items():
+        oprot.writeI64(kiter335)
+        oprot.writeByte(viter336)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.double_byte_map != None:
+      oprot.writeFieldBegin('double_byte_map', TType.MAP, 33)
+      oprot.writeMapBegin(TType.DOUBLE, TType.BYTE, len(self.double_byte_map))
+      for kiter337,viter338 in self.double_byte_map.items():
+        oprot.writeDouble(kiter337)
+        oprot.writeByte(viter338)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.string_byte_map != None:
+      oprot.writeFieldBegin('string_byte_map', TType.MAP, 34)
+      oprot.writeMapBegin(TType.STRING, TType.BYTE, len(self.string_byte_map))
+      for kiter339,viter340 in self.string_byte_map.items():
+        oprot.writeString(kiter339)
+        oprot.writeByte(viter340)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.binary_byte_map != None:
+      oprot.writeFieldBegin('binary_byte_map', TType.MAP, 35)
+      oprot.writeMapBegin(TType.STRING, TType.BYTE, len(self.binary_byte_map))
+      for kiter341,viter342 in self.binary_byte_map.items():
+        oprot.writeString(kiter341)
+        oprot.writeByte(viter342)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.boolean_byte_map != None:
+      oprot.writeFieldBegin('boolean_byte_map', TType.MAP, 36)
+      oprot.writeMapBegin(TType.BOOL, TType.BYTE, len(self.boolean_byte_map))
+      for kiter343,viter344 in self.boolean_byte_map.items():
+        oprot.writeBool(kiter343)
+        oprot.writeByte(viter344)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_i16_map != None:
+      oprot.writeFieldBegin('byte_i16_map', TType.MAP, 37)
+      oprot.writeMapBegin(TType.BYTE, TType.I16, len(self.byte_i16_map))
+      for kiter345,viter346 in self.byte_i16_map.items():
+        oprot.writeByte(kiter345)
+        oprot.writeI16(viter346)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_i32_map != None:
+      oprot.writeFieldBegin('byte_i32_map', TType.MAP, 38)
+      oprot.writeMapBegin(TType.BYTE, TType.I32, len(self.byte_i32_map))
+      for kiter347,viter348 in self.byte_i32_map.items():
+        oprot.writeByte(kiter347)
+        oprot.writeI32(viter348)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_i64_map != None:
+      oprot.writeFieldBegin('byte_i64_map', TType.MAP, 39)
+      oprot.writeMapBegin(TType.BYTE, TType.I64, len(self.byte_i64_map))
+      for kiter349,viter350 in self.byte_i64_map.items():
+        oprot.writeByte(kiter349)
+        oprot.writeI64(viter350)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_double_map != None:
+      oprot.writeFieldBegin('byte_double_map', TType.MAP, 40)
+      oprot.writeMapBegin(TType.BYTE, TType.DOUBLE, len(self.byte_double_map))
+      for kiter351,viter352 in self.byte_double_map.items():
+        oprot.writeByte(kiter351)
+        oprot.writeDouble(viter352)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_string_map != None:
+      oprot.writeFieldBegin('byte_string_map', TType.MAP, 41)
+      oprot.writeMapBegin(TType.BYTE, TType.STRING, len(self.byte_string_map))
+      for kiter353,viter354 in self.byte_string_map.items():
+        oprot.writeByte(kiter353)
+        oprot.writeString(viter354)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_binary_map != None:
+      oprot.writeFieldBegin('byte_binary_map', TType.MAP, 42)
+      oprot.writeMapBegin(TType.BYTE, TType.STRING, len(self.byte_binary_map))
+      for kiter355,viter356 in self.byte_binary_map.items():
+        oprot.writeByte(kiter355)
+        oprot.writeString(viter356)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_boolean_map != None:
+      oprot.writeFieldBegin('byte_boolean_map', TType.MAP, 43)
+      oprot.writeMapBegin(TType.BYTE, TType.BOOL, len(self.byte_boolean_map))
+      for kiter357,viter358 in self.byte_boolean_map.items():
+        oprot.writeByte(kiter357)
+        oprot.writeBool(viter358)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.list_byte_map != None:
+      oprot.writeFieldBegin('list_byte_map', TType.MAP, 44)
+      oprot.writeMapBegin(TType.LIST, TType.BYTE, len(self.list_byte_map))
+      for kiter359,viter360 in self.list_byte_map.items():
+        oprot.writeListBegin(TType.BYTE, len(kiter359))
+        oprot.writeFixedValues(TType.BYTE, kiter359)
+        oprot.writeListEnd()
+        oprot.writeByte(viter360)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.set_byte_map != None:
+      oprot.writeFieldBegin('set_byte_map', TType.MAP, 45)
+      oprot.writeMapBegin(TType.SET, TType.BYTE, len(self.set_byte_map))
+      for kiter361,viter362 in self.set_byte_map.items():
+        oprot.writeSetBegin(TType.BYTE, len(kiter361))
+        oprot.writeFixedValues(TType.BYTE, kiter361)
+        oprot.writeSetEnd()
+        oprot.writeByte(viter362)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.map_byte_map != None:
+      oprot.writeFieldBegin('map_byte_map', TType.MAP, 46)
+      oprot.writeMapBegin(TType.MAP, TType.BYTE, len(self.map_byte_map))
+      for kiter363,viter364 in self.map_byte_map.items():
+        oprot.writeMapBegin(TType.BYTE, TType.BYTE, len(kiter363))
+        for kiter365,viter366 in kiter363.items():
+          oprot.writeByte(kiter365)
+          oprot.writeByte(viter366)
+        oprot.writeMapEnd()
+        oprot.writeByte(viter364)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_map_map != None:
+      oprot.writeFieldBegin('byte_map_map', TType.MAP, 47)
+      oprot.writeMapBegin(TType.BYTE, TType.MAP, len(self.byte_map_map))
+      for kiter367,viter368 in self.byte_map_map.items():
+        oprot.writeByte(kiter367)
+        oprot.writeMapBegin(TType.BYTE, TType.BYTE, len(viter368))
+        for kiter369,viter370 in viter368.items():
+          oprot.writeByte(kiter369)
+          oprot.writeByte(viter370)
+        oprot.writeMapEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_set_map != None:
+      oprot.writeFieldBegin('byte_set_map', TType.MAP, 48)
+      oprot.writeMapBegin(TType.BYTE, TType.SET, len(self.byte_set_map))
+      for kiter371,viter372 in self.byte_set_map.items():
+        oprot.writeByte(kiter371)
+        oprot.writeSetBegin(TType.BYTE, len(viter372))
+        oprot.writeFixedValues(TType.BYTE, viter372)
+        oprot.writeSetEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.byte_list_map != None:
+      oprot.writeFieldBegin('byte_list_map', TType.MAP, 49)
+      oprot.writeMapBegin(TType.BYTE, TType.LIST, len(self.byte_list_map))
+      for kiter373,viter374 in self.byte_list_map.items():
+        oprot.writeByte(kiter373)
+        oprot.writeListBegin(TType.BYTE, len(viter374))
+        oprot.writeFixedValues(TType.BYTE, viter374)
+        oprot.writeListEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ExceptionWithAMap(Exception):
+  """
+  Attributes:
+   - blah
+   - map_field
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'blah', None, None, ), # 1
+    (2, TType.MAP, 'map_field', (TType.STRING,None,TType.STRING,None), None, ), # 2
+  )
+
+  def __init__(self, blah=None, map_field=None,):
+    self.blah = blah
+    self.map_field = map_field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.blah = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.MAP and (fields is None or 2 in fields):
+          self.map_field = {}
+          (_ktype376, _vtype377, _size375 ) = iprot.readMapBegin() 
+          for _i379 in xrange(_size375):
+            _key380 = iprot.readString();
+            _val381 = iprot.readString();
+            self.map_field[_key380] = _val381
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('ExceptionWithAMap')
+    if self.blah != None:
+      oprot.writeFieldBegin('blah', TType.STRING, 1)
+      oprot.writeString(self.blah)
+      oprot.writeFieldEnd()
+    if self.map_field != None:
+      oprot.writeFieldBegin('map_field', TType.MAP, 2)
+      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.map_field))
+      for kiter382,viter383 in self.map_field.items():
+        oprot.writeString(kiter382)
+        oprot.writeString(viter383)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class BlowUp:
+  """
+  Attributes:
+   - b1
+   - b2
+   - b3
+   - b4
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.MAP, 'b1', (TType.LIST,(TType.I32,None),TType.SET,(TType.MAP,(TType.I32,None,TType.STRING,None))), None, ), # 1
+    (2, TType.MAP, 'b2', (TType.LIST,(TType.I32,None),TType.SET,(TType.MAP,(TType.I32,None,TType.STRING,None))), None, ), # 2
+    (3, TType.MAP, 'b3', (TType.LIST,(TType.I32,None),TType.SET,(TType.MAP,(TType.I32,None,TType.STRING,None))), None, ), # 3
+    (4, TType.MAP, 'b4', (TType.LIST,(TType.I32,None),TType.SET,(TType.MAP,(TType.I32,None,TType.STRING,None))), None, ), # 4
+  )
+
+  def __init__(self, b1=None, b2=None, b3=None, b4=None,):
+    self.b1 = b1
+    self.b2 = b2
+    self.b3 = b3
+    self.b4 = b4
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.MAP and (fields is None or 1 in fields):
+          self.b1 = {}
+          (_ktype385, _vtype386, _size384 ) = iprot.readMapBegin() 
+          for _i388 in xrange(_size384):
+            (_etype394, _size391) = iprot.readListBegin()
+            _key389 = iprot.readFixedValues(TType.I32, _size391)
+            iprot.readListEnd()
+            _val390 = set()
+            (_etype398, _size395) = iprot.readSetBegin()
+            for _i399 in xrange(_size395):
+              _elem400 = {}
+              (_ktype402, _vtype403, _size401 ) = iprot.readMapBegin() 
+              for _i405 in xrange(_size401):
+                _key406 = iprot.readI32();
+                _val407 = iprot.readString();
+                _elem400[_key406] = _val407
+              iprot.readMapEnd()
+              _val390.add(_elem400)
+            iprot.readSetEnd()
+            self.b1[_key389] = _val390
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.MAP and (fields is None or 2 in fields):
+          self.b2 = {}
+          (_ktype409, _vtype410, _size408 ) = iprot.readMapBegin() 
+          for _i412 in xrange(_size408):
+            (_etype418, _size415) = iprot.readListBegin()
+            _key413 = iprot.readFixedValues(TType.I32, _size415)
+            iprot.readListEnd()
+            _val414 = set()
+            (_etype422, _size419) = iprot.readSetBegin()
+            for _i423 in xrange(_size419):
+              _elem424 = {}
+              (_ktype426, _vtype427, _size425 ) = iprot.readMapBegin() 
+              for _i429 in xrange(_size425):
+                _key430 = iprot.readI32();
+                _val431 = iprot.readString();
+                _elem424[_key430] = _val431
+              iprot.readMapEnd()
+              _val414.add(_elem424)
+            iprot.readSetEnd()
+            self.b2[_key413] = _val414
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.MAP and (fields is None or 3 in fields):
+          self.b3 = {}
+          (_ktype433, _vtype434, _size432 ) = iprot.readMapBegin() 
+          for _i436 in xrange(_size432):
+            (_etype442, _size439) = iprot.readListBegin()
+            _key437 = iprot.readFixedValues(TType.I32, _size439)
+            iprot.readListEnd()
+            _val438 = set()
+            (_etype446, _size443) = iprot.readSetBegin()
+            for _i447 in xrange(_size443):
+              _elem448 = {}
+              (_ktype450, _vtype451, _size449 ) = iprot.readMapBegin() 
+              for _i453 in xrange(_size449):
+                _key454 = iprot.readI32();
+                _val455 = iprot.readString();
+                _elem448[_key454] = _val455
+              iprot.readMapEnd()
+              _val438.add(_elem448)
+            iprot.readSetEnd()
+            self.b3[_key437] = _val438
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.MAP and (fields is None or 4 in fields):
+          self.b4 = {}
+          (_ktype457, _vtype458, _size456 ) = iprot.readMapBegin() 
+          for _i460 in xrange(_size456):
+            (_etype466, _size463) = iprot.readListBegin()
+            _key461 = iprot.readFixedValues(TType.I32, _size463)
+            iprot.readListEnd()
+            _val462 = set()
+            (_etype470, _size467) = iprot.readSetBegin()
+            for _i471 in xrange(_size467):
+              _elem472 = {}
+              (_ktype474, _vtype475, _size473 ) = iprot.readMapBegin() 
+              for _i477 in xrange(_size473):
+                _key478 = iprot.readI32();
+                _val479 = iprot.readString();
+                _elem472[_key478] = _val479
+              iprot.readMapEnd()
+              _val462.add(_elem472)
+            iprot.readSetEnd()
+            self.b4[_key461] = _val462
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('BlowUp')
+    if self.b1 != None:
+      oprot.writeFieldBegin('b1', TType.MAP, 1)
+      oprot.writeMapBegin(TType.LIST, TType.SET, len(self.b1))
+      for kiter480,viter481 in self.b1.items():
+        oprot.writeListBegin(TType.I32, len(kiter480))
+        oprot.writeFixedValues(TType.I32, kiter480)
+        oprot.writeListEnd()
+        oprot.writeSetBegin(TType.MAP, len(viter481))
+        for iter482 in viter481:
+          oprot.writeMapBegin(TType.I32, TType.STRING, len(iter482))
+          for kiter483,viter484 in iter482.items():
+            oprot.writeI32(kiter483)
+            oprot.writeString(viter484)
+          oprot.writeMapEnd()
+        oprot.writeSetEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.b2 != None:
+      oprot.writeFieldBegin('b2', TType.MAP, 2)
+      oprot.writeMapBegin(TType.LIST, TType.SET, len(self.b2))
+      for kiter485,viter486 in self.b2.items():
+        oprot.writeListBegin(TType.I32, len(kiter485))
+        oprot.writeFixedValues(TType.I32, kiter485)
+        oprot.writeListEnd()
+        oprot.writeSetBegin(TType.MAP, len(viter486))
+        for iter487 in viter486:
+          oprot.writeMapBegin(TType.I32, TType.STRING, len(iter487))
+          for kiter488,viter489 in iter487.items():
+            oprot.writeI32(kiter488)
+            oprot.writeString(viter489)
+          oprot.writeMapEnd()
+        oprot.writeSetEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.b3 != None:
+      oprot.writeFieldBegin('b3', TType.MAP, 3)
+      oprot.writeMapBegin(TType.LIST, TType.SET, len(self.b3))
+      for kiter490,viter491 in self.b3.items():
+        oprot.writeListBegin(TType.I32, len(kiter490))
+        oprot.writeFixedValues(TType.I32, kiter490)
+        oprot.writeListEnd()
+        oprot.writeSetBegin(TType.MAP, len(viter491))
+        for iter492 in viter491:
+          oprot.writeMapBegin(TType.I32, TType.STRING, len(iter492))
+          for kiter493,viter494 in iter492.items():
+            oprot.writeI32(kiter493)
+            oprot.writeString(viter494)
+          oprot.writeMapEnd()
+        oprot.writeSetEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.b4 != None:
+      oprot.writeFieldBegin('b4', TType.MAP, 4)
+      oprot.writeMapBegin(TType.LIST, TType.SET, len(self.b4))
+      for kiter495,viter496 in self.b4.items():
+        oprot.writeListBegin(TType.I32, len(kiter495))
+        oprot.writeFixedValues(TType.I32, kiter495)
+        oprot.writeListEnd()
+        oprot.writeSetBegin(TType.MAP, len(viter496))
+        for iter497 in viter496:
+          oprot.writeMapBegin(TType.I32, TType.STRING, len(iter497))
+          for kiter498,viter499 in iter497.items():
+            oprot.writeI32(kiter498)
+            oprot.writeString(viter499)
+          oprot.writeMapEnd()
+        oprot.writeSetEnd()
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ReverseOrderStruct:
+  """
+  Attributes:
+   - first
+   - second
+   - third
+   - fourth
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'fourth', None, None, ), # 1
+    (2, TType.I32, 'third', None, None, ), # 2
+    (3, TType.I16, 'second', None, None, ), # 3
+    (4, TType.STRING, 'first', None, None, ), # 4
+  )
+
+  def __init__(self, first=None, second=None, third=None, fourth=None,):
+    self.first = first
+    self.second = second
+    self.third = third
+    self.fourth = fourth
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 4:
+        if ftype == TType.STRING and (fields is None or 4 in fields):
+          self.first = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I16 and (fields is None or 3 in fields):
+          self.second = iprot.readI16();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.third = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.I64 and (fields is None or 1 in fields):
+          self.fourth = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('ReverseOrderStruct')
+    if self.fourth != None:
+      oprot.writeFieldBegin('fourth', TType.I64, 1)
+      oprot.writeI64(self.fourth)
+      oprot.writeFieldEnd()
+    if self.third != None:
+      oprot.writeFieldBegin('third', TType.I32, 2)
+      oprot.writeI32(self.third)
+      oprot.writeFieldEnd()
+    if self.second != None:
+      oprot.writeFieldBegin('second', TType.I16, 3)
+      oprot.writeI16(self.second)
+      oprot.writeFieldEnd()
+    if self.first != None:
+      oprot.writeFieldBegin('first', TType.STRING, 4)
+      oprot.writeString(self.first)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class StructWithSomeEnum:
+  """
+  Attributes:
+   - blah
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'blah', None, None, ), # 1
+  )
+
+  def __init__(self, blah=None,):
+    self.blah = blah
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.blah = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('StructWithSomeEnum')
+    if self.blah != None:
+      oprot.writeFieldBegin('blah', TType.I32, 1)
+      oprot.writeI32(self.blah)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TestUnion:
+  """
+  Attributes:
+   - string_field: A doc string
+   - i32_field
+   - struct_field
+   - struct_list
+   - other_i32_field
+   - enum_field
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'string_field', None, None, ), # 1
+    (2, TType.I32, 'i32_field', None, None, ), # 2
+    (3, TType.STRUCT, 'struct_field', (OneOfEach, OneOfEach.thrift_spec), None, ), # 3
+    (4, TType.LIST, 'struct_list', (TType.STRUCT,(RandomStuff, RandomStuff.thrift_spec)), None, ), # 4
+    (5, TType.I32, 'other_i32_field', None, None, ), # 5
+    (6, TType.I32, 'enum_field', None, None, ), # 6
+  )
+
+  def __init__(self, string_field=None, i32_field=None, struct_field=None, struct_list=None, other_i32_field=None, enum_field=None,):
+    self.string_field = string_field
+    self.i32_field = i32_field
+    self.struct_field = struct_field
+    self.struct_list = struct_list
+    self.other_i32_field = other_i32_field
+    self.enum_field = enum_field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.string_field = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.i32_field = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT and (fields is None or 3 in fields):
+          self.struct_field = OneOfEach()
+          self.struct_field.read(iprot, fields and fields[3])
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.LIST and (fields is None or 4 in fields):
+          self.struct_list = []
+          (_etype503, _size500) = iprot.readListBegin()
+          for _i504 in xrange(_size500):
+            _elem505 = RandomStuff()
+            _elem505.read(iprot, fields and fields[4])
+            self.struct_list.append(_elem505)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32 and (fields is None or 5 in fields):
+          self.other_i32_field = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I32 and (fields is None or 6 in fields):
+          self.enum_field = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('TestUnion')
+    if self.string_field != None:
+      oprot.writeFieldBegin('string_field', TType.STRING, 1)
+      oprot.writeString(self.string_field)
+      oprot.writeFieldEnd()
+    if self.i32_field != None:
+      oprot.writeFieldBegin('i32_field', TType.I32, 2)
+      oprot.writeI32(self.i32_field)
+      oprot.writeFieldEnd()
+    if self.struct_field != None:
+      oprot.writeFieldBegin('struct_field', TType.STRUCT, 3)
+      self.struct_field.write(oprot)
+      oprot.writeFieldEnd()
+    if self.struct_list != None:
+      oprot.writeFieldBegin('struct_list', TType.LIST, 4)
+      oprot.writeListBegin(TType.STRUCT, len(self.struct_list))
+      for iter506 in self.struct_list:
+        iter506.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.other_i32_field != None:
+      oprot.writeFieldBegin('other_i32_field', TType.I32, 5)
+      oprot.writeI32(self.other_i32_field)
+      oprot.writeFieldEnd()
+    if self.enum_field != None:
+      oprot.writeFieldBegin('enum_field', TType.I32, 6)
+      oprot.writeI32(self.enum_field)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TestUnionMinusStringField:
+  """
+  Attributes:
+   - i32_field
+   - struct_field
+   - struct_list
+   - other_i32_field
+   - enum_field
+  """
+
+  thrift_spec = (
+    None, # 0
+    None, # 1
+    (2, TType.I32, 'i32_field', None, None, ), # 2
+    (3, TType.STRUCT, 'struct_field', (OneOfEach, OneOfEach.thrift_spec), None, ), # 3
+    (4, TType.LIST, 'struct_list', (TType.STRUCT,(RandomStuff, RandomStuff.thrift_spec)), None, ), # 4
+    (5, TType.I32, 'other_i32_field', None, None, ), # 5
+    (6, TType.I32, 'enum_field', None, None, ), # 6
+  )
+
+  def __init__(self, i32_field=None, struct_field=None, struct_list=None, other_i32_field=None, enum_field=None,):
+    self.i32_field = i32_field
+    self.struct_field = struct_field
+    self.struct_list = struct_list
+    self.other_i32_field = other_i32_field
+    self.enum_field = enum_field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.i32_field = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT and (fields is None or 3 in fields):
+          self.struct_field = OneOfEach()
+          self.struct_field.read(iprot, fields and fields[3])
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.LIST and (fields is None or 4 in fields):
+          self.struct_list = []
+          (_etype510, _size507) = iprot.readListBegin()
+          for _i511 in xrange(_size507):
+            _elem512 = RandomStuff()
+            _elem512.read(iprot, fields and fields[4])
+            self.struct_list.append(_elem512)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32 and (fields is None or 5 in fields):
+          self.other_i32_field = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I32 and (fields is None or 6 in fields):
+          self.enum_field = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('TestUnionMinusStringField')
+    if self.i32_field != None:
+      oprot.writeFieldBegin('i32_field', TType.I32, 2)
+      oprot.writeI32(self.i32_field)
+      oprot.writeFieldEnd()
+    if self.struct_field != None:
+      oprot.writeFieldBegin('struct_field', TType.STRUCT, 3)
+      self.struct_field.write(oprot)
+      oprot.writeFieldEnd()
+    if self.struct_list != None:
+      oprot.writeFieldBegin('struct_list', TType.LIST, 4)
+      oprot.writeListBegin(TType.STRUCT, len(self.struct_list))
+      for iter513 in self.struct_list:
+        iter513.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.other_i32_field != None:
+      oprot.writeFieldBegin('other_i32_field', TType.I32, 5)
+      oprot.writeI32(self.other_i32_field)
+      oprot.writeFieldEnd()
+    if self.enum_field != None:
+      oprot.writeFieldBegin('enum_field', TType.I32, 6)
+      oprot.writeI32(self.enum_field)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ComparableUnion:
+  """
+  Attributes:
+   - string_field
+   - binary_field
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'string_field', None, None, ), # 1
+    (2, TType.STRING, 'binary_field', None, None, ), # 2
+  )
+
+  def __init__(self, string_field=None, binary_field=None,):
+    self.string_field = string_field
+    self.binary_field = binary_field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.string_field = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING and (fields is None or 2 in fields):
+          self.binary_field = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('ComparableUnion')
+    if self.string_field != None:
+      oprot.writeFieldBegin('string_field', TType.STRING, 1)
+      oprot.writeString(self.string_field)
+      oprot.writeFieldEnd()
+    if self.binary_field != None:
+      oprot.writeFieldBegin('binary_field', TType.STRING, 2)
+      oprot.writeString(self.binary_field)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class StructWithAUnion:
+  """
+  Attributes:
+   - test_union
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'test_union', (TestUnion, TestUnion.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, test_union=None,):
+    self.test_union = test_union
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT and (fields is None or 1 in fields):
+          self.test_union = TestUnion()
+          self.test_union.read(iprot, fields and fields[1])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('StructWithAUnion')
+    if self.test_union != None:
+      oprot.writeFieldBegin('test_union', TType.STRUCT, 1)
+      self.test_union.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class PrimitiveThenStruct:
+  """
+  Attributes:
+   - blah
+   - blah2
+   - bw
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'blah', None, None, ), # 1
+    (2, TType.I32, 'blah2', None, None, ), # 2
+    (3, TType.STRUCT, 'bw', (Backwards, Backwards.thrift_spec), None, ), # 3
+  )
+
+  def __init__(self, blah=None, blah2=None, bw=None,):
+    self.blah = blah
+    self.blah2 = blah2
+    self.bw = bw
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.blah = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.blah2 = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT and (fields is None or 3 in fields):
+          self.bw = Backwards()
+          self.bw.read(iprot, fields and fields[3])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('PrimitiveThenStruct')
+    if self.blah != None:
+      oprot.writeFieldBegin('blah', TType.I32, 1)
+      oprot.writeI32(self.blah)
+      oprot.writeFieldEnd()
+    if self.blah2 != None:
+      oprot.writeFieldBegin('blah2', TType.I32, 2)
+      oprot.writeI32(self.blah2)
+      oprot.writeFieldEnd()
+    if self.bw != None:
+      oprot.writeFieldBegin('bw', TType.STRUCT, 3)
+      self.bw.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class StructWithASomemap:
+  """
+  Attributes:
+   - somemap_field
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.MAP, 'somemap_field', (TType.I32,None,TType.I32,None), None, ), # 1
+  )
+
+  def __init__(self, somemap_field=None,):
+    self.somemap_field = somemap_field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.MAP and (fields is None or 1 in fields):
+          self.somemap_field = {}
+          (_ktype515, _vtype516, _size514 ) = iprot.readMapBegin() 
+          for _i518 in xrange(_size514):
+            _key519 = iprot.readI32();
+            _val520 = iprot.readI32();
+            self.somemap_field[_key519] = _val520
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('StructWithASomemap')
+    if self.somemap_field != None:
+      oprot.writeFieldBegin('somemap_field', TType.MAP, 1)
+      oprot.writeMapBegin(TType.I32, TType.I32, len(self.somemap_field))
+      for kiter521,viter522 in self.somemap_field.items():
+        oprot.writeI32(kiter521)
+        oprot.writeI32(viter522)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class BigFieldIdStruct:
+  """
+  Attributes:
+   - field1
+   - field2
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'field1', None, None, ), # 1
+    None, # 2
+    None, # 3
+    None, # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    None, # 10
+    None, # 11
+    None, # 12
+    None, # 13
+    None, # 14
+    None, # 15
+    None, # 16
+    None, # 17
+    None, # 18
+    None, # 19
+    None, # 20
+    None, # 21
+    None, # 22
+    None, # 23
+    None, # 24
+    None, # 25
+    None, # 26
+    None, # 27
+    None, # 28
+    None, # 29
+    None, # 30
+    None, # 31
+    None, # 32
+    None, # 33
+    None, # 34
+    None, # 35
+    None, # 36
+    None, # 37
+    None, # 38
+    None, # 39
+    None, # 40
+    None, # 41
+    None, # 42
+    None, # 43
+    None, # 44
+    (45, TType.STRING, 'field2', None, None, ), # 45
+  )
+
+  def __init__(self, field1=None, field2=None,):
+    self.field1 = field1
+    self.field2 = field2
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.field1 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 45:
+        if ftype == TType.STRING and (fields is None or 45 in fields):
+          self.field2 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('BigFieldIdStruct')
+    if self.field1 != None:
+      oprot.writeFieldBegin('field1', TType.STRING, 1)
+      oprot.writeString(self.field1)
+      oprot.writeFieldEnd()
+    if self.field2 != None:
+      oprot.writeFieldBegin('field2', TType.STRING, 45)
+      oprot.writeString(self.field2)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class BreaksRubyCompactProtocol:
+  """
+  Attributes:
+   - field1
+   - field2
+   - field3
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'field1', None, None, ), # 1
+    (2, TType.STRUCT, 'field2', (BigFieldIdStruct, BigFieldIdStruct.thrift_spec), None, ), # 2
+    (3, TType.I32, 'field3', None, None, ), # 3
+  )
+
+  def __init__(self, field1=None, field2=None, field3=None,):
+    self.field1 = field1
+    self.field2 = field2
+    self.field3 = field3
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.field1 = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT and (fields is None or 2 in fields):
+          self.field2 = BigFieldIdStruct()
+          self.field2.read(iprot, fields and fields[2])
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32 and (fields is None or 3 in fields):
+          self.field3 = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('BreaksRubyCompactProtocol')
+    if self.field1 != None:
+      oprot.writeFieldBegin('field1', TType.STRING, 1)
+      oprot.writeString(self.field1)
+      oprot.writeFieldEnd()
+    if self.field2 != None:
+      oprot.writeFieldBegin('field2', TType.STRUCT, 2)
+      self.field2.write(oprot)
+      oprot.writeFieldEnd()
+    if self.field3 != None:
+      oprot.writeFieldBegin('field3', TType.I32, 3)
+      oprot.writeI32(self.field3)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
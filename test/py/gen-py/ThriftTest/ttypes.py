@@ -0,0 +1,1632 @@
+#
+# Autogenerated by Thrift
+#
+# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+#
+
+from thrift.Thrift import *
+
+from thrift.transport import TTransport
+from thrift.protocol import TProtocol, TBinaryProtocol, TCompactProtocol, TJSONProtocol
+try:
+  from thrift.protocol import fastbinary
+except:
+  fastbinary = None
+
+
+class Numberz:
+  """
+  Docstring!
+  """
+  ONE = 1
+  TWO = 2
+  THREE = 3
+  FIVE = 5
+  SIX = 6
+  EIGHT = 8
+
+  _VALUES_TO_NAMES = {
+    1: "ONE",
+    2: "TWO",
+    3: "THREE",
+    5: "FIVE",
+    6: "SIX",
+    8: "EIGHT",
+  }
+
+  _NAMES_TO_VALUES = {
+    "ONE": 1,
+    "TWO": 2,
+    "THREE": 3,
+    "FIVE": 5,
+    "SIX": 6,
+    "EIGHT": 8,
+  }
+
+class Bonk:
+  """
+  Attributes:
+   - message
+   - type
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'message', None, None, ), # 1
+    (2, TType.I32, 'type', None, None, ), # 2
+  )
+
+  def __init__(self, message=None, type=None,):
+    self.message = message
+    self.type = type
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.message = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.type = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Bonk')
+    if self.message != None:
+      oprot.writeFieldBegin('message', TType.STRING, 1)
+      oprot.writeString(self.message)
+      oprot.writeFieldEnd()
+    if self.type != None:
+      oprot.writeFieldBegin('type', TType.I32, 2)
+      oprot.writeI32(self.type)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Bools:
+  """
+  Attributes:
+   - im_true
+   - im_false
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BOOL, 'im_true', None, None, ), # 1
+    (2, TType.BOOL, 'im_false', None, None, ), # 2
+  )
+
+  def __init__(self, im_true=None, im_false=None,):
+    self.im_true = im_true
+    self.im_false = im_false
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BOOL and (fields is None or 1 in fields):
+          self.im_true = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.BOOL and (fields is None or 2 in fields):
+          self.im_false = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Bools')
+    if self.im_true != None:
+      oprot.writeFieldBegin('im_true', TType.BOOL, 1)
+      oprot.writeBool(self.im_true)
+      oprot.writeFieldEnd()
+    if self.im_false != None:
+      oprot.writeFieldBegin('im_false', TType.BOOL, 2)
+      oprot.writeBool(self.im_false)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Xtruct:
+  """
+  Attributes:
+   - string_thing
+   - byte_thing
+   - i32_thing
+   - i64_thing
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'string_thing', None, None, ), # 1
+    None, # 2
+    None, # 3
+    (4, TType.BYTE, 'byte_thing', None, None, ), # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    (9, TType.I32, 'i32_thing', None, None, ), # 9
+    None, # 10
+    (11, TType.I64, 'i64_thing', None, None, ), # 11
+  )
+
+  def __init__(self, string_thing=None, byte_thing=None, i32_thing=None, i64_thing=None,):
+    self.string_thing = string_thing
+    self.byte_thing = byte_thing
+    self.i32_thing = i32_thing
+    self.i64_thing = i64_thing
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.string_thing = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.BYTE and (fields is None or 4 in fields):
+          self.byte_thing = iprot.readByte();
+        else:
+          iprot.skip(ftype)
+      elif fid == 9:
+        if ftype == TType.I32 and (fields is None or 9 in fields):
+          self.i32_thing = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 11:
+        if ftype == TType.I64 and (fields is None or 11 in fields):
+          self.i64_thing = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Xtruct')
+    if self.string_thing != None:
+      oprot.writeFieldBegin('string_thing', TType.STRING, 1)
+      oprot.writeString(self.string_thing)
+      oprot.writeFieldEnd()
+    if self.byte_thing != None:
+      oprot.writeFieldBegin('byte_thing', TType.BYTE, 4)
+      oprot.writeByte(self.byte_thing)
+      oprot.writeFieldEnd()
+    if self.i32_thing != None:
+      oprot.writeFieldBegin('i32_thing', TType.I32, 9)
+      oprot.writeI32(self.i32_thing)
+      oprot.writeFieldEnd()
+    if self.i64_thing != None:
+      oprot.writeFieldBegin('i64_thing', TType.I64, 11)
+      oprot.writeI64(self.i64_thing)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Xtruct2:
+  """
+  Attributes:
+   - byte_thing
+   - struct_thing
+   - i32_thing
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BYTE, 'byte_thing', None, None, ), # 1
+    (2, TType.STRUCT, 'struct_thing', (Xtruct, Xtruct.thrift_spec), None, ), # 2
+    (3, TType.I32, 'i32_thing', None, None, ), # 3
+  )
+
+  def __init__(self, byte_thing=None, struct_thing=None, i32_thing=None,):
+    self.byte_thing = byte_thing
+    self.struct_thing = struct_thing
+    self.i32_thing = i32_thing
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BYTE and (fields is None or 1 in fields):
+          self.byte_thing = iprot.readByte();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT and (fields is None or 2 in fields):
+          self.struct_thing = Xtruct()
+          self.struct_thing.read(iprot, fields and fields[2])
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32 and (fields is None or 3 in fields):
+          self.i32_thing = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Xtruct2')
+    if self.byte_thing != None:
+      oprot.writeFieldBegin('byte_thing', TType.BYTE, 1)
+      oprot.writeByte(self.byte_thing)
+      oprot.writeFieldEnd()
+    if self.struct_thing != None:
+      oprot.writeFieldBegin('struct_thing', TType.STRUCT, 2)
+      self.struct_thing.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i32_thing != None:
+      oprot.writeFieldBegin('i32_thing', TType.I32, 3)
+      oprot.writeI32(self.i32_thing)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Xtruct3:
+  """
+  Attributes:
+   - string_thing
+   - changed
+   - i32_thing
+   - i64_thing
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'string_thing', None, None, ), # 1
+    None, # 2
+    None, # 3
+    (4, TType.I32, 'changed', None, None, ), # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    (9, TType.I32, 'i32_thing', None, None, ), # 9
+    None, # 10
+    (11, TType.I64, 'i64_thing', None, None, ), # 11
+  )
+
+  def __init__(self, string_thing=None, changed=None, i32_thing=None, i64_thing=None,):
+    self.string_thing = string_thing
+    self.changed = changed
+    self.i32_thing = i32_thing
+    self.i64_thing = i64_thing
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.string_thing = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I32 and (fields is None or 4 in fields):
+          self.changed = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 9:
+        if ftype == TType.I32 and (fields is None or 9 in fields):
+          self.i32_thing = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 11:
+        if ftype == TType.I64 and (fields is None or 11 in fields):
+          self.i64_thing = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Xtruct3')
+    if self.string_thing != None:
+      oprot.writeFieldBegin('string_thing', TType.STRING, 1)
+      oprot.writeString(self.string_thing)
+      oprot.writeFieldEnd()
+    if self.changed != None:
+      oprot.writeFieldBegin('changed', TType.I32, 4)
+      oprot.writeI32(self.changed)
+      oprot.writeFieldEnd()
+    if self.i32_thing != None:
+      oprot.writeFieldBegin('i32_thing', TType.I32, 9)
+      oprot.writeI32(self.i32_thing)
+      oprot.writeFieldEnd()
+    if self.i64_thing != None:
+      oprot.writeFieldBegin('i64_thing', TType.I64, 11)
+      oprot.writeI64(self.i64_thing)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Insanity:
+  """
+  Attributes:
+   - userMap
+   - xtructs
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.MAP, 'userMap', (TType.I32,None,TType.I64,None), None, ), # 1
+    (2, TType.LIST, 'xtructs', (TType.STRUCT,(Xtruct, Xtruct.thrift_spec)), None, ), # 2
+  )
+
+  def __init__(self, userMap=None, xtructs=None,):
+    self.userMap = userMap
+    self.xtructs = xtructs
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.MAP and (fields is None or 1 in fields):
+          self.userMap = {}
+          (_ktype1, _vtype2, _size0 ) = iprot.readMapBegin() 
+          for _i4 in xrange(_size0):
+            _key5 = iprot.readI32();
+            _val6 = iprot.readI64();
+            self.userMap[_key5] = _val6
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST and (fields is None or 2 in fields):
+          self.xtructs = []
+          (_etype10, _size7) = iprot.readListBegin()
+          for _i11 in xrange(_size7):
+            _elem12 = Xtruct()
+            _elem12.read(iprot, fields and fields[2])
+            self.xtructs.append(_elem12)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Insanity')
+    if self.userMap != None:
+      oprot.writeFieldBegin('userMap', TType.MAP, 1)
+      oprot.writeMapBegin(TType.I32, TType.I64, len(self.userMap))
+      for kiter13,viter14 in self.userMap.items():
+        oprot.writeI32(kiter13)
+        oprot.writeI64(viter14)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.xtructs != None:
+      oprot.writeFieldBegin('xtructs', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRUCT, len(self.xtructs))
+      for iter15 in self.xtructs:
+        iter15.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class CrazyNesting:
+  """
+  Attributes:
+   - string_field
+   - set_field
+   - list_field
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'string_field', None, None, ), # 1
+    (2, TType.SET, 'set_field', (TType.STRUCT,(Insanity, Insanity.thrift_spec)), None, ), # 2
+    (3, TType.LIST, 'list_field', (TType.MAP,(TType.SET,(TType.I32,None),TType.MAP,(TType.I32,None,TType.SET,(TType.LIST,(TType.MAP,(TType.STRUCT,(Insanity, Insanity.thrift_spec),TType.STRING,None)))))), None, ), # 3
+  )
+
+  def __init__(self, string_field=None, set_field=None, list_field=None,):
+    self.string_field = string_field
+    self.set_field = set_field
+    self.list_field = list_field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING and (fields is None or 1 in fields):
+          self.string_field = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.SET and (fields is None or 2 in fields):
+          self.set_field = set()
+          (_etype19, _size16) = iprot.readSetBegin()
+          for _i20 in xrange(_size16):
+            _elem21 = Insanity()
+            _elem21.read(iprot, fields and fields[2])
+            self.set_field.add(_elem21)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.LIST and (fields is None or 3 in fields):
+          self.list_field = []
+          (_etype25, _size22) = iprot.readListBegin()
+          for _i26 in xrange(_size22):
+            _elem27 = {}
+            (_ktype29, _vtype30, _size28 ) = iprot.readMapBegin() 
+            for _i32 in xrange(_size28):
+              (_etype38, _size35) = iprot.readSetBegin()
+              _key33 = set(iprot.readFixedValues(TType.I32, _size35))
+              iprot.readSetEnd()
+              _val34 = {}
+              (_ktype40, _vtype41, _size39 ) = iprot.readMapBegin() 
+              for _i43 in xrange(_size39):
+                _key44 = iprot.readI32();
+                _val45 = set()
+                (_etype49, _size46) = iprot.readSetBegin()
+                for _i50 in xrange(_size46):
+                  _elem51 = []
+                  (_etype55, _size52) = iprot.readListBegin()
+                  for _i56 in xrange(_size52):
+                    _elem57 = {}
+                    (_ktype59, _vtype60, _size58 ) = iprot.readMapBegin() 
+                    for _i62 in xrange(_size58):
+                      _key63 = Insanity()
+                      _key63.read(iprot)
+                      _val64 = iprot.readString();
+                      _elem57[_key63] = _val64
+                    iprot.readMapEnd()
+                    _elem51.append(_elem57)
+                  iprot.readListEnd()
+                  _val45.add(_elem51)
+                iprot.readSetEnd()
+                _val34[_key44] = _val45
+              iprot.readMapEnd()
+              _elem27[_key33] = _val34
+            iprot.readMapEnd()
+            self.list_field.append(_elem27)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('CrazyNesting')
+    if self.string_field != None:
+      oprot.writeFieldBegin('string_field', TType.STRING, 1)
+      oprot.writeString(self.string_field)
+      oprot.writeFieldEnd()
+    if self.set_field != None:
+      oprot.writeFieldBegin('set_field', TType.SET, 2)
+      oprot.writeSetBegin(TType.STRUCT, len(self.set_field))
+      for iter65 in self.set_field:
+        iter65.write(oprot)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.list_field != None:
+      oprot.writeFieldBegin('list_field', TType.LIST, 3)
+      oprot.writeListBegin(TType.MAP, len(self.list_field))
+      for iter66 in self.list_field:
+        oprot.writeMapBegin(TType.SET, TType.MAP, len(iter66))
+        for kiter67,viter68 in iter66.items():
+          oprot.writeSetBegin(TType.I32, len(kiter67))
+          oprot.writeFixedValues(TType.I32, kiter67)
+          oprot.writeSetEnd()
+          oprot.writeMapBegin(TType.I32, TType.SET, len(viter68))
+          for kiter69,viter70 in viter68.items():
+            oprot.writeI32(kiter69)
+            oprot.writeSetBegin(TType.LIST, len(viter70))
+            for iter71 in viter70:
+              oprot.writeListBegin(TType.MAP, len(iter71))
+              for iter72 in iter71:
+                oprot.writeMapBegin(TType.STRUCT, TType.STRING, len(iter72))
+                for kiter73,viter74 in iter72.items():
+                  kiter73.write(oprot)
+                  oprot.writeString(viter74)
+                oprot.writeMapEnd()
+              oprot.writeListEnd()
+            oprot.writeSetEnd()
+          oprot.writeMapEnd()
+        oprot.writeMapEnd()
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Xception(Exception):
+  """
+  Attributes:
+   - errorCode
+   - message
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'errorCode', None, None, ), # 1
+    (2, TType.STRING, 'message', None, None, ), # 2
+  )
+
+  def __init__(self, errorCode=None, message=None,):
+    self.errorCode = errorCode
+    self.message = message
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.errorCode = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING and (fields is None or 2 in fields):
+          self.message = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Xception')
+    if self.errorCode != None:
+      oprot.writeFieldBegin('errorCode', TType.I32, 1)
+      oprot.writeI32(self.errorCode)
+      oprot.writeFieldEnd()
+    if self.message != None:
+      oprot.writeFieldBegin('message', TType.STRING, 2)
+      oprot.writeString(self.message)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Xception2(Exception):
+  """
+  Attributes:
+   - errorCode
+   - struct_thing
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'errorCode', None, None, ), # 1
+    (2, TType.STRUCT, 'struct_thing', (Xtruct, Xtruct.thrift_spec), None, ), # 2
+  )
+
+  def __init__(self, errorCode=None, struct_thing=None,):
+    self.errorCode = errorCode
+    self.struct_thing = struct_thing
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.errorCode = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT and (fields is None or 2 in fields):
+          self.struct_thing = Xtruct()
+          self.struct_thing.read(iprot, fields and fields[2])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('Xception2')
+    if self.errorCode != None:
+      oprot.writeFieldBegin('errorCode', TType.I32, 1)
+      oprot.writeI32(self.errorCode)
+      oprot.writeFieldEnd()
+    if self.struct_thing != None:
+      oprot.writeFieldBegin('struct_thing', TType.STRUCT, 2)
+      self.struct_thing.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class EmptyStruct:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('EmptyStruct')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class OneField:
+  """
+  Attributes:
+   - field
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'field', (EmptyStruct, EmptyStruct.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, field=None,):
+    self.field = field
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT and (fields is None or 1 in fields):
+          self.field = EmptyStruct()
+          self.field.read(iprot, fields and fields[1])
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('OneField')
+    if self.field != None:
+      oprot.writeFieldBegin('field', TType.STRUCT, 1)
+      self.field.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class VersioningTestV1:
+  """
+  Attributes:
+   - begin_in_both
+   - old_string
+   - end_in_both
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'begin_in_both', None, None, ), # 1
+    None, # 2
+    (3, TType.STRING, 'old_string', None, None, ), # 3
+    None, # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    None, # 10
+    None, # 11
+    (12, TType.I32, 'end_in_both', None, None, ), # 12
+  )
+
+  def __init__(self, begin_in_both=None, old_string=None, end_in_both=None,):
+    self.begin_in_both = begin_in_both
+    self.old_string = old_string
+    self.end_in_both = end_in_both
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.begin_in_both = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING and (fields is None or 3 in fields):
+          self.old_string = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 12:
+        if ftype == TType.I32 and (fields is None or 12 in fields):
+          self.end_in_both = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('VersioningTestV1')
+    if self.begin_in_both != None:
+      oprot.writeFieldBegin('begin_in_both', TType.I32, 1)
+      oprot.writeI32(self.begin_in_both)
+      oprot.writeFieldEnd()
+    if self.old_string != None:
+      oprot.writeFieldBegin('old_string', TType.STRING, 3)
+      oprot.writeString(self.old_string)
+      oprot.writeFieldEnd()
+    if self.end_in_both != None:
+      oprot.writeFieldBegin('end_in_both', TType.I32, 12)
+      oprot.writeI32(self.end_in_both)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class VersioningTestV2:
+  """
+  Attributes:
+   - begin_in_both
+   - newint
+   - newbyte
+   - newshort
+   - newlong
+   - newdouble
+   - newstruct
+   - newlist
+   - newset
+   - newmap
+   - newstring
+   - end_in_both
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'begin_in_both', None, None, ), # 1
+    (2, TType.I32, 'newint', None, None, ), # 2
+    (3, TType.BYTE, 'newbyte', None, None, ), # 3
+    (4, TType.I16, 'newshort', None, None, ), # 4
+    (5, TType.I64, 'newlong', None, None, ), # 5
+    (6, TType.DOUBLE, 'newdouble', None, None, ), # 6
+    (7, TType.STRUCT, 'newstruct', (Bonk, Bonk.thrift_spec), None, ), # 7
+    (8, TType.LIST, 'newlist', (TType.I32,None), None, ), # 8
+    (9, TType.SET, 'newset', (TType.I32,None), None, ), # 9
+    (10, TType.MAP, 'newmap', (TType.I32,None,TType.I32,None), None, ), # 10
+    (11, TType.STRING, 'newstring', None, None, ), # 11
+    (12, TType.I32, 'end_in_both', None, None, ), # 12
+  )
+
+  def __init__(self, begin_in_both=None, newint=None, newbyte=None, newshort=None, newlong=None, newdouble=None, newstruct=None, newlist=None, newset=None, newmap=None, newstring=None, end_in_both=None,):
+    self.begin_in_both = begin_in_both
+    self.newint = newint
+    self.newbyte = newbyte
+    self.newshort = newshort
+    self.newlong = newlong
+    self.newdouble = newdouble
+    self.newstruct = newstruct
+    self.newlist = newlist
+    self.newset = newset
+    self.newmap = newmap
+    self.newstring = newstring
+    self.end_in_both = end_in_both
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32 and (fields is None or 1 in fields):
+          self.begin_in_both = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32 and (fields is None or 2 in fields):
+          self.newint = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.BYTE and (fields is None or 3 in fields):
+          self.newbyte = iprot.readByte();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I16 and (fields is None or 4 in fields):
+          self.newshort = iprot.readI16();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I64 and (fields is None or 5 in fields):
+          self.newlong = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.DOUBLE and (fields is None or 6 in fields):
+          self.newdouble = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.STRUCT and (fields is None or 7 in fields):
+          self.newstruct = Bonk()
+          self.newstruct.read(iprot, fields and fields[7])
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.LIST and (fields is None or 8 in fields):
+          (_etype78, _size75) = iprot.readListBegin()
+          self.newlist = iprot.readFixedValues(TType.I32, _size75)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 9:
+        if ftype == TType.SET and (fields is None or 9 in fields):
+          (_etype82, _size79) = iprot.readSetBegin()
+          self.newset = set(iprot.readFixedValues(TType.I32, _size79))
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 10:
+        if ftype == TType.MAP and (fields is None or 10 in fields):
+          self.newmap = {}
+          (_ktype84, _vtype85, _size83 ) = iprot.readMapBegin() 
+          for _i87 in xrange(_size83):
+            _key88 = iprot.readI32();
+            _val89 = iprot.readI32();
+            self.newmap[_key88] = _val89
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 11:
+        if ftype == TType.STRING and (fields is None or 11 in fields):
+          self.newstring = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 12:
+        if ftype == TType.I32 and (fields is None or 12 in fields):
+          self.end_in_both = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('VersioningTestV2')
+    if self.begin_in_both != None:
+      oprot.writeFieldBegin('begin_in_both', TType.I32, 1)
+      oprot.writeI32(self.begin_in_both)
+      oprot.writeFieldEnd()
+    if self.newint != None:
+      oprot.writeFieldBegin('newint', TType.I32, 2)
+      oprot.writeI32(self.newint)
+      oprot.writeFieldEnd()
+    if self.newbyte != None:
+      oprot.writeFieldBegin('newbyte', TType.BYTE, 3)
+      oprot.writeByte(self.newbyte)
+      oprot.writeFieldEnd()
+    if self.newshort != None:
+      oprot.writeFieldBegin('newshort', TType.I16, 4)
+      oprot.writeI16(self.newshort)
+      oprot.writeFieldEnd()
+    if self.newlong != None:
+      oprot.writeFieldBegin('newlong', TType.I64, 5)
+      oprot.writeI64(self.newlong)
+      oprot.writeFieldEnd()
+    if self.newdouble != None:
+      oprot.writeFieldBegin('newdouble', TType.DOUBLE, 6)
+      oprot.writeDouble(self.newdouble)
+      oprot.writeFieldEnd()
+    if self.newstruct != None:
+      oprot.writeFieldBegin('newstruct', TType.STRUCT, 7)
+      self.newstruct.write(oprot)
+      oprot.writeFieldEnd()
+    if self.newlist != None:
+      oprot.writeFieldBegin('newlist', TType.LIST, 8)
+      oprot.writeListBegin(TType.I32, len(self.newlist))
+      oprot.writeFixedValues(TType.I32, self.newlist)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.newset != None:
+      oprot.writeFieldBegin('newset', TType.SET, 9)
+      oprot.writeSetBegin(TType.I32, len(self.newset))
+      oprot.writeFixedValues(TType.I32, self.newset)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.newmap != None:
+      oprot.writeFieldBegin('newmap', TType.MAP, 10)
+      oprot.writeMapBegin(TType.I32, TType.I32, len(self.newmap))
+      for kiter90,viter91 in self.newmap.items():
+        oprot.writeI32(kiter90)
+        oprot.writeI32(viter91)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.newstring != None:
+      oprot.writeFieldBegin('newstring', TType.STRING, 11)
+      oprot.writeString(self.newstring)
+      oprot.writeFieldEnd()
+    if self.end_in_both != None:
+      oprot.writeFieldBegin('end_in_both', TType.I32, 12)
+      oprot.writeI32(self.end_in_both)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ListTypeVersioningV1:
+  """
+  Attributes:
+   - myints
+   - hello
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'myints', (TType.I32,None), None, ), # 1
+    (2, TType.STRING, 'hello', None, None, ), # 2
+  )
+
+  def __init__(self, myints=None, hello=None,):
+    self.myints = myints
+    self.hello = hello
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST and (fields is None or 1 in fields):
+          (_etype95, _size92) = iprot.readListBegin()
+          self.myints = iprot.readFixedValues(TType.I32, _size92)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING and (fields is None or 2 in fields):
+          self.hello = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('ListTypeVersioningV1')
+    if self.myints != None:
+      oprot.writeFieldBegin('myints', TType.LIST, 1)
+      oprot.writeListBegin(TType.I32, len(self.myints))
+      oprot.writeFixedValues(TType.I32, self.myints)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.hello != None:
+      oprot.writeFieldBegin('hello', TType.STRING, 2)
+      oprot.writeString(self.hello)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ListTypeVersioningV2:
+  """
+  Attributes:
+   - strings
+   - hello
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'strings', (TType.STRING,None), None, ), # 1
+    (2, TType.STRING, 'hello', None, None, ), # 2
+  )
+
+  def __init__(self, strings=None, hello=None,):
+    self.strings = strings
+    self.hello = hello
+
+  def read(self, iprot, fields=None):
+    if fields is not None:
+      fields = TProtocol.projection(fields)
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      if fields is None:
+        fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      else:
+        fastbinary.decode_binary_fields(self, iprot.trans, (self.__class__, self.thrift_spec), fields)
+      return
+    if iprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None and fields is None:
+      fastbinary.decode_compact(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    if iprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fields is None:
+      iprot.readStruct(self, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST and (fields is None or 1 in fields):
+          self.strings = []
+          (_etype99, _size96) = iprot.readListBegin()
+          for _i100 in xrange(_size96):
+            _elem101 = iprot.readString();
+            self.strings.append(_elem101)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING and (fields is None or 2 in fields):
+          self.hello = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.encode_binary_into(self, (self.__class__, self.thrift_spec), oprot.trans)
+      return
+    if oprot.__class__ == TCompactProtocol.TCompactProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_compact(self, (self.__class__, self.thrift_spec)))
+      return
+    if oprot.__class__ == TJSONProtocol.TJSONProtocolAccelerated and self.thrift_spec is not None:
+      oprot.writeStruct(self, (self.__class__, self.thrift_spec))
+      return
+    oprot.writeStructBegin('ListTypeVersioningV2')
+    if self.strings != None:
+      oprot.writeFieldBegin('strings', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRING, len(self.strings))
+      for iter102 in self.strings:
+        oprot.writeString(iter102)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.hello != None:
+      oprot.writeFieldBegin('hello', TType.STRING, 2)
+      oprot.writeString(self.hello)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+